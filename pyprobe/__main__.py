@@ -5,8 +5,12 @@ Usage:
     python -m pyprobe [script.py]
     python -m pyprobe --loglevel DEBUG examples/dsp_demo.py
     python -m pyprobe --trace-states examples/dsp_demo.py
+    python -m pyprobe --startup-profile examples/dsp_demo.py
 """
 
+import time
+_START = time.perf_counter()
+
 import sys
 import os
 import argparse
@@ -54,6 +58,41 @@ def main():
         help="Overlay a signal on an existing probe. Format: target_symbol:line:symbol:instance "
              "(e.g., signal_i:75:received_symbols:1 overlays received_symbols onto signal_i)"
     )
+    parser.add_argument(
+        "--sweep",
+        action="append",
+        help="Run the script once per value of a module-level constant, in parallel, "
+             "overlaying the results. Format: NAME=v1,v2,... (e.g., SNR_DB=0,3,6). "
+             "Repeat to sweep the grid of several constants"
+    )
+    parser.add_argument(
+        "--sweep-args",
+        action="append",
+        help="Arguments for one sweep run of the script (e.g., \"--mod qpsk\"). "
+             "Repeat for each run; combined with every --sweep point"
+    )
+    parser.add_argument(
+        "-j", "--jobs",
+        type=int,
+        default=None,
+        help="Maximum sweep runs in parallel (default: CPU count)"
+    )
+    parser.add_argument(
+        "--session",
+        action="append",
+        help="Trace another script alongside the main one, e.g. an optimized version "
+             "of a reference script. Format: \"SCRIPT [ARGS]\". Repeat for more sessions"
+    )
+    parser.add_argument(
+        "--record",
+        metavar="PATH",
+        help="Record every capture to a .pprec file while the GUI runs"
+    )
+    parser.add_argument(
+        "--broker-socket",
+        metavar="PATH",
+        help="Serve the capture stream on a Unix socket for pyprobe.client subscribers"
+    )
     parser.add_argument(
         "-l", "--loglevel",
         choices=["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"],
@@ -77,8 +116,25 @@ def main():
         help="Enable detailed state tracing. Logs all user actions and reactions to /tmp/pyprobe_state_trace.log"
     )
 
+    parser.add_argument(
+        "--startup-profile",
+        action="store_true",
+        help="Print an import/initialization timing breakdown once the window is shown"
+    )
+
     args = parser.parse_args()
 
+    from pyprobe.core.sweep import build_grid
+    try:
+        sweep = build_grid(args.sweep or [], args.sweep_args or [])
+    except ValueError as e:
+        parser.error(str(e))
+
+    from pyprobe import startup_profile
+    if args.startup_profile:
+        startup_profile.enable(_START)
+        startup_profile.mark("arguments")
+
     # Initialize state tracer FIRST if requested
     if args.trace_states:
         from pyprobe.state_tracer import init_tracer
@@ -92,9 +148,11 @@ def main():
         log_file=args.logfile,
         console=args.log_console
     )
+    startup_profile.mark("logging")
 
     # Import here to avoid slow startup for --help
     from pyprobe.gui.app import run_app
+    startup_profile.mark("GUI imports")
 
     # Auto-detect file vs. folder
     script_path = args.script
@@ -112,7 +170,12 @@ def main():
         overlays=args.overlay,
         auto_run=args.auto_run,
         auto_quit=args.auto_quit,
-        auto_quit_timeout=args.auto_quit_timeout
+        auto_quit_timeout=args.auto_quit_timeout,
+        sweep=sweep,
+        sweep_jobs=args.jobs,
+        sessions=args.session,
+        record_path=args.record,
+        broker_socket=args.broker_socket
     ))
 
 
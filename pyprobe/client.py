@@ -0,0 +1,90 @@
+"""
+Async client for the capture broker socket.
+
+Lets a script outside the GUI (a notebook, an analysis job) follow a
+running capture:
+
+    async with pyprobe.client.subscribe("/tmp/pyprobe.sock", max_rate_hz=30) as stream:
+        async for record in stream:
+            print(record.anchor.symbol, record.value)
+
+Start the GUI with ``--broker-socket PATH`` to serve the stream.
+"""
+
+import asyncio
+import struct
+from typing import Iterable, Optional
+
+from .core.anchor import ProbeAnchor
+from .core.broker import decode_record
+from .core.capture_record import CaptureRecord
+from .ipc.messages import make_subscribe_cmd
+from .ipc.wire_protocol import encode_message
+
+
+class CaptureStream:
+    """Async iterator over the CaptureRecords a broker sends."""
+
+    def __init__(
+        self,
+        address: str,
+        anchors: Optional[Iterable[ProbeAnchor]] = None,
+        max_rate_hz: Optional[float] = None,
+    ):
+        self.address = address
+        self.anchors = None if anchors is None else list(anchors)
+        self.max_rate_hz = max_rate_hz
+        self._reader: Optional[asyncio.StreamReader] = None
+        self._writer: Optional[asyncio.StreamWriter] = None
+
+    async def connect(self) -> "CaptureStream":
+        self._reader, self._writer = await asyncio.open_unix_connection(self.address)
+        frame = encode_message(make_subscribe_cmd(self.anchors, self.max_rate_hz))
+        self._writer.write(struct.pack(">I", len(frame)) + frame)
+        await self._writer.drain()
+        return self
+
+    async def close(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+            try:
+                await self._writer.wait_closed()
+            except OSError:
+                pass
+            self._writer = None
+
+    async def __aenter__(self) -> "CaptureStream":
+        return await self.connect()
+
+    async def __aexit__(self, *exc) -> None:
+        await self.close()
+
+    def __aiter__(self) -> "CaptureStream":
+        return self
+
+    async def __anext__(self) -> CaptureRecord:
+        if self._reader is None:
+            raise RuntimeError("CaptureStream is not connected")
+        try:
+            prefix = await self._reader.readexactly(4)
+            (length,) = struct.unpack(">I", prefix)
+            frame = await self._reader.readexactly(length)
+        except (asyncio.IncompleteReadError, ConnectionError):
+            raise StopAsyncIteration
+        return decode_record(frame)
+
+
+def subscribe(
+    address: str,
+    anchors: Optional[Iterable[ProbeAnchor]] = None,
+    max_rate_hz: Optional[float] = None,
+) -> CaptureStream:
+    """
+    Stream of captures from the broker listening at ``address``.
+
+    Args:
+        address: Path of the broker's Unix socket
+        anchors: Anchors to receive (default: all)
+        max_rate_hz: Maximum records per second per anchor (default: all)
+    """
+    return CaptureStream(address, anchors, max_rate_hz)
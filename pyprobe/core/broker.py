@@ -0,0 +1,214 @@
+"""
+Publish/subscribe fan-out of the capture stream.
+
+The tracer sends each capture once; the broker hands it to every
+consumer that wants it. Each subscription chooses its anchors and a
+maximum rate per anchor, so for example a recorder can log everything
+while the GUI, or an analysis client, sees a decimated live view.
+
+Record subscribers (in the GUI process) are called synchronously and
+share the very same CaptureRecord objects and arrays; nothing is copied.
+Frame subscribers (the .pprec recorder, socket clients) receive the
+record encoded in the wire protocol. Encoding happens once per record on
+the broker's own thread, and every frame subscriber gets the same bytes.
+"""
+
+import queue
+import threading
+import time
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from pyprobe.logging import get_logger
+from .anchor import ProbeAnchor
+from .capture_record import CaptureRecord
+from ..ipc.messages import Message, MessageType
+from ..ipc.wire_protocol import ProtocolError, decode_message, encode_message
+
+logger = get_logger(__name__)
+
+RecordSubscriber = Callable[[List[CaptureRecord]], None]
+FrameSubscriber = Callable[[bytes], None]
+
+
+def encode_record(record: CaptureRecord) -> bytes:
+    """Wire-protocol frame (a DATA_PROBE_VALUE message) for ``record``."""
+    return encode_message(Message(
+        msg_type=MessageType.DATA_PROBE_VALUE,
+        payload=record.to_dict(),
+        timestamp=record.timestamp / 1e9 if record.timestamp else time.time(),
+    ))
+
+
+def decode_record(frame: bytes) -> CaptureRecord:
+    """
+    Inverse of ``encode_record``.
+
+    Raises:
+        ProtocolError: If the frame is malformed or not a probe value
+    """
+    msg = decode_message(frame)
+    if msg.msg_type != MessageType.DATA_PROBE_VALUE:
+        raise ProtocolError(f"Expected DATA_PROBE_VALUE, got {msg.msg_type.name}")
+    return CaptureRecord.from_dict(msg.payload)
+
+
+class Subscription:
+    """
+    One consumer's view of the capture stream.
+
+    A record is let through when its anchor is wanted and at least
+    ``1 / max_rate_hz`` seconds have passed since the last one delivered
+    for that anchor. The newest record held back by the rate limit is
+    delivered by ``CaptureBroker.flush()``, so a decimated view still
+    ends on the final value.
+    """
+
+    def __init__(
+        self,
+        deliver: Callable,
+        anchors: Optional[Iterable[ProbeAnchor]] = None,
+        max_rate_hz: Optional[float] = None,
+        frames: bool = False,
+    ):
+        self.deliver = deliver
+        self.anchors = None if anchors is None else frozenset(anchors)
+        self.max_rate_hz = max_rate_hz
+        self.frames = frames
+        self._interval = 1.0 / max_rate_hz if max_rate_hz else 0.0
+        self._last_sent: Dict[ProbeAnchor, float] = {}
+        self._held: Dict[ProbeAnchor, CaptureRecord] = {}
+
+    def wants(self, anchor: ProbeAnchor) -> bool:
+        return self.anchors is None or anchor in self.anchors
+
+    def select(self, records: Sequence[CaptureRecord], now: float) -> List[CaptureRecord]:
+        """The records of a batch this subscriber should receive."""
+        selected = []
+        for record in records:
+            anchor = record.anchor
+            if not self.wants(anchor):
+                continue
+            if self._interval:
+                last = self._last_sent.get(anchor)
+                if last is not None and now - last < self._interval:
+                    self._held[anchor] = record
+                    continue
+                self._last_sent[anchor] = now
+                self._held.pop(anchor, None)
+            selected.append(record)
+        return selected
+
+    def take_held(self) -> List[CaptureRecord]:
+        """Records held back by the rate limit, newest per anchor."""
+        held = list(self._held.values())
+        self._held.clear()
+        return held
+
+
+class CaptureBroker:
+    """Fans one capture stream out to any number of subscriptions."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._subscriptions: List[Subscription] = []
+        # (record, frame subscriptions) lists for the encoder thread
+        self._frame_jobs: "queue.SimpleQueue[Optional[List[Tuple[CaptureRecord, list]]]]" = queue.SimpleQueue()
+        self._encoder: Optional[threading.Thread] = None
+
+    def subscribe(
+        self,
+        deliver: RecordSubscriber,
+        anchors: Optional[Iterable[ProbeAnchor]] = None,
+        max_rate_hz: Optional[float] = None,
+    ) -> Subscription:
+        """
+        Call ``deliver`` with the selected records of every batch, on the
+        publishing thread.
+
+        Args:
+            deliver: Receives a list of CaptureRecords
+            anchors: Anchors to receive (default: all)
+            max_rate_hz: Maximum records per second per anchor (default: all)
+        """
+        return self._add(Subscription(deliver, anchors, max_rate_hz))
+
+    def subscribe_frames(
+        self,
+        deliver: FrameSubscriber,
+        anchors: Optional[Iterable[ProbeAnchor]] = None,
+        max_rate_hz: Optional[float] = None,
+    ) -> Subscription:
+        """
+        Call ``deliver`` with one encoded frame per selected record, on the
+        broker's encoder thread. ``deliver`` must not block for long: it
+        holds up every other frame subscriber.
+        """
+        return self._add(Subscription(deliver, anchors, max_rate_hz, frames=True))
+
+    def _add(self, subscription: Subscription) -> Subscription:
+        with self._lock:
+            self._subscriptions.append(subscription)
+            if subscription.frames and self._encoder is None:
+                self._encoder = threading.Thread(
+                    target=self._encode_loop, name="pyprobe-broker", daemon=True
+                )
+                self._encoder.start()
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        with self._lock:
+            if subscription in self._subscriptions:
+                self._subscriptions.remove(subscription)
+
+    def publish(self, records: Sequence[CaptureRecord], now: Optional[float] = None) -> None:
+        """Deliver a batch of records to every subscription that wants them."""
+        if not records:
+            return
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            subscriptions = list(self._subscriptions)
+        self._dispatch([(s, s.select(records, now)) for s in subscriptions])
+
+    def flush(self) -> None:
+        """Deliver the records rate limits held back (e.g. when a run ends)."""
+        with self._lock:
+            subscriptions = list(self._subscriptions)
+        self._dispatch([(s, s.take_held()) for s in subscriptions])
+
+    def _dispatch(self, selections: List[Tuple[Subscription, List[CaptureRecord]]]) -> None:
+        jobs: Dict[int, Tuple[CaptureRecord, list]] = {}
+        for subscription, selected in selections:
+            if not selected:
+                continue
+            if not subscription.frames:
+                subscription.deliver(selected)
+                continue
+            for record in selected:
+                jobs.setdefault(id(record), (record, []))[1].append(subscription)
+        if jobs:
+            self._frame_jobs.put(list(jobs.values()))
+
+    def _encode_loop(self) -> None:
+        while True:
+            jobs = self._frame_jobs.get()
+            if jobs is None:
+                return
+            for record, subscriptions in jobs:
+                try:
+                    frame = encode_record(record)
+                except (TypeError, ValueError) as e:
+                    logger.debug(f"Cannot encode capture of {record.anchor.symbol}: {e}")
+                    continue
+                for subscription in subscriptions:
+                    try:
+                        subscription.deliver(frame)
+                    except Exception:
+                        logger.exception("Frame subscriber failed")
+
+    def shutdown(self, timeout: float = 2.0) -> None:
+        """Deliver the frames already published, then stop the encoder thread."""
+        with self._lock:
+            encoder, self._encoder = self._encoder, None
+        if encoder is not None:
+            self._frame_jobs.put(None)
+            encoder.join(timeout)
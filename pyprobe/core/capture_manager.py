@@ -1,5 +1,7 @@
 """Capture orchestration for ordered probe captures."""
 
+import itertools
+import threading
 import time
 from dataclasses import dataclass
 from typing import Callable, Dict, List, Optional, Sequence, Tuple
@@ -9,9 +11,33 @@ from .capture_record import CaptureRecord
 from .sequence import SequenceGenerator
 from pyprobe.logging import trace_print
 
+_thread_ids = itertools.count(1)
+_thread_local = threading.local()
+
+
+def current_thread_id() -> int:
+    """
+    Id of the calling thread for tagging captures.
+
+    Unlike ``threading.get_ident()``, which the OS hands to the next thread
+    once a short-lived worker exits, an id is never reused within a process.
+    """
+    try:
+        return _thread_local.thread_id
+    except AttributeError:
+        _thread_local.thread_id = next(_thread_ids)
+        return _thread_local.thread_id
+
 
 class CaptureManager:
-    """Create ordered CaptureRecords for immediate captures."""
+    """
+    Create ordered CaptureRecords for immediate captures.
+
+    Safe to share between traced threads: every record is tagged with the
+    thread that captured it, and deferred captures are kept per thread,
+    keyed by (thread id, frame id), so frames of different threads never
+    share (or flush) each other's pending captures.
+    """
 
     def __init__(
         self,
@@ -20,7 +46,7 @@ class CaptureManager:
     ) -> None:
         self._seq_gen = seq_gen or SequenceGenerator()
         self._clock = clock or time.perf_counter_ns
-        self._pending: Dict[int, List[_DeferredItem]] = {}
+        self._pending: Dict[Tuple[int, int], List[_DeferredItem]] = {}
 
     def capture_immediate(
         self,
@@ -42,6 +68,7 @@ class CaptureManager:
             seq_num=seq_num,
             timestamp=ts,
             logical_order=logical_order,
+            thread_id=current_thread_id(),
         )
 
     def capture_batch(
@@ -81,13 +108,15 @@ class CaptureManager:
         """
         ts = self._clock() if timestamp is None else timestamp
         seq_num = self._seq_gen.next()
-        pending = self._pending.setdefault(frame_id, [])
+        thread_id = current_thread_id()
+        pending = self._pending.setdefault((thread_id, frame_id), [])
         pending.append(
             _DeferredItem(
                 anchor=anchor,
                 seq_num=seq_num,
                 timestamp=ts,
                 logical_order=logical_order,
+                thread_id=thread_id,
                 old_object_id=old_object_id,
             )
         )
@@ -110,7 +139,8 @@ class CaptureManager:
         if event not in ("line", "return", "exception"):
             return []
 
-        pending = self._pending.get(frame_id)
+        key = (current_thread_id(), frame_id)
+        pending = self._pending.get(key)
         if not pending:
             return []
         
@@ -149,31 +179,39 @@ class CaptureManager:
                     seq_num=item.seq_num,
                     timestamp=item.timestamp,
                     logical_order=item.logical_order,
+                    thread_id=item.thread_id,
                 )
             )
             trace_print(f"FLUSH: {item.anchor.symbol}@{item.anchor.line} dtype={dtype}")
 
         if still_pending:
-            self._pending[frame_id] = still_pending
+            self._pending[key] = still_pending
         else:
-            self._pending.pop(frame_id, None)
+            self._pending.pop(key, None)
 
         return records
 
     def has_pending(self, frame_id: int) -> bool:
-        """Check if a frame has pending deferred captures."""
-        pending = self._pending.get(frame_id)
+        """Check if a frame of the calling thread has pending deferred captures."""
+        pending = self._pending.get((current_thread_id(), frame_id))
         return bool(pending)
 
     def flush_all(
         self,
-        resolve_value: Callable[[ProbeAnchor], Tuple[object, str, Optional[tuple]]]
+        resolve_value: Callable[[ProbeAnchor], Tuple[object, str, Optional[tuple]]],
+        thread_id: Optional[int] = None,
     ) -> List[CaptureRecord]:
         """Flush all pending captures regardless of event type or object ID changes.
         Used during shutdown to ensure no captures are lost.
+
+        Args:
+            thread_id: Only flush the captures deferred by this thread
+                       (default: every thread's)
         """
         records: List[CaptureRecord] = []
-        for frame_id, pending in self._pending.items():
+        keys = [k for k in list(self._pending) if thread_id is None or k[0] == thread_id]
+        for key in keys:
+            pending = self._pending.pop(key, None) or []
             for item in pending:
                 try:
                     value, dtype, shape = resolve_value(item.anchor)
@@ -189,11 +227,11 @@ class CaptureManager:
                         seq_num=item.seq_num,
                         timestamp=item.timestamp,
                         logical_order=item.logical_order,
+                        thread_id=item.thread_id,
                     )
                 )
                 trace_print(f"FLUSH (ALL): {item.anchor.symbol}@{item.anchor.line} dtype={dtype}")
-        
-        self._pending.clear()
+
         return records
 
 @dataclass(frozen=True)
@@ -202,4 +240,5 @@ class _DeferredItem:
     seq_num: int
     timestamp: int
     logical_order: int
+    thread_id: int
     old_object_id: Optional[int] = None  # Track object ID to detect new assignment
@@ -17,6 +17,7 @@ class CaptureRecord:
     seq_num: int
     timestamp: int
     logical_order: int
+    thread_id: int = 0  # current_thread_id() of the thread that captured it
 
     def to_dict(self) -> Dict[str, Any]:
         """Serialize for IPC or persistence."""
@@ -28,6 +29,7 @@ class CaptureRecord:
             'seq_num': self.seq_num,
             'timestamp': self.timestamp,
             'logical_order': self.logical_order,
+            'thread_id': self.thread_id,
         }
 
     @staticmethod
@@ -41,4 +43,5 @@ class CaptureRecord:
             seq_num=payload.get('seq_num', -1),
             timestamp=payload.get('timestamp', 0),
             logical_order=payload.get('logical_order', 0),
+            thread_id=payload.get('thread_id') or 0,
         )
@@ -0,0 +1,444 @@
+"""
+Per-capture summary statistics and a columnar index for history queries.
+
+Every capture is reduced once, at ingest, to a fixed set of scalars
+(min, max, mean, RMS, energy, NaN count, |x| max and a content hash).
+The scalars live in growable numpy columns so that history queries like
+``max(abs(x)) > 3`` or ``first frame with NaN`` are evaluated as a handful
+of vectorized comparisons and never touch the captured arrays.
+
+Complex data is summarized by magnitude, matching what the waveform
+lenses draw for complex input.
+"""
+
+import ast
+import hashlib
+import re
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from .data_classifier import DTYPE_ARRAY_COLLECTION, DTYPE_WAVEFORM_COLLECTION
+
+
+# Float columns of the summary index
+FLOAT_FIELDS = ('min', 'max', 'mean', 'rms', 'energy', 'absmax')
+# Integer columns
+INT_FIELDS = ('seq', 'nans', 'size', 'hash')
+
+
+@dataclass(frozen=True)
+class CaptureSummary:
+    """Scalar summary of a single captured value."""
+
+    min: float
+    max: float
+    mean: float
+    rms: float
+    energy: float
+    absmax: float
+    nans: int
+    size: int
+    hash: int
+
+
+def _numeric_parts(value: Any) -> Optional[List[np.ndarray]]:
+    """Return the numeric arrays that make up a (serialized) capture."""
+    if isinstance(value, dict):
+        tag = value.get('__dtype__')
+        if tag == DTYPE_WAVEFORM_COLLECTION:
+            return [np.asarray(wf['samples']) for wf in value.get('waveforms', [])]
+        if tag == DTYPE_ARRAY_COLLECTION:
+            return [np.asarray(arr) for arr in value.get('arrays', [])]
+        if 'samples' in value:
+            return [np.asarray(value['samples'])]
+        return None
+
+    if isinstance(value, (bool, int, float, complex, np.number, np.bool_)):
+        return [np.asarray(value)]
+
+    if isinstance(value, (np.ndarray, list, tuple)):
+        try:
+            arr = np.asarray(value)
+        except (ValueError, TypeError):
+            return None
+        if arr.dtype.kind in 'biufc':
+            return [arr]
+    return None
+
+
+def _reduce(arr: np.ndarray) -> Tuple[int, int, float, float, float, float]:
+    """Reduce one array to (n_valid, n_nan, min, max, sum, sum_sq)."""
+    flat = arr.ravel()
+    if flat.dtype.kind == 'c':
+        flat = np.abs(flat)
+    elif flat.dtype.kind in 'biu':
+        flat = flat.astype(np.float64)
+
+    nan_mask = np.isnan(flat)
+    n_nan = int(np.count_nonzero(nan_mask))
+    if n_nan:
+        flat = flat[~nan_mask]
+    n = flat.size
+    if n == 0:
+        return 0, n_nan, np.nan, np.nan, 0.0, 0.0
+    return (
+        n,
+        n_nan,
+        float(flat.min()),
+        float(flat.max()),
+        float(flat.sum()),
+        float(np.dot(flat, flat)),
+    )
+
+
+def _content_hash(parts: Iterable[np.ndarray]) -> int:
+    """64-bit content hash (signed, so it fits an int64 column)."""
+    h = hashlib.blake2b(digest_size=8)
+    for arr in parts:
+        arr = np.ascontiguousarray(arr)
+        h.update(arr.dtype.str.encode())
+        h.update(str(arr.shape).encode())
+        h.update(arr.tobytes())
+    return int.from_bytes(h.digest(), 'little', signed=True)
+
+
+def summarize_value(value: Any) -> CaptureSummary:
+    """
+    Summarize a captured value in a single vectorized pass per array.
+
+    Non-numeric values get NaN statistics and a hash of their repr so that
+    change detection still works.
+    """
+    parts = _numeric_parts(value)
+    if parts is None:
+        digest = hashlib.blake2b(repr(value).encode(), digest_size=8).digest()
+        return CaptureSummary(
+            min=np.nan, max=np.nan, mean=np.nan, rms=np.nan, energy=np.nan,
+            absmax=np.nan, nans=0, size=0,
+            hash=int.from_bytes(digest, 'little', signed=True),
+        )
+
+    n_total = 0
+    n_nan = 0
+    lo = np.inf
+    hi = -np.inf
+    total = 0.0
+    energy = 0.0
+    for arr in parts:
+        n, nans, a_min, a_max, a_sum, a_sq = _reduce(arr)
+        n_nan += nans
+        if n == 0:
+            continue
+        n_total += n
+        lo = min(lo, a_min)
+        hi = max(hi, a_max)
+        total += a_sum
+        energy += a_sq
+
+    if n_total == 0:
+        lo = hi = mean = rms = absmax = np.nan
+    else:
+        mean = total / n_total
+        rms = float(np.sqrt(energy / n_total))
+        absmax = max(abs(lo), abs(hi))
+
+    return CaptureSummary(
+        min=lo, max=hi, mean=mean, rms=rms, energy=energy, absmax=absmax,
+        nans=n_nan, size=n_total + n_nan, hash=_content_hash(parts),
+    )
+
+
+class SummaryIndex:
+    """
+    Columnar store of capture summaries for one probe.
+
+    Row ``i`` describes the ``i``-th capture in the owning buffer, so query
+    results are frame indices into that buffer.
+    """
+
+    _INITIAL_CAPACITY = 64
+
+    def __init__(self) -> None:
+        self._count = 0
+        self._capacity = self._INITIAL_CAPACITY
+        self._columns: Dict[str, np.ndarray] = {}
+        for name in FLOAT_FIELDS:
+            self._columns[name] = np.empty(self._capacity, dtype=np.float64)
+        for name in INT_FIELDS:
+            self._columns[name] = np.empty(self._capacity, dtype=np.int64)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _grow(self) -> None:
+        self._capacity *= 2
+        for name, col in self._columns.items():
+            grown = np.empty(self._capacity, dtype=col.dtype)
+            grown[:self._count] = col[:self._count]
+            self._columns[name] = grown
+
+    def append(self, seq_num: int, value: Any) -> CaptureSummary:
+        """Summarize ``value`` and append it as a new row."""
+        summary = summarize_value(value)
+        self.append_summary(seq_num, summary)
+        return summary
+
+    def append_summary(self, seq_num: int, summary: CaptureSummary) -> None:
+        """Append a precomputed summary as a new row."""
+        if self._count == self._capacity:
+            self._grow()
+        i = self._count
+        cols = self._columns
+        cols['seq'][i] = seq_num
+        for name in FLOAT_FIELDS:
+            cols[name][i] = getattr(summary, name)
+        cols['nans'][i] = summary.nans
+        cols['size'][i] = summary.size
+        cols['hash'][i] = summary.hash
+        self._count += 1
+
+    def column(self, name: str) -> np.ndarray:
+        """Return a read-only view of a column, trimmed to the row count."""
+        if name not in self._columns:
+            raise KeyError(name)
+        view = self._columns[name][:self._count]
+        view.flags.writeable = False
+        return view
+
+    def row(self, index: int) -> CaptureSummary:
+        """Return the summary stored at ``index``."""
+        if not -self._count <= index < self._count:
+            raise IndexError(index)
+        index %= self._count
+        cols = self._columns
+        return CaptureSummary(
+            **{name: float(cols[name][index]) for name in FLOAT_FIELDS},
+            nans=int(cols['nans'][index]),
+            size=int(cols['size'][index]),
+            hash=int(cols['hash'][index]),
+        )
+
+    def query(self, text: str) -> np.ndarray:
+        """Compile and run a history query; return matching frame indices."""
+        return HistoryQuery.compile(text).run(self)
+
+
+# ── Query language ─────────────────────────────────────────
+
+# Bare metric names and the column they read
+_METRIC_COLUMNS = {
+    'min': 'min',
+    'max': 'max',
+    'mean': 'mean',
+    'rms': 'rms',
+    'energy': 'energy',
+    'absmax': 'absmax',
+    'nans': 'nans',
+    'size': 'size',
+    'hash': 'hash',
+    'seq': 'seq',
+}
+
+# Call forms over the captured value ``x``
+_CALL_COLUMNS = {
+    'min': 'min',
+    'max': 'max',
+    'mean': 'mean',
+    'rms': 'rms',
+    'energy': 'energy',
+    'nans': 'nans',
+    'size': 'size',
+    'len': 'size',
+    'hash': 'hash',
+}
+
+_COMPARE_OPS = {
+    ast.Gt: np.greater,
+    ast.GtE: np.greater_equal,
+    ast.Lt: np.less,
+    ast.LtE: np.less_equal,
+    ast.Eq: np.equal,
+    ast.NotEq: np.not_equal,
+}
+
+_PREFIX_RE = re.compile(
+    r'^\s*(?:(?P<mode>first|last|all)\s+)?'
+    r'(?:frames?\s+(?:where|with)\b|frames?\s*:|where\b|with\b)?\s*',
+    re.IGNORECASE,
+)
+
+_Columns = Callable[[str], np.ndarray]
+
+
+@dataclass(frozen=True)
+class HistoryQuery:
+    """A compiled history query.
+
+    Grammar (Python expression syntax)::
+
+        [first|last|all] [frame[s]] [where|with] <condition>
+
+    where ``<condition>`` combines comparisons with ``and``/``or``/``not``.
+    Operands are numbers, bare metrics (``max``, ``rms``, ``nans``,
+    ``frame`` ...), metric calls on the value (``max(x)``,
+    ``max(abs(x))``, ``rms(x)``), ``nan``/``any(isnan(x))`` and
+    ``changed`` (content hash differs from the previous frame).
+    """
+
+    text: str
+    mode: str
+    _evaluate: Callable[[_Columns, int], np.ndarray]
+
+    @classmethod
+    def compile(cls, text: str) -> 'HistoryQuery':
+        """Parse ``text``; raise ValueError on invalid queries."""
+        if not text or not text.strip():
+            raise ValueError("Empty query")
+        if "__" in text:
+            raise ValueError("Forbidden name: query contains '__'")
+
+        match = _PREFIX_RE.match(text)
+        mode = (match.group('mode') or 'all').lower()
+        condition = text[match.end():].strip()
+        if not condition:
+            raise ValueError("Query has no condition")
+
+        try:
+            tree = ast.parse(condition, mode='eval')
+        except SyntaxError as e:
+            raise ValueError(f"Invalid query syntax: {e.msg}")
+
+        return cls(text=text, mode=mode, _evaluate=_compile_node(tree.body, as_mask=True))
+
+    def mask(self, index: SummaryIndex) -> np.ndarray:
+        """Boolean mask over all frames in ``index``."""
+        n = len(index)
+        result = self._evaluate(index.column, n)
+        return np.broadcast_to(np.asarray(result, dtype=bool), (n,))
+
+    def run(self, index: SummaryIndex) -> np.ndarray:
+        """Return matching frame indices (at most one for first/last)."""
+        hits = np.flatnonzero(self.mask(index))
+        if self.mode == 'first':
+            return hits[:1]
+        if self.mode == 'last':
+            return hits[-1:]
+        return hits
+
+
+def _abs_column(node: ast.AST) -> bool:
+    """True for ``abs(x)``."""
+    return (
+        isinstance(node, ast.Call)
+        and isinstance(node.func, ast.Name)
+        and node.func.id == 'abs'
+        and len(node.args) == 1
+        and isinstance(node.args[0], ast.Name)
+        and node.args[0].id == 'x'
+    )
+
+
+def _compile_call(node: ast.Call) -> Callable[[_Columns, int], Any]:
+    if not isinstance(node.func, ast.Name) or len(node.args) != 1 or node.keywords:
+        raise ValueError("Unsupported call in query")
+    name = node.func.id
+    arg = node.args[0]
+
+    if name in ('any', 'isnan') and (
+        (isinstance(arg, ast.Name) and arg.id == 'x')
+        or (isinstance(arg, ast.Call) and isinstance(arg.func, ast.Name)
+            and arg.func.id == 'isnan')
+    ):
+        return lambda cols, n: cols('nans') > 0
+
+    if name == 'max' and _abs_column(arg):
+        return lambda cols, n: cols('absmax')
+
+    if isinstance(arg, ast.Name) and arg.id == 'x' and name in _CALL_COLUMNS:
+        column = _CALL_COLUMNS[name]
+        return lambda cols, n: cols(column)
+
+    raise ValueError(f"Unsupported metric '{ast.unparse(node)}'")
+
+
+def _compile_node(node: ast.AST, as_mask: bool = False) -> Callable[[_Columns, int], Any]:
+    """Compile an AST node into a function of (column getter, frame count)."""
+    if isinstance(node, ast.BoolOp):
+        parts = [_compile_node(v, as_mask=True) for v in node.values]
+        combine = np.logical_and if isinstance(node.op, ast.And) else np.logical_or
+
+        def _bool(cols, n):
+            result = parts[0](cols, n)
+            for part in parts[1:]:
+                result = combine(result, part(cols, n))
+            return result
+        return _bool
+
+    if isinstance(node, ast.UnaryOp):
+        operand = _compile_node(node.operand, as_mask=isinstance(node.op, ast.Not))
+        if isinstance(node.op, ast.Not):
+            return lambda cols, n: np.logical_not(operand(cols, n))
+        if isinstance(node.op, ast.USub):
+            return lambda cols, n: -operand(cols, n)
+        if isinstance(node.op, ast.UAdd):
+            return operand
+        raise ValueError("Unsupported operator in query")
+
+    if isinstance(node, ast.Compare):
+        left = _compile_node(node.left)
+        steps = []
+        for op, comparator in zip(node.ops, node.comparators):
+            func = _COMPARE_OPS.get(type(op))
+            if func is None:
+                raise ValueError("Unsupported comparison in query")
+            steps.append((func, _compile_node(comparator)))
+
+        def _compare(cols, n):
+            lhs = left(cols, n)
+            result = True
+            for func, right in steps:
+                rhs = right(cols, n)
+                result = np.logical_and(result, func(lhs, rhs))
+                lhs = rhs
+            return result
+        return _compare
+
+    if isinstance(node, ast.BinOp):
+        ops = {
+            ast.Add: np.add, ast.Sub: np.subtract,
+            ast.Mult: np.multiply, ast.Div: np.divide,
+        }
+        func = ops.get(type(node.op))
+        if func is None:
+            raise ValueError("Unsupported operator in query")
+        left, right = _compile_node(node.left), _compile_node(node.right)
+        return lambda cols, n: func(left(cols, n), right(cols, n))
+
+    if isinstance(node, ast.Constant) and isinstance(node.value, (int, float)):
+        value = node.value
+        return lambda cols, n: value
+
+    if isinstance(node, ast.Call):
+        return _compile_call(node)
+
+    if isinstance(node, ast.Name):
+        name = node.id.lower()
+        if name in ('nan', 'nans') and as_mask:
+            return lambda cols, n: cols('nans') > 0
+        if name in ('frame', 'index'):
+            return lambda cols, n: np.arange(n)
+        if name == 'changed':
+            def _changed(cols, n):
+                h = cols('hash')
+                out = np.ones(n, dtype=bool)
+                out[1:] = h[1:] != h[:-1]
+                return out
+            return _changed
+        if name in _METRIC_COLUMNS:
+            column = _METRIC_COLUMNS[name]
+            return lambda cols, n: cols(column)
+        raise ValueError(f"Name {node.id} is not defined")
+
+    raise ValueError(f"Unsupported query expression: {ast.unparse(node)}")
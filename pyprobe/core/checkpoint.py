@@ -0,0 +1,126 @@
+"""
+Fork-based checkpoints (Linux only).
+
+When a run reaches the checkpoint line, the runner forks a snapshot: a
+frozen copy of the process parked just before that line executes. The
+run announces the snapshot to the GUI with DATA_CHECKPOINT before it
+carries on, so the announcement always arrives ahead of the run's own
+DATA_SCRIPT_END. The snapshot then serves resume requests like a zygote,
+forking a child that carries on from the checkpoint. Later runs in the
+same IPC session therefore skip everything the script did before the
+line.
+
+A snapshot keeps running the code it was started with, so it is only
+valid while the script file is unchanged.
+"""
+
+import multiprocessing as mp
+import os
+import signal
+from multiprocessing.connection import Client, Listener
+from pathlib import Path
+from typing import Optional
+
+from .zygote import ForkServer, serve_forks
+from ..ipc.messages import make_checkpoint_msg
+
+# A snapshot the GUI never connects to exits after this long
+SNAPSHOT_CONNECT_TIMEOUT_S = 60
+
+
+def park_snapshot(line: int, ipc) -> bool:
+    """
+    Fork a snapshot of the running script and park it.
+
+    Args:
+        line: Checkpoint line, reported to the GUI
+        ipc: The runner's queue-based IPCChannel
+
+    Returns:
+        False in the run that reached the checkpoint, which just carries on.
+        True in a run resumed from the snapshot: the caller must re-sync
+        with the GUI before the script continues.
+    """
+    # The snapshot inherits a socket that is already listening, so the GUI
+    # can connect as soon as it hears of it. The address is in the Linux
+    # abstract namespace: there is no file to unlink, and closing the run's
+    # copy of the socket leaves the snapshot's open.
+    address = f"\0pyprobe-checkpoint-{os.getpid()}"
+    listener = Listener(address, family='AF_UNIX', authkey=mp.current_process().authkey)
+    # The IPC queues are PipeQueues: a write the run's sender thread has in
+    # progress completes in the run, and the snapshot can send as it is
+    pid = os.fork()
+    if pid != 0:
+        listener.close()
+        ipc.send_data(make_checkpoint_msg(line, address, pid))
+        return False
+
+    # Snapshot: wait for the GUI, then fork a child per resumed run
+    # SIGALRM's default action ends a snapshot nobody connects to
+    signal.alarm(SNAPSHOT_CONNECT_TIMEOUT_S)
+    try:
+        conn = listener.accept()
+    except Exception:
+        os._exit(0)
+    finally:
+        signal.alarm(0)
+        listener.close()
+
+    if serve_forks(conn):
+        return True
+    os._exit(0)
+
+
+class CheckpointSnapshot(ForkServer):
+    """
+    GUI-side handle on a parked snapshot.
+
+    Connecting claims the snapshot; it exits when ``discard()`` is called
+    or the GUI goes away.
+    """
+
+    def __init__(self, script_path: str, line: int, address: str, pid: int):
+        """
+        Raises:
+            OSError: If the snapshot cannot be reached
+        """
+        try:
+            conn = Client(address, family='AF_UNIX', authkey=mp.current_process().authkey)
+        except mp.AuthenticationError as e:
+            raise OSError(f"Checkpoint snapshot at {address} rejected the GUI") from e
+        super().__init__(conn)
+        self.script_path = script_path
+        self.line = line
+        self.pid = pid
+        self._source = self._read_source()
+
+    def _read_source(self) -> Optional[str]:
+        try:
+            return Path(self.script_path).read_text()
+        except OSError:
+            return None
+
+    def is_alive(self) -> bool:
+        # Not our child (the run that forked it is its parent), so probe the pid
+        try:
+            os.kill(self.pid, 0)
+        except ProcessLookupError:
+            return False
+        except PermissionError:
+            pass
+        return True
+
+    def is_stale(self) -> bool:
+        """True if the script no longer matches the code the snapshot runs."""
+        return self._read_source() != self._source
+
+    def _describe(self) -> str:
+        return f"Checkpoint snapshot (line {self.line})"
+
+    def discard(self) -> None:
+        """Stop the snapshot and any run resumed from it."""
+        try:
+            self._conn.send('quit')
+        except (BrokenPipeError, OSError):
+            pass
+        self._conn.close()
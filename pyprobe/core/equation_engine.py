@@ -1,14 +1,38 @@
+import ast
+import importlib
+from types import CodeType, ModuleType
+from typing import Dict, Any, Optional, Set
+
 import numpy as np
-from typing import Dict, Any
+
+
+class _LazyModule:
+    """Stand-in for a module that is imported on first attribute access."""
+
+    def __init__(self, name: str):
+        self._name = name
+        self._module: Optional[ModuleType] = None
+
+    def __getattr__(self, attr: str) -> Any:
+        if self._module is None:
+            self._module = importlib.import_module(self._name)
+        return getattr(self._module, attr)
+
+    def __repr__(self) -> str:
+        return f"<lazy module '{self._name}'>"
+
 
 class EquationEngine:
     """
     Evaluates mathematical expressions on trace data.
     """
+    _CODE_CACHE_SIZE = 256
+
     def __init__(self):
-        # Lazy-import scipy.signal to avoid segfault on macOS ARM64
-        # when PyQt6 is loaded before scipy (e.g. under pytest-qt).
-        import scipy.signal as signal
+        # scipy.signal is imported by the first equation that uses it: it
+        # dominates GUI startup otherwise, and importing it eagerly next to
+        # PyQt6 segfaults on macOS ARM64 (e.g. under pytest-qt).
+        signal = _LazyModule("scipy.signal")
 
         # Restricted global scope for eval
         self.safe_globals = {
@@ -28,20 +52,21 @@ class EquationEngine:
                 if callable(obj):
                     self.safe_globals[name] = obj
 
-    def evaluate(self, expression: str, data: Dict[str, Any]) -> Any:
+        # Built once; data is passed as locals on each evaluation
+        self._globals = {"__builtins__": {}, **self.safe_globals}
+        self._code_cache: Dict[str, CodeType] = {}
+
+    def compile(self, expression: str) -> CodeType:
         """
-        Evaluates the expression using the provided data dictionary.
-        
-        Args:
-            expression: The string expression to evaluate
-            data: Mapping of variable names (tr0, eq0, etc.) to values
-            
-        Returns:
-            The result of the evaluation (usually a numpy array)
-            
+        Compile an expression once so it can be evaluated repeatedly.
+
         Raises:
-            ValueError: If the expression is invalid or contains forbidden operations
+            ValueError: If the expression is empty, forbidden or not valid syntax
         """
+        code = self._code_cache.get(expression)
+        if code is not None:
+            return code
+
         if not expression or not expression.strip():
             raise ValueError("Empty expression")
 
@@ -50,12 +75,51 @@ class EquationEngine:
             raise ValueError("Forbidden name: expression contains '__'")
 
         try:
-            # Evaluate with restricted globals and variable data as locals
-            result = eval(expression, {"__builtins__": {}}, {**self.safe_globals, **data})
-            return result
-        except NameError as e:
-            raise ValueError(f"Name {str(e).split(' ')[1]} is not defined")
+            code = compile(expression.strip(), "<equation>", "eval")
         except SyntaxError as e:
             raise ValueError(f"Invalid expression syntax: {e.msg}")
+
+        if len(self._code_cache) >= self._CODE_CACHE_SIZE:
+            self._code_cache.clear()
+        self._code_cache[expression] = code
+        return code
+
+    def dependencies(self, expression: str) -> Set[str]:
+        """
+        Return the data names (tr0, eq1, ...) an expression reads.
+
+        Names provided by the engine itself (np, abs, fft, ...) are excluded.
+        """
+        tree = ast.parse(expression.strip(), mode="eval")
+        return {
+            node.id for node in ast.walk(tree)
+            if isinstance(node, ast.Name)
+            and isinstance(node.ctx, ast.Load)
+            and node.id not in self.safe_globals
+        }
+
+    def evaluate_code(self, code: CodeType, data: Dict[str, Any]) -> Any:
+        """Evaluate a compiled expression against the data dictionary."""
+        try:
+            # Restricted globals, variable data as locals
+            return eval(code, self._globals, data)
+        except NameError as e:
+            raise ValueError(f"Name {str(e).split(' ')[1]} is not defined")
         except Exception as e:
             raise ValueError(f"Evaluation error: {str(e)}")
+
+    def evaluate(self, expression: str, data: Dict[str, Any]) -> Any:
+        """
+        Evaluates the expression using the provided data dictionary.
+        
+        Args:
+            expression: The string expression to evaluate
+            data: Mapping of variable names (tr0, eq0, etc.) to values
+            
+        Returns:
+            The result of the evaluation (usually a numpy array)
+            
+        Raises:
+            ValueError: If the expression is invalid or contains forbidden operations
+        """
+        return self.evaluate_code(self.compile(expression), data)
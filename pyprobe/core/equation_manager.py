@@ -1,5 +1,8 @@
+import time
+from dataclasses import dataclass, field
 import numpy as np
-from typing import Dict, List, Any, Optional
+from types import CodeType
+from typing import Callable, Dict, List, Any, Optional, Set
 from .equation_engine import EquationEngine
 
 class Equation:
@@ -8,73 +11,265 @@ class Equation:
         self.expression = expression
         self.result: Optional[np.ndarray] = None
         self.error: Optional[str] = None
+        # Compiled form and the data names it reads; set by EquationManager
+        self.code: Optional[CodeType] = None
+        self.dependencies: Set[str] = set()
+        # Wall time of the last evaluation, in milliseconds
+        self.eval_ms: Optional[float] = None
+
+@dataclass(frozen=True)
+class EvaluationStep:
+    """One equation to evaluate; ``code`` None means fail with ``error``."""
+    eq_id: str
+    code: Optional[CodeType]
+    error: Optional[str] = None
+
+@dataclass
+class EvaluationJob:
+    """Equations to evaluate, in order, against a snapshot of their inputs."""
+    generation: int
+    steps: List[EvaluationStep]
+    data: Dict[str, Any]
+
+@dataclass
+class EvaluationResult:
+    """Outcome of running an EvaluationJob (possibly cancelled part-way)."""
+    generation: int
+    values: Dict[str, Any] = field(default_factory=dict)
+    errors: Dict[str, Optional[str]] = field(default_factory=dict)
+    timings_ms: Dict[str, float] = field(default_factory=dict)
+    completed: List[str] = field(default_factory=list)
+    cancelled: bool = False
 
 class EquationManager:
     """
     Manages a collection of equations and their evaluation.
+
+    Expressions are compiled once when they change. Their dependencies form
+    a DAG that is evaluated in topological order, and only equations whose
+    inputs changed since the previous call are re-evaluated.
     """
     def __init__(self):
         self.engine = EquationEngine()
         self.equations: Dict[str, Equation] = {}
         self._next_eq_idx = 0
 
+        # Equations to evaluate on the next call regardless of inputs,
+        # mapped to the generation that last marked them
+        self._dirty: Dict[str, int] = {}
+        self._generation = 0
+        # Names removed since the last call (their dependents must re-run)
+        self._removed: Set[str] = set()
+        # Input objects seen by the last call, for identity-based change detection
+        self._last_inputs: Dict[str, Any] = {}
+        # Cached topological order and cyclic equations; None when stale
+        self._order: Optional[List[str]] = None
+        self._cyclic: Set[str] = set()
+
     def add_equation(self, expression: str = "") -> Equation:
         eq_id = f"eq{self._next_eq_idx}"
         self._next_eq_idx += 1
         eq = Equation(eq_id, expression)
         self.equations[eq_id] = eq
+        self._compile(eq)
         return eq
 
     def remove_equation(self, eq_id: str):
         if eq_id in self.equations:
             del self.equations[eq_id]
+            self._dirty.pop(eq_id, None)
+            self._removed.add(eq_id)
+            self._order = None
 
     def update_expression(self, eq_id: str, expression: str):
         if eq_id in self.equations:
             self.equations[eq_id].expression = expression
             self.equations[eq_id].result = None
             self.equations[eq_id].error = None
+            self._compile(self.equations[eq_id])
+
+    def _compile(self, eq: Equation) -> None:
+        """Compile the expression and extract its dependencies."""
+        eq.code = None
+        eq.dependencies = set()
+        self._dirty[eq.id] = self._next_generation()
+        self._order = None
+        if not eq.expression.strip():
+            return
+        try:
+            eq.code = self.engine.compile(eq.expression)
+            eq.dependencies = self.engine.dependencies(eq.expression)
+        except (ValueError, SyntaxError) as e:
+            eq.error = str(e)
+
+    def _topological_order(self) -> List[str]:
+        """Order equations so each comes after the equations it reads."""
+        if self._order is not None:
+            return self._order
+
+        graph = {
+            eq_id: {d for d in eq.dependencies if d in self.equations}
+            for eq_id, eq in self.equations.items()
+        }
+
+        def kahn(nodes: Set[str]) -> List[str]:
+            pending = {n: graph[n] & nodes for n in nodes}
+            order = []
+            ready = sorted(n for n, deps in pending.items() if not deps)
+            while ready:
+                node = ready.pop(0)
+                order.append(node)
+                del pending[node]
+                for other, deps in pending.items():
+                    if node in deps:
+                        deps.discard(node)
+                        if not deps:
+                            ready.append(other)
+            return order
+
+        order = kahn(set(graph))
+        remaining = set(graph) - set(order)
+
+        # Separate equations on a cycle from those merely downstream of one
+        def on_cycle(start: str) -> bool:
+            stack, seen = list(graph[start]), set()
+            while stack:
+                node = stack.pop()
+                if node == start:
+                    return True
+                if node not in seen:
+                    seen.add(node)
+                    stack.extend(graph[node])
+            return False
+
+        self._cyclic = {n for n in remaining if on_cycle(n)}
+        # Cycle members keep no stale results from before the cycle formed
+        for eq_id in self._cyclic:
+            self._dirty[eq_id] = self._next_generation()
+        # Downstream equations still run (and fail on the missing input)
+        self._order = order + kahn(remaining - self._cyclic)
+        return self._order
+
+    def _next_generation(self) -> int:
+        self._generation += 1
+        return self._generation
+
+    def plan(self, trace_data: Dict[str, Any]) -> Optional[EvaluationJob]:
+        """
+        Decide which equations must be re-evaluated and snapshot their inputs.
+
+        A trace counts as changed when ``trace_data`` holds a different
+        object for it than on the previous call. Must be called from the
+        thread that owns the manager; the returned job can run anywhere.
+
+        Returns:
+            The job to run, or None if nothing needs evaluating.
+        """
+        changed = set(self._removed)
+        self._removed.clear()
+        for name, value in trace_data.items():
+            if self._last_inputs.get(name, self) is not value:
+                changed.add(name)
+        for name in self._last_inputs.keys() - trace_data.keys():
+            changed.add(name)
+        self._last_inputs = dict(trace_data)
+
+        order = self._topological_order()
+        if not changed and not self._dirty:
+            return None
 
-    def evaluate_all(self, trace_data: Dict[str, Any]):
+        generation = self._next_generation()
+        steps: List[EvaluationStep] = []
+
+        for eq_id in sorted(self._cyclic):
+            if eq_id in self._dirty:
+                steps.append(EvaluationStep(eq_id, None, f"Circular dependency involving {eq_id}"))
+                changed.add(eq_id)
+
+        for eq_id in order:
+            eq = self.equations[eq_id]
+            if eq_id not in self._dirty and not (eq.dependencies & changed):
+                continue
+            changed.add(eq_id)
+            # Empty or invalid expression: keep any compile error
+            steps.append(EvaluationStep(eq_id, eq.code, eq.error if eq.code is None else None))
+
+        if not steps:
+            return None
+        # Stay dirty until a result for this generation is applied
+        for step in steps:
+            self._dirty[step.eq_id] = generation
+
+        # Results of equations that are not re-evaluated stay visible as inputs
+        to_run = {step.eq_id for step in steps}
+        data = dict(trace_data)
+        for eq in self.equations.values():
+            if eq.result is not None and eq.id not in to_run:
+                data[eq.id] = eq.result
+
+        return EvaluationJob(generation=generation, steps=steps, data=data)
+
+    def run_job(self, job: EvaluationJob,
+                is_cancelled: Callable[[], bool] = lambda: False) -> EvaluationResult:
         """
-        Evaluates all equations, handling dependencies.
+        Evaluate a planned job. Safe to call from a worker thread.
+
+        ``is_cancelled`` is checked between equations; a cancelled job
+        returns the equations it completed so far.
         """
-        # Create a combined data dict with traces
-        data = trace_data.copy()
-        
-        # Simple iterative evaluation to handle dependencies
-        # In a real app, we might want a DAG, but for now we'll just 
-        # iterate a few times or sort them.
-        # Since eq<n> only depends on lower or higher eq<m>, 
-        # we can just try to evaluate multiple times until stable or max iterations.
-        
-        to_evaluate = list(self.equations.values())
-        max_iters = len(to_evaluate) + 1
-        
-        for _ in range(max_iters):
-            changed = False
-            for eq in to_evaluate:
-                if not eq.expression.strip():
-                    continue
-                    
+        result = EvaluationResult(generation=job.generation)
+        data = dict(job.data)
+        for step in job.steps:
+            if is_cancelled():
+                result.cancelled = True
+                break
+            start = time.perf_counter()
+            value, error = None, step.error
+            if step.code is not None:
                 try:
-                    # Try to evaluate
-                    new_result = self.engine.evaluate(eq.expression, data)
-                    
-                    # Check if result changed (approximately)
-                    if eq.result is None or not np.array_equal(new_result, eq.result):
-                        eq.result = new_result
-                        eq.error = None
-                        data[eq.id] = eq.result
-                        changed = True
+                    value = self.engine.evaluate_code(step.code, data)
+                    data[step.eq_id] = value
                 except Exception as e:
-                    # If it fails, it might be due to a missing dependency that will be 
-                    # available in a later iteration.
-                    eq.error = str(e)
-                    eq.result = None
-            
-            if not changed:
-                break
+                    error = str(e)
+            result.values[step.eq_id] = value
+            result.errors[step.eq_id] = error
+            result.timings_ms[step.eq_id] = (time.perf_counter() - start) * 1000.0
+            result.completed.append(step.eq_id)
+        return result
+
+    def apply(self, result: EvaluationResult) -> Set[str]:
+        """
+        Store a job's results on the equations.
+
+        Equations edited or removed after the job was planned are skipped
+        and stay dirty.
+
+        Returns:
+            IDs of the equations that were updated.
+        """
+        applied: Set[str] = set()
+        for eq_id in result.completed:
+            eq = self.equations.get(eq_id)
+            if eq is None or self._dirty.get(eq_id, 0) > result.generation:
+                continue
+            eq.result = result.values[eq_id]
+            eq.error = result.errors[eq_id]
+            eq.eval_ms = result.timings_ms[eq_id]
+            self._dirty.pop(eq_id, None)
+            applied.add(eq_id)
+        return applied
+
+    def evaluate_all(self, trace_data: Dict[str, Any]) -> Set[str]:
+        """
+        Synchronously evaluates equations whose inputs changed, in dependency order.
+
+        Returns:
+            IDs of the equations that were re-evaluated.
+        """
+        job = self.plan(trace_data)
+        if job is None:
+            return set()
+        return self.apply(self.run_job(job))
 
     def equation_entries(self) -> list:
         """Return a list of EquationEntry for each equation."""
@@ -0,0 +1,62 @@
+"""
+.pprec capture recordings.
+
+A recording is the capture stream as the CaptureBroker encodes it: wire
+protocol frames (one DATA_PROBE_VALUE message per record) written back
+to back. Each frame starts with its magic and length, so a recording is
+read by walking the frames.
+"""
+
+import struct
+import threading
+from typing import Iterator
+
+from .capture_record import CaptureRecord
+from .broker import decode_record
+from ..ipc.wire_protocol import MAGIC, ProtocolError
+
+_HEADER_LEN = len(MAGIC) + 4
+
+
+class PprecRecorder:
+    """Frame subscriber that appends every frame it receives to a file."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._file = open(path, 'wb')
+
+    def __call__(self, frame: bytes) -> None:
+        with self._lock:
+            if self._file is not None:
+                self._file.write(frame)
+
+    def close(self) -> None:
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+
+def read_pprec(path: str) -> Iterator[CaptureRecord]:
+    """
+    Yield the records of a .pprec recording in the order they were captured.
+
+    A frame cut short at the end of the file (e.g. the GUI was killed
+    mid-write) ends the recording.
+
+    Raises:
+        ProtocolError: If the file is not a recording
+    """
+    with open(path, 'rb') as f:
+        while True:
+            header = f.read(_HEADER_LEN)
+            if len(header) < _HEADER_LEN:
+                return
+            if header[:len(MAGIC)] != MAGIC:
+                raise ProtocolError(f"Invalid magic in {path}: {header[:len(MAGIC)]!r}")
+            (length,) = struct.unpack('>I', header[len(MAGIC):])
+            body = f.read(length)
+            if len(body) < length:
+                return
+            yield decode_record(header + body)
@@ -10,18 +10,26 @@ import threading
 import traceback
 import time
 from pathlib import Path
-from typing import List, Optional, Set
-import multiprocessing as mp
+from types import CodeType
+from typing import Any, Dict, List, Optional, Set
 
 from .tracer import VariableTracer, WatchConfig, ThrottleStrategy, CapturedVariable
 from .anchor import ProbeAnchor
 from .sequence import SequenceGenerator
+from .thread_buffers import ThreadBuffers
+from .checkpoint import park_snapshot
+from .sweep import compile_with_constants
 from ..ipc.channels import IPCChannel
+from ..ipc.pipe_queue import PipeQueue
 from ..ipc.messages import (
     Message, MessageType, make_variable_data_msg, make_exception_msg,
     make_probe_value_msg, make_probe_value_batch_msg
 )
 
+# Captures a traced thread may buffer before it sends them itself (and so
+# waits on the IPC queue like a single-threaded run would)
+_MAX_THREAD_BUFFERED = 256
+
 
 class ScriptRunner:
     """
@@ -40,7 +48,9 @@ class ScriptRunner:
         script_path: str,
         ipc_channel: IPCChannel,
         script_args: Optional[list] = None,
-        initial_watches: Optional[List[str]] = None
+        initial_watches: Optional[List[str]] = None,
+        code: Optional[CodeType] = None,
+        constants: Optional[Dict[str, Any]] = None
     ):
         """
         Args:
@@ -48,11 +58,17 @@ class ScriptRunner:
             ipc_channel: IPC channel for communication with GUI
             script_args: Optional arguments to pass to the script
             initial_watches: Optional list of variable names to watch from start
+            code: Optional precompiled script (e.g. cached by the zygote);
+                the script file is compiled when omitted
+            constants: Optional module-level constants to override when
+                compiling the script (parameter sweeps)
         """
         self._script_path = Path(script_path).resolve()
         self._ipc = ipc_channel
         self._script_args = script_args or []
         self._initial_watches = initial_watches or []
+        self._code = code
+        self._constants = constants or {}
 
         self._tracer: Optional[VariableTracer] = None
         self._running = False
@@ -66,6 +82,15 @@ class ScriptRunner:
         # Sequence generator for probe captures
         self._seq_gen = SequenceGenerator()
 
+        # Probe messages buffered per traced thread; the sender thread
+        # merges them into capture order. Other messages (stdout/stderr,
+        # exceptions, script start/end) still go to the data queue directly,
+        # so they are not ordered against probes still in the buffers.
+        self._send_buffers = ThreadBuffers()
+        self._send_lock = threading.Lock()
+        self._sender_thread: Optional[threading.Thread] = None
+        self._sending = False
+
     def run(self) -> int:
         """
         Execute the target script with tracing.
@@ -98,6 +123,7 @@ class ScriptRunner:
 
         # Notify GUI that script is starting
         self._ipc.send_data(Message(msg_type=MessageType.DATA_SCRIPT_START))
+        self._start_sender()
 
         try:
             # Capture stdout/stderr
@@ -126,24 +152,20 @@ class ScriptRunner:
 
             # Wait for START command from GUI to ensure initial probes are registered
             # This prevents race condition where script runs before probes are added
-            while True:
-                msg = self._ipc.receive_command(timeout=0.01)
-                if msg:
-                    if msg.msg_type == MessageType.CMD_START:
-                        break
-                    self._handle_command(msg)
-                
-                # Check if parent process died
-                # (Optional safety check, but IPC channel usually handles EOF)
+            self._wait_for_start()
 
             # Start command listener thread (NOW safe to start)
             if not self._cmd_thread.is_alive():
                 self._cmd_thread.start()
 
             # Execute the script
-            with open(self._script_path, 'r') as f:
-                code = compile(f.read(), str(self._script_path), 'exec')
-                exec(code, script_globals)
+            code = self._code
+            if code is None:
+                with open(self._script_path, 'r') as f:
+                    code = compile_with_constants(
+                        f.read(), str(self._script_path), self._constants
+                    )
+            exec(code, script_globals)
 
             return 0
 
@@ -159,6 +181,7 @@ class ScriptRunner:
             # Cleanup
             if self._tracer:
                 self._tracer.stop()
+            self._stop_sender()
             self._running = False
             sys.stdout, sys.stderr = old_stdout, old_stderr
             sys.argv = old_argv
@@ -179,6 +202,41 @@ class ScriptRunner:
             # Wait a bit to ensure IPC buffer flushes before process exit
             time.sleep(0.5)
 
+    def _wait_for_start(self) -> None:
+        """Handle commands from the GUI until it sends CMD_START."""
+        while True:
+            msg = self._ipc.receive_command(timeout=0.01)
+            if msg:
+                if msg.msg_type == MessageType.CMD_START:
+                    break
+                self._handle_command(msg)
+
+            # Check if parent process died
+            # (Optional safety check, but IPC channel usually handles EOF)
+
+    def _on_checkpoint(self, line: int) -> None:
+        """Park a snapshot at the checkpoint line (called from the tracer)."""
+        # Captures made so far belong to this run, not to the snapshot's
+        self._send_buffered()
+        if not park_snapshot(line, self._ipc):
+            return
+
+        # The sender thread did not survive the fork, and may have held
+        # these locks when it happened
+        self._send_buffers = ThreadBuffers()
+        self._send_lock = threading.Lock()
+        self._start_sender()
+
+        # Resumed from the snapshot: this is a new run, so take the GUI's
+        # current probes and wait for its START like run() does
+        self._tracer.clear_anchor_watches()
+        self._paused = False
+        self._pause_event.set()
+        self._ipc.send_data(Message(msg_type=MessageType.DATA_SCRIPT_START))
+        self._wait_for_start()
+        self._cmd_thread = threading.Thread(target=self._command_listener, daemon=True)
+        self._cmd_thread.start()
+
     def _on_variable_captured(self, captured: CapturedVariable) -> None:
         """Callback when tracer captures a variable."""
         # Check if paused
@@ -236,13 +294,38 @@ class ScriptRunner:
                 self._seq_gen.next(),
                 timestamp,
                 logical_order,
+                captured.thread_id,
             ))
 
         msg = make_probe_value_batch_msg(probes)
-        self._ipc.send_data(msg)
+        if self._send_buffers.append(probes[0][4], msg) > _MAX_THREAD_BUFFERED:
+            self._send_buffered()
+
+    def _start_sender(self) -> None:
+        self._sending = True
+        self._sender_thread = threading.Thread(target=self._sender_loop, daemon=True)
+        self._sender_thread.start()
+
+    def _stop_sender(self) -> None:
+        """Stop the sender thread and send whatever it left buffered."""
+        self._sending = False
+        self._send_buffered()
+
+    def _sender_loop(self) -> None:
+        """Send the captures traced threads buffer, in capture order."""
+        sys.settrace(None)  # Started while tracing; not part of the script
+        while self._sending:
+            self._send_buffers.wait(timeout=0.1)
+            self._send_buffered()
+
+    def _send_buffered(self) -> None:
+        with self._send_lock:
+            for msg in self._send_buffers.drain():
+                self._ipc.send_data(msg)
 
     def _command_listener(self) -> None:
         """Listen for commands from GUI in a separate thread."""
+        sys.settrace(None)  # Started while tracing; not part of the script
         while self._running:
             msg = self._ipc.receive_command(timeout=0.1)
             if msg is None:
@@ -311,6 +394,12 @@ class ScriptRunner:
             anchor = ProbeAnchor.from_dict(msg.payload['anchor'])
             self._tracer.remove_anchor_watch(anchor)
 
+        elif msg.msg_type == MessageType.CMD_SET_CHECKPOINT:
+            line = msg.payload['line']
+            self._tracer.set_checkpoint(
+                str(self._script_path), line, lambda: self._on_checkpoint(line)
+            )
+
     def _on_stdout(self, text: str) -> None:
         """Send stdout to GUI."""
         self._ipc.send_data(Message(
@@ -327,6 +416,11 @@ class ScriptRunner:
 
     def _send_exception(self, exc: Exception) -> None:
         """Send exception info to GUI."""
+        # Data captured before the exception goes first, including the
+        # captures stop() flushes; nothing traced after it can follow
+        if self._tracer:
+            self._tracer.stop()
+        self._send_buffered()
         msg = make_exception_msg(
             exc_type=type(exc).__name__,
             message=str(exc),
@@ -353,35 +447,28 @@ class _TeeWriter:
 
 def run_script_subprocess(
     script_path: str,
-    cmd_queue: mp.Queue,
-    data_queue: mp.Queue,
-    initial_watches: Optional[list] = None
+    cmd_queue: PipeQueue,
+    data_queue: PipeQueue,
+    initial_watches: Optional[list] = None,
+    code: Optional[CodeType] = None,
+    script_args: Optional[list] = None,
+    constants: Optional[dict] = None
 ):
     """
     Entry point for the subprocess.
     Called via multiprocessing.Process(target=run_script_subprocess, ...)
+    or in a child forked by the tracer zygote, which passes its cached code.
+    Sweep runs pass their script arguments and constant overrides.
     """
-    ipc = IPCChannel(is_gui_side=False)
-    # Replace queues with the ones passed from parent
-    ipc._command_queue = cmd_queue
-    ipc._data_queue = data_queue
+    ipc = IPCChannel(is_gui_side=False, command_queue=cmd_queue, data_queue=data_queue)
 
-    runner = ScriptRunner(script_path, ipc, initial_watches=initial_watches)
+    runner = ScriptRunner(
+        script_path, ipc, script_args=script_args,
+        initial_watches=initial_watches, code=code, constants=constants
+    )
     exit_code = runner.run()
 
-    # CRITICAL: Give the queue's feeder thread time to send DATA_SCRIPT_END
-    # before we call os._exit(). The feeder thread runs in background and
-    # os._exit() terminates immediately, potentially losing queued messages.
-    import time
-    time.sleep(0.5)  # 500ms should be enough for the feeder thread even on slow CI
-    
-    # Cancel join threads to prevent hang on exit
-    try:
-        cmd_queue.cancel_join_thread()
-        data_queue.cancel_join_thread()
-    except Exception:
-        pass
-
-    # Use os._exit() for immediate termination without waiting for threads
+    # PipeQueue.put() has already written DATA_SCRIPT_END to the pipe, so
+    # nothing is lost here. Use os._exit() for immediate termination without waiting for threads
     os._exit(exit_code)
 
@@ -1,18 +1,16 @@
 """Thread-safe monotonic sequence generator."""
 
-import threading
+import itertools
 
 
 class SequenceGenerator:
     """Generates monotonically increasing integers."""
 
     def __init__(self, start: int = 0) -> None:
-        self._lock = threading.Lock()
-        self._next = start
+        # count.__next__ is a single C call, atomic under the GIL, so
+        # threads capturing at once do not queue up on a lock here
+        self._counter = itertools.count(start)
 
     def next(self) -> int:
         """Return the next sequence number."""
-        with self._lock:
-            current = self._next
-            self._next += 1
-            return current
+        return next(self._counter)
@@ -0,0 +1,121 @@
+"""
+Parameter sweeps: one traced run of the script per point of a grid.
+
+A grid axis either overrides a module-level constant of the script
+(``NAME=v1,v2,...``) or lists whole argument strings for the script, one
+per value. Constant overrides replace the value of the script's top-level
+``NAME = ...`` assignment in its AST, so line numbers, and with them probe
+anchors, stay the same in every run.
+"""
+
+import ast
+import itertools
+import shlex
+from dataclasses import dataclass
+from types import CodeType
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+
+@dataclass(frozen=True)
+class SweepPoint:
+    """One run of a sweep: constant overrides and script arguments."""
+    constants: Tuple[Tuple[str, Any], ...] = ()
+    args: Tuple[str, ...] = ()
+
+    @property
+    def label(self) -> str:
+        """Short description of the point, e.g. ``SNR_DB=3, --mod qpsk``."""
+        parts = [f"{name}={value!r}" for name, value in self.constants]
+        if self.args:
+            parts.append(shlex.join(self.args))
+        return ", ".join(parts) or "defaults"
+
+
+def parse_constant_axis(spec: str) -> Tuple[str, List[Any]]:
+    """
+    Parse ``NAME=v1,v2,...`` into the constant's name and its values.
+
+    Values are Python literals; if the list is not valid Python (e.g.
+    ``MOD=qpsk,16qam``) each comma-separated item is taken as a string.
+
+    Raises:
+        ValueError: If the spec has no name or no values
+    """
+    name, sep, values = spec.partition("=")
+    name = name.strip()
+    if not sep or not name.isidentifier():
+        raise ValueError(f"Sweep axis must look like NAME=v1,v2: {spec!r}")
+    try:
+        parsed = list(ast.literal_eval(f"({values},)"))
+    except (ValueError, SyntaxError):
+        parsed = [v.strip() for v in values.split(",") if v.strip()]
+    if not parsed:
+        raise ValueError(f"Sweep axis {name} has no values")
+    return name, parsed
+
+
+def build_grid(
+    constant_specs: Sequence[str] = (),
+    arg_specs: Sequence[str] = (),
+) -> List[SweepPoint]:
+    """
+    Cartesian product of every constant axis and the argument strings.
+
+    Args:
+        constant_specs: ``NAME=v1,v2,...`` axes
+        arg_specs: Argument strings for the script, one run each
+
+    Returns:
+        One SweepPoint per combination (empty if no axis was given).
+    """
+    axes = [parse_constant_axis(spec) for spec in constant_specs]
+    names = [name for name, _ in axes]
+    arg_lists = [tuple(shlex.split(spec)) for spec in arg_specs] or [()]
+    if not axes and not arg_specs:
+        return []
+
+    points = []
+    for values in itertools.product(*(values for _, values in axes)):
+        for args in arg_lists:
+            points.append(SweepPoint(tuple(zip(names, values)), args))
+    return points
+
+
+def _literal_node(value: Any, at: ast.AST) -> ast.expr:
+    """AST for ``value`` placed at ``at``'s location."""
+    node = ast.parse(repr(value), mode="eval").body
+    for child in ast.walk(node):
+        ast.copy_location(child, at)
+    return node
+
+
+def compile_with_constants(
+    source: str,
+    filename: str,
+    constants: Optional[Dict[str, Any]] = None,
+) -> CodeType:
+    """
+    Compile ``source`` with its top-level assignments to ``constants`` replaced.
+
+    Raises:
+        ValueError: If a constant has no top-level assignment to override
+        SyntaxError: If the source does not parse
+    """
+    constants = constants or {}
+    tree = ast.parse(source, filename)
+    missing = set(constants)
+    for node in tree.body:
+        if isinstance(node, ast.Assign) and len(node.targets) == 1:
+            target = node.targets[0]
+        elif isinstance(node, ast.AnnAssign) and node.value is not None:
+            target = node.target
+        else:
+            continue
+        if isinstance(target, ast.Name) and target.id in constants:
+            node.value = _literal_node(constants[target.id], node.value)
+            missing.discard(target.id)
+    if missing:
+        raise ValueError(
+            f"No top-level assignment to {', '.join(sorted(missing))} in {filename}"
+        )
+    return compile(tree, filename, "exec")
@@ -0,0 +1,84 @@
+"""
+Per-thread send buffers for captures from multi-threaded scripts.
+
+Each traced thread appends to its own deque, so threads capturing at
+the same time do not contend on a shared lock or on the IPC queue. A
+single sender drains every buffer and merges the items back into
+capture (sequence number) order before sending them.
+"""
+
+import heapq
+import threading
+from collections import deque
+from operator import itemgetter
+from typing import Any, List, Tuple
+
+
+class ThreadBuffers:
+    """Lock-free per-thread append buffers with a merging ``drain()``."""
+
+    def __init__(self) -> None:
+        self._local = threading.local()
+        # (owning thread, its buffer); the lock only guards registration
+        self._buffers: List[Tuple[threading.Thread, deque]] = []
+        self._register_lock = threading.Lock()
+        self._ready = threading.Event()
+
+    def append(self, seq_num: int, item: Any) -> int:
+        """
+        Buffer ``item`` for the calling thread.
+
+        Returns:
+            The number of items now buffered by the calling thread
+        """
+        try:
+            buffer = self._local.buffer
+        except AttributeError:
+            buffer = self._register()
+        buffer.append((seq_num, item))
+        # Event.set() takes a lock; skip it while a wake-up is already pending
+        if not self._ready.is_set():
+            self._ready.set()
+        return len(buffer)
+
+    def _register(self) -> deque:
+        buffer = deque()
+        self._local.buffer = buffer
+        with self._register_lock:
+            self._buffers.append((threading.current_thread(), buffer))
+        return buffer
+
+    def wait(self, timeout: float) -> bool:
+        """Wait until an item may have been appended since the last call."""
+        ready = self._ready.wait(timeout)
+        self._ready.clear()
+        return ready
+
+    def drain(self) -> List[Any]:
+        """Take every buffered item, merged across threads in sequence order."""
+        with self._register_lock:
+            buffers = list(self._buffers)
+        runs = []
+        finished = set()
+        for thread, buffer in buffers:
+            # Checked before draining: a thread that had already ended
+            # cannot append after the drain, so its buffer can be dropped
+            if not thread.is_alive():
+                finished.add(id(buffer))
+            run = []
+            while True:
+                try:
+                    run.append(buffer.popleft())
+                except IndexError:
+                    break
+            if run:
+                runs.append(run)
+        if finished:
+            with self._register_lock:
+                self._buffers = [b for b in self._buffers if id(b[1]) not in finished]
+
+        if not runs:
+            return []
+        if len(runs) == 1:
+            return [item for _seq, item in runs[0]]
+        return [item for _seq, item in heapq.merge(*runs, key=itemgetter(0))]
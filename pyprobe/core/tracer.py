@@ -4,6 +4,7 @@ with careful attention to minimizing overhead in tight loops.
 """
 
 import sys
+import threading
 import time
 from typing import Dict, List, Set, Optional, Any, Callable, Tuple
 from dataclasses import dataclass, field
@@ -18,7 +19,7 @@ from .data_classifier import (
 )
 from .anchor import ProbeAnchor
 from .anchor_matcher import AnchorMatcher
-from .capture_manager import CaptureManager
+from .capture_manager import CaptureManager, current_thread_id
 from .capture_record import CaptureRecord
 from pyprobe.logging import trace_print
 
@@ -57,6 +58,7 @@ class CapturedVariable:
     source_file: str
     line_number: int
     function_name: str
+    thread_id: int = 0  # current_thread_id() of the capturing thread
 
 
 class VariableTracer:
@@ -66,6 +68,9 @@ class VariableTracer:
     Design decisions for minimizing overhead:
     1. Early exit in trace function for non-watched files/functions
     2. Anchor-based matching for O(1) lookup
+
+    Threads the script starts after ``start()`` are traced too. Capture
+    state is kept per thread, and callbacks run on the capturing thread.
     """
 
     def __init__(
@@ -110,24 +115,33 @@ class VariableTracer:
         
         # Capture manager for ordered captures
         self._capture_manager = CaptureManager()
-        self._last_frame = None
+        # Thread id -> frame of the last line event that thread traced
+        self._last_frames: Dict[int, Any] = {}
+
+        # Checkpoint: (filename, line) and the callback to run there once
+        self._checkpoint: Optional[Tuple[str, int]] = None
+        self._checkpoint_callback: Optional[Callable[[], None]] = None
 
     def stop(self) -> None:
         """Disable tracing and flush any pending LHS captures."""
-        if self._enabled and self._last_frame is not None:
-            # Flush any captures that were pending assignment on the very last line executed
-            try:
-                flushed = self._capture_manager.flush_all(
-                    resolve_value=lambda anchor: self._resolve_anchor_value(self._last_frame, anchor)
-                )
-                if flushed:
-                    self._send_record_batch(flushed)
-            except Exception as e:
-                print(f"[TRACER] Warn: Failed to flush pending captures on stop: {e}", file=sys.stderr)
+        if self._enabled:
+            # Flush any captures that were pending assignment on the very
+            # last line each thread executed
+            for thread_id, frame in list(self._last_frames.items()):
+                try:
+                    flushed = self._capture_manager.flush_all(
+                        resolve_value=lambda anchor, frame=frame: self._resolve_anchor_value(frame, anchor),
+                        thread_id=thread_id,
+                    )
+                    if flushed:
+                        self._send_record_batch(flushed)
+                except Exception as e:
+                    print(f"[TRACER] Warn: Failed to flush pending captures on stop: {e}", file=sys.stderr)
 
         self._enabled = False
+        threading.settrace(None)
         sys.settrace(None)
-        self._last_frame = None
+        self._last_frames.clear()
 
     def _serialize_value(self, value: Any) -> Any:
         """
@@ -210,6 +224,19 @@ class VariableTracer:
         self._anchor_matcher.remove(anchor)
         self._anchor_watches.pop(anchor, None)
 
+    def set_checkpoint(self, filename: str, line: int, callback: Callable[[], None]) -> None:
+        """Call ``callback`` the first time execution reaches ``filename:line``.
+
+        The callback runs before the line executes and before its captures.
+        """
+        self._checkpoint = (filename, line)
+        self._checkpoint_callback = callback
+
+    def clear_anchor_watches(self) -> None:
+        """Remove every anchor watch (e.g. before the GUI re-sends its probes)."""
+        for anchor in list(self._anchor_watches):
+            self.remove_anchor_watch(anchor)
+
     def _trace_func(self, frame, event: str, arg) -> Optional[Callable]:
         import traceback
         try:
@@ -241,9 +268,16 @@ class VariableTracer:
 
         # Only process 'line' events for new matching
         if event != 'line':
+            if event == 'return':
+                # Its deferred captures were flushed above; don't keep the
+                # frame (and its locals) alive after it returns, e.g. once
+                # a worker thread finishes
+                thread_id = current_thread_id()
+                if self._last_frames.get(thread_id) is frame:
+                    self._last_frames.pop(thread_id, None)
             return self._trace_func
 
-        self._last_frame = frame
+        self._last_frames[current_thread_id()] = frame
 
         # Fast file filter
         code = frame.f_code
@@ -253,6 +287,13 @@ class VariableTracer:
         if filename.startswith(self._skip_prefixes):
             return self._trace_func
 
+        if (self._checkpoint is not None and self._checkpoint == (filename, frame.f_lineno)
+                and threading.current_thread() is threading.main_thread()):
+            # Snapshots fork the process, which only carries the forking
+            # thread along, so only the main thread parks one
+            callback, self._checkpoint = self._checkpoint_callback, None
+            callback()
+
         # Fast check: does this file have any anchors?
         if not self._anchor_matcher.has_file(filename):
             return self._trace_func
@@ -369,6 +410,7 @@ class VariableTracer:
             source_file=record.anchor.file,
             line_number=record.anchor.line,
             function_name=record.anchor.func,
+            thread_id=record.thread_id,
         )
 
     def _resolve_anchor_value(
@@ -401,8 +443,10 @@ class VariableTracer:
             return None
 
     def start(self) -> None:
-        """Start tracing with anchor-based matching."""
+        """Start tracing with anchor-based matching, in this thread and
+        every thread started from now on."""
         self._enabled = True
+        threading.settrace(self._trace_func)
         sys.settrace(self._trace_func)
 
     # Alias for backwards compatibility
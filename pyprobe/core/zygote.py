@@ -0,0 +1,369 @@
+"""
+Warm, pre-forked parent for tracer runs (Linux only).
+
+Starting a run used to cost a fresh interpreter's worth of imports (numpy,
+scipy, the script's libraries) plus compiling the script. A zygote pays
+that once per loop-mode IPC session: it is handed the session's queues,
+imports the script's third-party modules, compiles the script, and then
+forks one child per run. Children inherit the queues, the imports and
+the code object, so loop-mode iterations start in milliseconds.
+
+The zygote is started from multiprocessing's forkserver, a clean
+single-threaded process, not forked from the GUI: a fork copies only
+the calling thread, and the GUI's other threads (broker, session reader,
+render and equation workers) may hold locks at that moment.
+
+Modules that live next to the script are not preloaded: they may be
+edited between runs, and importing them would run user code in the
+zygote. The compiled script is refreshed whenever the file changes.
+"""
+
+import ast
+from abc import ABC, abstractmethod
+import importlib
+import importlib.util
+import multiprocessing as mp
+import os
+import signal
+import subprocess
+import sys
+import time
+from pathlib import Path
+from types import CodeType
+from typing import Dict, List, Optional, Tuple
+
+from pyprobe.logging import get_logger
+
+logger = get_logger(__name__)
+
+# How often the zygote checks for finished children between requests
+_REAP_INTERVAL_S = 0.05
+
+
+def zygote_supported() -> bool:
+    """True where runs can be forked from a zygote."""
+    return sys.platform.startswith('linux') and hasattr(os, 'fork')
+
+
+def script_imports(script_path: str) -> List[str]:
+    """
+    Top-level packages imported by ``script_path`` that do not live in its
+    directory (stdlib and installed packages), in first-use order.
+    """
+    path = Path(script_path).resolve()
+    try:
+        tree = ast.parse(path.read_text(), str(path))
+    except (OSError, SyntaxError, ValueError):
+        return []
+
+    names: List[str] = []
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            candidates = [alias.name for alias in node.names]
+        elif isinstance(node, ast.ImportFrom) and node.level == 0 and node.module:
+            candidates = [node.module]
+        else:
+            continue
+        for name in candidates:
+            top = name.split('.')[0]
+            if top not in names:
+                names.append(top)
+
+    script_dir = path.parent
+    external = []
+    for name in names:
+        try:
+            spec = importlib.util.find_spec(name)
+        except (ImportError, ValueError):
+            continue
+        origin = spec.origin if spec else None
+        if spec is None or (origin and Path(origin).resolve().is_relative_to(script_dir)):
+            continue
+        external.append(name)
+    return external
+
+
+def preload_imports(script_path: str) -> List[str]:
+    """Import the script's external packages; return those that imported."""
+    loaded = []
+    for name in script_imports(script_path):
+        try:
+            importlib.import_module(name)
+        except Exception:
+            logger.debug("Zygote could not preload %s", name, exc_info=True)
+            continue
+        loaded.append(name)
+    return loaded
+
+
+class _CodeCache:
+    """The script's code object, recompiled when the file changes."""
+
+    def __init__(self, script_path: str):
+        self._path = Path(script_path).resolve()
+        self._key: Optional[Tuple[int, int]] = None
+        self._code: Optional[CodeType] = None
+
+    def get(self) -> Optional[CodeType]:
+        """Compiled script, or None if it cannot be read or compiled."""
+        try:
+            st = self._path.stat()
+        except OSError:
+            return None
+        key = (st.st_mtime_ns, st.st_size)
+        if key != self._key:
+            self._key = key
+            try:
+                self._code = compile(self._path.read_text(), str(self._path), 'exec')
+            except (OSError, SyntaxError, ValueError):
+                # The child compiles again and reports the error to the GUI
+                self._code = None
+        return self._code
+
+
+def serve_forks(conn, before_fork=None) -> bool:
+    """
+    Fork a child per 'spawn' request on ``conn`` until told to quit.
+
+    Replies ('spawned', pid) to each request and reports ('exited', pid,
+    code) as children finish. ``before_fork`` runs ahead of each fork.
+
+    Returns:
+        True in a forked child, which carries on as the run; False in the
+        server once the GUI sends 'quit' or goes away (its children are
+        killed first).
+    """
+    children = set()
+    while True:
+        try:
+            request = conn.recv() if conn.poll(_REAP_INTERVAL_S) else None
+        except (EOFError, OSError):
+            break  # GUI went away
+        if request == 'quit':
+            break
+        if request == 'spawn':
+            if before_fork is not None:
+                before_fork()
+            # The IPC queues (PipeQueues) need nothing reset in the child
+            pid = os.fork()
+            if pid == 0:
+                conn.close()
+                return True
+            children.add(pid)
+            conn.send(('spawned', pid))
+        for pid in list(children):
+            done, status = os.waitpid(pid, os.WNOHANG)
+            if done:
+                children.discard(pid)
+                try:
+                    conn.send(('exited', pid, os.waitstatus_to_exitcode(status)))
+                except OSError:
+                    pass
+
+    for pid in children:
+        try:
+            os.kill(pid, signal.SIGKILL)
+            os.waitpid(pid, 0)
+        except OSError:
+            pass
+    return False
+
+
+def _zygote_main(conn, script_path: str, cmd_queue, data_queue) -> None:
+    """Zygote process: preload, then fork a runner per 'spawn' request."""
+    from .runner import run_script_subprocess
+
+    preload_imports(script_path)
+    code_cache = _CodeCache(script_path)
+    code_cache.get()
+    conn.send(('ready',))
+
+    code = None
+
+    def refresh_code():
+        nonlocal code
+        code = code_cache.get()
+
+    if serve_forks(conn, before_fork=refresh_code):
+        run_script_subprocess(script_path, cmd_queue, data_queue, code=code)
+        os._exit(1)  # not reached: run_script_subprocess exits
+
+
+class ForkServer(ABC):
+    """
+    GUI-side end of a ``serve_forks`` connection.
+
+    ``spawn()`` returns a ForkedChild, which answers the subset of the
+    ``subprocess.Popen`` API ScriptRunner uses (pid, poll, wait, terminate,
+    kill, returncode).
+    """
+
+    def __init__(self, conn):
+        self._conn = conn
+        self._exit_codes: Dict[int, int] = {}
+
+    @abstractmethod
+    def is_alive(self) -> bool:
+        """True while the server process is running."""
+
+    def spawn(self, timeout: float = 10.0) -> "ForkedChild":
+        """
+        Fork a runner from the server.
+
+        Raises:
+            RuntimeError: If the server is gone or does not answer in time
+        """
+        try:
+            self._conn.send('spawn')
+        except (BrokenPipeError, OSError) as e:
+            raise RuntimeError(f"{self._describe()} is not running") from e
+        deadline = time.monotonic() + timeout
+        while True:
+            msg = self._receive(max(0.0, deadline - time.monotonic()))
+            if msg is None:
+                raise RuntimeError(f"{self._describe()} did not answer")
+            if msg[0] == 'spawned':
+                return ForkedChild(self, msg[1])
+
+    def _describe(self) -> str:
+        return type(self).__name__
+
+    def _receive(self, timeout: float) -> Optional[tuple]:
+        """Next message from the server (exit reports are recorded), or None."""
+        try:
+            if not self._conn.poll(timeout):
+                return None
+            msg = self._conn.recv()
+        except (EOFError, OSError):
+            return None
+        if msg[0] == 'exited':
+            self._exit_codes[msg[1]] = msg[2]
+        return msg
+
+    def exit_code(self, pid: int, timeout: float = 0.0) -> Optional[int]:
+        """Exit code of child ``pid``, waiting up to ``timeout`` seconds for it."""
+        deadline = time.monotonic() + timeout
+        while pid not in self._exit_codes:
+            remaining = deadline - time.monotonic()
+            if self._receive(max(0.0, remaining)) is None:
+                if remaining <= 0 or not self.is_alive():
+                    break
+        return self._exit_codes.get(pid)
+
+
+class TracerZygote(ForkServer):
+    """
+    GUI-side handle on a zygote serving one IPC session.
+
+    Until ``ready`` is True the zygote is still preloading; ``spawn()``
+    refuses rather than block the GUI for that long, and callers start
+    a normal process instead.
+    """
+
+    def __init__(self, script_path: str, cmd_queue, data_queue):
+        # Not 'fork': see the module docstring. The queues' locks come from
+        # the same context (IPCChannel), so they can be passed along.
+        ctx = mp.get_context('forkserver')
+        conn, child_conn = ctx.Pipe()
+        super().__init__(conn)
+        self._process = ctx.Process(
+            target=_zygote_main,
+            args=(child_conn, script_path, cmd_queue, data_queue),
+            name="pyprobe-zygote",
+            daemon=True,
+        )
+        self._process.start()
+        child_conn.close()
+        self._ready = False
+
+    @property
+    def pid(self) -> Optional[int]:
+        return self._process.pid
+
+    def is_alive(self) -> bool:
+        return self._process.is_alive()
+
+    @property
+    def ready(self) -> bool:
+        """True once the zygote has preloaded and can fork without delay."""
+        while not self._ready and self._receive(0.0) is not None:
+            pass
+        return self._ready
+
+    def wait_ready(self, timeout: float) -> bool:
+        """Wait up to ``timeout`` seconds for ``ready``; return it."""
+        deadline = time.monotonic() + timeout
+        while not self._ready and self.is_alive():
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            self._receive(remaining)
+        return self._ready
+
+    def spawn(self, timeout: float = 10.0) -> "ForkedChild":
+        """
+        Fork a runner from the zygote.
+
+        Raises:
+            RuntimeError: If the zygote is still preloading, is gone, or
+                does not answer in time
+        """
+        if not self.ready:
+            raise RuntimeError("Tracer zygote is still preloading")
+        return super().spawn(timeout)
+
+    def _describe(self) -> str:
+        return "Tracer zygote"
+
+    def _receive(self, timeout: float) -> Optional[tuple]:
+        msg = super()._receive(timeout)
+        if msg is not None and msg[0] == 'ready':
+            self._ready = True
+        return msg
+
+    def shutdown(self, timeout: float = 1.0) -> None:
+        """Stop the zygote and any child still running."""
+        try:
+            self._conn.send('quit')
+        except (BrokenPipeError, OSError):
+            pass
+        self._process.join(timeout)
+        if self._process.is_alive():
+            self._process.kill()
+            self._process.join(0.1)
+        self._conn.close()
+
+
+class ForkedChild:
+    """A run forked from a ForkServer, with a Popen-like interface."""
+
+    def __init__(self, server: ForkServer, pid: int):
+        self._server = server
+        self.pid = pid
+        self.returncode: Optional[int] = None
+
+    def poll(self) -> Optional[int]:
+        if self.returncode is None:
+            self.returncode = self._server.exit_code(self.pid)
+        return self.returncode
+
+    def wait(self, timeout: Optional[float] = None) -> int:
+        if self.returncode is None:
+            limit = 1e9 if timeout is None else timeout
+            self.returncode = self._server.exit_code(self.pid, limit)
+        if self.returncode is None:
+            raise subprocess.TimeoutExpired(f"forked run {self.pid}", timeout)
+        return self.returncode
+
+    def _signal(self, signum: int) -> None:
+        if self.poll() is None:
+            try:
+                os.kill(self.pid, signum)
+            except ProcessLookupError:
+                pass
+
+    def terminate(self) -> None:
+        self._signal(signal.SIGTERM)
+
+    def kill(self) -> None:
+        self._signal(signal.SIGKILL)
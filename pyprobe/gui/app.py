@@ -5,7 +5,7 @@ Application entry point and setup.
 import sys
 from typing import List, Optional
 from PyQt6.QtWidgets import QApplication
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QTimer
 
 # Configure PyQtGraph before importing any plot modules
 import pyqtgraph as pg
@@ -19,6 +19,7 @@ from .main_window import MainWindow
 from ..core.settings import get_setting
 from .theme import DEFAULT_THEME_ID, THEMES
 from .theme.theme_manager import ThemeManager
+from .. import startup_profile
 
 
 def create_app() -> QApplication:
@@ -49,10 +50,16 @@ def run_app(
     overlays: Optional[List[str]] = None,
     auto_run: bool = False,
     auto_quit: bool = False,
-    auto_quit_timeout: Optional[float] = None
+    auto_quit_timeout: Optional[float] = None,
+    sweep: Optional[list] = None,
+    sweep_jobs: Optional[int] = None,
+    sessions: Optional[List[str]] = None,
+    record_path: Optional[str] = None,
+    broker_socket: Optional[str] = None
 ) -> int:
     """Run the PyProbe application."""
     app = create_app()
+    startup_profile.mark("QApplication + theme")
 
     window = MainWindow(
         script_path=script_path,
@@ -61,10 +68,24 @@ def run_app(
         overlays=overlays,
         auto_run=auto_run,
         auto_quit=auto_quit,
-        auto_quit_timeout=auto_quit_timeout
+        auto_quit_timeout=auto_quit_timeout,
+        sweep=sweep,
+        sweep_jobs=sweep_jobs,
+        sessions=sessions,
+        record_path=record_path,
+        broker_socket=broker_socket
     )
     if folder_path:
         window._load_folder(folder_path)
+    startup_profile.mark("main window")
     window.show()
+    if startup_profile.get_profile() is not None:
+        # Runs after the first pass of the event loop has shown the window
+        QTimer.singleShot(0, _report_startup)
 
     return app.exec()
+
+
+def _report_startup() -> None:
+    startup_profile.mark("first show")
+    print(startup_profile.get_profile().report(), file=sys.stderr, flush=True)
@@ -5,11 +5,12 @@ This widget displays:
 - Line numbers synced with the code viewer
 - Eye icons for lines with active probes
 - Color-matched indicators for probe colors
+- A checkpoint bar, toggled by clicking a line number
 """
 
 from typing import Optional, Dict
 from PyQt6.QtWidgets import QWidget
-from PyQt6.QtCore import Qt, QSize, QRectF
+from PyQt6.QtCore import Qt, QSize, QRectF, pyqtSignal
 from PyQt6.QtGui import (
     QPainter, QColor, QPen, QBrush, QFont, QFontMetricsF
 )
@@ -26,13 +27,19 @@ class CodeGutter(QWidget):
     - Eye icon (drawn as ellipse) for probed lines
     - Color-matched to probe color
     - Auto-width based on line count
+    - Checkpoint bar: outlined while armed, filled once a snapshot is parked
     """
 
+    line_clicked = pyqtSignal(int)  # line number (1-indexed)
+
     def __init__(self, code_viewer, parent: Optional[QWidget] = None):
         super().__init__(parent)
 
         self._code_viewer = code_viewer
         self._probed_lines: Dict[int, QColor] = {}  # line number -> color
+        self._checkpoint_line: Optional[int] = None
+        self._checkpoint_parked = False
+        self._checkpoint_color = QColor("#ffaa00")
         self._bg_color = QColor("#0a0a0a")
         self._line_number_color = QColor("#666666")
 
@@ -66,6 +73,7 @@ class CodeGutter(QWidget):
         self.setFont(mono_font)
         self._bg_color = QColor(c['bg_darkest'])
         self._line_number_color = QColor(c['text_muted'])
+        self._checkpoint_color = QColor(c['warning'])
         self.setStyleSheet(f"QWidget {{ background-color: {c['bg_darkest']}; }}")
         self._update_width()
         self.update()
@@ -113,6 +121,40 @@ class CodeGutter(QWidget):
         self._probed_lines.clear()
         self.update()
 
+    def set_checkpoint(self, line: Optional[int], parked: bool = False) -> None:
+        """Show the checkpoint bar on a line (None hides it).
+
+        Args:
+            line: Line number (1-indexed)
+            parked: Whether a snapshot is parked there
+        """
+        self._checkpoint_line = line
+        self._checkpoint_parked = parked
+        self.update()
+
+    def mousePressEvent(self, event) -> None:
+        """Emit line_clicked for a left click on a line."""
+        if event.button() == Qt.MouseButton.LeftButton:
+            line = self._line_at(event.position().y())
+            if line is not None:
+                self.line_clicked.emit(line)
+                event.accept()
+                return
+        super().mousePressEvent(event)
+
+    def _line_at(self, y: float) -> Optional[int]:
+        """Line number (1-indexed) of the visible block at height ``y``."""
+        block = self._code_viewer.firstVisibleBlock()
+        top = self._code_viewer.blockBoundingGeometry(block).translated(
+            self._code_viewer.contentOffset()).top()
+        while block.isValid() and top <= y:
+            bottom = top + self._code_viewer.blockBoundingRect(block).height()
+            if block.isVisible() and y < bottom:
+                return block.blockNumber() + 1
+            block = block.next()
+            top = bottom
+        return None
+
     def sizeHint(self) -> QSize:
         """Return the preferred size."""
         return QSize(self.width(), 0)
@@ -154,6 +196,9 @@ class CodeGutter(QWidget):
                     str(line_number)
                 )
 
+                if line_number == self._checkpoint_line:
+                    self._draw_checkpoint(painter, top, fm.height())
+
                 # Draw eye icon if this line has a probe
                 if line_number in self._probed_lines:
                     color = self._probed_lines[line_number]
@@ -171,6 +216,16 @@ class CodeGutter(QWidget):
 
         painter.end()
 
+    def _draw_checkpoint(self, painter: QPainter, top: float, height: float) -> None:
+        """Draw the checkpoint bar in the left padding of a line."""
+        rect = QRectF(1.5, top + 1.5, 4, height - 3)
+        painter.setPen(QPen(self._checkpoint_color, 1))
+        if self._checkpoint_parked:
+            painter.setBrush(QBrush(self._checkpoint_color))
+        else:
+            painter.setBrush(Qt.BrushStyle.NoBrush)
+        painter.drawRect(rect)
+
     def _draw_eye_icon(
         self,
         painter: QPainter,
@@ -3,12 +3,13 @@ Debug overlay for visualizing layout regions.
 
 Toggle with Ctrl+Shift+D in a ProbePanel.
 Draws semi-transparent colored bounding boxes over named regions
-(toolbar, plot area, pin buttons) so layout intent is immediately visible.
+(toolbar, plot area, pin buttons) so layout intent is immediately visible,
+plus a caption line (the panel's achieved redraw rate and cost).
 """
 
 from PyQt6.QtWidgets import QWidget
 from PyQt6.QtGui import QPainter, QColor, QFont, QPen
-from PyQt6.QtCore import Qt, QRect, QRectF
+from PyQt6.QtCore import Qt, QPoint, QRect, QRectF
 
 
 # Region definitions: (label, colour)
@@ -32,12 +33,14 @@ class DebugOverlay(QWidget):
 
     Call ``set_regions(dict[str, QRect|QRectF])`` to update the
     regions to draw.  Keys should match ``_REGION_STYLES`` above;
-    unknown keys get a default grey colour.
+    unknown keys get a default grey colour.  ``set_caption(str)`` sets a
+    line of text drawn at the bottom-left corner.
     """
 
     def __init__(self, parent: QWidget = None):
         super().__init__(parent)
         self._regions: dict[str, QRect | QRectF] = {}
+        self._caption = ""
         self.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents, True)
         self.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground, True)
         self.setStyleSheet("background: transparent;")
@@ -53,9 +56,19 @@ class DebugOverlay(QWidget):
         self._regions = dict(regions)
         self.update()
 
+    def set_caption(self, text: str) -> None:
+        """Set the text drawn at the bottom-left corner ('' for none)."""
+        if text != self._caption:
+            self._caption = text
+            self.update()
+
+    @property
+    def caption(self) -> str:
+        return self._caption
+
     # ------------------------------------------------------------------
     def paintEvent(self, event) -> None:  # noqa: N802
-        if not self._regions:
+        if not self._regions and not self._caption:
             return
 
         painter = QPainter(self)
@@ -81,4 +94,13 @@ class DebugOverlay(QWidget):
             painter.setPen(QPen(border.lighter(140), 1))
             painter.drawText(r.adjusted(4, 2, 0, 0), Qt.AlignmentFlag.AlignTop | Qt.AlignmentFlag.AlignLeft, name)
 
+        if self._caption:
+            box = painter.fontMetrics().boundingRect(self._caption).adjusted(-4, -2, 4, 2)
+            box.moveBottomLeft(self.rect().bottomLeft() + QPoint(6, -6))
+            painter.setBrush(QColor(0, 0, 0, 160))
+            painter.setPen(Qt.PenStyle.NoPen)
+            painter.drawRect(box)
+            painter.setPen(QPen(QColor(255, 255, 255, 220), 1))
+            painter.drawText(box, Qt.AlignmentFlag.AlignCenter, self._caption)
+
         painter.end()
@@ -37,6 +37,7 @@ class EquationEditorDialog(QDialog):
     def __init__(self, manager: EquationManager, parent=None):
         super().__init__(parent)
         self._manager = manager
+        self._status_labels: dict = {}  # eq_id -> QLabel
 
         self.setWindowTitle("Equation Editor")
         self.setMinimumSize(500, 300)
@@ -82,6 +83,7 @@ class EquationEditorDialog(QDialog):
 
     def _populate_table(self):
         self.table.setRowCount(0)
+        self._status_labels.clear()
         for eq in self._manager.equations.values():
             self._add_row(eq)
 
@@ -114,6 +116,8 @@ class EquationEditorDialog(QDialog):
 
         status_lbl = QLabel("?")
         status_layout.addWidget(status_lbl)
+        self._status_labels[eq.id] = status_lbl
+        self._update_status_label(eq)
         
         del_btn = QPushButton("×")
         del_btn.setFixedSize(20, 20)
@@ -125,6 +129,30 @@ class EquationEditorDialog(QDialog):
         container.setLayout(status_layout)
         self.table.setCellWidget(row, 2, container)
 
+    def refresh_status(self):
+        """Show each equation's last evaluation time or error."""
+        for eq in self._manager.equations.values():
+            self._update_status_label(eq)
+
+    def _update_status_label(self, eq: Equation):
+        label = self._status_labels.get(eq.id)
+        if label is None:
+            return
+        from .theme.theme_manager import ThemeManager
+        c = ThemeManager.instance().current.colors
+        if eq.error:
+            label.setText("!")
+            label.setToolTip(eq.error)
+            label.setStyleSheet(f"color: {c['error']}; font-weight: bold;")
+        elif eq.eval_ms is not None:
+            label.setText(f"{eq.eval_ms:.1f} ms")
+            label.setToolTip("Last evaluation time")
+            label.setStyleSheet(f"color: {c['text_secondary']}; font-family: 'Menlo', 'Consolas';")
+        else:
+            label.setText("?")
+            label.setToolTip("")
+            label.setStyleSheet("")
+
     def _on_add_clicked(self):
         eq = self._manager.add_equation()
         self._add_row(eq)
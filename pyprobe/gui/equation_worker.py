@@ -0,0 +1,104 @@
+"""
+Background evaluation of equations, off the Qt main thread.
+
+The GUI thread plans a job (which equations to run, plus a snapshot of
+their inputs), a worker thread runs it, and the results are applied back
+on the GUI thread. numpy/scipy release the GIL for the heavy lifting
+(FFTs, filters), so a thread is enough and avoids pickling large traces
+to another process.
+"""
+
+import threading
+from typing import Any, Dict, Optional
+
+from PyQt6.QtCore import QObject, pyqtSignal
+
+from pyprobe.logging import get_logger
+from ..core.equation_manager import EquationManager, EvaluationJob, EvaluationResult
+
+logger = get_logger(__name__)
+
+
+class EquationWorker(QObject):
+    """
+    Runs EquationManager jobs on a worker thread, one at a time.
+
+    While a job runs, newer submissions are coalesced into a single pending
+    snapshot and the running job is asked to stop at the next equation
+    boundary. A job is never cancelled twice in a row, so a steady stream
+    of data cannot starve slow equations.
+
+    Signals:
+        results_ready: Equation IDs whose results were updated (set)
+    """
+
+    results_ready = pyqtSignal(set)
+    _job_finished = pyqtSignal(object)  # EvaluationResult, queued to the GUI thread
+
+    def __init__(self, manager: EquationManager, parent: Optional[QObject] = None):
+        super().__init__(parent)
+        self._manager = manager
+        self._thread: Optional[threading.Thread] = None
+        self._cancel = threading.Event()
+        self._pending: Optional[Dict[str, Any]] = None
+        self._last_cancelled = False
+        self._job_finished.connect(self._on_job_finished)
+
+    @property
+    def is_busy(self) -> bool:
+        """True while a job is running."""
+        return self._thread is not None
+
+    def submit(self, trace_data: Dict[str, Any]) -> None:
+        """Request evaluation against the latest trace data."""
+        if self.is_busy:
+            # Supersede whatever is queued; the newest snapshot wins
+            self._pending = dict(trace_data)
+            if not self._last_cancelled:
+                self._cancel.set()
+            return
+
+        job = self._manager.plan(trace_data)
+        if job is None:
+            return
+        self._start(job)
+
+    def _start(self, job: EvaluationJob) -> None:
+        self._cancel.clear()
+        self._thread = threading.Thread(
+            target=self._run, args=(job,), name="pyprobe-equations", daemon=True
+        )
+        self._thread.start()
+
+    def _run(self, job: EvaluationJob) -> None:
+        try:
+            result = self._manager.run_job(job, self._cancel.is_set)
+        except Exception:
+            logger.exception("Equation job failed")
+            result = EvaluationResult(generation=job.generation, cancelled=True)
+        self._job_finished.emit(result)
+
+    def _on_job_finished(self, result: EvaluationResult) -> None:
+        self._thread = None
+        self._last_cancelled = result.cancelled
+        applied = self._manager.apply(result)
+        if applied:
+            self.results_ready.emit(applied)
+
+        if self._pending is not None:
+            pending, self._pending = self._pending, None
+            self.submit(pending)
+
+    def wait(self, timeout: float = 5.0) -> bool:
+        """Block until the running job's thread exits (results still arrive via the event loop)."""
+        thread = self._thread
+        if thread is not None:
+            thread.join(timeout)
+            return not thread.is_alive()
+        return True
+
+    def shutdown(self, timeout: float = 1.0) -> None:
+        """Cancel the running job and drop pending work."""
+        self._pending = None
+        self._cancel.set()
+        self.wait(timeout)
@@ -0,0 +1,176 @@
+"""
+History query dialog: search a probe's capture history by summary statistics.
+
+Queries run against the per-probe SummaryIndex (see core.capture_summary),
+so they never touch the captured arrays. Selecting a hit jumps the probe's
+panels to that frame.
+"""
+
+import time
+from typing import Callable, Dict, Optional
+
+from PyQt6.QtWidgets import (
+    QDialog, QVBoxLayout, QHBoxLayout, QComboBox, QLineEdit, QPushButton,
+    QLabel, QListWidget, QListWidgetItem
+)
+from PyQt6.QtCore import Qt, pyqtSignal
+
+from ..core.anchor import ProbeAnchor
+from .probe_buffer import ProbeDataBuffer
+
+
+class HistoryQueryDialog(QDialog):
+    """
+    Dialog for querying capture history, e.g. ``max(abs(x)) > 3``
+    or ``first frame with NaN``.
+    """
+    _instance = None
+    MAX_LISTED_HITS = 1000
+
+    frame_selected = pyqtSignal(object, int)  # (ProbeAnchor, frame index)
+    query_run = pyqtSignal(str, int)  # (query text, hit count)
+
+    @classmethod
+    def show_instance(cls, buffers: Callable[[], Dict[ProbeAnchor, ProbeDataBuffer]],
+                      label_for: Callable[[ProbeAnchor], str], parent=None):
+        if cls._instance is not None:
+            try:
+                cls._instance.objectName()
+                if cls._instance.isVisible():
+                    cls._instance.refresh_probes()
+                    cls._instance.raise_()
+                    cls._instance.activateWindow()
+                    return cls._instance
+                cls._instance.deleteLater()
+            except RuntimeError:
+                pass
+        cls._instance = cls(buffers, label_for, parent)
+        cls._instance.show()
+        return cls._instance
+
+    def __init__(self, buffers: Callable[[], Dict[ProbeAnchor, ProbeDataBuffer]],
+                 label_for: Callable[[ProbeAnchor], str], parent=None):
+        super().__init__(parent)
+        self._buffers = buffers
+        self._label_for = label_for
+        self._anchors: list = []
+
+        self.setWindowTitle("History Query")
+        self.setMinimumSize(520, 320)
+        self.setWindowFlag(Qt.WindowType.Tool)
+
+        self._setup_ui()
+        from .theme.theme_manager import ThemeManager
+        tm = ThemeManager.instance()
+        tm.theme_changed.connect(self._apply_theme)
+        self._apply_theme(tm.current)
+        self.refresh_probes()
+
+    def _setup_ui(self):
+        layout = QVBoxLayout(self)
+
+        query_row = QHBoxLayout()
+        self.probe_combo = QComboBox()
+        self.probe_combo.setMinimumWidth(140)
+        query_row.addWidget(self.probe_combo)
+
+        self.query_edit = QLineEdit()
+        self.query_edit.setPlaceholderText("max(abs(x)) > 3   |   first frame with NaN")
+        self.query_edit.returnPressed.connect(self.run_query)
+        query_row.addWidget(self.query_edit, 1)
+
+        self.run_btn = QPushButton("Find")
+        self.run_btn.clicked.connect(self.run_query)
+        query_row.addWidget(self.run_btn)
+        layout.addLayout(query_row)
+
+        self.results = QListWidget()
+        self.results.currentRowChanged.connect(self._on_result_selected)
+        layout.addWidget(self.results)
+
+        self.status_label = QLabel("")
+        layout.addWidget(self.status_label)
+
+    def _apply_theme(self, theme=None):
+        from .theme.theme_manager import ThemeManager
+        c = (theme.colors if theme is not None else ThemeManager.instance().current.colors)
+        self.setStyleSheet(f"""
+            QDialog {{ background-color: {c['bg_dark']}; color: {c['text_primary']}; }}
+            QListWidget {{ background-color: {c['bg_dark']}; color: {c['text_primary']}; border: 1px solid {c['border_default']}; font-family: 'Menlo', 'Consolas'; }}
+            QLineEdit, QComboBox {{ background-color: {c['bg_medium']}; color: {c['text_primary']}; border: 1px solid {c['border_default']}; border-radius: 2px; padding: 2px; }}
+            QPushButton {{ background-color: {c['bg_medium']}; color: {c['text_primary']}; border-radius: 2px; padding: 4px 8px; }}
+            QPushButton:hover {{ background-color: {c['border_default']}; }}
+            QLabel {{ color: {c['text_secondary']}; }}
+        """)
+
+    def refresh_probes(self) -> None:
+        """Re-populate the probe selector, keeping the current selection."""
+        current = self._current_anchor()
+        self._anchors = list(self._buffers())
+        self.probe_combo.blockSignals(True)
+        self.probe_combo.clear()
+        for anchor in self._anchors:
+            self.probe_combo.addItem(self._label_for(anchor))
+        if current in self._anchors:
+            self.probe_combo.setCurrentIndex(self._anchors.index(current))
+        self.probe_combo.blockSignals(False)
+
+    def _current_anchor(self) -> Optional[ProbeAnchor]:
+        row = self.probe_combo.currentIndex()
+        if 0 <= row < len(self._anchors):
+            return self._anchors[row]
+        return None
+
+    def _current_buffer(self) -> Optional[ProbeDataBuffer]:
+        anchor = self._current_anchor()
+        if anchor is None:
+            return None
+        return self._buffers().get(anchor)
+
+    def run_query(self) -> None:
+        """Run the query text against the selected probe and list the hits."""
+        self.results.clear()
+        buffer = self._current_buffer()
+        if buffer is None:
+            self.status_label.setText("No probe with captured data selected")
+            return
+
+        text = self.query_edit.text()
+        start = time.perf_counter()
+        try:
+            hits = buffer.query(text)
+        except ValueError as e:
+            self.status_label.setText(str(e))
+            return
+        elapsed_ms = (time.perf_counter() - start) * 1000.0
+
+        summary = buffer.summary
+        seq = summary.column('seq')
+        peak = summary.column('absmax')
+        rms = summary.column('rms')
+        nans = summary.column('nans')
+        for frame in hits[:self.MAX_LISTED_HITS]:
+            frame = int(frame)
+            item = QListWidgetItem(
+                f"frame {frame:>7}  seq {int(seq[frame]):>7}  "
+                f"|x|max {peak[frame]:.6g}  rms {rms[frame]:.6g}  nan {int(nans[frame])}"
+            )
+            item.setData(Qt.ItemDataRole.UserRole, frame)
+            self.results.addItem(item)
+
+        shown = "" if len(hits) <= self.MAX_LISTED_HITS else f" (first {self.MAX_LISTED_HITS} listed)"
+        self.status_label.setText(
+            f"{len(hits)} of {buffer.count} frames match{shown} - {elapsed_ms:.2f} ms"
+        )
+        self.query_run.emit(text, len(hits))
+
+        # Jump straight to the first hit
+        if len(hits):
+            self.results.setCurrentRow(0)
+
+    def _on_result_selected(self, row: int) -> None:
+        item = self.results.item(row)
+        anchor = self._current_anchor()
+        if item is None or anchor is None:
+            return
+        self.frame_selected.emit(anchor, item.data(Qt.ItemDataRole.UserRole))
@@ -0,0 +1,86 @@
+"""
+GUI-side ingest stage for probe captures.
+
+Every CaptureRecord enters the GUI here exactly once: it is stored in its
+probe buffer, the latest record per anchor in each batch is fanned out to
+subscribers (registry, scalar watches, overlays, equation inputs), and a
+single repaint is scheduled for the next frame no matter how many batches
+arrive before it. A repaint redraws what fits the throttler's frame
+budget; probes left out are repainted on a following frame.
+"""
+
+import math
+from typing import Callable, Dict, Iterable, List, Optional
+
+from PyQt6.QtCore import QObject, QTimer, pyqtSignal
+
+from ..core.anchor import ProbeAnchor
+from ..core.capture_record import CaptureRecord
+from .redraw_throttler import RedrawThrottler
+
+# Receives the newest record of each anchor in a batch
+IngestSubscriber = Callable[[Dict[ProbeAnchor, CaptureRecord]], None]
+
+
+class IngestPipeline(QObject):
+    """
+    Turns incoming records into buffer updates, subscriber notifications
+    and one coalesced repaint per frame.
+
+    Signals:
+        repaint: Emitted at most once per throttle interval while buffers are dirty
+    """
+
+    repaint = pyqtSignal()
+
+    def __init__(self, throttler: RedrawThrottler, parent: Optional[QObject] = None):
+        super().__init__(parent)
+        self._throttler = throttler
+        self._subscribers: List[IngestSubscriber] = []
+
+        self._repaint_timer = QTimer(self)
+        self._repaint_timer.setSingleShot(True)
+        self._repaint_timer.timeout.connect(self._on_repaint_timer)
+
+    def subscribe(self, callback: IngestSubscriber) -> None:
+        """Call ``callback`` with the newest record per anchor of every batch."""
+        self._subscribers.append(callback)
+
+    def ingest(self, records: Iterable[CaptureRecord]) -> None:
+        """Store a batch of records, notify subscribers and schedule a repaint."""
+        latest: Dict[ProbeAnchor, CaptureRecord] = {}
+        for record in records:
+            self._throttler.receive(record)
+            latest[record.anchor] = record
+        if not latest:
+            return
+
+        for callback in self._subscribers:
+            callback(latest)
+        self._schedule_repaint()
+
+    @property
+    def repaint_pending(self) -> bool:
+        """True while a repaint is scheduled but has not run yet."""
+        return self._repaint_timer.isActive()
+
+    def flush(self) -> None:
+        """Repaint every dirty buffer now, regardless of the throttle and budget."""
+        self._repaint_timer.stop()
+        self._throttler.expedite()
+        self.repaint.emit()
+
+    def _schedule_repaint(self) -> None:
+        if self._repaint_timer.isActive():
+            return
+        # Round up so the timer never fires before the throttle opens
+        self._repaint_timer.start(math.ceil(self._throttler.time_until_redraw_ms()))
+
+    def _on_repaint_timer(self) -> None:
+        if not self._throttler.should_redraw():
+            self._schedule_repaint()
+            return
+        self.repaint.emit()
+        # Probes that were not due, or did not fit this frame, go next
+        if self._throttler.has_dirty:
+            self._schedule_repaint()
@@ -4,7 +4,7 @@ Main application window with probe panels and controls.
 M1: Source-anchored probing with code viewer.
 """
 
-from typing import Dict, List, Optional
+from typing import TYPE_CHECKING, Dict, List, Optional
 from PyQt6.QtWidgets import (
     QMainWindow, QWidget, QHBoxLayout, QSplitter,
     QStatusBar, QFileDialog, QMessageBox, QLabel
@@ -13,13 +13,18 @@ from PyQt6.QtCore import Qt, QTimer, pyqtSignal, pyqtSlot
 from PyQt6.QtGui import QColor, QAction, QActionGroup
 import multiprocessing as mp
 import os
+import shlex
 import sys
+import time
 import numpy as np
 from PyQt6 import sip
 
 from pyprobe.logging import get_logger, trace_print
 logger = get_logger(__name__)
 
+if TYPE_CHECKING:
+    from .equation_editor import EquationEditorDialog
+
 
 def is_obj_deleted(obj):
     """Safely check if a Qt object has been deleted."""
@@ -34,6 +39,10 @@ from ..core.runner import run_script_subprocess
 
 # === M1 IMPORTS ===
 from ..core.anchor import ProbeAnchor
+from ..core.sweep import SweepPoint
+from ..core.broker import CaptureBroker
+from ..core.recording import PprecRecorder
+from ..ipc.broker_server import BrokerServer
 from .code_viewer import CodeViewer
 from .code_gutter import CodeGutter
 from .code_highlighter import PythonHighlighter
@@ -47,14 +56,17 @@ from ..state_tracer import get_tracer
 # === M2.5 IMPORTS ===
 from .dock_bar import DockBar
 from .script_runner import ScriptRunner
+from .sweep_runner import SweepRunner
+from .session_manager import SessionManager
 from .message_handler import MessageHandler
 from .probe_controller import ProbeController
 from ..core.trace_reference_manager import TraceReferenceManager
 from .scalar_watch_window import ScalarWatchSidebar
 from .redraw_throttler import RedrawThrottler
+from .ingest import IngestPipeline
 from .file_tree import FileTreePanel
 from .collapsible_pane import CollapsiblePane
-from .equation_editor import EquationEditorDialog
+from .equation_worker import EquationWorker
 from ..core.equation_manager import EquationManager
 from ..report.step_recorder import StepRecorder
 
@@ -112,7 +124,12 @@ class MainWindow(QMainWindow):
         overlays: Optional[List[str]] = None,
         auto_run: bool = False,
         auto_quit: bool = False,
-        auto_quit_timeout: Optional[float] = None
+        auto_quit_timeout: Optional[float] = None,
+        sweep: Optional[List[SweepPoint]] = None,
+        sweep_jobs: Optional[int] = None,
+        sessions: Optional[List[str]] = None,
+        record_path: Optional[str] = None,
+        broker_socket: Optional[str] = None
     ):
         super().__init__()
         
@@ -134,6 +151,9 @@ class MainWindow(QMainWindow):
         self._auto_run = auto_run
         self._auto_quit = auto_quit
         self._auto_quit_timeout = auto_quit_timeout
+        self._sweep = sweep or []
+        self._sweep_jobs = sweep_jobs
+        self._sweep_failures = 0
         self._report_bug_dialog = None  # ReportBugDialog | None
         self._runner_process: Optional[mp.Process] = None
         self._ipc: Optional[IPCChannel] = None
@@ -150,10 +170,13 @@ class MainWindow(QMainWindow):
         # M1: Source file content cache for anchor mapping
         self._last_source_content: Optional[str] = None
         self._pending_markers = {} # (line, symbol) -> markers_dict
+        # M2.5: Newest overlay payload per anchor, drawn at the next redraw
+        self._overlay_payloads: Dict[ProbeAnchor, dict] = {}
 
         # M4: Equation Manager
         self._equation_manager = EquationManager()
         self._latest_trace_data = {}
+        self._equation_worker = EquationWorker(self._equation_manager, self)
 
         self._setup_ui()
         self._setup_signals()
@@ -167,8 +190,23 @@ class MainWindow(QMainWindow):
         self._script_runner = ScriptRunner(self)
         self._message_handler = MessageHandler(self._script_runner, self._tracer, self)
         self._redraw_throttler = RedrawThrottler()
+        self._ingest = IngestPipeline(self._redraw_throttler, self)
+        self._broker = CaptureBroker()
+        self._recorder: Optional[PprecRecorder] = None
+        if record_path:
+            self._recorder = PprecRecorder(record_path)
+            self._broker.subscribe_frames(self._recorder)
+        self._broker_server: Optional[BrokerServer] = None
+        if broker_socket:
+            self._broker_server = BrokerServer(self._broker, broker_socket)
         self._saved_ui_states: Dict[str, bool] = {}
+        self._sweep_runner = SweepRunner(self)
+        self._session_manager = SessionManager(self)
+        for spec in sessions or []:
+            args = shlex.split(spec)
+            self._session_manager.add_script(args[0], args[1:])
         self._setup_script_runner()
+        self._setup_ingest()
         self._setup_message_handler()
         self._setup_fps_timer()
         self._setup_auto_quit_timeout()
@@ -494,8 +532,17 @@ class MainWindow(QMainWindow):
         self._status_bar.addPermanentWidget(self._coord_label)
 
         self._setup_theme_menu()
+        self._setup_session_menu()
         self._setup_help_menu()
 
+    def _setup_session_menu(self) -> None:
+        """Create the Sessions menu for scripts traced alongside the main one."""
+        session_menu = self.menuBar().addMenu("Sessions")
+        add_action = session_menu.addAction("Run Alongside...")
+        add_action.triggered.connect(self._on_add_session)
+        clear_action = session_menu.addAction("Remove All Sessions")
+        clear_action.triggered.connect(self._on_clear_sessions)
+
     def _setup_help_menu(self) -> None:
         help_menu = self.menuBar().addMenu("Help")
         report_action = help_menu.addAction("Report Bug")
@@ -657,6 +704,8 @@ class MainWindow(QMainWindow):
         # M4: Equation Editor
         eq_action = view_menu.addAction("Equation Editor")
         eq_action.triggered.connect(self._show_equation_editor)
+        history_action = view_menu.addAction("History Query...")
+        history_action.triggered.connect(self._show_history_query)
         view_menu.addSeparator()
 
         theme_menu = view_menu.addMenu("Theme")
@@ -683,11 +732,12 @@ class MainWindow(QMainWindow):
 
     def _show_equation_editor(self):
         """Show the equation editor dialog."""
+        from .equation_editor import EquationEditorDialog
         dialog = EquationEditorDialog.show_instance(self._equation_manager, self)
         dialog.plot_requested.connect(self._on_equation_plot_requested)
         self._connect_equation_editor_recorder(dialog)
 
-    def _connect_equation_editor_recorder(self, dialog: EquationEditorDialog) -> None:
+    def _connect_equation_editor_recorder(self, dialog: 'EquationEditorDialog') -> None:
         """Wire equation editor signals to step recorder (idempotent)."""
         if getattr(dialog, '_recorder_connected', False):
             return
@@ -698,6 +748,38 @@ class MainWindow(QMainWindow):
         r.connect_signal(dialog.equation_deleted, lambda eq_id: f"Deleted equation: {eq_id}")
         r.connect_signal(dialog.plot_requested, lambda eq_id: f"Plotted equation: {eq_id}")
 
+    def _show_history_query(self):
+        """Show the capture history query dialog."""
+        from .history_query import HistoryQueryDialog
+        dialog = HistoryQueryDialog.show_instance(
+            lambda: self._redraw_throttler.buffers,
+            self._history_label_for,
+            self,
+        )
+        if not getattr(dialog, '_main_window_connected', False):
+            dialog._main_window_connected = True
+            dialog.frame_selected.connect(self._on_history_frame_selected)
+            r = self._step_recorder
+            r.connect_signal(dialog.query_run,
+                             lambda text, hits: f"Ran history query '{text}' ({hits} hits)")
+
+    def _history_label_for(self, anchor: ProbeAnchor) -> str:
+        trace_id = self._probe_registry.get_trace_id(anchor)
+        label = anchor.identity_label()
+        return f"{trace_id}: {label}" if trace_id else label
+
+    def _on_history_frame_selected(self, anchor: ProbeAnchor, index: int):
+        """Jump every panel of ``anchor`` to history frame ``index``."""
+        buffer = self._redraw_throttler.buffer_for(anchor)
+        if buffer is None:
+            return
+        for panel in self._probe_panels.get(anchor, []):
+            if not is_obj_deleted(panel) and not panel.is_closing:
+                panel.show_frame(buffer, index)
+        self._status_bar.showMessage(
+            f"{anchor.symbol}: frame {index + 1}/{buffer.count}"
+        )
+
     def _on_equation_plot_requested(self, eq_id: str):
         """Handle 'Plot' click from Equation Editor."""
         # Create a new panel for the equation
@@ -783,6 +865,9 @@ class MainWindow(QMainWindow):
         # File tree signals
         self._file_tree.file_selected.connect(self._on_file_tree_selected)
 
+        # M4: Equation results from the worker thread
+        self._equation_worker.results_ready.connect(self._on_equation_results)
+
         # Scalar watch sidebar
         self._scalar_watch_sidebar.scalar_removed.connect(self._on_watch_scalar_removed)
         self._scalar_watch_sidebar.scalar_removed.connect(self._save_probe_settings)
@@ -799,6 +884,9 @@ class MainWindow(QMainWindow):
         # === M1: File watcher signals ===
         self._file_watcher.file_changed.connect(self._on_file_changed)
 
+        # Clicking a line number toggles the checkpoint
+        self._code_gutter.line_clicked.connect(self._on_gutter_line_clicked)
+
         # === M1: Probe registry signals ===
         self._probe_registry.probe_state_changed.connect(self._on_probe_state_changed)
         self._probe_registry.probe_state_changed.connect(self._save_probe_settings)
@@ -849,81 +937,100 @@ class MainWindow(QMainWindow):
 
     def _setup_message_handler(self):
         """Connect MessageHandler signals to slots."""
-        self._message_handler.probe_record.connect(self._on_probe_record)
-        self._message_handler.probe_record_batch.connect(self._on_probe_record_batch)
+        self._message_handler.probe_record_batch.connect(self._broker.publish)
         self._message_handler.script_ended.connect(self._on_script_ended)
         self._message_handler.exception_raised.connect(self._on_exception)
         self._message_handler.variable_data.connect(self._on_variable_data)
-
-    @pyqtSlot(object)
-    def _on_probe_record(self, record):
-        """Handle single probe record from MessageHandler."""
-        self._handle_probe_records([record])
-
-    @pyqtSlot(list)
-    def _on_probe_record_batch(self, records: list):
-        """Handle batched probe records from MessageHandler."""
-        self._handle_probe_records(records)
-
-    def _handle_probe_records(self, records: list) -> None:
-        """Store records and schedule redraws from buffers."""
-        for record in records:
-            anchor = record.anchor
+        self._message_handler.checkpoint_parked.connect(self._on_checkpoint_parked)
+
+    def _setup_ingest(self):
+        """Subscribe GUI consumers to the probe ingest pipeline."""
+        self._broker.subscribe(self._ingest.ingest)
+        self._ingest.subscribe(self._on_ingest_registry)
+        self._ingest.subscribe(self._on_ingest_watches)
+        self._ingest.subscribe(self._on_ingest_overlays)
+        self._ingest.subscribe(self._on_ingest_equations)
+        self._ingest.repaint.connect(self._redraw)
+
+    def _on_ingest_registry(self, latest: dict) -> None:
+        """Refresh liveness and metadata once per anchor per batch."""
+        for anchor, record in latest.items():
             self._probe_registry.update_data_received(anchor)
-
             if anchor in self._probe_metadata:
                 self._probe_metadata[anchor]['dtype'] = record.dtype
                 self._probe_metadata[anchor]['shape'] = record.shape
 
-            self._redraw_throttler.receive(record)
-
+    def _on_ingest_watches(self, latest: dict) -> None:
+        """Route scalar values to the watch sidebar."""
+        for anchor, record in latest.items():
             if self._scalar_watch_sidebar.has_scalar(anchor):
                 self._scalar_watch_sidebar.update_scalar(anchor, record.value)
 
-            self._forward_overlay_data(anchor, {
+    def _on_ingest_overlays(self, latest: dict) -> None:
+        """M2.5: Keep the newest overlay data; ``_redraw`` forwards it to target panels."""
+        for anchor, record in latest.items():
+            self._overlay_payloads[anchor] = {
                 'value': record.value,
                 'dtype': record.dtype,
                 'shape': record.shape,
-            })
+            }
 
-            # Populate trace data for equations
+    def _on_ingest_equations(self, latest: dict) -> None:
+        """M4: Populate trace data for equations (evaluated at redraw cadence)."""
+        for anchor, record in latest.items():
             trace_id = self._probe_registry.get_trace_id(anchor)
             if trace_id:
                 self._latest_trace_data[trace_id] = record.value
 
-        # Evaluate equations if any exist
-        if self._equation_manager.equations:
-            self._equation_manager.evaluate_all(self._latest_trace_data)
-            self._update_equation_plots()
-
-        self._maybe_redraw()
-
-    def _maybe_redraw(self) -> None:
-        """Redraw dirty buffers at a throttled rate."""
-        if not self._redraw_throttler.should_redraw():
-            return
-
-        dirty = self._redraw_throttler.get_dirty_buffers()
+    def _redraw(self) -> None:
+        """Redraw the buffers due this frame; runs via the ingest pipeline."""
+        throttler = self._redraw_throttler
+        dirty = throttler.take_due_buffers(self._redraw_priority)
         for anchor, buffer in dirty.items():
             if anchor in self._probe_panels:
-                for panel in self._probe_panels[anchor]:
-                    if not is_obj_deleted(panel) and not panel.is_closing:
-                        panel.update_from_buffer(buffer)
-        
+                panels = [p for p in self._probe_panels[anchor]
+                          if not is_obj_deleted(p) and not p.is_closing]
+                start = time.perf_counter()
+                for panel in panels:
+                    panel.update_from_buffer(buffer)
+                throttler.record_render(anchor, (time.perf_counter() - start) * 1000.0)
+                stats = throttler.render_stats(anchor)
+                for panel in panels:
+                    panel.set_render_stats(stats)
+
+        # Overlay data from every batch since the last frame, newest only
+        overlays, self._overlay_payloads = self._overlay_payloads, {}
+        for anchor, payload in overlays.items():
+            self._forward_overlay_data(anchor, payload)
         # Flush any pending overlay data now that plot widgets may exist
         self._probe_controller.flush_pending_overlays()
+        self._evaluate_equations()
+
+    def _redraw_priority(self, anchor: ProbeAnchor) -> int:
+        """Redraw order: the focused panel's probe, then probes on screen, then the rest."""
+        panels = self._probe_panels.get(anchor, ())
+        focused = self._probe_container.focus_manager.focused_panel
+        if focused is not None and focused in panels:
+            return 2
+        return 1 if any(not is_obj_deleted(p) and p.is_live for p in panels) else 0
 
     def _force_redraw(self) -> None:
-        """Redraw all dirty buffers regardless of throttle."""
-        dirty = self._redraw_throttler.get_dirty_buffers()
-        for anchor, buffer in dirty.items():
-            if anchor in self._probe_panels:
-                for panel in self._probe_panels[anchor]:
-                    if not is_obj_deleted(panel) and not panel.is_closing:
-                        panel.update_from_buffer(buffer)
-        
-        # Flush any pending overlay data now that plot widgets may exist
-        self._probe_controller.flush_pending_overlays()
+        """Redraw all dirty buffers now, regardless of throttle."""
+        self._ingest.flush()
+
+    def _evaluate_equations(self) -> None:
+        """M4: Queue re-evaluation of equations whose inputs changed (off the GUI thread)."""
+        if not self._equation_manager.equations:
+            return
+        self._equation_worker.submit(self._latest_trace_data)
+
+    def _on_equation_results(self, eq_ids: set) -> None:
+        """Apply results posted back by the equation worker."""
+        self._update_equation_plots(eq_ids)
+        from .equation_editor import EquationEditorDialog
+        dialog = EquationEditorDialog._instance
+        if dialog is not None and not is_obj_deleted(dialog):
+            dialog.refresh_status()
 
     def _setup_script_runner(self):
         """Configure the script runner with callbacks and connect signals."""
@@ -931,6 +1038,18 @@ class MainWindow(QMainWindow):
         self._script_runner.started.connect(self._on_runner_started)
         self._script_runner.ended.connect(self._on_runner_ended)
         self._script_runner.loop_restarted.connect(self._on_loop_restarted)
+        self._script_runner.checkpoint_changed.connect(self._update_checkpoint_marker)
+        self._sweep_runner.records.connect(self._on_sweep_records)
+        self._sweep_runner.run_finished.connect(self._on_sweep_run_finished)
+        self._sweep_runner.finished.connect(self._on_sweep_finished)
+        self._session_manager.records.connect(self._on_session_records)
+        self._session_manager.exception_raised.connect(self._on_session_exception)
+        self._session_manager.session_ended.connect(self._on_session_ended)
+        # Probes added or removed mid-run reach the side sessions too
+        self._probe_registry.probe_added.connect(
+            lambda anchor, _color: self._session_manager.add_probe(anchor)
+        )
+        self._probe_registry.probe_removed.connect(self._session_manager.remove_probe)
 
     def _setup_probe_controller(self):
         """Connect ProbeController signals to slots."""
@@ -950,72 +1069,6 @@ class MainWindow(QMainWindow):
         else:
             self._status_bar.showMessage(msg)
 
-    @pyqtSlot(dict)
-    def _on_probe_value(self, payload: dict):
-        """Handle single probe value from MessageHandler."""
-        anchor = ProbeAnchor.from_dict(payload['anchor'])
-        logger.debug(f"Received data for {anchor.symbol}")
-        self._probe_registry.update_data_received(anchor)
-
-        # Update all panels for this anchor
-        if anchor in self._probe_panels:
-            # Update metadata dtype
-            if anchor in self._probe_metadata:
-                self._probe_metadata[anchor]['dtype'] = payload['dtype']
-                self._probe_metadata[anchor]['shape'] = payload.get('shape')
-
-            for panel in self._probe_panels[anchor]:
-                if not is_obj_deleted(panel) and not panel.is_closing:
-                    panel.update_data(
-                        value=payload['value'],
-                        dtype=payload['dtype'],
-                        shape=payload.get('shape'),
-                    )
-
-        # Route to scalar watch sidebar if it has this anchor
-        if self._scalar_watch_sidebar.has_scalar(anchor):
-            self._scalar_watch_sidebar.update_scalar(anchor, payload['value'])
-
-        # M2.5: Forward overlay data to target panels
-        self._forward_overlay_data(anchor, payload)
-
-    @pyqtSlot(list)
-    def _on_probe_value_batch(self, probes: list):
-        """Handle batched probe values from MessageHandler."""
-        for probe_data in probes:
-            anchor = ProbeAnchor.from_dict(probe_data['anchor'])
-            
-            # Update trace data for equations
-            trace_id = self._probe_registry.get_trace_id(anchor)
-            if trace_id:
-                self._latest_trace_data[trace_id] = probe_data['value']
-
-            self._probe_registry.update_data_received(anchor)
-            if anchor in self._probe_metadata:
-                self._probe_metadata[anchor]['dtype'] = probe_data['dtype']
-                self._probe_metadata[anchor]['shape'] = probe_data.get('shape')
-
-            if anchor in self._probe_panels:
-                for panel in self._probe_panels[anchor]:
-                    panel.update_data(
-                        value=probe_data['value'],
-                        dtype=probe_data['dtype'],
-                        shape=probe_data.get('shape'),
-                    )
-            
-            # Route to scalar watch sidebar if it has this anchor
-            if self._scalar_watch_sidebar.has_scalar(anchor):
-                self._scalar_watch_sidebar.update_scalar(anchor, probe_data['value'])
-            
-            # M2.5: Forward overlay data to target panels
-            self._forward_overlay_data(anchor, probe_data)
-
-        # M4: Evaluate equations
-        if self._equation_manager.equations:
-            self._equation_manager.evaluate_all(self._latest_trace_data)
-            # Update any widgets currently plotting equations
-            self._update_equation_plots()
-
     def _update_fps(self):
         """Update FPS display."""
         self._fps = self._message_handler.reset_frame_count()
@@ -1138,6 +1191,7 @@ class MainWindow(QMainWindow):
             self._file_watcher.watch_file(abs_path)
             self._last_source_content = self._code_viewer.toPlainText()
             self._restore_file_visuals(abs_path)
+            self._update_checkpoint_marker()
         else:
             # First visit: full load from sidecar
             self._load_script(abs_path)
@@ -1181,6 +1235,7 @@ class MainWindow(QMainWindow):
         self._code_viewer.load_file(path)
         self._file_watcher.watch_file(path)
         self._last_source_content = self._code_viewer.toPlainText()
+        self._update_checkpoint_marker()
 
         self._load_probe_settings()
 
@@ -1283,6 +1338,8 @@ class MainWindow(QMainWindow):
                 target_panel = valid_panels[-1]
                 if hasattr(target_panel, '_overlay_anchors'):
                     for overlay_anchor in target_panel._overlay_anchors:
+                        if self._probe_controller.is_labelled_overlay(overlay_anchor):
+                            continue
                         settings.overlays.append(OverlaySpec(
                             target=ProbeSpec.from_anchor(target_anchor),
                             overlay=ProbeSpec.from_anchor(overlay_anchor)
@@ -1293,6 +1350,8 @@ class MainWindow(QMainWindow):
     @pyqtSlot()
     def _on_action_clicked(self):
         """Handle Run/Pause/Resume action."""
+        if self._sweep_runner.is_running:
+            return  # Sweep runs cannot be paused
         if not self._script_runner.is_running:
              self._on_run_script()
         else:
@@ -1307,12 +1366,17 @@ class MainWindow(QMainWindow):
         # Use the run target (first loaded file) instead of currently viewed file
         run_path = self._run_target_path or self._script_path
 
+        if self._sweep:
+            self._start_sweep(run_path)
+            return
+
         # Configure and start the script runner
         self._script_runner.configure(
             script_path=run_path,
             get_active_anchors=lambda: list(self._probe_registry.active_anchors),
             tracer=self._tracer
         )
+        self._script_runner.loop_mode = self._control_bar.is_loop_enabled
         
         if self._script_runner.start():
             # Start polling timers
@@ -1320,6 +1384,7 @@ class MainWindow(QMainWindow):
             self._fps_timer.start()
             self._status_bar.showMessage(f"Running: {self._script_path}")
             self._control_bar.set_running(True)
+            self._session_manager.start(list(self._probe_registry.active_anchors))
 
     @pyqtSlot()
     def _on_pause_script(self):
@@ -1334,9 +1399,63 @@ class MainWindow(QMainWindow):
     @pyqtSlot()
     def _on_stop_script(self):
         """Stop script execution."""
+        if self._sweep_runner.is_running:
+            self._sweep_runner.stop()
+            return
+        self._session_manager.stop()
         self._script_runner.stop()
         # UI updates handled in _on_runner_ended signal handler
 
+    # === Parameter sweep ===
+
+    def _start_sweep(self, run_path: str) -> None:
+        """
+        Run the script once per sweep point, in parallel.
+
+        The first point feeds the probe panels as a normal run would; every
+        other point's data is overlaid on the same panels, one trace per run.
+        """
+        self._probe_controller.clear_labelled_overlays('sweep')
+        anchors = list(self._probe_registry.active_anchors)
+        self._sweep_failures = 0
+        if self._sweep_runner.start(run_path, self._sweep, anchors, self._sweep_jobs):
+            self._fps_timer.start()
+            self._status_bar.showMessage(
+                f"Sweeping {len(self._sweep)} runs; panels show {self._sweep[0].label}"
+            )
+            self._control_bar.set_running(True)
+
+    def _on_sweep_records(self, index: int, point: SweepPoint, records: list) -> None:
+        """Route one sweep run's captures to the panels or their overlays."""
+        if index == 0:
+            self._broker.publish(records)
+            return
+        latest = {}
+        for record in records:
+            latest[record.anchor] = record
+        for anchor, record in latest.items():
+            self._probe_controller.forward_labelled_data(anchor, point.label, {
+                'value': record.value,
+                'dtype': record.dtype,
+                'shape': record.shape,
+            }, group='sweep')
+
+    def _on_sweep_run_finished(self, index: int, point: SweepPoint, exit_code: int) -> None:
+        """Count runs that failed, for the summary once the sweep is done."""
+        if exit_code != 0:
+            self._sweep_failures += 1
+            logger.warning(f"Sweep run {point.label} exited with code {exit_code}")
+
+    def _on_sweep_finished(self) -> None:
+        """Render the final captures and report the sweep."""
+        self._force_redraw()
+        self._fps_timer.stop()
+        self._control_bar.set_running(False)
+        failed = f", {self._sweep_failures} failed" if self._sweep_failures else ""
+        self._status_bar.showMessage(f"Sweep finished: {len(self._sweep)} runs{failed}")
+        if self._auto_quit:
+            self._schedule_auto_quit()
+
     @pyqtSlot()
     def _on_toggle_watch_window(self):
         """Toggle the scalar watch sidebar visibility."""
@@ -1517,6 +1636,9 @@ class MainWindow(QMainWindow):
     @pyqtSlot(str)
     def _on_file_changed(self, filepath: str):
         """Handle file modification detected by file watcher."""
+        if self._script_runner.script_changed(filepath):
+            self._status_bar.showMessage("Script changed: checkpoint snapshot discarded")
+
         if filepath != self._script_path:
             return
 
@@ -1574,7 +1696,9 @@ class MainWindow(QMainWindow):
         self._tracer.trace_ipc_received("script_ended signal", {})
         self._status_bar.showMessage("Script finished")
 
-        # Ensure final buffered data is rendered after fast runs
+        # Deliver captures held back by subscriber rate limits, then make
+        # sure the final buffered data is rendered after fast runs
+        self._broker.flush()
         self._force_redraw()
 
         # Check loop BEFORE cleanup to decide how to handle
@@ -1601,26 +1725,91 @@ class MainWindow(QMainWindow):
 
             # Auto-quit if requested
             if self._auto_quit:
-                from PyQt6.QtWidgets import QApplication
-                import json
-                
-                logger.info("Auto-quit requested, closing application")
-                # Delay to allow GUI updates to complete, then export, cleanup, and quit
-                def export_and_quit():
-                    self._export_plot_data()
-                    self._script_runner.cleanup()
-                    QTimer.singleShot(500, QApplication.quit)
-                
-                QTimer.singleShot(500, export_and_quit)
+                self._schedule_auto_quit()
             else:
                 self._script_runner.cleanup()
 
+    # === Side sessions ===
+
+    def _on_add_session(self) -> None:
+        """Pick a script to trace alongside the main one."""
+        start_dir = self._folder_path or os.path.dirname(self._script_path or "")
+        path, _ = QFileDialog.getOpenFileName(
+            self,
+            "Run Script Alongside",
+            start_dir,
+            "Python Files (*.py);;All Files (*)"
+        )
+        if not path:
+            return
+        name = self._session_manager.add_script(path)
+        self._status_bar.showMessage(f"Session {name} runs alongside the main script")
+        if self._script_runner.is_running:
+            self._session_manager.start(list(self._probe_registry.active_anchors))
+
+    def _on_clear_sessions(self) -> None:
+        """Stop and remove every side session and its overlays."""
+        for name in self._session_manager.names:
+            self._probe_controller.clear_labelled_overlays(f"session:{name}")
+        self._session_manager.remove_all()
+
+    def _on_session_records(self, name: str, records: list) -> None:
+        """
+        Route a side session's captures. Probes that only this session can
+        produce feed their panels directly; data for probes the main run
+        (or another session) also produces is overlaid under the session's
+        name, so the runs can be compared on one plot.
+        """
+        main_script = self._run_target_path or self._script_path
+        owned, labelled = [], {}
+        owner: Dict[ProbeAnchor, bool] = {}
+        for record in records:
+            anchor = record.anchor
+            if anchor not in owner:
+                owner[anchor] = self._session_manager.owns(name, anchor, main_script)
+            if owner[anchor]:
+                owned.append(record)
+            else:
+                labelled[anchor] = record
+        if owned:
+            self._broker.publish(owned)
+        for anchor, record in labelled.items():
+            self._probe_controller.forward_labelled_data(anchor, name, {
+                'value': record.value,
+                'dtype': record.dtype,
+                'shape': record.shape,
+            }, group=f"session:{name}")
+
+    def _on_session_exception(self, name: str, payload: dict) -> None:
+        """Report a side session's exception without interrupting the main run."""
+        logger.warning(f"Session {name} raised {payload['type']}:\n{payload['traceback']}")
+        self._status_bar.showMessage(f"Session {name}: {payload['type']}: {payload['message']}")
+
+    def _on_session_ended(self, name: str, exit_code: int) -> None:
+        """Log a side session finishing; the main run carries on regardless."""
+        logger.debug(f"Session {name} ended (exit code {exit_code})")
+
+    def _schedule_auto_quit(self) -> None:
+        """Export plot data, clean up and quit once pending GUI updates are done."""
+        from PyQt6.QtWidgets import QApplication
+
+        logger.info("Auto-quit requested, closing application")
+        # Delay to allow GUI updates to complete, then export, cleanup, and quit
+        def export_and_quit():
+            self._export_plot_data()
+            self._script_runner.cleanup()
+            QTimer.singleShot(500, QApplication.quit)
+
+        QTimer.singleShot(500, export_and_quit)
+
     def _do_restart_loop(self):
         """Restart script for loop mode (called after delay)."""
         if self._script_runner.restart_loop():
             self._message_handler.start_polling()
             self._fps_timer.start()
             self._status_bar.showMessage(f"Looping: {self._script_path}")
+            # Sessions that have finished go round again with the main script
+            self._session_manager.start(list(self._probe_registry.active_anchors))
         else:
             self._control_bar.set_running(False)
             self._status_bar.showMessage("Ready")
@@ -1655,9 +1844,54 @@ class MainWindow(QMainWindow):
         """Handle ScriptRunner loop restarted signal."""
         logger.debug(f"ScriptRunner loop restarted, count={loop_count}")
 
+    # === Checkpoints ===
+
+    @pyqtSlot(int)
+    def _on_gutter_line_clicked(self, line: int):
+        """Toggle the checkpoint on a line of the run target."""
+        if not self._script_runner.checkpoints_supported:
+            self._status_bar.showMessage("Checkpoints need os.fork (Linux)")
+            return
+        run_path = self._run_target_path or self._script_path
+        if self._script_path != run_path:
+            self._status_bar.showMessage("Checkpoints can only be set in the run target")
+            return
+
+        if self._script_runner.checkpoint == (run_path, line):
+            self._script_runner.set_checkpoint(None)
+            self._status_bar.showMessage("Checkpoint cleared")
+        else:
+            self._script_runner.set_checkpoint(run_path, line)
+            self._status_bar.showMessage(f"Checkpoint set at line {line}; the next run parks a snapshot there")
+
+    @pyqtSlot(dict)
+    def _on_checkpoint_parked(self, payload: dict):
+        """Hand a freshly parked snapshot to the script runner."""
+        if self._script_runner.adopt_snapshot(payload):
+            self._status_bar.showMessage(
+                f"Checkpoint snapshot parked at line {payload['line']}; later runs resume there"
+            )
+
+    def _update_checkpoint_marker(self):
+        """Show the checkpoint in the gutter if it belongs to the viewed file."""
+        checkpoint = self._script_runner.checkpoint
+        if checkpoint is not None and checkpoint[0] == self._script_path:
+            self._code_gutter.set_checkpoint(checkpoint[1], parked=self._script_runner.has_snapshot)
+        else:
+            self._code_gutter.set_checkpoint(None)
+
     def closeEvent(self, event):
         """Handle window close."""
         self._on_stop_script()
+        self._sweep_runner.shutdown()
+        self._session_manager.shutdown()
+        if self._broker_server is not None:
+            self._broker_server.close()
+        self._broker.shutdown()
+        if self._recorder is not None:
+            self._recorder.close()
+        self._script_runner.set_checkpoint(None)  # releases a parked snapshot
+        self._equation_worker.shutdown()
         super().closeEvent(event)
 
     def _export_plot_data(self) -> None:
@@ -1829,8 +2063,12 @@ class MainWindow(QMainWindow):
             if eq and eq.result is not None:
                 self._update_equation_plots()
 
-    def _update_equation_plots(self):
-        """Update all panels that have equation overlays or are primary equation plots."""
+    def _update_equation_plots(self, eq_ids=None):
+        """Update all panels that have equation overlays or are primary equation plots.
+
+        Args:
+            eq_ids: Only refresh these equations (default: all of them)
+        """
         if not hasattr(self, "_equation_to_panels"):
             return
             
@@ -1838,6 +2076,8 @@ class MainWindow(QMainWindow):
         from pyprobe.plugins.builtins.constellation import ConstellationWidget
         
         for eq_id, panels in self._equation_to_panels.items():
+            if eq_ids is not None and eq_id not in eq_ids:
+                continue
             eq = self._equation_manager.equations.get(eq_id)
             if not eq or eq.result is None:
                 continue
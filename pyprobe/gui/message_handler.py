@@ -5,14 +5,13 @@ Extracted from MainWindow to separate concerns.
 Handles: polling IPC queue, dispatching by message type, emitting Qt signals.
 """
 
-from typing import Optional
+from typing import List, Optional
 from PyQt6.QtCore import QObject, pyqtSignal, QTimer
 
 from pyprobe.logging import get_logger, trace_print
 logger = get_logger(__name__)
 
 from ..ipc.messages import Message, MessageType
-from ..core.anchor import ProbeAnchor
 from ..core.capture_record import CaptureRecord
 
 
@@ -21,21 +20,19 @@ class MessageHandler(QObject):
     Handles IPC message polling and dispatch.
     
     Signals:
-        probe_value: Emitted when probe data arrives (anchor_dict, payload)
-        probe_value_batch: Emitted when batched probe data arrives (list of probe_data)
+        probe_record_batch: Emitted once per poll with every CaptureRecord received
         script_ended: Emitted when script execution completes
         exception_raised: Emitted when script raises exception (payload dict)
         variable_data: Emitted for legacy variable data (payload dict)
+        checkpoint_parked: Emitted when a checkpoint snapshot is parked (payload dict)
     """
     
     # Signals for thread-safe GUI updates
-    probe_value = pyqtSignal(dict)  # Full payload with anchor, value, dtype
-    probe_value_batch = pyqtSignal(list)  # List of probe payloads
-    probe_record = pyqtSignal(object)  # CaptureRecord
     probe_record_batch = pyqtSignal(list)  # List[CaptureRecord]
     script_ended = pyqtSignal()
     exception_raised = pyqtSignal(dict)
     variable_data = pyqtSignal(dict)  # Legacy support
+    checkpoint_parked = pyqtSignal(dict)
     
     def __init__(self, script_runner, tracer=None, parent: Optional[QObject] = None):
         """
@@ -51,6 +48,8 @@ class MessageHandler(QObject):
         self._tracer = tracer
         self._frame_count = 0
         self._end_received = False
+        # Records decoded during the current poll, emitted as one batch
+        self._records: List[CaptureRecord] = []
         
         # Polling timer
         self._poll_timer = QTimer(self)
@@ -128,6 +127,7 @@ class MessageHandler(QObject):
                 )
             self._dispatch(msg)
 
+        self._flush_records()
         if self._end_received:
             self._drain_after_end()
         
@@ -167,17 +167,15 @@ class MessageHandler(QObject):
             self._frame_count += 1
             record = self._payload_to_record(msg.payload)
             if record is not None:
-                self.probe_record.emit(record)
-            self.probe_value.emit(msg.payload)
+                self._records.append(record)
 
         # Handle batched probe data for atomic updates
         elif msg.msg_type == MessageType.DATA_PROBE_VALUE_BATCH:
             self._frame_count += 1
-            probes = msg.payload.get('probes', [])
-            records = [r for r in (self._payload_to_record(p) for p in probes) if r is not None]
-            if records:
-                self.probe_record_batch.emit(records)
-            self.probe_value_batch.emit(probes)
+            for probe in msg.payload.get('probes', []):
+                record = self._payload_to_record(probe)
+                if record is not None:
+                    self._records.append(record)
 
         elif msg.msg_type == MessageType.DATA_SCRIPT_END:
             logger.debug("DATA_SCRIPT_END received, emitting script_ended signal")
@@ -195,9 +193,14 @@ class MessageHandler(QObject):
             self._end_received = True
 
         elif msg.msg_type == MessageType.DATA_EXCEPTION:
+            # Data captured before the exception reaches the GUI first
+            self._flush_records()
             logger.error(f"Received exception from runner: {msg.payload}")
             self.exception_raised.emit(msg.payload)
 
+        elif msg.msg_type == MessageType.DATA_CHECKPOINT:
+            self.checkpoint_parked.emit(msg.payload)
+
         elif msg.msg_type == MessageType.DATA_STDOUT:
             pass  # Could display in a console widget
 
@@ -220,22 +223,19 @@ class MessageHandler(QObject):
                 continue
             self._dispatch(msg)
 
+        self._flush_records()
         self._end_received = False
         self.script_ended.emit()
 
+    def _flush_records(self) -> None:
+        """Emit the records collected so far as a single batch."""
+        if self._records:
+            records, self._records = self._records, []
+            self.probe_record_batch.emit(records)
+
     def _payload_to_record(self, payload: dict) -> Optional[CaptureRecord]:
         """Convert a probe payload dict into a CaptureRecord."""
         try:
-            anchor = ProbeAnchor.from_dict(payload['anchor'])
+            return CaptureRecord.from_dict(payload)
         except Exception:
             return None
-
-        return CaptureRecord(
-            anchor=anchor,
-            value=payload.get('value'),
-            dtype=payload.get('dtype', 'unknown'),
-            shape=payload.get('shape'),
-            seq_num=payload.get('seq_num', -1),
-            timestamp=payload.get('timestamp', 0),
-            logical_order=payload.get('logical_order', 0),
-        )
@@ -4,9 +4,9 @@ Container widget for probe panels with grid layout.
 
 from typing import Dict, Optional, List
 from PyQt6.QtWidgets import (
-    QWidget, QScrollArea, QGridLayout, QLabel
+    QApplication, QWidget, QScrollArea, QGridLayout, QLabel
 )
-from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtCore import Qt, pyqtSignal, QEvent, QRect, QTimer
 from PyQt6.QtGui import QColor
 
 from pyprobe.logging import get_logger
@@ -16,15 +16,22 @@ from ..core.anchor import ProbeAnchor
 from ..core.window_id_manager import WindowIDManager
 from ..core.trace_reference_manager import TraceReferenceManager
 from .probe_panel import ProbePanel
+from .widget_pool import PlotWidgetPool
 
 
 class ProbePanelContainer(QScrollArea):
     """
     Scrollable container for multiple probe panels.
 
-    Uses a grid layout to arrange panels.
+    Uses a grid layout to arrange panels. Panels are virtualized: only
+    those in (or near) the viewport hold a live plot widget; the others,
+    and parked ones, release theirs to a shared pool and skip redraws.
     """
 
+    # Panels within this fraction of a viewport beyond its edges stay live,
+    # so scrolling a little does not rebind widgets
+    LIVE_MARGIN = 0.5
+
     # Emitted before a panel is removed, so controllers can clean up overlays etc.
     panel_closing = pyqtSignal(object)  # ProbePanel
 
@@ -36,6 +43,7 @@ class ProbePanelContainer(QScrollArea):
         self._panels_by_name: Dict[str, ProbePanel] = {}  # For legacy access
         self._parked_panels: set = set()  # Track parked panel anchors
         self._wid_manager = WindowIDManager()
+        self._widget_pool = PlotWidgetPool(self)
 
         # M2.5: Layout manager and focus manager
         from .layout_manager import LayoutManager
@@ -45,6 +53,14 @@ class ProbePanelContainer(QScrollArea):
 
         self._setup_ui()
 
+        # Coalesces scroll/resize/relayout into one viewport check per event loop pass
+        self._visibility_timer = QTimer(self)
+        self._visibility_timer.setSingleShot(True)
+        self._visibility_timer.setInterval(0)
+        self._visibility_timer.timeout.connect(self.update_panel_visibility)
+        self.verticalScrollBar().valueChanged.connect(self._schedule_visibility_update)
+        self.horizontalScrollBar().valueChanged.connect(self._schedule_visibility_update)
+
     def _setup_ui(self):
         """Create the container UI."""
         self.setWidgetResizable(True)
@@ -124,7 +140,10 @@ class ProbePanelContainer(QScrollArea):
         window_id = self._wid_manager.allocate()
 
         # Create panel
-        panel = ProbePanel(anchor, color, dtype, trace_id, window_id, self._content)
+        # While shown, a new panel builds its plot widget only once the
+        # visibility pass finds it in view; off-screen probes never build one
+        panel = ProbePanel(anchor, color, dtype, trace_id, window_id, self._content,
+                           widget_pool=self._widget_pool, live=not self.isVisible())
         
         # Track reference
         if trace_id:
@@ -146,6 +165,12 @@ class ProbePanelContainer(QScrollArea):
         # Add to grid via relayout to handle spanning logic
         self._relayout_panels()
 
+        # Bind the plot widget right away if the panel lands in view, so
+        # callers can render into it straight after creation
+        if self.isVisible():
+            panel.show()
+            panel.set_live(self._should_be_live(anchor, panel, self._live_rect()))
+
         return panel
 
     def remove_panel(self, var_name: str = None, anchor: ProbeAnchor = None, panel: ProbePanel = None):
@@ -235,6 +260,7 @@ class ProbePanelContainer(QScrollArea):
 
         self._layout.removeWidget(target_panel)
         target_panel.deleteLater()
+        self._widget_pool.discard(target_panel)
 
         # Notify reference manager AFTER deleteLater so sip.isdeleted(target_panel) is True
         if wid:
@@ -305,6 +331,8 @@ class ProbePanelContainer(QScrollArea):
             else:
                 self._layout.setRowStretch(r, 0)
 
+        self._schedule_visibility_update()
+
     def get_panel(self, var_name: str = None, anchor: ProbeAnchor = None) -> Optional[ProbePanel]:
         """Get the first panel by variable name or anchor (for backwards compatibility)."""
         if anchor is not None:
@@ -331,12 +359,66 @@ class ProbePanelContainer(QScrollArea):
     def park_panel(self, anchor: ProbeAnchor) -> None:
         """Mark a panel as parked (excluded from layout)."""
         self._parked_panels.add(anchor)
+        for panel in self._panels.get(anchor, []):
+            panel.set_live(False)
         self._relayout_panels()
 
     def unpark_panel(self, anchor: ProbeAnchor) -> None:
         """Mark a panel as unparked (included in layout)."""
         self._parked_panels.discard(anchor)
         self._relayout_panels()
+        self.update_panel_visibility()
+
+    # === Virtualization ===
+
+    def _schedule_visibility_update(self, *_args) -> None:
+        self._visibility_timer.start()
+
+    def update_panel_visibility(self) -> None:
+        """
+        Make panels near the viewport live and the rest dormant.
+
+        Parked panels are always dormant. While the container itself is not
+        shown (e.g. headless use) geometry means nothing, so every unparked
+        panel stays live.
+        """
+        visible = self._live_rect()
+        for anchor, panel_list in self._panels.items():
+            for panel in panel_list:
+                panel.set_live(self._should_be_live(anchor, panel, visible))
+
+    def _live_rect(self) -> Optional[QRect]:
+        """Content-space rectangle live panels must intersect (None when not shown)."""
+        if not self.isVisible():
+            return None
+        # Apply the pending layout (and the scroll area's resize of the
+        # content that follows it) so panel geometry is current
+        QApplication.sendPostedEvents(None, QEvent.Type.LayoutRequest)
+        viewport = self.viewport()
+        mx = int(viewport.width() * self.LIVE_MARGIN)
+        my = int(viewport.height() * self.LIVE_MARGIN)
+        return QRect(-self._content.x(), -self._content.y(),
+                     viewport.width(), viewport.height()).adjusted(-mx, -my, mx, my)
+
+    def _should_be_live(self, anchor: ProbeAnchor, panel: ProbePanel, visible: Optional[QRect]) -> bool:
+        if anchor in self._parked_panels:
+            return False
+        if visible is None:
+            return True
+        return not panel.isHidden() and panel.geometry().intersects(visible)
+
+    @property
+    def widget_pool(self) -> PlotWidgetPool:
+        """The pool plot widgets of dormant panels are returned to."""
+        return self._widget_pool
+
+    def resizeEvent(self, event) -> None:
+        super().resizeEvent(event)
+        self._schedule_visibility_update()
+
+    def showEvent(self, event) -> None:
+        super().showEvent(event)
+        self._schedule_visibility_update()
 
     # === M1 CONVENIENCE METHODS ===
 
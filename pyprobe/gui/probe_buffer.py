@@ -3,9 +3,12 @@
 from dataclasses import dataclass, field
 from typing import List, Optional, Tuple
 
+import numpy as np
+
 from pyprobe.logging import get_logger
 from ..core.anchor import ProbeAnchor
 from ..core.capture_record import CaptureRecord
+from ..core.capture_summary import SummaryIndex
 
 logger = get_logger(__name__)
 
@@ -18,8 +21,10 @@ class ProbeDataBuffer:
     _values: List[object] = field(default_factory=list, init=False, repr=False)
     _timestamps: List[int] = field(default_factory=list, init=False, repr=False)
     _seq_nums: List[int] = field(default_factory=list, init=False, repr=False)
-    _last_dtype: Optional[str] = field(default=None, init=False, repr=False)
-    _last_shape: Optional[tuple] = field(default=None, init=False, repr=False)
+    # Per capture: a probe's dtype and shape can change between captures
+    _dtypes: List[Optional[str]] = field(default_factory=list, init=False, repr=False)
+    _shapes: List[Optional[tuple]] = field(default_factory=list, init=False, repr=False)
+    _summary: SummaryIndex = field(default_factory=SummaryIndex, init=False, repr=False)
 
     def append(self, record: CaptureRecord) -> None:
         """Append a capture record, logging if sequence is out of order."""
@@ -34,13 +39,35 @@ class ProbeDataBuffer:
         self._values.append(record.value)
         self._timestamps.append(record.timestamp)
         self._seq_nums.append(record.seq_num)
-        self._last_dtype = record.dtype
-        self._last_shape = record.shape
+        self._summary.append(record.seq_num, record.value)
+        self._dtypes.append(record.dtype)
+        self._shapes.append(record.shape)
 
     def get_plot_data(self) -> Tuple[List[int], List[object]]:
         """Return timestamps and values for graph rendering."""
         return self._timestamps, self._values
 
+    def value_at(self, index: int) -> object:
+        """Return the value of the ``index``-th capture."""
+        return self._values[index]
+
+    def dtype_at(self, index: int) -> Optional[str]:
+        """Return the dtype of the ``index``-th capture."""
+        return self._dtypes[index]
+
+    def shape_at(self, index: int) -> Optional[tuple]:
+        """Return the shape of the ``index``-th capture."""
+        return self._shapes[index]
+
+    def query(self, text: str) -> np.ndarray:
+        """Run a history query over the summary index; return frame indices."""
+        return self._summary.query(text)
+
+    @property
+    def summary(self) -> SummaryIndex:
+        """Columnar summary index, one row per capture."""
+        return self._summary
+
     @property
     def count(self) -> int:
         """Number of captures stored."""
@@ -63,9 +90,13 @@ class ProbeDataBuffer:
     @property
     def last_dtype(self) -> Optional[str]:
         """Last dtype stored, if any."""
-        return self._last_dtype
+        if not self._dtypes:
+            return None
+        return self._dtypes[-1]
 
     @property
     def last_shape(self) -> Optional[tuple]:
         """Last shape stored, if any."""
-        return self._last_shape
+        if not self._shapes:
+            return None
+        return self._shapes[-1]
@@ -5,7 +5,8 @@ Extracted from MainWindow to separate concerns.
 Handles: probe add/remove, lens preferences, overlay registration and rendering.
 """
 
-from typing import Dict, Optional, List, Callable
+from dataclasses import replace
+from typing import Dict, Optional, List, Callable, Tuple
 from PyQt6.QtCore import QObject, pyqtSignal
 from PyQt6.QtGui import QColor
 from PyQt6.QtWidgets import QWidget
@@ -105,9 +106,20 @@ class ProbeController(QObject):
         # Pending overlay data: buffered when panel._plot is None
         # Key: id(panel), Value: list of (overlay_key, payload) tuples
         self._pending_overlays: Dict[int, list] = {}
+        self._pending_panels: Dict[int, QWidget] = {}
+
+        # Reverse index for overlay routing, so forwarding a record costs
+        # O(targets) instead of a scan over every panel's overlay list.
+        # Key: (symbol, line, is_assignment) of the overlay signal
+        # Value: id(panel) -> (panel, overlay anchors on that panel with this key)
+        self._overlay_routes: Dict[tuple, Dict[int, Tuple[QWidget, List[ProbeAnchor]]]] = {}
 
         # M2.5: Cache last known payload for every anchor to allow immediate re-render on lens change
         self._last_payloads: Dict[ProbeAnchor, dict] = {}
+
+        # Overlays of a probe's data from other runs (sweep points, side
+        # sessions). Key: group, e.g. 'sweep'; Value: [(panel, labelled anchor)]
+        self._labelled_overlays: Dict[str, List[Tuple[QWidget, ProbeAnchor]]] = {}
     
     @property
     def probe_panels(self) -> Dict[ProbeAnchor, List[QWidget]]:
@@ -136,15 +148,72 @@ class ProbeController(QObject):
             ))
         return entries
 
+    # === Overlay routing index ===
+
+    @staticmethod
+    def _overlay_route_key(anchor: ProbeAnchor) -> tuple:
+        """Identity used to match incoming data to overlays (symbol + line + is_assignment)."""
+        return (anchor.symbol, anchor.line, anchor.is_assignment)
+
+    def _register_overlay_route(self, panel, overlay_anchor: ProbeAnchor) -> None:
+        routes = self._overlay_routes.setdefault(self._overlay_route_key(overlay_anchor), {})
+        _panel, anchors = routes.setdefault(id(panel), (panel, []))
+        if overlay_anchor not in anchors:
+            anchors.append(overlay_anchor)
+
+    def _unregister_overlay_route(self, panel, overlay_anchor: ProbeAnchor) -> None:
+        key = self._overlay_route_key(overlay_anchor)
+        routes = self._overlay_routes.get(key)
+        if not routes or id(panel) not in routes:
+            return
+        _panel, anchors = routes[id(panel)]
+        if overlay_anchor in anchors:
+            anchors.remove(overlay_anchor)
+        if not anchors:
+            del routes[id(panel)]
+        if not routes:
+            del self._overlay_routes[key]
+
+    def _unregister_panel_routes(self, panel) -> None:
+        """Drop every overlay route that targets ``panel``."""
+        panel_id = id(panel)
+        for key in list(self._overlay_routes):
+            routes = self._overlay_routes[key]
+            if routes.pop(panel_id, None) is not None and not routes:
+                del self._overlay_routes[key]
+        self._pending_overlays.pop(panel_id, None)
+        self._pending_panels.pop(panel_id, None)
+
+    def _overlay_targets(self, anchor: ProbeAnchor) -> List[Tuple[QWidget, List[ProbeAnchor]]]:
+        """Return live (panel, overlay anchors) pairs that overlay ``anchor``'s data."""
+        key = self._overlay_route_key(anchor)
+        routes = self._overlay_routes.get(key)
+        if not routes:
+            return []
+        targets = []
+        for panel_id, (panel, anchors) in list(routes.items()):
+            if is_obj_deleted(panel):
+                del routes[panel_id]
+                continue
+            targets.append((panel, anchors))
+        if not routes:
+            del self._overlay_routes[key]
+        return targets
+
+    def _overlay_in_use(self, anchor: ProbeAnchor, exclude=None, skip_closing: bool = True) -> bool:
+        """Check whether any panel (other than ``exclude``) overlays exactly ``anchor``."""
+        for panel, anchors in self._overlay_targets(anchor):
+            if panel is exclude:
+                continue
+            if skip_closing and getattr(panel, 'is_closing', False):
+                continue
+            if anchor in anchors:
+                return True
+        return False
+
     def is_used_as_overlay(self, anchor: ProbeAnchor) -> bool:
         """Check if anchor is currently used as an overlay on any active panel."""
-        for panel_list in self._probe_panels.values():
-            for panel in panel_list:
-                if is_obj_deleted(panel) or getattr(panel, 'is_closing', False):
-                    continue
-                if hasattr(panel, '_overlay_anchors') and anchor in panel._overlay_anchors:
-                    return True
-        return False
+        return self._overlay_in_use(anchor)
 
     def has_active_panels(self, anchor: ProbeAnchor) -> bool:
         """Check if anchor has any non-deleted, non-closing panels."""
@@ -161,6 +230,10 @@ class ProbeController(QObject):
         """
         if is_obj_deleted(panel):
             return
+
+        # The panel is going away: stop routing overlay data to it
+        self._unregister_panel_routes(panel)
+
         overlay_anchors = getattr(panel, '_overlay_anchors', None)
         if not overlay_anchors:
             return
@@ -169,16 +242,7 @@ class ProbeController(QObject):
 
         for overlay_anchor in list(overlay_anchors):
             # Check if any OTHER panel still uses this overlay
-            anchor_still_used = False
-            for panel_list in self._probe_panels.values():
-                for p in panel_list:
-                    if p is panel or is_obj_deleted(p) or getattr(p, 'is_closing', False):
-                        continue
-                    if hasattr(p, '_overlay_anchors') and overlay_anchor in p._overlay_anchors:
-                        anchor_still_used = True
-                        break
-                if anchor_still_used:
-                    break
+            anchor_still_used = self._overlay_in_use(overlay_anchor, exclude=panel)
 
             if not anchor_still_used:
                 # Decrement highlight ref count
@@ -373,8 +437,9 @@ class ProbeController(QObject):
                     hex_color = color.name()
                     if hasattr(panel, '_identity_label'):
                         panel._identity_label.setStyleSheet(f"QLabel {{ color: {hex_color}; font-size: 11px; font-weight: bold; }}")
-                    if panel._plot and hasattr(panel._plot, 'set_color'):
-                        panel._plot.set_color(color)
+                    plot = panel.owned_plot()
+                    if plot is not None and hasattr(plot, 'set_color'):
+                        plot.set_color(color)
                 panel.blockSignals(False)
     
     def remove_probe(self, anchor: ProbeAnchor, on_animation_done: Callable = None):
@@ -428,6 +493,8 @@ class ProbeController(QObject):
                 logger.debug(f"Removed last panel, {len(panel_list)} remaining")
 
             # Clean up container
+            if panel is not None:
+                self._unregister_panel_routes(panel)
             if not is_obj_deleted(panel):
                 self._container.remove_probe_panel(panel=panel)
 
@@ -514,6 +581,7 @@ class ProbeController(QObject):
         if overlay_anchor not in target_panel._overlay_anchors:
             target_panel._overlay_anchors.append(overlay_anchor)
             logger.debug(f"Added overlay anchor: {overlay_anchor.symbol} to panel {target_panel._anchor.symbol}")
+        self._register_overlay_route(target_panel, overlay_anchor)
         
         self.status_message.emit(f"Overlaid: {overlay_anchor.symbol} on {target_panel._anchor.symbol}")
     
@@ -536,9 +604,10 @@ class ProbeController(QObject):
             if overlay_anchor in target_panel._overlay_anchors:
                 target_panel._overlay_anchors.remove(overlay_anchor)
                 logger.debug(f"Removed overlay anchor from list")
+        self._unregister_overlay_route(target_panel, overlay_anchor)
         
-        # Remove curves from plot
-        plot = target_panel._plot
+        # Remove curves from plot (including a dormant panel's idle widget)
+        plot = target_panel.owned_plot()
         if plot is not None:
             # Build the overlay key used when adding curves
             overlay_key = f"{overlay_anchor.symbol}_{'lhs' if overlay_anchor.is_assignment else 'rhs'}"
@@ -552,16 +621,7 @@ class ProbeController(QObject):
                 self._remove_overlay_from_constellation(plot, overlay_anchor)
         
         # Check if this overlay anchor is used by any other panels
-        anchor_still_used = False
-        for panel_list in self._probe_panels.values():
-            for panel in panel_list:
-                if is_obj_deleted(panel):
-                    continue
-                if hasattr(panel, '_overlay_anchors') and overlay_anchor in panel._overlay_anchors:
-                    anchor_still_used = True
-                    break
-            if anchor_still_used:
-                break
+        anchor_still_used = self._overlay_in_use(overlay_anchor, skip_closing=False)
 
         if not anchor_still_used:
             # Decrement the overlay ref count that was added by handle_overlay_requested
@@ -652,80 +712,110 @@ class ProbeController(QObject):
         # Cache for immediate re-rendering on lens change
         self._last_payloads[anchor] = payload
 
-        # Find all panels that have this anchor as an overlay
-        for panel_list in self._probe_panels.values():
-            for panel in panel_list:
-                if is_obj_deleted(panel):
-                    continue
-                if not hasattr(panel, '_overlay_anchors'):
-                    continue
+        targets = self._overlay_targets(anchor)
+        if not targets:
+            return
 
-                # Match by full anchor identity: symbol + line + is_assignment
-                matching_overlay = None
-                for overlay_anchor in panel._overlay_anchors:
-                    if (overlay_anchor.symbol == anchor.symbol and
-                        overlay_anchor.line == anchor.line and
-                        overlay_anchor.is_assignment == anchor.is_assignment):
-                        matching_overlay = overlay_anchor
-                        break
+        from pyprobe.plugins.builtins.waveform import WaveformWidget
+        from pyprobe.plugins.builtins.complex_plots import ComplexWidget
+        from pyprobe.plugins.builtins.constellation import ConstellationWidget
 
-                if matching_overlay is None:
-                    continue
+        # Use unique key that includes is_assignment to distinguish LHS/RHS
+        overlay_key = f"{anchor.symbol}_{'lhs' if anchor.is_assignment else 'rhs'}"
 
-                # Forward data to this panel's plot as overlay
-                plot = panel._plot
-
-                # Add overlay data to the waveform or constellation plot
-                from pyprobe.plugins.builtins.waveform import WaveformWidget
-                from pyprobe.plugins.builtins.complex_plots import ComplexWidget
-                from pyprobe.plugins.builtins.constellation import ConstellationWidget
-
-                if plot is None or not isinstance(plot, (WaveformWidget, ComplexWidget, ConstellationWidget)):
-                    # Buffer for later: plot widget not created yet or is still a
-                    # placeholder type (e.g. ScalarHistoryChart) that will be replaced
-                    # once the primary signal's data arrives and determines the final type.
-                    panel_id = id(panel)
-                    if panel_id not in self._pending_overlays:
-                        self._pending_overlays[panel_id] = []
-                    overlay_key = f"{anchor.symbol}_{'lhs' if anchor.is_assignment else 'rhs'}"
-                    self._pending_overlays[panel_id].append({
-                        'overlay_key': overlay_key,
-                        'value': payload['value'],
-                        'dtype': payload['dtype'],
-                        'shape': payload.get('shape'),
-                    })
-                    logger.debug(f"Buffered overlay data for {anchor.symbol} (plot={type(plot).__name__ if plot else 'None'})")
-                    continue
+        for panel, overlay_anchors in targets:
+            matching_overlay = overlay_anchors[0]
 
-                # Use unique key that includes is_assignment to distinguish LHS/RHS
-                overlay_key = f"{anchor.symbol}_{'lhs' if anchor.is_assignment else 'rhs'}"
-
-                if isinstance(plot, ConstellationWidget):
-                    self._add_overlay_to_constellation(
-                        plot,
-                        matching_overlay,
-                        payload['value'],
-                        payload['dtype'],
-                        payload.get('shape'),
-                        primary_anchor=panel._anchor,
-                        target_panel=panel
-                    )
-                elif isinstance(plot, (WaveformWidget, ComplexWidget)):
-                    self._add_overlay_to_waveform(
-                        plot,
-                        matching_overlay,
-                        payload['value'],
-                        payload['dtype'],
-                        payload.get('shape'),
-                        primary_anchor=panel._anchor,
-                        target_panel=panel
-                    )
+            # Forward data to this panel's plot as overlay
+            plot = panel._plot
+
+            if plot is None or not isinstance(plot, (WaveformWidget, ComplexWidget, ConstellationWidget)):
+                # Buffer for later: plot widget not created yet or is still a
+                # placeholder type (e.g. ScalarHistoryChart) that will be replaced
+                # once the primary signal's data arrives and determines the final type.
+                panel_id = id(panel)
+                if panel_id not in self._pending_overlays:
+                    self._pending_overlays[panel_id] = []
+                    self._pending_panels[panel_id] = panel
+                # Only the newest capture per overlay is drawn, so a dormant
+                # panel's buffer stays bounded however long it sleeps
+                pending_list = self._pending_overlays[panel_id]
+                pending_list[:] = [p for p in pending_list if p['overlay_key'] != overlay_key]
+                pending_list.append({
+                    'overlay_key': overlay_key,
+                    'value': payload['value'],
+                    'dtype': payload['dtype'],
+                    'shape': payload.get('shape'),
+                })
+                logger.debug(f"Buffered overlay data for {anchor.symbol} (plot={type(plot).__name__ if plot else 'None'})")
+                continue
+
+            if isinstance(plot, ConstellationWidget):
+                self._add_overlay_to_constellation(
+                    plot,
+                    matching_overlay,
+                    payload['value'],
+                    payload['dtype'],
+                    payload.get('shape'),
+                    primary_anchor=panel._anchor,
+                    target_panel=panel
+                )
+            elif isinstance(plot, (WaveformWidget, ComplexWidget)):
+                self._add_overlay_to_waveform(
+                    plot,
+                    matching_overlay,
+                    payload['value'],
+                    payload['dtype'],
+                    payload.get('shape'),
+                    primary_anchor=panel._anchor,
+                    target_panel=panel
+                )
     
+    # === Overlays from other runs ===
+
+    @staticmethod
+    def labelled_anchor(anchor: ProbeAnchor, label: str) -> ProbeAnchor:
+        """Overlay identity for ``anchor``'s data from the run called ``label``."""
+        return replace(anchor, symbol=f"{anchor.symbol} [{label}]")
+
+    def is_labelled_overlay(self, anchor: ProbeAnchor) -> bool:
+        """True if ``anchor`` carries another run's data for a probe."""
+        return any(
+            labelled == anchor
+            for overlays in self._labelled_overlays.values()
+            for _panel, labelled in overlays
+        )
+
+    def forward_labelled_data(self, anchor: ProbeAnchor, label: str, payload: dict, group: str):
+        """
+        Overlay another run's data for ``anchor`` on that probe's own panels.
+
+        Each label gets its own overlay trace, created on first data and
+        kept until ``clear_labelled_overlays(group)``.
+        """
+        labelled = self.labelled_anchor(anchor, label)
+        for panel in self._probe_panels.get(anchor, []):
+            if is_obj_deleted(panel) or panel.is_closing:
+                continue
+            if not hasattr(panel, '_overlay_anchors'):
+                panel._overlay_anchors = []
+            if labelled not in panel._overlay_anchors:
+                panel._overlay_anchors.append(labelled)
+                self._register_overlay_route(panel, labelled)
+                self._labelled_overlays.setdefault(group, []).append((panel, labelled))
+        self.forward_overlay_data(labelled, payload)
+
+    def clear_labelled_overlays(self, group: str):
+        """Remove every overlay added for ``group``."""
+        for panel, labelled in self._labelled_overlays.pop(group, []):
+            self.remove_overlay(panel, labelled)
+            self._last_payloads.pop(labelled, None)
+
     def flush_pending_overlays(self):
         """
         Apply any buffered overlay data to panels whose plot widgets now exist.
         
-        Called after _maybe_redraw() / _force_redraw() which may create plot widgets.
+        Called after each redraw which may create plot widgets.
         """
         if not self._pending_overlays:
             return
@@ -735,53 +825,52 @@ class ProbeController(QObject):
         
         flushed_ids = []
         
-        for panel_list in self._probe_panels.values():
-            for panel in panel_list:
-                if is_obj_deleted(panel):
-                    continue
-                panel_id = id(panel)
-                if panel_id not in self._pending_overlays:
-                    continue
-                
-                plot = panel._plot
-                if plot is None:
-                    continue  # Still not ready
-                
-                # Only flush if plot is now a supported overlay target type
-                if not isinstance(plot, (WaveformWidget, ComplexWidget)):
-                    continue  # Plot still placeholder (e.g. ScalarHistoryChart), keep buffered
-                
-                # Apply all pending overlay data
-                for pending in self._pending_overlays[panel_id]:
-                    # Match pending key to an anchor in panel._overlay_anchors if possible
-                    match_anchor = None
-                    if hasattr(panel, '_overlay_anchors'):
-                        for oa in panel._overlay_anchors:
-                            key = f"{oa.symbol}_{'lhs' if oa.is_assignment else 'rhs'}"
-                            if key == pending['overlay_key']:
-                                match_anchor = oa
-                                break
-                    
-                    if not match_anchor:
-                        continue
-
-                    if isinstance(plot, (WaveformWidget, ComplexWidget)):
-                        self._add_overlay_to_waveform(
-                            plot,
-                            match_anchor,
-                            pending['value'],
-                            pending['dtype'],
-                            pending['shape'],
-                            primary_anchor=panel._anchor,
-                            target_panel=panel
-                        )
-                    logger.debug(f"Flushed pending overlay: {pending['overlay_key']}")
-                
+        for panel_id, pending_list in self._pending_overlays.items():
+            panel = self._pending_panels.get(panel_id)
+            if is_obj_deleted(panel):
                 flushed_ids.append(panel_id)
+                continue
+            
+            plot = panel._plot
+            if plot is None:
+                continue  # Still not ready
+            
+            # Only flush if plot is now a supported overlay target type
+            if not isinstance(plot, (WaveformWidget, ComplexWidget)):
+                continue  # Plot still placeholder (e.g. ScalarHistoryChart), keep buffered
+            
+            # Apply all pending overlay data
+            for pending in pending_list:
+                # Match pending key to an anchor in panel._overlay_anchors if possible
+                match_anchor = None
+                if hasattr(panel, '_overlay_anchors'):
+                    for oa in panel._overlay_anchors:
+                        key = f"{oa.symbol}_{'lhs' if oa.is_assignment else 'rhs'}"
+                        if key == pending['overlay_key']:
+                            match_anchor = oa
+                            break
+                
+                if not match_anchor:
+                    continue
+
+                self._add_overlay_to_waveform(
+                    plot,
+                    match_anchor,
+                    pending['value'],
+                    pending['dtype'],
+                    pending['shape'],
+                    primary_anchor=panel._anchor,
+                    target_panel=panel
+                )
+                logger.debug(f"Flushed pending overlay: {pending['overlay_key']}")
+            
+            flushed_ids.append(panel_id)
         
         # Clean up flushed entries
         for pid in flushed_ids:
             del self._pending_overlays[pid]
+            self._pending_panels.pop(pid, None)
+
     def _add_overlay_to_waveform(
         self,
         plot,
@@ -812,6 +901,14 @@ class ProbeController(QObject):
         if not hasattr(plot, '_overlay_curves'):
             plot._overlay_curves = {}
 
+        from pyprobe.plots.render_cache import RenderCache
+        cache = RenderCache.instance()
+
+        def overlay_points(channel):
+            n_points = plot.MAX_DISPLAY_POINTS
+            return cache.derived(channel, ('overlay', n_points),
+                                 lambda: plot.downsample(channel, n_points))
+
         from pyprobe.gui.theme.theme_manager import ThemeManager
         theme = ThemeManager.instance().current
         theme_palette = list(theme.row_colors)
@@ -939,15 +1036,15 @@ class ProbeController(QObject):
                 ensure_legend()
                 plot._legend.addItem(curve, f"{trace_id}: {symbol} (imag)")
             
-            # Update curve data
-            real_data = data.real.copy()
-            imag_data = data.imag.copy()
+            # Update curve data (channels shared with every other view of this frame)
+            real_data = cache.channel(data, 'real')
+            imag_data = cache.channel(data, 'imag')
             x = np.arange(len(data))
             
             # Downsample if needed
             if len(data) > plot.MAX_DISPLAY_POINTS:
-                x_real, real_data = plot.downsample(real_data)
-                x_imag, imag_data = plot.downsample(imag_data)
+                x_real, real_data = overlay_points(real_data)
+                x_imag, imag_data = overlay_points(imag_data)
                 plot._overlay_curves[real_key].setData(x_real, real_data)
                 plot._overlay_curves[imag_key].setData(x_imag, imag_data)
             else:
@@ -978,7 +1075,7 @@ class ProbeController(QObject):
             x = np.arange(len(data))
             y = data
             if len(data) > plot.MAX_DISPLAY_POINTS:
-                x, y = plot.downsample(data)
+                x, y = overlay_points(data)
             
             plot._overlay_curves[symbol_key].setData(x, y)
     
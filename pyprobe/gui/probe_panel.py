@@ -23,6 +23,7 @@ from .lens_dropdown import LensDropdown
 from .plot_toolbar import PlotToolbar, InteractionMode
 from .drag_helpers import has_anchor_mime, decode_anchor_mime
 from .probe_buffer import ProbeDataBuffer
+from .widget_pool import PlotWidgetPool
 import pyqtgraph as pg
 
 
@@ -122,7 +123,9 @@ class ProbePanel(QFrame):
         dtype: str,
         trace_id: str = "",
         window_id: str = "",
-        parent: Optional[QWidget] = None
+        parent: Optional[QWidget] = None,
+        widget_pool: Optional[PlotWidgetPool] = None,
+        live: bool = True
     ):
         super().__init__(parent)
 
@@ -139,6 +142,7 @@ class ProbePanel(QFrame):
         self._toolbar: Optional[PlotToolbar] = None
         self._focus_style_base = ""
         self._debug_overlay = None  # Ctrl+Shift+D layout debug overlay
+        self._render_stats = None  # RenderStats of the last redraw, for the overlay
         
         # Track interaction mode and saved ranges for axis-constrained zoom
         self._current_interaction_mode = InteractionMode.POINTER
@@ -155,6 +159,17 @@ class ProbePanel(QFrame):
         self._is_closing = False
         self._pending_lens: Optional[str] = None  # Deferred lens preference
 
+        # History query: panel pinned to a past capture instead of live data
+        self._held_frame: Optional[int] = None
+        self._held_buffer: Optional[ProbeDataBuffer] = None
+
+        # Virtualization: a dormant panel (scrolled away or parked) hands its
+        # plot widget back to the pool and only remembers its data binding
+        self._widget_pool = widget_pool
+        self._live = live
+        self._bound_buffer: Optional[ProbeDataBuffer] = None
+        self._stale = False
+
         self._setup_ui()
 
         # M2.5: Focus policy for keyboard shortcuts
@@ -216,6 +231,15 @@ class ProbePanel(QFrame):
         # Spacer
         header.addStretch()
 
+        # Held-frame indicator (hidden while live); click returns to live
+        from PyQt6.QtWidgets import QPushButton
+        self._frame_btn = QPushButton("")
+        self._frame_btn.setToolTip("Showing a capture from history - click to return to live")
+        self._frame_btn.setFlat(True)
+        self._frame_btn.clicked.connect(self.release_frame)
+        self._frame_btn.hide()
+        header.addWidget(self._frame_btn)
+
         # Throttle indicator (hidden by default)
         self._throttle_label = QLabel("\u26a1")  # Lightning bolt
         self._throttle_label.setToolTip("Data throttling active")
@@ -223,7 +247,6 @@ class ProbePanel(QFrame):
         header.addWidget(self._throttle_label)
 
         # Close button (×)
-        from PyQt6.QtWidgets import QPushButton
         self._close_btn = QPushButton("×")
         self._close_btn.setToolTip("Close this panel")
         self._close_btn.setFixedSize(16, 16)
@@ -242,7 +265,8 @@ class ProbePanel(QFrame):
         
         if plugin:
             self._current_plugin = plugin
-            self._plot = plugin.create_widget(self._anchor.symbol, self._color, self, trace_id=self._trace_id)
+            if self._live:
+                self._plot = self._create_plot_widget(plugin)
             if self._lens_dropdown:
                  # Update dropdown to match if possible, though update_for_dtype usually handles this
                  pass 
@@ -251,7 +275,8 @@ class ProbePanel(QFrame):
             # This ensures we don't break if M2 is partial
             self._plot = create_plot(self._anchor.symbol, self._dtype, self)
 
-        self._layout.addWidget(self._plot)
+        if self._plot is not None:
+            self._layout.addWidget(self._plot)
 
         # Wire legend signals for StepRecorder
         self._wire_legend()
@@ -294,6 +319,19 @@ class ProbePanel(QFrame):
         self._throttle_label.setStyleSheet(
             f"QLabel {{ color: {c['warning']}; font-size: 12px; }}"
         )
+        self._frame_btn.setStyleSheet(f"""
+            QPushButton {{
+                color: {c['accent_primary']};
+                font-size: 11px;
+                border: none;
+                background: transparent;
+                padding: 0px 4px;
+            }}
+            QPushButton:hover {{
+                background-color: {c['bg_medium']};
+                border-radius: 2px;
+            }}
+        """)
         self._close_btn.setStyleSheet(f"""
             QPushButton {{
                 color: {c['text_muted']};
@@ -342,8 +380,10 @@ class ProbePanel(QFrame):
                 return
 
         # If we have an active plugin-based widget, update it
-        if self._current_plugin and self._plot:
-            self._current_plugin.update(self._plot, value, dtype, shape, source_info)
+        # (a dormant panel has a plugin but no widget until it is live again)
+        if self._current_plugin:
+            if self._plot:
+                self._current_plugin.update(self._plot, value, dtype, shape, source_info)
             return
 
         # FALLBACK (Legacy M1 behavior):
@@ -364,6 +404,17 @@ class ProbePanel(QFrame):
 
     def update_from_buffer(self, buffer: ProbeDataBuffer) -> None:
         """Update the plot using the full capture buffer."""
+        self._bound_buffer = buffer
+        if not self._live:
+            # Nothing on screen to redraw; catch up when the panel is live again
+            self._stale = True
+            return
+
+        if self._held_frame is not None:
+            # Pinned to a history frame: keep it on screen, just track the count
+            self._update_frame_label(buffer)
+            return
+
         timestamps, values = buffer.get_plot_data()
         if not values:
             return
@@ -388,6 +439,42 @@ class ProbePanel(QFrame):
             # Fallback to updating with just the latest value
             self.update_data(values[-1], dtype, shape)
 
+    def show_frame(self, buffer: ProbeDataBuffer, index: int) -> None:
+        """Jump to the ``index``-th capture in ``buffer`` and hold it."""
+        if not 0 <= index < buffer.count:
+            return
+        self._held_frame = index
+        self._held_buffer = buffer
+
+        _timestamps, values = buffer.get_plot_data()
+        if hasattr(self._plot, "update_history"):
+            # History widgets show everything up to the selected frame
+            self._plot.update_history(values[:index + 1])
+        else:
+            # The held capture's own dtype and shape, not the newest one's
+            self.update_data(
+                values[index], buffer.dtype_at(index) or self._dtype, buffer.shape_at(index)
+            )
+        self._update_frame_label(buffer)
+        self._frame_btn.show()
+
+    def release_frame(self) -> None:
+        """Return from a held history frame to live data."""
+        buffer = self._held_buffer
+        self._held_frame = None
+        self._held_buffer = None
+        self._frame_btn.hide()
+        if buffer is not None:
+            self.update_from_buffer(buffer)
+
+    @property
+    def held_frame(self) -> Optional[int]:
+        """Index of the history frame on display, or None when live."""
+        return self._held_frame
+
+    def _update_frame_label(self, buffer: ProbeDataBuffer) -> None:
+        self._frame_btn.setText(f"frame {self._held_frame + 1}/{buffer.count} \u25b8 live")
+
     def _on_lens_changed(self, plugin_name: str):
         """Handle lens change - swap out the plot widget."""
         from ..plugins import PluginRegistry
@@ -406,6 +493,11 @@ class ProbePanel(QFrame):
         if not plugin:
             return
 
+        if not self._live:
+            # Dormant: the widget is bound when the panel is live again
+            self._current_plugin = plugin
+            return
+
         # Remove old plot widget
         if self._plot:
             self._plot.hide()  # Hide immediately to prevent visual overlap
@@ -414,12 +506,32 @@ class ProbePanel(QFrame):
         
         # Create new widget from plugin
         self._current_plugin = plugin
-        self._plot = plugin.create_widget(self._anchor.symbol, self._color, self, trace_id=self._trace_id)
+        self._plot = self._create_plot_widget(plugin)
+        self._attach_plot(restore_markers=True)
         
+        # Re-apply data if we had any - but ONLY if widget doesn't support update_history.
+        # For widgets with update_history (like ScalarHistoryWidget), update_from_buffer
+        # will call update_history() which replaces the full buffer, making this redundant
+        # and causing duplicate values.
+        if hasattr(self, '_data') and self._data is not None:
+            if not hasattr(self._plot, 'update_history'):
+                # Application MUST be synchronous to avoid race conditions where 
+                # a later update_data() call is overwritten by a delayed timer!
+                plugin.update(self._plot, self._data, self._dtype, getattr(self, '_shape', None))
+
+    def _create_plot_widget(self, plugin) -> QWidget:
+        """Get a widget for ``plugin`` from the pool (or the plugin directly)."""
+        if self._widget_pool is not None:
+            return self._widget_pool.acquire(plugin, self._anchor.symbol, self._color,
+                                             self, trace_id=self._trace_id)
+        return plugin.create_widget(self._anchor.symbol, self._color, self, trace_id=self._trace_id)
+
+    def _attach_plot(self, restore_markers: bool) -> None:
+        """Put ``self._plot`` under the header and wire it to the panel."""
         # Restore markers from vault if any
-        if hasattr(self._plot, '_marker_store'):
-            parked = self._marker_vault.get(plugin_name, [])
-            for m_data in parked:
+        if restore_markers and hasattr(self._plot, '_marker_store'):
+            lens = self._current_plugin.name if self._current_plugin else "Unknown"
+            for m_data in self._marker_vault.get(lens, []):
                 self._plot._marker_store.add_marker_data(m_data)
 
         # Insert into layout (index 1, after header)
@@ -438,16 +550,109 @@ class ProbePanel(QFrame):
         # Re-apply current toolbar mode to new plot widget
         if self._toolbar:
             self._on_toolbar_mode_changed(self._toolbar.current_mode)
-        
-        # Re-apply data if we had any - but ONLY if widget doesn't support update_history.
-        # For widgets with update_history (like ScalarHistoryWidget), update_from_buffer
-        # will call update_history() which replaces the full buffer, making this redundant
-        # and causing duplicate values.
-        if hasattr(self, '_data') and self._data is not None:
-            if not hasattr(self._plot, 'update_history'):
-                # Application MUST be synchronous to avoid race conditions where 
-                # a later update_data() call is overwritten by a delayed timer!
-                plugin.update(self._plot, self._data, self._dtype, getattr(self, '_shape', None))
+
+    # === Virtualization ===
+
+    @property
+    def is_live(self) -> bool:
+        """False while the panel is dormant (out of view or parked)."""
+        return self._live
+
+    def set_live(self, live: bool) -> None:
+        """
+        Bind or release the plot widget as the panel enters or leaves view.
+
+        A dormant panel hands its plugin widget to the widget pool (or
+        deletes it when it has no pool) and skips redraws, remembering only
+        the buffer it is bound to. Going live takes a widget back and
+        redraws it from that buffer. Panels created with ``live=False``
+        build no widget until their first ``set_live(True)``.
+        """
+        if live == self._live or self._is_closing:
+            return
+        self._live = live
+        if live:
+            self._bind_plot()
+        else:
+            self._release_plot()
+
+    def owned_plot(self) -> Optional[QWidget]:
+        """
+        The plot widget that belongs to this panel: ``_plot`` while live,
+        or while dormant the widget idling in the pool that ``_bind_plot``
+        will reclaim. Changes made to it (colour, overlays) are therefore
+        still there when the panel comes back into view.
+        """
+        if self._plot is not None:
+            return self._plot
+        if self._widget_pool is None or self._current_plugin is None:
+            return None
+        return self._widget_pool.peek(self._current_plugin.name, self)
+
+    def _release_plot(self) -> None:
+        plot = self._plot
+        # Legacy (non-plugin) plots are cheap and stay; they just stop redrawing
+        if plot is None or self._current_plugin is None:
+            return
+        lens = self._current_plugin.name
+        if hasattr(plot, '_marker_store'):
+            # Copy only: an idle widget keeps its markers in case it comes back
+            self._marker_vault[lens] = plot._marker_store.get_markers()
+        self._unwire_plot_signals()
+        self._layout.removeWidget(plot)
+        self._plot = None
+        if self._widget_pool is not None:
+            self._widget_pool.release(lens, self, plot)
+        else:
+            plot.hide()
+            if hasattr(plot, '_marker_store'):
+                plot._marker_store.dispose(release_ids=False)
+            plot.deleteLater()
+
+    def _bind_plot(self) -> None:
+        plugin = self._current_plugin
+        if self._plot is None and plugin is not None:
+            pool = self._widget_pool
+            self._plot = pool.reclaim(plugin.name, self) if pool is not None else None
+            if self._plot is not None:
+                # Our own widget, untouched while idle: only new data is missing
+                self._attach_plot(restore_markers=False)
+            else:
+                # A rebound or new widget starts empty: redraw it from the binding
+                self._plot = self._create_plot_widget(plugin)
+                self._attach_plot(restore_markers=True)
+                self._stale = False
+                if self._held_frame is not None:
+                    self.show_frame(self._held_buffer, self._held_frame)
+                elif self._bound_buffer is not None:
+                    self.update_from_buffer(self._bound_buffer)
+                elif getattr(self, '_data', None) is not None:
+                    plugin.update(self._plot, self._data, self._dtype, getattr(self, '_shape', None))
+        if self._stale and self._bound_buffer is not None:
+            self._stale = False
+            self.update_from_buffer(self._bound_buffer)
+
+    def _unwire_plot_signals(self) -> None:
+        """Disconnect the panel from ``self._plot`` before handing it on."""
+        plot = self._plot
+        connections = [
+            (getattr(plot, 'status_message_requested', None), self.status_message_requested),
+            (getattr(plot, 'axis_interaction_triggered', None), self._on_axis_interaction),
+        ]
+        legend = getattr(plot, '_legend', None) or getattr(plot, '_plot_legend', None)
+        if legend is not None:
+            connections.append((getattr(legend, 'trace_visibility_changed', None), self._on_legend_toggled))
+            connections.append((getattr(legend, 'legend_moved', None), self.legend_moved))
+        if hasattr(plot, '_plot_widget'):
+            vb = plot._plot_widget.getPlotItem().getViewBox()
+            connections.append((getattr(vb, 'sigRangeChangedManually', None), self._on_manual_view_change))
+        for signal, slot in connections:
+            if signal is None:
+                continue
+            try:
+                signal.disconnect(slot)
+            except (TypeError, RuntimeError):
+                pass
 
     @property
     def current_lens(self) -> str:
@@ -478,15 +683,15 @@ class ProbePanel(QFrame):
         
         from ..plugins import PluginRegistry
         registry = PluginRegistry.instance()
-        compatible = registry.get_compatible_plugins(self._dtype, getattr(self, '_shape', None))
+        compatible = {p.name for p in registry.get_compatible_plugins(self._dtype, getattr(self, '_shape', None))}
         
-        for plugin in registry.all_plugins:
-            action = view_menu.addAction(plugin.name)
+        for plugin_name in registry.plugin_names:
+            action = view_menu.addAction(plugin_name)
             action.setCheckable(True)
-            action.setChecked(plugin.name == self.current_lens)
-            action.setEnabled(plugin in compatible)
+            action.setChecked(plugin_name == self.current_lens)
+            action.setEnabled(plugin_name in compatible)
             # Use default argument to capture loop variable
-            action.triggered.connect(lambda checked, name=plugin.name: self._lens_dropdown.set_lens(name))
+            action.triggered.connect(lambda checked, name=plugin_name: self._lens_dropdown.set_lens(name))
         
         # Draw Mode submenu
         if self._plot and hasattr(self._plot, 'series_keys') and hasattr(self._plot, 'set_draw_mode'):
@@ -528,6 +733,68 @@ class ProbePanel(QFrame):
                             )
                         )
         
+        # Spectrum averaging submenu (FFT lenses)
+        if self._plot and hasattr(self._plot, 'set_averaging'):
+            from ..plots.fft_engine import SpectrumAveraging
+            avg_menu = menu.addMenu("Averaging")
+            current = self._plot.get_averaging()
+            for mode in SpectrumAveraging:
+                action = avg_menu.addAction(mode.name.capitalize())
+                action.setCheckable(True)
+                action.setChecked(current == mode)
+                action.triggered.connect(
+                    lambda checked, m=mode: self._plot.set_averaging(m)
+                )
+
+        # Colormap submenu (image lenses)
+        if self._plot and hasattr(self._plot, 'set_colormap'):
+            cmap_menu = menu.addMenu("Colormap")
+            for name in self._plot.COLORMAPS:
+                action = cmap_menu.addAction(name)
+                action.setCheckable(True)
+                action.setChecked(name == self._plot.colormap)
+                action.triggered.connect(
+                    lambda checked, n=name: self._plot.set_colormap(n)
+                )
+
+        # Persistence toggle (waveform lenses)
+        if self._plot and hasattr(self._plot, 'set_persistence'):
+            persistence_action = menu.addAction("Persistence")
+            persistence_action.setCheckable(True)
+            persistence_action.setChecked(self._plot.persistence)
+            persistence_action.triggered.connect(
+                lambda checked: self._plot.set_persistence(checked)
+            )
+
+        # Density (persistence) toggle (constellation lens)
+        if self._plot and hasattr(self._plot, 'set_density_mode'):
+            density_action = menu.addAction("Density")
+            density_action.setCheckable(True)
+            density_action.setChecked(self._plot.density_mode)
+            density_action.triggered.connect(
+                lambda checked: self._plot.set_density_mode(checked)
+            )
+
+        # Eye diagram settings
+        if self._plot and hasattr(self._plot, 'set_samples_per_symbol'):
+            eye_menu = menu.addMenu("Samples/Symbol")
+            for sps in self._plot.SAMPLES_PER_SYMBOL_CHOICES:
+                action = eye_menu.addAction(str(sps))
+                action.setCheckable(True)
+                action.setChecked(sps == self._plot.samples_per_symbol)
+                action.triggered.connect(
+                    lambda checked, n=sps: self._plot.set_samples_per_symbol(n)
+                )
+            if self._plot.is_complex:
+                eye_menu.addSeparator()
+                for channel in self._plot.CHANNELS:
+                    action = eye_menu.addAction(f"{channel} Eye")
+                    action.setCheckable(True)
+                    action.setChecked(channel == self._plot.channel)
+                    action.triggered.connect(
+                        lambda checked, c=channel: self._plot.set_channel(c)
+                    )
+
         # M2.5: Park to bar action
         menu.addSeparator()
         park_action = menu.addAction("Park to Bar")
@@ -1018,8 +1285,22 @@ class ProbePanel(QFrame):
             regions['y_pin'] = QRectF(float(y_tl.x()), float(y_tl.y()), y_geo.width(), y_geo.height())
 
         self._debug_overlay.set_regions(regions)
+        self._debug_overlay.set_caption(self._render_stats_text())
         self._debug_overlay.raise_()
 
+    def set_render_stats(self, stats) -> None:
+        """Record the redraw statistics of this panel's probe (shown in the debug overlay)."""
+        self._render_stats = stats
+        if self._debug_overlay is not None and self._debug_overlay.isVisible():
+            self._debug_overlay.set_caption(self._render_stats_text())
+
+    def _render_stats_text(self) -> str:
+        stats = self._render_stats
+        if stats is None:
+            return ""
+        return (f"{stats.fps:.1f} fps | {stats.cost_ms:.1f} ms/redraw"
+                f" | every {stats.interval_ms:.0f} ms")
+
     @property
     def anchor(self) -> ProbeAnchor:
         """Return the probe anchor."""
@@ -1191,6 +1472,13 @@ class ProbePanel(QFrame):
             dict with 'x' and 'y' keys containing lists of values,
             or empty dict if no data available.
         """
+        if not self._live:
+            # Dormant: bind a widget just long enough to draw and read it
+            self.set_live(True)
+            try:
+                return self.get_plot_data()
+            finally:
+                self.set_live(False)
         if self._plot and hasattr(self._plot, 'get_plot_data'):
             return self._plot.get_plot_data()
         return {'x': [], 'y': []}
@@ -1229,6 +1517,11 @@ class ProbePanel(QFrame):
                 markers.append(m)
             self._marker_vault[lens_name] = markers
             
+        # A dormant panel's idle widget holds the old markers: let it go, so
+        # the panel is rebuilt from the vault when it is live again
+        if self._plot is None and self._widget_pool is not None:
+            self._widget_pool.discard(self)
+
         # If any markers for current lens, inject them
         if self._plot and hasattr(self._plot, '_marker_store'):
             active_lens = self._current_plugin.name if self._current_plugin else "Unknown"
@@ -1,23 +1,56 @@
 """Redraw throttling for probe buffers."""
 
 import time
+from collections import deque
 from dataclasses import dataclass, field
-from typing import Callable, Dict, List, Optional
+from typing import Callable, Deque, Dict, List, Optional
 
 from ..core.anchor import ProbeAnchor
 from ..core.capture_record import CaptureRecord
 from .probe_buffer import ProbeDataBuffer
 
 
+# Weight of the newest sample in each probe's render-cost average
+_COST_SMOOTHING = 0.3
+# Redraw timestamps kept per probe to measure its achieved frame rate
+_FPS_WINDOW = 32
+
+
+@dataclass(frozen=True)
+class RenderStats:
+    """Measured redraw behaviour of one probe."""
+
+    cost_ms: float      # smoothed time one redraw of its panels takes
+    interval_ms: float  # shortest time allowed between its redraws
+    fps: float          # redraws per second actually achieved
+
+
 @dataclass
 class RedrawThrottler:
-    """Throttle redraws while always storing incoming captures."""
+    """
+    Throttle redraws while always storing incoming captures.
+
+    Besides the global ``min_interval_ms`` gate, each probe's render cost is
+    measured (``record_render``) and ``take_due_buffers`` fills a frame with
+    at most ``frame_budget_ms`` of estimated work, highest priority (e.g.
+    focused, then visible panels) first. A probe may use at most
+    ``max_share`` of wall time, so a panel costing 50 ms redraws every
+    200 ms at most instead of stalling every other panel. Dirty probes left
+    out of a frame stay dirty for the next one; probes waiting longer than
+    ``starvation_ms`` go first regardless of priority.
+    """
 
     min_interval_ms: float = 16.0
     clock: Callable[[], float] = time.perf_counter
+    frame_budget_ms: float = 12.0
+    max_share: float = 0.25
+    starvation_ms: float = 1000.0
     _buffers: Dict[ProbeAnchor, ProbeDataBuffer] = field(default_factory=dict, init=False)
     _dirty: Dict[ProbeAnchor, ProbeDataBuffer] = field(default_factory=dict, init=False)
     _last_redraw: float = field(default=0.0, init=False)
+    _cost_ms: Dict[ProbeAnchor, float] = field(default_factory=dict, init=False)
+    _drawn_at: Dict[ProbeAnchor, Deque[float]] = field(default_factory=dict, init=False)
+    _expedite: bool = field(default=False, init=False)
 
     def receive(self, record: CaptureRecord) -> None:
         """Store a capture record and mark its buffer as dirty."""
@@ -36,16 +69,113 @@ class RedrawThrottler:
             return True
         return False
 
+    def time_until_redraw_ms(self) -> float:
+        """
+        Milliseconds until should_redraw() will next return True (0 if now).
+
+        When every dirty probe is still inside its own cost-based interval,
+        this is when the first of them becomes due.
+        """
+        now = self.clock()
+        wait_ms = max(0.0, self.min_interval_ms - (now - self._last_redraw) * 1000.0)
+        if self._dirty and not self._expedite:
+            due_ms = min(self._due_in_ms(anchor, now) for anchor in self._dirty)
+            wait_ms = max(wait_ms, due_ms)
+        return wait_ms
+
+    @property
+    def has_dirty(self) -> bool:
+        """True if any buffer received data since the last redraw."""
+        return bool(self._dirty)
+
     def get_dirty_buffers(self) -> Dict[ProbeAnchor, ProbeDataBuffer]:
         """Return and clear buffers that received new data."""
         dirty = dict(self._dirty)
         self._dirty.clear()
+        self._expedite = False
         return dirty
 
+    def take_due_buffers(
+        self, priority: Optional[Callable[[ProbeAnchor], int]] = None
+    ) -> Dict[ProbeAnchor, ProbeDataBuffer]:
+        """
+        Return and clear the dirty buffers to redraw this frame.
+
+        Due probes are taken in order of starvation, then ``priority``
+        (higher first), then time since their last redraw, skipping any
+        whose estimated cost no longer fits the frame budget. The first
+        one is always taken, so a frame never comes back empty while a
+        probe is due. After ``expedite()`` every dirty buffer is returned.
+        """
+        if self._expedite:
+            return self.get_dirty_buffers()
+        now = self.clock()
+        due = [anchor for anchor in self._dirty if self._due_in_ms(anchor, now) == 0.0]
+
+        def order(anchor: ProbeAnchor) -> tuple:
+            last = self._last_drawn(anchor)
+            starving = (now - last) * 1000.0 >= self.starvation_ms
+            return (not starving, -(priority(anchor) if priority else 0), last)
+
+        batch: Dict[ProbeAnchor, ProbeDataBuffer] = {}
+        spent_ms = 0.0
+        for anchor in sorted(due, key=order):
+            cost_ms = self._cost_ms.get(anchor, 0.0)
+            if batch and spent_ms + cost_ms > self.frame_budget_ms:
+                continue
+            batch[anchor] = self._dirty.pop(anchor)
+            spent_ms += cost_ms
+        return batch
+
+    def expedite(self) -> None:
+        """Make the next take_due_buffers() return every dirty buffer."""
+        self._expedite = True
+
+    # === Render cost ===
+
+    def record_render(self, anchor: ProbeAnchor, cost_ms: float) -> None:
+        """Account one redraw of ``anchor``'s panels that took ``cost_ms``."""
+        previous = self._cost_ms.get(anchor)
+        self._cost_ms[anchor] = cost_ms if previous is None else (
+            previous + _COST_SMOOTHING * (cost_ms - previous))
+        drawn = self._drawn_at.get(anchor)
+        if drawn is None:
+            drawn = self._drawn_at[anchor] = deque(maxlen=_FPS_WINDOW)
+        drawn.append(self.clock())
+
+    def interval_ms(self, anchor: ProbeAnchor) -> float:
+        """Shortest time between redraws of ``anchor`` given its render cost."""
+        return max(self.min_interval_ms, self._cost_ms.get(anchor, 0.0) / self.max_share)
+
+    def render_stats(self, anchor: ProbeAnchor) -> Optional[RenderStats]:
+        """Cost, interval and achieved fps of ``anchor``, or None if never drawn."""
+        if anchor not in self._cost_ms:
+            return None
+        drawn = self._drawn_at[anchor]
+        fps = 0.0
+        if len(drawn) >= 2 and drawn[-1] > drawn[0]:
+            fps = (len(drawn) - 1) / (drawn[-1] - drawn[0])
+            # A probe that stopped redrawing has no rate, whatever it once had
+            if (self.clock() - drawn[-1]) * fps > 2.0:
+                fps = 0.0
+        return RenderStats(self._cost_ms[anchor], self.interval_ms(anchor), fps)
+
+    def _last_drawn(self, anchor: ProbeAnchor) -> float:
+        drawn = self._drawn_at.get(anchor)
+        return drawn[-1] if drawn else float('-inf')
+
+    def _due_in_ms(self, anchor: ProbeAnchor, now: float) -> float:
+        return max(0.0, self.interval_ms(anchor) - (now - self._last_drawn(anchor)) * 1000.0)
+
     def buffer_for(self, anchor: ProbeAnchor) -> Optional[ProbeDataBuffer]:
         """Get the buffer for a probe anchor if present."""
         return self._buffers.get(anchor)
 
+    @property
+    def buffers(self) -> Dict[ProbeAnchor, ProbeDataBuffer]:
+        """Snapshot of all tracked buffers keyed by anchor."""
+        return dict(self._buffers)
+
     @property
     def buffer_count(self) -> int:
         """Number of buffers tracked."""
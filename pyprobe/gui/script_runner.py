@@ -5,7 +5,7 @@ Extracted from MainWindow to separate concerns.
 Handles: start, stop, pause, resume, loop restart, cleanup.
 """
 
-from typing import Optional, List, Callable
+from typing import Optional, List, Callable, Tuple
 from PyQt6.QtCore import QObject, pyqtSignal, QTimer
 import multiprocessing as mp
 
@@ -13,9 +13,13 @@ from pyprobe.logging import get_logger, trace_print
 logger = get_logger(__name__)
 
 from ..ipc.channels import IPCChannel
-from ..ipc.messages import Message, MessageType, make_add_probe_cmd
+from ..ipc.messages import (
+    Message, MessageType, make_add_probe_cmd, make_set_checkpoint_cmd
+)
 from ..core.runner import run_script_subprocess
 from ..core.anchor import ProbeAnchor
+from ..core.checkpoint import CheckpointSnapshot
+from ..core.zygote import TracerZygote, zygote_supported
 
 
 class ScriptRunner(QObject):
@@ -28,6 +32,11 @@ class ScriptRunner(QObject):
         paused: Emitted when script is paused
         resumed: Emitted when script is resumed
         loop_restarted: Emitted when loop mode restarts (with loop count)
+        checkpoint_changed: Emitted when the checkpoint or its snapshot changes
+
+    While a checkpoint snapshot is parked, cleanup keeps the IPC session
+    (and zygote) open: the snapshot holds the session's queues, and later
+    runs of the same script resume from it instead of starting over.
     """
     
     started = pyqtSignal()
@@ -35,6 +44,7 @@ class ScriptRunner(QObject):
     paused = pyqtSignal()
     resumed = pyqtSignal()
     loop_restarted = pyqtSignal(int)  # loop count
+    checkpoint_changed = pyqtSignal()
     
     def __init__(self, parent: Optional[QObject] = None):
         super().__init__(parent)
@@ -47,6 +57,17 @@ class ScriptRunner(QObject):
         self._user_stopped = False
         self._loop_count = 0
         self.use_legacy_ipc = True
+        # Fork legacy-IPC loop restarts from a warm zygote where the platform
+        # allows; a one-shot run would start a zygote it never forks from
+        self.use_zygote = zygote_supported()
+        self.loop_mode = False
+        self._zygote: Optional[TracerZygote] = None
+
+        # Checkpoint as (script path, line), and the snapshot parked there
+        self._checkpoint: Optional[Tuple[str, int]] = None
+        self._snapshot: Optional[CheckpointSnapshot] = None
+        self._snapshot_stale = False
+        self._session_held = False  # IPC kept open after cleanup for the snapshot
         
         # Callbacks to get state from MainWindow
         self._get_active_anchors: Optional[Callable[[], List[ProbeAnchor]]] = None
@@ -79,6 +100,112 @@ class ScriptRunner(QObject):
     @property
     def loop_count(self) -> int:
         return self._loop_count
+
+    @property
+    def checkpoints_supported(self) -> bool:
+        """Checkpoints fork the runner, so they need Linux and queue IPC."""
+        return self.use_legacy_ipc and zygote_supported()
+
+    @property
+    def checkpoint(self) -> Optional[Tuple[str, int]]:
+        """The checkpoint as (script path, line), or None."""
+        return self._checkpoint
+
+    @property
+    def has_snapshot(self) -> bool:
+        """True while a snapshot is parked at the checkpoint."""
+        return self._snapshot is not None
+
+    def set_checkpoint(self, script_path: Optional[str], line: Optional[int] = None) -> None:
+        """Park a snapshot at ``line`` of ``script_path`` on the next run (None clears)."""
+        checkpoint = (script_path, line) if script_path and line else None
+        if checkpoint == self._checkpoint:
+            return
+        self._checkpoint = checkpoint
+        self.discard_snapshot()
+        self.checkpoint_changed.emit()
+
+    def adopt_snapshot(self, payload: dict) -> bool:
+        """
+        Take over the snapshot announced by a DATA_CHECKPOINT message.
+
+        Returns:
+            True if later runs will resume from it.
+        """
+        try:
+            snapshot = CheckpointSnapshot(
+                self._script_path, payload['line'], payload['address'], payload['pid']
+            )
+        except OSError as e:
+            logger.warning(f"Could not reach checkpoint snapshot: {e}")
+            return False
+
+        if (self._checkpoint != (self._script_path, payload['line'])
+                or self._snapshot is not None or self._snapshot_stale):
+            # Checkpoint moved or script edited since this run started
+            snapshot.discard()
+            return False
+
+        self._snapshot = snapshot
+        self.checkpoint_changed.emit()
+        return True
+
+    def discard_snapshot(self) -> None:
+        """Discard the parked snapshot; a run resumed from it may finish first."""
+        self._snapshot_stale = True
+        if not self._is_running:
+            self._drop_stale_snapshot()
+
+    def script_changed(self, script_path: str) -> bool:
+        """
+        React to an edit of ``script_path`` seen by the file watcher.
+
+        A snapshot keeps running the code it was started with, so it is
+        discarded once its script's contents change.
+
+        Returns:
+            True if a snapshot (parked or about to be) was discarded.
+        """
+        if self._checkpoint is None or self._checkpoint[0] != script_path:
+            return False
+        if self._snapshot is not None:
+            if not self._snapshot.is_stale():
+                return False
+        elif not self._is_running:
+            return False
+        self.discard_snapshot()
+        return True
+
+    def _drop_stale_snapshot(self) -> None:
+        """Stop the snapshot if it was discarded; release an idle held session."""
+        if not self._snapshot_stale:
+            return
+        self._snapshot_stale = False
+        if self._snapshot is None:
+            return
+        self._snapshot.discard()
+        self._snapshot = None
+        if self._session_held:
+            self._session_held = False
+            self._release_session()
+        self.checkpoint_changed.emit()
+
+    def _release_session(self) -> None:
+        """Close the IPC channel and the zygote serving it."""
+        if self._zygote is not None:
+            self._zygote.shutdown()
+            self._zygote = None
+
+        if self._ipc is not None:
+            self._ipc.cleanup()
+        self._ipc = None
+
+    def _send_checkpoint(self) -> None:
+        """Ask a fresh run to park a snapshot at the checkpoint."""
+        if (self.checkpoints_supported and self._snapshot is None
+                and self._checkpoint is not None
+                and self._checkpoint[0] == self._script_path):
+            self._ipc.send_command(make_set_checkpoint_cmd(self._checkpoint[1]))
     
     def start(self) -> bool:
         """
@@ -99,17 +226,19 @@ class ScriptRunner(QObject):
         # Create IPC channel and start runner subprocess
         if self.use_legacy_ipc:
             from ..ipc.channels import IPCChannel
-            self._ipc = IPCChannel(is_gui_side=True)
-            self._runner_process = mp.Process(
-                target=run_script_subprocess,
-                args=(
-                    self._script_path,
-                    self._ipc.command_queue,
-                    self._ipc.data_queue,
-                    []  # No legacy watches
-                )
-            )
-            self._runner_process.start()
+            if self._snapshot is not None and self._snapshot.script_path != self._script_path:
+                self.discard_snapshot()
+            if self._session_held and self._snapshot is not None:
+                # Session held for the snapshot: drop the last run's leftovers
+                self._ipc.drain()
+            else:
+                self._release_session()
+                self._ipc = IPCChannel(is_gui_side=True)
+            self._session_held = False
+            self._runner_process = self._spawn_legacy_runner()
+            if self.loop_mode:
+                # Warms up alongside the first run; loop restarts fork from it
+                self._warm_zygote()
         else:
             from ..ipc.socket_channel import SocketIPCChannel
             import subprocess
@@ -134,12 +263,11 @@ class ScriptRunner(QObject):
                 trace_print(f"ScriptRunner.start: ADD_PROBE {anchor.symbol} at line {anchor.line}")
                 msg = make_add_probe_cmd(anchor)
                 self._ipc.send_command(msg)
+        self._send_checkpoint()
         
         # Send START command to begin execution
         self._ipc.send_command(Message(msg_type=MessageType.CMD_START))
         
-
-        
         self._is_running = True
         self._is_paused = False
         
@@ -150,6 +278,54 @@ class ScriptRunner(QObject):
         self.started.emit()
         return True
     
+    def _warm_zygote(self) -> None:
+        """Start a zygote for the session's loop restarts, if there is none."""
+        if self.use_zygote and self._zygote is None and self._ipc is not None:
+            self._zygote = TracerZygote(
+                self._script_path,
+                self._ipc.command_queue,
+                self._ipc.data_queue,
+            )
+
+    def _spawn_legacy_runner(self):
+        """
+        Start a runner on the current IPC queues.
+
+        Resumes from the checkpoint snapshot if one is parked, else forks
+        from the zygote once it has warmed up, so the run skips interpreter
+        startup; otherwise starts a fresh mp.Process.
+        """
+        if self._snapshot is not None:
+            try:
+                return self._snapshot.spawn()
+            except RuntimeError as e:
+                logger.warning(f"Checkpoint snapshot unavailable, running from the top: {e}")
+                self._snapshot.discard()
+                self._snapshot = None
+                self.checkpoint_changed.emit()
+
+        # A zygote still preloading is passed over rather than waited for;
+        # a ready one answers at once, so the GUI only waits briefly
+        if self._zygote is not None and self._zygote.ready:
+            try:
+                return self._zygote.spawn(timeout=1.0)
+            except RuntimeError as e:
+                logger.warning(f"Tracer zygote unavailable, using a new process: {e}")
+                self._zygote.shutdown()
+                self._zygote = None
+
+        process = mp.Process(
+            target=run_script_subprocess,
+            args=(
+                self._script_path,
+                self._ipc.command_queue,
+                self._ipc.data_queue,
+                []  # No legacy watches
+            )
+        )
+        process.start()
+        return process
+
     def stop(self):
         """Stop script execution."""
         if self._tracer:
@@ -230,17 +406,10 @@ class ScriptRunner(QObject):
         
         # Start new subprocess with existing IPC queues
         if isinstance(self._runner_process, mp.Process) or getattr(self, 'use_legacy_ipc', False):
-            self._runner_process = mp.Process(
-                target=run_script_subprocess,
-                args=(
-                    self._script_path,
-                    self._ipc.command_queue,
-                    self._ipc.data_queue,
-                    []
-                )
-            )
-            self._runner_process.start()
+            self._runner_process = self._spawn_legacy_runner()
             logger.debug(f"  new process pid={self._runner_process.pid}")
+            # Loop mode may have been switched on after the first run started
+            self._warm_zygote()
         else:
             import subprocess
             import sys
@@ -265,6 +434,7 @@ class ScriptRunner(QObject):
             for anchor in self._get_active_anchors():
                 msg = make_add_probe_cmd(anchor)
                 self._ipc.send_command(msg)
+        self._send_checkpoint()
         
         # Send START command to begin execution
         self._ipc.send_command(Message(msg_type=MessageType.CMD_START))
@@ -316,6 +486,7 @@ class ScriptRunner(QObject):
                 self._tracer.trace_reaction_subprocess_ended(exitcode)
         
         self._runner_process = None
+        self._drop_stale_snapshot()
         logger.debug(f"  IPC still valid: {self._ipc is not None}")
     
     def cleanup(self):
@@ -358,12 +529,19 @@ class ScriptRunner(QObject):
             if self._tracer:
                 self._tracer.trace_reaction_subprocess_ended(exitcode)
         
-        # Clean up IPC
-        if self._ipc is not None:
-            self._ipc.cleanup()
-        
-        self._ipc = None
         self._runner_process = None
+        self._drop_stale_snapshot()
+
+        if self._snapshot is not None and not self._snapshot.is_alive():
+            self._snapshot.discard()
+            self._snapshot = None
+            self.checkpoint_changed.emit()
+
+        # Clean up IPC, unless a parked snapshot still needs it
+        if self._snapshot is None:
+            self._release_session()
+        else:
+            self._session_held = True
         
         if self._tracer:
             self._tracer.trace_reaction_state_changed("cleanup complete, now IDLE")
@@ -0,0 +1,150 @@
+"""
+Extra tracer sessions that run alongside the main script.
+
+Each session is a script (with its own arguments) traced by its own
+runner process, started together with the main run, so for example a
+reference implementation and an optimized one can be probed side by side
+in real time. Every session is read through one SessionMux.
+"""
+
+import os
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from PyQt6.QtCore import QObject, pyqtSignal
+
+from pyprobe.logging import get_logger
+logger = get_logger(__name__)
+
+from ..ipc.messages import (
+    Message, MessageType, make_add_probe_cmd, make_remove_probe_cmd
+)
+from ..core.anchor import ProbeAnchor
+from ..core.capture_record import CaptureRecord
+from .session_mux import SessionMux, TracerSession, capture_records
+
+
+class SessionManager(QObject):
+    """
+    Runs the configured side sessions and decodes what they send.
+
+    Signals:
+        records: Emitted with (session name, List[CaptureRecord])
+        exception_raised: Emitted with (session name, exception payload dict)
+        session_ended: Emitted with (session name, exit code)
+        sessions_changed: Emitted when sessions are added or removed
+    """
+
+    records = pyqtSignal(str, list)
+    exception_raised = pyqtSignal(str, dict)
+    session_ended = pyqtSignal(str, int)
+    sessions_changed = pyqtSignal()
+
+    def __init__(self, parent: Optional[QObject] = None):
+        super().__init__(parent)
+        # Session name -> (absolute script path, script arguments)
+        self._scripts: Dict[str, Tuple[str, Tuple[str, ...]]] = {}
+        self._running: Dict[str, TracerSession] = {}
+
+        self._mux = SessionMux(self)
+        self._mux.messages.connect(self._on_messages)
+        self._mux.exited.connect(self._on_exited)
+
+    @property
+    def names(self) -> List[str]:
+        return list(self._scripts)
+
+    @property
+    def is_running(self) -> bool:
+        return bool(self._running)
+
+    def script_path(self, name: str) -> Optional[str]:
+        entry = self._scripts.get(name)
+        return entry[0] if entry else None
+
+    def add_script(self, script_path: str, script_args: Sequence[str] = ()) -> str:
+        """Add a session for ``script_path``; return its (unique) name."""
+        base = Path(script_path).stem
+        name, n = base, 2
+        while name in self._scripts:
+            name, n = f"{base}#{n}", n + 1
+        self._scripts[name] = (os.path.abspath(script_path), tuple(script_args))
+        self.sessions_changed.emit()
+        return name
+
+    def remove_all(self) -> None:
+        """Stop and forget every session."""
+        self.stop()
+        self._scripts.clear()
+        self.sessions_changed.emit()
+
+    def owns(self, name: str, anchor: ProbeAnchor, main_script: Optional[str]) -> bool:
+        """
+        True if session ``name`` alone produces data for ``anchor``: the
+        probe is in the session's own script, and neither the main run nor
+        another session runs that script too.
+        """
+        path = self.script_path(name)
+        if path is None or os.path.abspath(anchor.file) != path:
+            return False
+        if main_script and os.path.abspath(main_script) == path:
+            return False
+        return sum(1 for p, _args in self._scripts.values() if p == path) == 1
+
+    def start(self, anchors: Sequence[ProbeAnchor]) -> List[str]:
+        """Start every session that is not already running; return their names."""
+        started = []
+        for name, (path, args) in self._scripts.items():
+            if name in self._running:
+                continue
+            session = TracerSession(name, path, args)
+            session.start(anchors)
+            self._running[name] = session
+            self._mux.add(session)
+            started.append(name)
+        return started
+
+    def stop(self) -> None:
+        """Stop every running session."""
+        for name, session in list(self._running.items()):
+            session.join(stop=True)
+            self._mux.remove(name)
+        self._running.clear()
+
+    def shutdown(self) -> None:
+        """Stop every session and the reader thread."""
+        self.stop()
+        self._mux.shutdown()
+
+    def add_probe(self, anchor: ProbeAnchor) -> None:
+        """Probe ``anchor`` in every running session."""
+        self._send_to_all(make_add_probe_cmd(anchor))
+
+    def remove_probe(self, anchor: ProbeAnchor) -> None:
+        """Stop probing ``anchor`` in every running session."""
+        self._send_to_all(make_remove_probe_cmd(anchor))
+
+    def _send_to_all(self, msg: Message) -> None:
+        for session in self._running.values():
+            session.send_command(msg)
+
+    def _on_messages(self, name: str, messages: list) -> None:
+        records: List[CaptureRecord] = []
+        for msg in messages:
+            if msg.msg_type == MessageType.DATA_EXCEPTION:
+                # Data captured before the exception reaches the GUI first
+                if records:
+                    self.records.emit(name, records)
+                    records = []
+                self.exception_raised.emit(name, msg.payload)
+            records.extend(capture_records(msg))
+        if records:
+            self.records.emit(name, records)
+
+    def _on_exited(self, name: str) -> None:
+        session = self._running.pop(name, None)
+        if session is None:
+            return
+        exit_code = session.join()
+        self._mux.remove(name)
+        self.session_ended.emit(name, exit_code)
@@ -0,0 +1,258 @@
+"""
+Event-driven ingest for runner processes that run side by side.
+
+Sweep runs and extra tracer sessions each own a runner process and an
+IPC channel. Instead of a polling timer per channel, one reader thread
+blocks in ``multiprocessing.connection.wait()`` on every channel's data
+queue and process sentinel at once, and hands each batch of messages to
+the GUI thread. A session is not read again until the GUI has taken its
+last batch, so a fast runner fills its own queue (and throttles itself)
+rather than the Qt event queue.
+"""
+
+import multiprocessing as mp
+import threading
+from multiprocessing.connection import wait
+from typing import Dict, List, Optional, Sequence
+
+from PyQt6.QtCore import QObject, pyqtSignal
+
+from pyprobe.logging import get_logger
+logger = get_logger(__name__)
+
+from ..ipc.channels import IPCChannel
+from ..ipc.messages import Message, MessageType, make_add_probe_cmd
+from ..core.anchor import ProbeAnchor
+from ..core.capture_record import CaptureRecord
+from ..core.runner import run_script_subprocess
+
+# Messages read from one session per wake-up, so one chatty runner cannot
+# hold the others back
+_BATCH_LIMIT = 200
+
+
+def capture_records(msg: Message) -> List[CaptureRecord]:
+    """CaptureRecords carried by a probe-value message (none for other types)."""
+    if msg.msg_type == MessageType.DATA_PROBE_VALUE:
+        payloads = [msg.payload]
+    elif msg.msg_type == MessageType.DATA_PROBE_VALUE_BATCH:
+        payloads = msg.payload.get('probes', [])
+    else:
+        return []
+    records = []
+    for payload in payloads:
+        try:
+            records.append(CaptureRecord.from_dict(payload))
+        except Exception:
+            continue
+    return records
+
+
+class TracerSession:
+    """One runner process and its IPC channel."""
+
+    def __init__(
+        self,
+        name: str,
+        script_path: str,
+        script_args: Sequence[str] = (),
+        constants: Optional[dict] = None,
+    ):
+        self.name = name
+        self.script_path = script_path
+        self.script_args = list(script_args)
+        self.constants = dict(constants or {})
+        self.ipc = IPCChannel(is_gui_side=True)
+        self.process: Optional[mp.Process] = None
+
+    def start(self, anchors: Sequence[ProbeAnchor]) -> None:
+        """Start the runner with ``anchors`` probed from the first line."""
+        self.process = mp.Process(
+            target=run_script_subprocess,
+            args=(self.script_path, self.ipc.command_queue, self.ipc.data_queue, []),
+            kwargs={'script_args': self.script_args, 'constants': self.constants},
+        )
+        self.process.start()
+        for anchor in anchors:
+            self.ipc.send_command(make_add_probe_cmd(anchor))
+        self.ipc.send_command(Message(msg_type=MessageType.CMD_START))
+
+    def send_command(self, msg: Message) -> None:
+        try:
+            self.ipc.send_command(msg)
+        except (OSError, ValueError):
+            pass  # Channel already closed
+
+    def join(self, stop: bool = False) -> int:
+        """
+        Wait for the runner to exit, terminating it if it does not.
+
+        Args:
+            stop: Ask the runner to stop first
+
+        Returns:
+            The exit code (-1 if it could not be read)
+        """
+        proc = self.process
+        if proc is None:
+            return -1
+        if stop and proc.is_alive():
+            self.send_command(Message(msg_type=MessageType.CMD_STOP))
+            proc.join(timeout=2.0)
+        proc.join(timeout=0.5)
+        if proc.is_alive():
+            proc.terminate()
+            proc.join(timeout=0.5)
+            if proc.is_alive():
+                proc.kill()
+                proc.join(timeout=0.1)
+        return proc.exitcode if proc.exitcode is not None else -1
+
+
+class _Watch:
+    def __init__(self, session: TracerSession):
+        self.session = session
+        self.armed = True      # False while the GUI holds an unprocessed batch
+        self.exited = False    # Process sentinel fired and the queue is empty
+
+
+class SessionMux(QObject):
+    """
+    Reads the data queues of any number of TracerSessions on one thread.
+
+    Signals:
+        messages: Emitted with (session name, List[Message]) per batch read
+        exited: Emitted with the session name once its process has ended
+            and every message it sent has been delivered
+    """
+
+    messages = pyqtSignal(str, list)
+    exited = pyqtSignal(str)
+    _batch_read = pyqtSignal(object, list)  # (_Watch, batch), queued to the GUI thread
+    _exit_seen = pyqtSignal(object)
+
+    def __init__(self, parent: Optional[QObject] = None):
+        super().__init__(parent)
+        self._lock = threading.Lock()
+        self._watches: Dict[str, _Watch] = {}
+        # Removed while the reader may be waiting on them; it closes these
+        self._closing: List[_Watch] = []
+        self._wake_reader, self._wake_writer = mp.Pipe(duplex=False)
+        self._thread: Optional[threading.Thread] = None
+        self._stopping = False
+        self._batch_read.connect(self._on_batch_read)
+        self._exit_seen.connect(self._on_exit_seen)
+
+    def add(self, session: TracerSession) -> None:
+        """Start reading ``session`` (its process must already be started)."""
+        with self._lock:
+            self._watches[session.name] = _Watch(session)
+        if self._thread is None:
+            self._stopping = False
+            self._thread = threading.Thread(
+                target=self._run, name="pyprobe-session-mux", daemon=True
+            )
+            self._thread.start()
+        self._wake()
+
+    def remove(self, name: str) -> None:
+        """Stop reading session ``name`` and close its channel."""
+        with self._lock:
+            watch = self._watches.pop(name, None)
+            if watch is None:
+                return
+            if self._thread is None:
+                watch.session.ipc.cleanup()
+                return
+            self._closing.append(watch)
+        self._wake()
+
+    def shutdown(self) -> None:
+        """Stop the reader thread and close every remaining channel."""
+        thread = self._thread
+        if thread is not None:
+            with self._lock:
+                self._stopping = True
+            self._wake()
+            thread.join(timeout=1.0)
+            self._thread = None
+        with self._lock:
+            watches = list(self._watches.values()) + self._closing
+            self._watches, self._closing = {}, []
+        for watch in watches:
+            watch.session.ipc.cleanup()
+
+    def _wake(self) -> None:
+        try:
+            self._wake_writer.send_bytes(b'\0')
+        except OSError:
+            pass
+
+    def _is_current(self, watch: _Watch) -> bool:
+        return self._watches.get(watch.session.name) is watch
+
+    # === GUI thread ===
+
+    def _on_batch_read(self, watch: _Watch, batch: list) -> None:
+        if not self._is_current(watch):
+            return  # Removed since the batch was read
+        self.messages.emit(watch.session.name, batch)
+        with self._lock:
+            watch.armed = True
+        self._wake()
+
+    def _on_exit_seen(self, watch: _Watch) -> None:
+        if self._is_current(watch):
+            self.exited.emit(watch.session.name)
+
+    # === Reader thread ===
+
+    def _run(self) -> None:
+        while True:
+            with self._lock:
+                if self._stopping:
+                    return
+                closing, self._closing = self._closing, []
+                waitables = {}
+                for watch in self._watches.values():
+                    if watch.armed and not watch.exited:
+                        waitables[watch.session.ipc.data_queue.reader] = watch
+                        waitables[watch.session.process.sentinel] = watch
+            for watch in closing:
+                watch.session.ipc.cleanup()
+
+            ready = wait(list(waitables) + [self._wake_reader])
+            serviced = set()
+            for obj in ready:
+                watch = waitables.get(obj)
+                if watch is not None and id(watch) not in serviced:
+                    serviced.add(id(watch))
+                    self._service(watch)
+            if self._wake_reader in ready:
+                while self._wake_reader.poll():
+                    self._wake_reader.recv_bytes()
+
+    def _service(self, watch: _Watch) -> None:
+        """Read one batch from ``watch``'s session and post it to the GUI thread."""
+        with self._lock:
+            if not self._is_current(watch):
+                return  # Closed next time round the loop
+        session = watch.session
+        batch = []
+        for _ in range(_BATCH_LIMIT):
+            try:
+                msg = session.ipc.receive_data(timeout=0)
+            except (OSError, EOFError, ValueError):
+                break
+            if msg is None:
+                break
+            batch.append(msg)
+
+        if batch:
+            with self._lock:
+                watch.armed = False
+            self._batch_read.emit(watch, batch)
+        elif wait([session.process.sentinel], 0):
+            with self._lock:
+                watch.exited = True
+            self._exit_seen.emit(watch)
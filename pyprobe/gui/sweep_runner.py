@@ -0,0 +1,134 @@
+"""
+Parallel parameter-sweep runs.
+
+Each point of a sweep runs as its own TracerSession, up to
+``max_workers`` at a time. A SessionMux reads every run's channel and
+the decoded records are re-emitted tagged with the point they came from.
+"""
+
+import os
+from typing import Dict, List, Optional, Sequence
+
+from PyQt6.QtCore import QObject, pyqtSignal
+
+from pyprobe.logging import get_logger
+logger = get_logger(__name__)
+
+from ..ipc.messages import MessageType
+from ..core.anchor import ProbeAnchor
+from ..core.capture_record import CaptureRecord
+from ..core.sweep import SweepPoint
+from .session_mux import SessionMux, TracerSession, capture_records
+
+
+class SweepRunner(QObject):
+    """
+    Runs one script once per sweep point, several points at a time.
+
+    Signals:
+        records: Emitted with (run index, SweepPoint, List[CaptureRecord])
+            for every batch of data a run produced
+        run_finished: Emitted with (run index, SweepPoint, exit code)
+        finished: Emitted once every run has ended or the sweep was stopped
+    """
+
+    records = pyqtSignal(int, object, list)
+    run_finished = pyqtSignal(int, object, int)
+    finished = pyqtSignal()
+
+    def __init__(self, parent: Optional[QObject] = None):
+        super().__init__(parent)
+        self._script_path: Optional[str] = None
+        self._anchors: List[ProbeAnchor] = []
+        self._points: List[SweepPoint] = []
+        self._next = 0
+        self._active: Dict[str, TracerSession] = {}
+        self._max_workers = 1
+
+        self._mux = SessionMux(self)
+        self._mux.messages.connect(self._on_messages)
+        self._mux.exited.connect(self._on_exited)
+
+    @property
+    def is_running(self) -> bool:
+        return bool(self._active) or self._next < len(self._points)
+
+    def start(
+        self,
+        script_path: str,
+        points: Sequence[SweepPoint],
+        anchors: Sequence[ProbeAnchor],
+        max_workers: Optional[int] = None,
+    ) -> bool:
+        """
+        Start the sweep.
+
+        Args:
+            script_path: Script to run at every point
+            points: Grid points, in the order results should be reported
+            anchors: Probes to register in every run
+            max_workers: Runs in flight at once (default: CPU count)
+
+        Returns:
+            False if a sweep is already running or there is nothing to run.
+        """
+        if self.is_running or not points:
+            return False
+        self._script_path = script_path
+        self._anchors = list(anchors)
+        self._max_workers = max(1, max_workers or os.cpu_count() or 1)
+        self._points = list(points)
+        self._next = 0
+        self._launch()
+        return True
+
+    def stop(self) -> None:
+        """Stop every run and drop the points not started yet."""
+        self._next = len(self._points)
+        for name, session in list(self._active.items()):
+            session.join(stop=True)
+            self._mux.remove(name)
+        self._active = {}
+        self.finished.emit()
+
+    def shutdown(self) -> None:
+        """Stop the sweep, if any, and the reader thread."""
+        if self.is_running:
+            self.stop()
+        self._mux.shutdown()
+
+    def _launch(self) -> None:
+        while self._next < len(self._points) and len(self._active) < self._max_workers:
+            index = self._next
+            self._next += 1
+            point = self._points[index]
+            session = TracerSession(
+                str(index), self._script_path, point.args, dict(point.constants)
+            )
+            session.start(self._anchors)
+            self._active[session.name] = session
+            self._mux.add(session)
+
+    def _on_messages(self, name: str, messages: list) -> None:
+        index = int(name)
+        point = self._points[index]
+        records: List[CaptureRecord] = []
+        for msg in messages:
+            if msg.msg_type == MessageType.DATA_EXCEPTION:
+                logger.warning(f"Sweep run {point.label} raised: {msg.payload}")
+            records.extend(capture_records(msg))
+        if records:
+            self.records.emit(index, point, records)
+
+    def _on_exited(self, name: str) -> None:
+        session = self._active.pop(name, None)
+        if session is None:
+            return
+        exit_code = session.join()
+        self._mux.remove(name)
+        index = int(name)
+        self.run_finished.emit(index, self._points[index], exit_code)
+
+        self._launch()
+        if not self.is_running:
+            self.finished.emit()
@@ -0,0 +1,104 @@
+"""Pool of idle lens widgets shared by the panels of a container."""
+
+from collections import OrderedDict
+from typing import Dict, Optional
+
+from PyQt6.QtGui import QColor
+from PyQt6.QtWidgets import QWidget
+
+
+class PlotWidgetPool:
+    """
+    Idle plot widgets, per lens, handed back by panels that went dormant.
+
+    A panel scrolled out of view or parked releases its widget here and
+    keeps only its data binding. When it comes back, ``reclaim`` returns
+    its own widget if it is still idle (with zoom, markers and settings
+    intact). Otherwise ``acquire`` re-binds the longest-idle widget of the
+    same lens that supports ``rebind(var_name, color, trace_id)``, or asks
+    the lens plugin for a new one. At most ``max_idle`` widgets are kept per
+    lens; older ones are deleted.
+    """
+
+    DEFAULT_MAX_IDLE = 16
+
+    def __init__(self, parent: Optional[QWidget] = None, max_idle: int = DEFAULT_MAX_IDLE):
+        if max_idle < 0:
+            raise ValueError(f"max_idle must be >= 0, got {max_idle}")
+        self._max_idle = max_idle
+        # lens name -> owner panel -> idle widget, longest idle first
+        self._idle: Dict[str, 'OrderedDict[object, QWidget]'] = {}
+        # Idle widgets are parented here so they outlive their last panel
+        self._holder = QWidget(parent)
+        self._holder.hide()
+        self._created = 0
+        self._rebound = 0
+
+    def peek(self, lens: str, owner: object) -> Optional[QWidget]:
+        """The widget ``owner`` released for ``lens``, if still idle (left in the pool)."""
+        idle = self._idle.get(lens)
+        return idle.get(owner) if idle else None
+
+    def reclaim(self, lens: str, owner: object) -> Optional[QWidget]:
+        """Take back the widget ``owner`` released for ``lens``, if still idle."""
+        idle = self._idle.get(lens)
+        return idle.pop(owner, None) if idle else None
+
+    def acquire(self, plugin, var_name: str, color: QColor,
+                parent: Optional[QWidget] = None, trace_id: str = "") -> QWidget:
+        """Return a fresh-looking widget of ``plugin``'s lens bound to ``var_name``."""
+        idle = self._idle.get(plugin.name)
+        if idle:
+            for key, widget in idle.items():
+                if hasattr(widget, 'rebind'):
+                    del idle[key]
+                    widget.rebind(var_name, color, trace_id)
+                    self._rebound += 1
+                    return widget
+        self._created += 1
+        return plugin.create_widget(var_name, color, parent, trace_id=trace_id)
+
+    def release(self, lens: str, owner: object, widget: QWidget) -> None:
+        """Keep ``owner``'s ``widget`` of ``lens`` idle for reuse."""
+        widget.hide()
+        widget.setParent(self._holder)
+        idle = self._idle.setdefault(lens, OrderedDict())
+        stale = idle.pop(owner, None)
+        if stale is not None and stale is not widget:
+            self._dispose(stale)
+        idle[owner] = widget
+        while len(idle) > self._max_idle:
+            _, oldest = idle.popitem(last=False)
+            self._dispose(oldest)
+
+    def discard(self, owner: object) -> None:
+        """Delete the idle widgets ``owner`` left behind (e.g. on panel removal)."""
+        for idle in self._idle.values():
+            widget = idle.pop(owner, None)
+            if widget is not None:
+                self._dispose(widget)
+
+    def clear(self) -> None:
+        """Delete every idle widget."""
+        for idle in self._idle.values():
+            for widget in idle.values():
+                self._dispose(widget)
+        self._idle.clear()
+
+    @staticmethod
+    def _dispose(widget: QWidget) -> None:
+        # Marker IDs stay reserved: the owning panel keeps copies to restore
+        if hasattr(widget, '_marker_store'):
+            widget._marker_store.dispose(release_ids=False)
+        widget.deleteLater()
+
+    def idle_count(self, lens: Optional[str] = None) -> int:
+        """Idle widgets of ``lens``, or of every lens when None."""
+        if lens is not None:
+            return len(self._idle.get(lens, ()))
+        return sum(len(idle) for idle in self._idle.values())
+
+    @property
+    def stats(self) -> dict:
+        """Widgets 'created' by plugins, 'rebound' from other panels, and 'idle'."""
+        return {'created': self._created, 'rebound': self._rebound, 'idle': self.idle_count()}
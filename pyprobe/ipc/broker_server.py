@@ -0,0 +1,133 @@
+"""
+Socket endpoint of the capture broker.
+
+External clients (see ``pyprobe.client``) connect, send one CMD_SUBSCRIBE
+frame naming the anchors and rate they want, then receive a stream of
+DATA_PROBE_VALUE frames. Each client is a frame subscriber of the
+CaptureBroker with its own bounded send queue and sender thread, so a
+slow client loses frames instead of stalling the broker or other clients.
+"""
+
+import os
+import queue
+import threading
+from typing import List, Optional
+
+from pyprobe.logging import get_logger
+logger = get_logger(__name__)
+
+from .messages import MessageType
+from .socket_transport import ConnectionClosed, SocketServer, SocketTransport
+from .wire_protocol import ProtocolError, decode_message
+from ..core.anchor import ProbeAnchor
+from ..core.broker import CaptureBroker, Subscription
+
+# Frames buffered per client before new ones are dropped
+_CLIENT_QUEUE_SIZE = 1000
+
+
+class _Client:
+    def __init__(self, transport: SocketTransport):
+        self.transport = transport
+        self.frames: "queue.Queue[Optional[bytes]]" = queue.Queue(maxsize=_CLIENT_QUEUE_SIZE)
+        self.subscription: Optional[Subscription] = None
+        self.dropped = 0
+
+    def offer(self, frame: bytes) -> None:
+        try:
+            self.frames.put_nowait(frame)
+        except queue.Full:
+            self.dropped += 1
+
+
+class BrokerServer:
+    """Serves the capture stream of a CaptureBroker on a Unix socket."""
+
+    def __init__(self, broker: CaptureBroker, unix_path: str):
+        self._broker = broker
+        self._server = SocketServer(unix_path=unix_path)
+        self._clients: List[_Client] = []
+        self._lock = threading.Lock()
+        self._shutdown_event = threading.Event()
+        self._accept_thread = threading.Thread(
+            target=self._accept_loop, name="pyprobe-broker-accept", daemon=True
+        )
+        self._accept_thread.start()
+
+    @property
+    def address(self) -> str:
+        return self._server.address()[0]
+
+    def _accept_loop(self) -> None:
+        while not self._shutdown_event.is_set():
+            try:
+                transport = self._server.accept(timeout=0.5)
+            except TimeoutError:
+                continue
+            except ConnectionError as e:
+                if not self._shutdown_event.is_set():
+                    logger.error(f"Broker socket accept failed: {e}")
+                return
+            threading.Thread(
+                target=self._serve, args=(transport,), name="pyprobe-broker-client", daemon=True
+            ).start()
+
+    def _serve(self, transport: SocketTransport) -> None:
+        """Read the client's subscription, then send it frames until it goes away."""
+        try:
+            msg = decode_message(transport.recv_frame())
+        except (ConnectionClosed, ProtocolError) as e:
+            logger.debug(f"Broker client did not subscribe: {e}")
+            transport.close()
+            return
+        if msg.msg_type != MessageType.CMD_SUBSCRIBE:
+            logger.debug(f"Broker client sent {msg.msg_type.name} instead of CMD_SUBSCRIBE")
+            transport.close()
+            return
+
+        anchors = msg.payload.get('anchors')
+        if anchors is not None:
+            anchors = [ProbeAnchor.from_dict(a) for a in anchors]
+        client = _Client(transport)
+        with self._lock:
+            if self._shutdown_event.is_set():
+                transport.close()
+                return
+            self._clients.append(client)
+        client.subscription = self._broker.subscribe_frames(
+            client.offer, anchors, msg.payload.get('max_rate_hz')
+        )
+
+        try:
+            while True:
+                frame = client.frames.get()
+                if frame is None:
+                    break
+                transport.send_frame(frame)
+        except ConnectionClosed:
+            pass
+        finally:
+            self._broker.unsubscribe(client.subscription)
+            with self._lock:
+                if client in self._clients:
+                    self._clients.remove(client)
+            if client.dropped:
+                logger.info(f"Broker client dropped {client.dropped} frames")
+            transport.close()
+
+    def close(self) -> None:
+        """Stop accepting clients and disconnect the connected ones."""
+        self._shutdown_event.set()
+        self._server.close()
+        try:
+            os.unlink(self.address)
+        except OSError:
+            pass
+        with self._lock:
+            clients = list(self._clients)
+        for client in clients:
+            try:
+                client.frames.put_nowait(None)
+            except queue.Full:
+                client.transport.close()
+        self._accept_thread.join(timeout=1.0)
@@ -4,6 +4,7 @@ Queue-based messaging and shared memory for large arrays.
 """
 
 import multiprocessing as mp
+import os
 from multiprocessing import shared_memory
 from typing import Optional, Dict, Any
 from dataclasses import dataclass
@@ -12,6 +13,13 @@ import numpy as np
 import threading
 
 from .messages import Message
+from .pipe_queue import PipeQueue
+
+# Queues whose locks are made in the 'forkserver' context (where there is
+# one) can be handed to the processes it starts, e.g. the tracer zygote
+_QUEUE_CONTEXT = mp.get_context(
+    'forkserver' if 'forkserver' in mp.get_all_start_methods() else None
+)
 
 
 @dataclass
@@ -31,23 +39,33 @@ class IPCChannel:
     - Data (Runner -> GUI):
       - Small data via Queue (< 10KB)
       - Large arrays via shared memory
+
+    The queues are PipeQueues, so runs forked with ``os.fork()`` (zygote
+    runs, checkpoint snapshots) can keep using them.
     """
 
     # Threshold for using shared memory vs queue (10 KB)
     SHARED_MEM_THRESHOLD = 10 * 1024
 
-    def __init__(self, is_gui_side: bool = True):
+    def __init__(
+        self,
+        is_gui_side: bool = True,
+        command_queue: Optional[PipeQueue] = None,
+        data_queue: Optional[PipeQueue] = None,
+    ):
         """
         Args:
             is_gui_side: True if this is the GUI process, False for runner
+            command_queue: Existing command queue to use (runner side)
+            data_queue: Existing data queue to use (runner side)
         """
         self._is_gui = is_gui_side
 
         # Command queue: GUI -> Runner
-        self._command_queue: mp.Queue = mp.Queue(maxsize=100)
+        self._command_queue = command_queue or PipeQueue(maxsize=100, ctx=_QUEUE_CONTEXT)
 
         # Data queue: Runner -> GUI
-        self._data_queue: mp.Queue = mp.Queue(maxsize=1000)
+        self._data_queue = data_queue or PipeQueue(maxsize=1000, ctx=_QUEUE_CONTEXT)
 
         # Shared memory pool for large arrays
         self._shm_pool: Dict[str, shared_memory.SharedMemory] = {}
@@ -57,12 +75,12 @@ class IPCChannel:
         self._shm_idx = 0
 
     @property
-    def command_queue(self) -> mp.Queue:
+    def command_queue(self) -> PipeQueue:
         """Queue for GUI -> Runner commands."""
         return self._command_queue
 
     @property
-    def data_queue(self) -> mp.Queue:
+    def data_queue(self) -> PipeQueue:
         """Queue for Runner -> GUI data."""
         return self._data_queue
 
@@ -129,8 +147,8 @@ class IPCChannel:
     def _put_array_in_shared_mem(self, arr: np.ndarray) -> SharedArrayHandle:
         """Put a numpy array into shared memory."""
         with self._shm_lock:
-            # Create unique name for this array
-            name = f"pyprobe_arr_{self._shm_idx}"
+            # Create unique name for this array (runners may run side by side)
+            name = f"pyprobe_arr_{os.getpid()}_{self._shm_idx}"
             self._shm_idx = (self._shm_idx + 1) % 100  # Ring buffer of 100 slots
 
             # Clean up old shared memory if exists
@@ -176,24 +194,17 @@ class IPCChannel:
             # Return a copy (so shared memory can be reused)
             return arr.copy()
 
+    def drain(self):
+        """Discard pending messages in both directions (e.g. from a finished run)."""
+        self._drain_queue(self._data_queue)
+        self._drain_queue(self._command_queue)
+
     def cleanup(self):
         """Clean up all IPC resources."""
         # Drain queues first (non-blocking)
         self._drain_queue(self._data_queue)
         self._drain_queue(self._command_queue)
 
-        # Cancel any pending joins on the feeder threads
-        # This prevents hanging on macOS when subprocess has exited
-        try:
-            self._data_queue.cancel_join_thread()
-        except Exception:
-            pass
-
-        try:
-            self._command_queue.cancel_join_thread()
-        except Exception:
-            pass
-
         # Close queues
         try:
             self._data_queue.close()
@@ -216,7 +227,7 @@ class IPCChannel:
                     pass
             self._shm_pool.clear()
 
-    def _drain_queue(self, queue: mp.Queue):
+    def _drain_queue(self, queue: PipeQueue):
         """Drain all messages from a queue without blocking."""
         try:
             while True:
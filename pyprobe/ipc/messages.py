@@ -4,7 +4,7 @@ Message protocol for GUI <-> Runner communication.
 
 from dataclasses import dataclass, field
 from enum import Enum, auto
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 import time
 
 
@@ -34,6 +34,13 @@ class MessageType(Enum):
     DATA_PROBE_VALUE = auto()   # Probe data with anchor context
     DATA_PROBE_VALUE_BATCH = auto()  # Batched probe data from same trace event
 
+    # Fork-based checkpoints
+    CMD_SET_CHECKPOINT = auto()  # Park a snapshot when the script reaches a line
+    DATA_CHECKPOINT = auto()     # A snapshot is parked and accepting connections
+
+    # Capture broker (client -> GUI)
+    CMD_SUBSCRIBE = auto()       # Subscribe to captures, optionally filtered and rate-limited
+
 
 @dataclass
 class Message:
@@ -138,6 +145,7 @@ def make_probe_value_msg(
     seq_num: Optional[int] = None,
     timestamp: Optional[int] = None,
     logical_order: int = 0,
+    thread_id: int = 0,
 ) -> Message:
     """Create DATA_PROBE_VALUE message."""
     return Message(
@@ -150,12 +158,13 @@ def make_probe_value_msg(
             'seq_num': seq_num,
             'timestamp': timestamp,
             'logical_order': logical_order,
+            'thread_id': thread_id,
         }
     )
 
 
 def make_probe_value_batch_msg(
-    probes: list,  # List of dicts or (anchor, value, dtype, shape, seq, timestamp, order)
+    probes: list,  # List of dicts or (anchor, value, dtype, shape, seq, timestamp, order[, thread_id])
 ) -> Message:
     """
     Create DATA_PROBE_VALUE_BATCH message.
@@ -169,7 +178,7 @@ def make_probe_value_batch_msg(
             items.append(item)
             continue
 
-        anchor, value, dtype, shape, seq_num, timestamp, logical_order = item
+        anchor, value, dtype, shape, seq_num, timestamp, logical_order, *rest = item
         items.append({
             'anchor': anchor.to_dict(),
             'value': value,
@@ -178,9 +187,47 @@ def make_probe_value_batch_msg(
             'seq_num': seq_num,
             'timestamp': timestamp,
             'logical_order': logical_order,
+            'thread_id': rest[0] if rest else 0,
         })
     return Message(
         msg_type=MessageType.DATA_PROBE_VALUE_BATCH,
         payload={'probes': items}
     )
 
+
+# === Checkpoint messages ===
+
+def make_set_checkpoint_cmd(line: int) -> Message:
+    """Create CMD_SET_CHECKPOINT message for a line of the target script."""
+    return Message(
+        msg_type=MessageType.CMD_SET_CHECKPOINT,
+        payload={'line': line}
+    )
+
+
+def make_checkpoint_msg(line: int, address: str, pid: int) -> Message:
+    """Create DATA_CHECKPOINT message announcing a parked snapshot."""
+    return Message(
+        msg_type=MessageType.DATA_CHECKPOINT,
+        payload={
+            'line': line,
+            'address': address,
+            'pid': pid,
+        }
+    )
+
+
+# === Capture broker messages ===
+
+def make_subscribe_cmd(
+    anchors: Optional[List['ProbeAnchor']] = None,
+    max_rate_hz: Optional[float] = None,
+) -> Message:
+    """Create CMD_SUBSCRIBE message (no anchors means every anchor)."""
+    return Message(
+        msg_type=MessageType.CMD_SUBSCRIBE,
+        payload={
+            'anchors': None if anchors is None else [a.to_dict() for a in anchors],
+            'max_rate_hz': max_rate_hz,
+        }
+    )
@@ -0,0 +1,95 @@
+"""
+Queue over a pipe that stays usable across a bare ``os.fork()``.
+
+``multiprocessing.Queue`` hands each ``put()`` to a feeder thread. A
+process forked with ``os.fork()`` (zygote runs, checkpoint snapshots)
+inherits that thread's buffer and locks but not the thread, so its own
+puts would never be sent. PipeQueue has no thread: ``put()`` pickles the
+message and writes it to the pipe under a lock shared by every process
+holding the queue. A fork in the middle of a write only makes the child
+wait for the parent to finish it.
+"""
+
+import multiprocessing as mp
+import pickle
+import time
+from multiprocessing.connection import Connection
+from queue import Empty, Full
+from typing import Any, Optional
+
+
+class PipeQueue:
+    """
+    Multi-producer, multi-consumer queue with the put/get API of
+    ``multiprocessing.Queue``.
+
+    ``put()`` writes synchronously, so it blocks while the pipe is full:
+    a slow reader slows its writers down instead of piling messages up
+    in them.
+    """
+
+    def __init__(self, maxsize: int = 0, ctx=None):
+        """
+        Args:
+            maxsize: Most messages sent but not yet received (0 = no limit)
+            ctx: multiprocessing context to create the locks in (default:
+                the default context)
+        """
+        ctx = ctx or mp.get_context()
+        self._reader, self._writer = ctx.Pipe(duplex=False)
+        self._rlock = ctx.Lock()
+        self._wlock = ctx.Lock()
+        self._slots = ctx.BoundedSemaphore(maxsize) if maxsize > 0 else None
+
+    @property
+    def reader(self) -> Connection:
+        """Read end of the pipe, e.g. for ``multiprocessing.connection.wait()``."""
+        return self._reader
+
+    def put(self, obj: Any, block: bool = True, timeout: Optional[float] = None) -> None:
+        """
+        Send ``obj``.
+
+        Raises:
+            queue.Full: If ``maxsize`` messages are still unread after
+                ``timeout`` seconds (at once when ``block`` is False)
+        """
+        if self._slots is not None and not self._slots.acquire(block, timeout):
+            raise Full
+        try:
+            data = pickle.dumps(obj, pickle.HIGHEST_PROTOCOL)
+            with self._wlock:
+                self._writer.send_bytes(data)
+        except BaseException:
+            if self._slots is not None:
+                self._slots.release()
+            raise
+
+    def get(self, block: bool = True, timeout: Optional[float] = None) -> Any:
+        """
+        Receive the next message.
+
+        Raises:
+            queue.Empty: If none arrives within ``timeout`` seconds (at once
+                when ``block`` is False)
+        """
+        if not block:
+            timeout = 0.0
+        deadline = None if timeout is None else time.monotonic() + timeout
+        if not self._rlock.acquire(True, timeout):
+            raise Empty
+        try:
+            remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+            if not self._reader.poll(remaining):
+                raise Empty
+            data = self._reader.recv_bytes()
+        finally:
+            self._rlock.release()
+        if self._slots is not None:
+            self._slots.release()
+        return pickle.loads(data)
+
+    def close(self) -> None:
+        """Close this process's ends of the pipe."""
+        self._reader.close()
+        self._writer.close()
@@ -14,7 +14,22 @@ def _extract_arrays(obj: Any, arrays: List[bytes], array_metadata: List[Dict[str
     """
     Recursively find numpy arrays in an object, replace them with placeholders,
     and collect their raw bytes and metadata.
+
+    Scalars JSON cannot hold (complex, numpy ints and bools) travel as 0-d
+    arrays and come back as numpy scalars.
     """
+    if isinstance(obj, complex) or (isinstance(obj, np.generic) and not isinstance(obj, (float, str))):
+        idx = len(arrays)
+        scalar = np.asarray(obj)
+        arrays.append(scalar.tobytes())
+        array_metadata.append({
+            'dtype': str(scalar.dtype),
+            'shape': [],
+            'idx': idx,
+            'scalar': True
+        })
+        return f"__array_idx_{idx}__"
+
     if isinstance(obj, np.ndarray):
         idx = len(arrays)
         # Ensure it's C-contiguous for reliable tobytes/frombuffer
@@ -135,6 +150,8 @@ def decode_message(data: bytes) -> Message:
             
         array_bytes = binary_data[current_offset:current_offset+int(size)]
         arr = np.frombuffer(array_bytes, dtype=dtype).reshape(shape).copy()
+        if meta.get('scalar'):
+            arr = arr[()]
         reconstructed_arrays.append(arr)
         current_offset += int(size)
         
@@ -183,13 +183,12 @@ class ConstellationPlot(PinLayoutMixin, BasePlot):
             # If real, treat as I channel only
             self._data = self._data.astype(np.complex128)
 
-        # Update history
-        self._history.append(self._data.copy())
+        # Update history; frames are downsampled once, when they arrive
+        displayed = self._downsample(self._data)
+        self._history.append(displayed.copy() if displayed is self._data else displayed)
         if len(self._history) > self.HISTORY_LENGTH:
             self._history.pop(0)
-
-        # Downsample if needed
-        display_data = [self._downsample(d) for d in self._history]
+        display_data = self._history
 
         # Offset so newest data goes to brightest scatter (last scatter item has alpha=1.0)
         offset = len(self._scatter_items) - len(display_data)
@@ -0,0 +1,257 @@
+"""
+Min-max decimation shared by all line-plot lenses.
+
+Each chunk of samples contributes its minimum and maximum, in time order,
+so peaks survive at any zoom level. The first and last samples are always
+kept so a decimated trace spans exactly the same x-range as the raw data.
+
+Chunk extrema are found in bulk: the longest prefix that divides evenly
+into equal chunks is reshaped to (chunks, chunk_len) and reduced along the
+last axis, and the short remainder is reduced as one extra chunk. The
+reduction runs over cache-sized blocks of chunks, so large traces are read
+from main memory once rather than once for argmin and again for argmax.
+"""
+
+from typing import Optional, Tuple
+
+import numpy as np
+
+
+def minmax_decimate(data: np.ndarray, n_points: int, x_offset: int = 0
+                    ) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Reduce samples along the last axis to at most ``n_points`` per row.
+
+    Args:
+        data: 1D array, or 2D array of rows decimated independently.
+        n_points: Maximum output points per row (first, last and one
+            min/max pair per chunk).
+        x_offset: Added to the returned sample indices (for sliced data).
+
+    Returns:
+        (x, y): sample indices into the original data and their values.
+        For 1D input both are 1D. For 2D input both have one row per input
+        row; rows may pick different indices.
+        Data that already fits is returned unchanged with ``x = arange``.
+    """
+    data = np.asarray(data)
+    n = data.shape[-1]
+    if n <= n_points or n < 2:
+        x = np.arange(n, dtype=np.int64) + x_offset
+        if data.ndim == 2:
+            x = np.broadcast_to(x, data.shape)
+        return x, data
+
+    # Reserve 2 points for the first and last samples
+    n_chunks = (n_points - 2) // 2
+    if n_chunks <= 0:
+        x = np.array([0, n - 1], dtype=np.int64) + x_offset
+        y = data[..., [0, n - 1]]
+        if data.ndim == 2:
+            x = np.broadcast_to(x, y.shape)
+        return x, y
+
+    rows = data.reshape(-1, n)
+    chunk_len = -(-n // n_chunks)  # ceil, so at most n_chunks chunks in total
+    full = n // chunk_len
+    body = full * chunk_len
+
+    lo, hi = _chunk_extrema(rows[:, :body].reshape(len(rows), full, chunk_len))
+    starts = np.arange(full, dtype=np.int64) * chunk_len
+    lo += starts
+    hi += starts
+    if body < n:
+        t_lo, t_hi = _chunk_extrema(rows[:, np.newaxis, body:])
+        lo = np.concatenate([lo, t_lo + body], axis=1)
+        hi = np.concatenate([hi, t_hi + body], axis=1)
+
+    # Interleave each chunk's (earlier, later) extremum between the endpoints
+    n_rows, used = lo.shape
+    x = np.empty((n_rows, 2 * used + 2), dtype=np.int64)
+    x[:, 0] = 0
+    x[:, 1:-1:2] = lo
+    x[:, 2:-1:2] = hi
+    x[:, -1] = n - 1
+    y = np.take_along_axis(rows, x, axis=1)
+    x += x_offset
+
+    if data.ndim == 1:
+        return x[0], y[0]
+    return x, y
+
+
+# Bytes reduced per argmin/argmax call: small enough that the argmax pass
+# re-reads the block from cache instead of main memory
+_BLOCK_BYTES = 1 << 20
+
+
+def _chunk_extrema(chunks: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Per-chunk (earlier, later) of argmin/argmax along the last axis."""
+    n_rows, n_chunks, chunk_len = chunks.shape
+    amin = np.empty((n_rows, n_chunks), dtype=np.int64)
+    amax = np.empty((n_rows, n_chunks), dtype=np.int64)
+    step = max(1, _BLOCK_BYTES // max(1, chunk_len * chunks.itemsize))
+    for r in range(n_rows):
+        for c in range(0, n_chunks, step):
+            block = chunks[r, c:c + step]
+            amin[r, c:c + step] = block.argmin(axis=-1)
+            amax[r, c:c + step] = block.argmax(axis=-1)
+    return np.minimum(amin, amax), np.maximum(amin, amax)
+
+
+def viewport_decimate(y: np.ndarray, xmin: float, xmax: float, width: int,
+                      x: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Pick the samples to draw for viewport [xmin, xmax] at ``width`` pixels.
+
+    Implements docs/feat_downsampling.md: visible samples are bucketed by
+    the screen pixel column they project to, and each column contributes
+    its min and max in time order (one sample if they coincide). The first
+    and last visible samples are always included. When no more samples are
+    visible than there are pixel columns, all of them are returned.
+
+    Args:
+        y: 1D sample values.
+        xmin, xmax: Viewport bounds in data coordinates.
+        width: Pixel columns available (>= 1).
+        x: Strictly increasing sample positions, or None for 0..len(y)-1.
+
+    Returns:
+        Sorted indices into ``y`` (and ``x``) of the samples to draw.
+    """
+    i0, i1 = _visible_range(len(y), xmin, xmax, width, x)
+    if i1 < i0:
+        return np.empty(0, dtype=np.int64)
+
+    count = i1 - i0 + 1
+    if count <= width:
+        return np.arange(i0, i1 + 1, dtype=np.int64)
+
+    yv = np.asarray(y[i0:i1 + 1])
+    starts = _pixel_column_starts(x, i0, i1, xmin, xmax, width)
+    if count >= _LOOP_MIN_RUN * len(starts):
+        first_min, first_max = _run_extrema_loop(yv, starts)
+    else:
+        first_min = _first_index_of(yv, starts, np.fmin.reduceat(yv, starts))
+        first_max = _first_index_of(yv, starts, np.fmax.reduceat(yv, starts))
+
+    picks = np.stack([np.minimum(first_min, first_max),
+                      np.maximum(first_min, first_max)], axis=1).ravel()
+    # Columns that are all NaN have no extremum (index == count)
+    picks = picks[picks < count]
+    picks = np.unique(np.concatenate(([0], picks, [count - 1])))
+    return picks + i0
+
+
+def _visible_range(n: int, xmin: float, xmax: float, width: int,
+                   x: Optional[np.ndarray]) -> Tuple[int, int]:
+    """Validate viewport arguments; first and last visible sample (i1 < i0 if none)."""
+    if width < 1:
+        raise ValueError(f"width must be >= 1, got {width}")
+    if xmax < xmin:
+        raise ValueError(f"Empty viewport: xmin={xmin} > xmax={xmax}")
+    if x is None:
+        return max(0, int(np.ceil(xmin))), min(n - 1, int(np.floor(xmax)))
+    if len(x) != n:
+        raise ValueError(f"x has {len(x)} samples but y has {n}")
+    return (int(np.searchsorted(x, xmin, side='left')),
+            int(np.searchsorted(x, xmax, side='right')) - 1)
+
+
+# Mean samples per pixel column above which a per-column argmin/argmax
+# loop beats the fully vectorized (several passes over the data) path
+_LOOP_MIN_RUN = 64
+
+
+def _pixel_column_starts(x: Optional[np.ndarray], i0: int, i1: int,
+                         xmin: float, xmax: float, width: int) -> np.ndarray:
+    """
+    Offsets (relative to i0) where each non-empty pixel column begins.
+
+    Column k holds samples with floor((x - xmin) * scale) == k, clamped to
+    [0, width - 1]. Because x is monotonic, the columns are contiguous runs
+    whose boundaries can be found by binary search instead of projecting
+    every sample.
+    """
+    count = i1 - i0 + 1
+    if xmax == xmin or width == 1:
+        return np.zeros(1, dtype=np.int64)
+    scale = (width - 1) / (xmax - xmin)
+    thresholds = xmin + np.arange(1, width) / scale
+    if x is None:
+        bounds = np.ceil(thresholds).astype(np.int64) - i0
+    else:
+        bounds = np.searchsorted(x[i0:i1 + 1], thresholds, side='left')
+    bounds = bounds[(bounds > 0) & (bounds < count)]
+    return np.unique(np.concatenate(([0], bounds))).astype(np.int64)
+
+
+def _run_extrema_loop(values: np.ndarray, starts: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """First argmin/argmax of each run, ignoring NaN (all-NaN runs give len(values))."""
+    n = len(values)
+    bounds = np.append(starts, n).tolist()
+    first_min = np.empty(len(starts), dtype=np.int64)
+    first_max = np.empty(len(starts), dtype=np.int64)
+    for k in range(len(starts)):
+        start, end = bounds[k], bounds[k + 1]
+        run = values[start:end]
+        first_min[k] = start + run.argmin()
+        first_max[k] = start + run.argmax()
+
+    # argmin/argmax stop at the first NaN; redo those runs NaN-aware
+    if values.dtype.kind == 'f':
+        bad = np.flatnonzero(np.isnan(values[first_min]) | np.isnan(values[first_max]))
+        for k in bad.tolist():
+            start, end = bounds[k], bounds[k + 1]
+            run = values[start:end]
+            if np.isnan(run).all():
+                first_min[k] = first_max[k] = n
+            else:
+                first_min[k] = start + np.nanargmin(run)
+                first_max[k] = start + np.nanargmax(run)
+    return first_min, first_max
+
+
+def _first_index_of(values: np.ndarray, starts: np.ndarray, targets: np.ndarray) -> np.ndarray:
+    """First index in each run ``values[starts[k]:starts[k+1]]`` equal to ``targets[k]``."""
+    n = len(values)
+    lengths = np.diff(np.append(starts, n))
+    hits = np.where(values == np.repeat(targets, lengths), np.arange(n), n)
+    return np.minimum.reduceat(hits, starts)
+
+
+def block_reduce(image: np.ndarray, fy: int, fx: int) -> np.ndarray:
+    """
+    Mean of each ``fy`` x ``fx`` block of a 2D array (edge blocks may be
+    smaller). Returns the array unchanged when both factors are 1.
+    """
+    if fy < 1 or fx < 1:
+        raise ValueError(f"Block factors must be >= 1, got ({fy}, {fx})")
+    if fy == 1 and fx == 1:
+        return image
+    n_rows, n_cols = image.shape
+    sums = _block_sums(image, fy, axis=0)
+    sums = _block_sums(sums, fx, axis=1)
+    row_counts = np.full(sums.shape[0], fy)
+    row_counts[-1] = n_rows - fy * (sums.shape[0] - 1)
+    col_counts = np.full(sums.shape[1], fx)
+    col_counts[-1] = n_cols - fx * (sums.shape[1] - 1)
+    return sums / np.outer(row_counts, col_counts)
+
+
+def _block_sums(image: np.ndarray, factor: int, axis: int) -> np.ndarray:
+    """Sums of consecutive runs of ``factor`` rows (axis 0) or columns (axis 1)."""
+    if factor == 1:
+        return image.astype(np.float64, copy=False)
+    n = image.shape[axis]
+    body = n - n % factor
+    # Whole blocks reduce as a reshape, which keeps the inner loop contiguous
+    if axis == 0:
+        parts = [image[:body].reshape(body // factor, factor, image.shape[1]).sum(axis=1, dtype=np.float64)]
+        if body < n:
+            parts.append(image[body:].sum(axis=0, dtype=np.float64)[np.newaxis, :])
+    else:
+        parts = [image[:, :body].reshape(len(image), body // factor, factor).sum(axis=2, dtype=np.float64)]
+        if body < n:
+            parts.append(image[:, body:].sum(axis=1, dtype=np.float64)[:, np.newaxis])
+    return np.concatenate(parts, axis=axis) if len(parts) > 1 else parts[0]
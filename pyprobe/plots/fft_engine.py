@@ -0,0 +1,160 @@
+"""
+Spectrum computation for the FFT lenses.
+
+Windows and frequency axes depend only on the frame length, FFT size and
+sample spacing, which rarely change between captures, so they are built
+once and cached. Real input is transformed with ``rfft`` (half the work,
+one-sided spectrum); complex input with a full, fftshift-ed ``fft``. All
+rows of a 2D frame go through a single batched transform.
+
+SpectrumAverager accumulates power spectra across frames, either as a
+running mean of every frame since the last reset (Welch) or as an
+exponential moving average.
+"""
+
+from enum import Enum, auto
+from functools import lru_cache
+from typing import NamedTuple, Optional
+
+import numpy as np
+
+# Kaiser-Bessel window shape used by every FFT lens
+KAISER_BETA = 9.0
+
+# Short frames are zero-padded to this many bins so their spectra plot smoothly
+MIN_NFFT = 8192
+
+# Added to |X| before taking dB so empty bins stay finite
+_DB_FLOOR = 1e-12
+
+
+def fft_size(n: int) -> int:
+    """FFT length for an ``n``-sample frame: the next power of two, at least MIN_NFFT."""
+    return max(MIN_NFFT, 1 << max(0, int(n) - 1).bit_length())
+
+
+@lru_cache(maxsize=32)
+def kaiser_window(n: int) -> np.ndarray:
+    """Symmetric Kaiser window of ``n`` samples (cached, read-only)."""
+    window = np.kaiser(n, KAISER_BETA)
+    window.flags.writeable = False
+    return window
+
+
+@lru_cache(maxsize=32)
+def frequency_axis(nfft: int, dt: Optional[float], onesided: bool) -> np.ndarray:
+    """
+    Bin positions for an ``nfft``-point spectrum (cached, read-only).
+
+    In Hz when ``dt`` is a positive sample spacing, otherwise in FFT bins.
+    Two-sided axes run from the most negative frequency up (fftshift order).
+    """
+    if dt is not None and dt > 0:
+        freqs = np.fft.rfftfreq(nfft, d=dt) if onesided else np.fft.fftshift(np.fft.fftfreq(nfft, d=dt))
+    elif onesided:
+        freqs = np.arange(nfft // 2 + 1, dtype=np.float64)
+    else:
+        freqs = np.arange(-(nfft // 2), nfft - nfft // 2, dtype=np.float64)
+    freqs.flags.writeable = False
+    return freqs
+
+
+class Spectrum(NamedTuple):
+    """Spectra of one frame; arrays have one row per input row (1D for 1D input)."""
+    magnitude: np.ndarray  # |X|
+    mag_db: np.ndarray     # 20*log10(|X|) normalized by nfft
+    phase_deg: np.ndarray
+    freqs: np.ndarray
+    nfft: int
+
+
+def compute_spectrum(rows: np.ndarray, dt: Optional[float] = None) -> Spectrum:
+    """
+    Windowed spectrum of every row of ``rows`` in one batched transform.
+
+    Args:
+        rows: 1D frame, or 2D array of equal-length frames (one per row).
+        dt: Sample spacing for a Hz axis; None or <= 0 for FFT bins.
+
+    Raises:
+        ValueError: If ``rows`` is empty or not 1D/2D.
+    """
+    import scipy.fft
+
+    rows = np.asarray(rows)
+    if rows.ndim not in (1, 2) or rows.shape[-1] == 0:
+        raise ValueError(f"Expected a non-empty 1D or 2D frame, got shape {rows.shape}")
+    n = rows.shape[-1]
+    nfft = fft_size(n)
+    onesided = not np.iscomplexobj(rows)
+    windowed = rows * kaiser_window(n)
+    if onesided:
+        spectrum = scipy.fft.rfft(windowed, n=nfft, axis=-1, workers=-1)
+    else:
+        spectrum = scipy.fft.fftshift(scipy.fft.fft(windowed, n=nfft, axis=-1, workers=-1), axes=-1)
+
+    magnitude = np.abs(spectrum)
+    mag_db = 20 * np.log10(magnitude + _DB_FLOOR) - 20 * np.log10(nfft)
+    return Spectrum(
+        magnitude=magnitude,
+        mag_db=mag_db,
+        phase_deg=np.rad2deg(np.angle(spectrum)),
+        freqs=frequency_axis(nfft, dt, onesided),
+        nfft=nfft,
+    )
+
+
+class SpectrumAveraging(Enum):
+    NONE = auto()         # every frame on its own
+    WELCH = auto()        # mean power of all frames since the last reset
+    EXPONENTIAL = auto()  # exponentially weighted mean power
+
+
+class SpectrumAverager:
+    """Incremental average of power spectra across frames."""
+
+    def __init__(self, mode: SpectrumAveraging = SpectrumAveraging.NONE, alpha: float = 0.1):
+        if not 0.0 < alpha <= 1.0:
+            raise ValueError(f"alpha must be in (0, 1], got {alpha}")
+        self._mode = mode
+        self._alpha = alpha
+        self._power: Optional[np.ndarray] = None
+        self._frames = 0
+
+    @property
+    def mode(self) -> SpectrumAveraging:
+        return self._mode
+
+    @mode.setter
+    def mode(self, mode: SpectrumAveraging) -> None:
+        if mode != self._mode:
+            self._mode = mode
+            self.reset()
+
+    @property
+    def frames(self) -> int:
+        """Frames in the current average."""
+        return self._frames
+
+    def reset(self) -> None:
+        self._power = None
+        self._frames = 0
+
+    def update(self, spectrum: Spectrum) -> np.ndarray:
+        """
+        Fold ``spectrum`` into the average and return the averaged magnitude
+        in dB (the frame's own ``mag_db`` when averaging is off). A change
+        of shape or FFT size restarts the average.
+        """
+        if self._mode == SpectrumAveraging.NONE:
+            return spectrum.mag_db
+        power = np.square(spectrum.magnitude)
+        if self._power is None or self._power.shape != power.shape:
+            self._power = power
+            self._frames = 1
+        else:
+            self._frames += 1
+            weight = 1.0 / self._frames if self._mode == SpectrumAveraging.WELCH else self._alpha
+            # In place: mean += weight * (new - mean)
+            self._power += weight * (power - self._power)
+        return 10 * np.log10(self._power + _DB_FLOOR ** 2) - 20 * np.log10(spectrum.nfft)
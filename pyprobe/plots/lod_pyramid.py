@@ -0,0 +1,321 @@
+"""
+Multi-resolution min/max pyramids for interactive zoom on long traces.
+
+Level k of a pyramid holds, for every bucket of 2**k consecutive samples,
+the index of its minimum and of its maximum. Rendering a viewport picks
+the coarsest level whose buckets are still narrower than one pixel column,
+so a redraw reads about two buckets per column (plus at most one partial
+bucket at each edge) instead of every visible sample.
+
+The finest level has buckets of 2**BASE_LEVEL samples and is computed with
+one blocked argmin/argmax pass; every coarser level is folded pairwise from
+the one below. Finer levels are not kept: a view with fewer than that many
+samples per column is cheaper to decimate from the samples directly than
+from a pyramid, and skipping them keeps the pyramid at a few percent of the
+trace's size. Appended samples (``extend``) only compute the buckets they
+complete.
+
+Only indices are stored; values are read back from the samples, which are
+not copied and must not be modified in place afterwards.
+"""
+
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from .decimation import (
+    _BLOCK_BYTES, _first_index_of, _pixel_column_starts, _visible_range,
+    viewport_decimate,
+)
+
+# Finest stored level: buckets of 2**BASE_LEVEL samples
+BASE_LEVEL = 6
+
+# Traces shorter than this are decimated straight from the samples: a full
+# pass is already cheaper than keeping a pyramid around
+PYRAMID_MIN_SAMPLES = 1 << 18
+
+
+class MinMaxPyramid:
+    """Min/max index pyramid over a 1D trace, one level per power of two."""
+
+    def __init__(self, samples: np.ndarray):
+        samples = np.asarray(samples)
+        if samples.ndim != 1:
+            raise ValueError(f"MinMaxPyramid needs 1D samples, got shape {samples.shape}")
+        self._buf = samples
+        self._n = len(samples)
+        self._nan_aware = samples.dtype.kind == 'f'
+        # _min_idx[i] / _max_idx[i] hold level BASE_LEVEL + i
+        self._min_idx: List[np.ndarray] = []
+        self._max_idx: List[np.ndarray] = []
+        self._counts: List[int] = []
+        self._update()
+
+    @property
+    def samples(self) -> np.ndarray:
+        """The trace the pyramid covers."""
+        return self._buf[:self._n]
+
+    @property
+    def top_level(self) -> int:
+        """Coarsest level built (0 if the trace is shorter than one base bucket)."""
+        return BASE_LEVEL + len(self._counts) - 1 if self._counts else 0
+
+    def level(self, k: int) -> Tuple[np.ndarray, np.ndarray]:
+        """(min indices, max indices) of the buckets of 2**k samples."""
+        if not BASE_LEVEL <= k <= self.top_level:
+            raise ValueError(f"Level {k} out of range {BASE_LEVEL}..{self.top_level}")
+        i = k - BASE_LEVEL
+        used = self._counts[i]
+        return self._min_idx[i][:used], self._max_idx[i][:used]
+
+    def built_from(self, samples: Any) -> bool:
+        """True if ``samples`` is the very array (memory, shape, strides) covered."""
+        return _same_memory(samples, self.samples)
+
+    def extend(self, samples: np.ndarray) -> None:
+        """Append samples, computing only the buckets they complete."""
+        samples = np.asarray(samples, dtype=self._buf.dtype)
+        if samples.ndim != 1:
+            raise ValueError(f"MinMaxPyramid needs 1D samples, got shape {samples.shape}")
+        end = self._n + len(samples)
+        self._buf = _reserve(self._buf, self._n, end)
+        self._buf[self._n:end] = samples
+        self._n = end
+        self._update()
+
+    def decimate(self, xmin: float, xmax: float, width: int,
+                 x: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Sorted sample indices to draw for viewport [xmin, xmax] at ``width``
+        pixels; same contract as ``viewport_decimate``.
+
+        Buckets are assigned to the pixel column of their first sample, so
+        the result can differ from an exact per-sample pass by less than one
+        column at bucket boundaries. The visible peaks and the first and last
+        visible samples are always kept.
+        """
+        y = self.samples
+        i0, i1 = _visible_range(self._n, xmin, xmax, width, x)
+        if i1 < i0:
+            return np.empty(0, dtype=np.int64)
+        count = i1 - i0 + 1
+        k = min(int(np.log2(max(1.0, count / width))), self.top_level)
+        bucket = 1 << k
+        j0 = -(-i0 // bucket)
+        j1 = (i1 + 1) // bucket
+        if k < BASE_LEVEL or j1 <= j0:
+            return viewport_decimate(y, xmin, xmax, width, x)
+
+        # Units: partial head, the whole buckets inside the view, partial tail
+        mins, maxs = self.level(k)
+        starts = [np.arange(j0, j1, dtype=np.int64) * bucket]
+        unit_min = [mins[j0:j1].astype(np.int64)]
+        unit_max = [maxs[j0:j1].astype(np.int64)]
+        if i0 < j0 * bucket:
+            lo, hi = self._segment_extrema(i0, j0 * bucket)
+            starts.insert(0, [i0])
+            unit_min.insert(0, [lo])
+            unit_max.insert(0, [hi])
+        if j1 * bucket <= i1:
+            lo, hi = self._segment_extrema(j1 * bucket, i1 + 1)
+            starts.append([j1 * bucket])
+            unit_min.append([lo])
+            unit_max.append([hi])
+        starts = np.concatenate(starts)
+        unit_min = np.concatenate(unit_min)
+        unit_max = np.concatenate(unit_max)
+
+        pos = starts.astype(np.float64) if x is None else x[starts]
+        cols = _pixel_column_starts(pos, 0, len(pos) - 1, xmin, xmax, width)
+        v_min = y[unit_min]
+        v_max = y[unit_max]
+        first_min = _first_index_of(v_min, cols, np.fmin.reduceat(v_min, cols))
+        first_max = _first_index_of(v_max, cols, np.fmax.reduceat(v_max, cols))
+        # Columns whose units are all NaN have no extremum (index == units)
+        n_units = len(starts)
+        picks = np.concatenate((
+            [i0],
+            unit_min[first_min[first_min < n_units]],
+            unit_max[first_max[first_max < n_units]],
+            [i1],
+        ))
+        return np.unique(picks)
+
+    def _segment_extrema(self, start: int, end: int) -> Tuple[int, int]:
+        """(argmin, argmax) of samples[start:end], ignoring NaN where possible."""
+        seg = self._buf[start:end]
+        if self._nan_aware and np.isnan(seg).any():
+            if np.isnan(seg).all():
+                return start, start
+            return start + int(np.nanargmin(seg)), start + int(np.nanargmax(seg))
+        return start + int(seg.argmin()), start + int(seg.argmax())
+
+    def _update(self) -> None:
+        """Fold every newly completed bucket into each level, bottom up."""
+        y = self._buf
+        index_dtype = np.int32 if self._n < 2 ** 31 else np.int64
+        if self._min_idx and self._min_idx[0].dtype != index_dtype:
+            self._min_idx = [a.astype(index_dtype) for a in self._min_idx]
+            self._max_idx = [a.astype(index_dtype) for a in self._max_idx]
+
+        # Values of the buckets just computed, so the next level reads them
+        # sequentially instead of gathering samples
+        carried: Optional[Tuple[int, np.ndarray, np.ndarray]] = None
+        for i in range(64 - BASE_LEVEL):
+            if i == 0:
+                total = self._n >> BASE_LEVEL
+            else:
+                total = self._counts[i - 1] // 2
+            if total == 0:
+                break
+            if i == len(self._counts):
+                self._min_idx.append(np.empty(0, dtype=index_dtype))
+                self._max_idx.append(np.empty(0, dtype=index_dtype))
+                self._counts.append(0)
+            done = self._counts[i]
+            if total == done:
+                break  # nothing new here, so nothing new above either
+
+            if i == 0:
+                new_min, new_max = self._base_extrema(done, total, index_dtype)
+                val_min, val_max = y[new_min], y[new_max]
+            else:
+                lo, hi = 2 * done, 2 * total
+                idx_min, idx_max = (a[lo:hi] for a in self.level(BASE_LEVEL + i - 1))
+                if carried is not None and carried[0] == lo:
+                    src_min, src_max = carried[1][:hi - lo], carried[2][:hi - lo]
+                else:
+                    src_min, src_max = y[idx_min], y[idx_max]
+                new_min = _pick(idx_min, self._keep_first(src_min, np.less_equal))
+                new_max = _pick(idx_max, self._keep_first(src_max, np.greater_equal))
+                val_min = np.fmin(src_min[0::2], src_min[1::2])
+                val_max = np.fmax(src_max[0::2], src_max[1::2])
+            carried = (done, val_min, val_max)
+
+            self._min_idx[i] = _reserve(self._min_idx[i], done, total)
+            self._max_idx[i] = _reserve(self._max_idx[i], done, total)
+            self._min_idx[i][done:total] = new_min
+            self._max_idx[i][done:total] = new_max
+            self._counts[i] = total
+
+    def _base_extrema(self, done: int, total: int, index_dtype) -> Tuple[np.ndarray, np.ndarray]:
+        """Sample indices of the min and max of base buckets done..total-1."""
+        bucket = 1 << BASE_LEVEL
+        rows = self._buf[done * bucket:total * bucket].reshape(total - done, bucket)
+        amin = np.empty(len(rows), dtype=index_dtype)
+        amax = np.empty(len(rows), dtype=index_dtype)
+        step = max(1, _BLOCK_BYTES // (bucket * rows.itemsize))
+        for c in range(0, len(rows), step):
+            block = rows[c:c + step]
+            amin[c:c + step] = block.argmin(axis=1)
+            amax[c:c + step] = block.argmax(axis=1)
+
+        # argmin/argmax stop at the first NaN; redo those buckets NaN-aware
+        if self._nan_aware:
+            r = np.arange(len(rows))
+            bad = np.flatnonzero(np.isnan(rows[r, amin]) | np.isnan(rows[r, amax]))
+            if len(bad):
+                sub = rows[bad]
+                ok = ~np.isnan(sub).all(axis=1)
+                amin[bad[ok]] = np.nanargmin(sub[ok], axis=1)
+                amax[bad[ok]] = np.nanargmax(sub[ok], axis=1)
+
+        offsets = np.arange(done, total, dtype=index_dtype) * bucket
+        return amin + offsets, amax + offsets
+
+    def _keep_first(self, values: np.ndarray, op) -> np.ndarray:
+        """Per pair, whether the earlier candidate wins (ties and NaN in the later one included)."""
+        first, second = values[0::2], values[1::2]
+        keep = op(first, second)
+        if self._nan_aware:
+            keep |= np.isnan(second)
+        return keep
+
+
+class LodCache:
+    """
+    Pyramids for the series of one widget, keyed by series.
+
+    A pyramid only pays off when the same data is drawn more than once, so
+    the first render of a new array decimates it directly and the pyramid is
+    built when that array is rendered again (a pan or zoom before the next
+    frame arrives). Short traces always bypass the cache.
+    """
+
+    def __init__(self, min_samples: int = PYRAMID_MIN_SAMPLES):
+        self._min_samples = min_samples
+        self._pyramids: Dict[Hashable, MinMaxPyramid] = {}
+        self._seen: Dict[Hashable, np.ndarray] = {}
+
+    def decimate(self, key: Hashable, y: np.ndarray, xmin: float, xmax: float,
+                 width: int, x: Optional[np.ndarray] = None) -> np.ndarray:
+        """``viewport_decimate`` for series ``key``, via its pyramid once it has one."""
+        y = np.asarray(y)
+        pyramid = self._pyramids.get(key)
+        if pyramid is not None and pyramid.built_from(y):
+            return pyramid.decimate(xmin, xmax, width, x)
+        self._pyramids.pop(key, None)
+        if len(y) < self._min_samples or y.ndim != 1:
+            self._seen.pop(key, None)
+            return viewport_decimate(y, xmin, xmax, width, x)
+        if not _same_memory(y, self._seen.get(key)):
+            self._seen[key] = y
+            return viewport_decimate(y, xmin, xmax, width, x)
+        del self._seen[key]
+        pyramid = self._pyramids[key] = MinMaxPyramid(y)
+        return pyramid.decimate(xmin, xmax, width, x)
+
+    def note_rendered(self, key: Hashable, y: np.ndarray) -> None:
+        """Record that ``y`` was drawn for ``key`` elsewhere (e.g. on a worker thread)."""
+        y = np.asarray(y)
+        pyramid = self._pyramids.get(key)
+        if pyramid is not None and pyramid.built_from(y):
+            return
+        self._pyramids.pop(key, None)
+        if len(y) < self._min_samples or y.ndim != 1:
+            self._seen.pop(key, None)
+        else:
+            self._seen[key] = y
+
+    def pyramid(self, key: Hashable) -> Optional[MinMaxPyramid]:
+        """The pyramid currently held for ``key``, if any."""
+        return self._pyramids.get(key)
+
+    def retain(self, keys: Iterable[Hashable]) -> None:
+        """Forget every series not in ``keys``."""
+        keep = set(keys)
+        for store in (self._pyramids, self._seen):
+            for key in [k for k in store if k not in keep]:
+                del store[key]
+
+    def clear(self) -> None:
+        self._pyramids.clear()
+        self._seen.clear()
+
+
+def _pick(idx: np.ndarray, keep_first: np.ndarray) -> np.ndarray:
+    """idx[0::2] where ``keep_first`` else idx[1::2] (arithmetic beats np.where here)."""
+    second = idx[1::2]
+    picked = idx[0::2] - second
+    picked *= keep_first
+    picked += second
+    return picked
+
+
+def _reserve(arr: np.ndarray, used: int, needed: int) -> np.ndarray:
+    """``arr`` with room for ``needed`` items, keeping the first ``used``."""
+    if len(arr) >= needed and arr.flags.writeable and arr.flags.owndata:
+        return arr
+    grown = np.empty(max(needed, 2 * used), dtype=arr.dtype)
+    grown[:used] = arr[:used]
+    return grown
+
+
+def _same_memory(a: Any, b: Any) -> bool:
+    if not isinstance(a, np.ndarray) or not isinstance(b, np.ndarray):
+        return False
+    ai, bi = a.__array_interface__, b.__array_interface__
+    return (ai['data'][0] == bi['data'][0] and ai['shape'] == bi['shape']
+            and ai['strides'] == bi['strides'] and ai['typestr'] == bi['typestr'])
@@ -9,10 +9,6 @@ from typing import Optional
 from PyQt6.QtWidgets import QWidget
 from PyQt6.QtGui import QColor
 
-from .base_plot import BasePlot
-from ..plugins.builtins.waveform import WaveformWidget
-from .constellation import ConstellationPlot
-from .scalar_history_chart import ScalarHistoryChart
 from ..core.data_classifier import (
     DTYPE_SCALAR, DTYPE_ARRAY_1D, DTYPE_ARRAY_COMPLEX,
     DTYPE_ARRAY_2D, DTYPE_ARRAY_COLLECTION,
@@ -31,6 +27,11 @@ def create_plot(
     DEPRECATED: Use PluginRegistry.get_default_plugin() instead.
     This factory is retained as a fallback for edge cases.
     """
+    # Imported on use: the plot modules pull in pyqtgraph items
+    from ..plugins.builtins.waveform import WaveformWidget
+    from .constellation import ConstellationPlot
+    from .scalar_history_chart import ScalarHistoryChart
+
     # Default color for fallback widgets (cyan)
     default_color = QColor('#00ffff')
     
@@ -0,0 +1,293 @@
+"""
+Fixed-resolution intensity rasters for persistence displays.
+
+A raster is a 2D grid of hit counts over a fixed data extent. Each frame
+adds its points to the grid and every earlier hit fades by a constant
+factor, the way phosphor does on an analogue scope. Hits are single
+points (``add_points``) or traces drawn as connected lines
+(``add_traces``, and ``add_folded`` for one long signal cut into
+overlapping traces, as in an eye diagram). The grid is drawn as one
+image, so its cost depends on the new data and the grid size, never on
+how many frames have been accumulated.
+
+Fading is applied lazily: the grid is stored divided by a running gain,
+so ``fade()`` multiplies one scalar and new hits are added scaled by
+``1 / gain``. The grid is renormalized only when the gain gets small.
+"""
+
+from typing import Optional, Tuple
+
+import numpy as np
+
+# Below this gain the stored grid is folded back to true counts
+_RENORMALIZE_GAIN = 1e-150
+# Trace samples plus column spans processed per chunk of traces
+_CHUNK_CELLS = 1 << 20
+
+
+def alpha_ramp_lut(r: int, g: int, b: int) -> np.ndarray:
+    """256-entry RGBA lookup table from transparent to opaque ``(r, g, b)``."""
+    lut = np.empty((256, 4), dtype=np.ubyte)
+    lut[:, :3] = (r, g, b)
+    lut[:, 3] = np.arange(256)
+    return lut
+
+
+def fit_range(lo: float, hi: float, current: Optional[Tuple[float, float]] = None,
+              margin: float = 0.1) -> Optional[Tuple[float, float]]:
+    """
+    Axis range for a raster holding data in [lo, hi], or None to keep ``current``.
+
+    ``current`` is kept while it covers the data and the data spans at
+    least a quarter of it. Data that outgrows it is merged with it, so a
+    noisy signal settles after a few refits instead of restarting the
+    accumulation at every new extreme.
+    """
+    if hi <= lo:
+        lo, hi = lo - 1.0, hi + 1.0
+    if current is not None and (hi - lo) * 4 >= current[1] - current[0]:
+        if current[0] <= lo and hi <= current[1]:
+            return None
+        lo, hi = min(lo, current[0]), max(hi, current[1])
+    pad = (hi - lo) * margin
+    return lo - pad, hi + pad
+
+
+class DensityRaster:
+    """
+    Decaying 2D histogram of points.
+
+    Row ``r`` covers ``y0 + r * dy`` to ``y0 + (r + 1) * dy`` and column
+    ``c`` covers ``x0 + c * dx`` to ``x0 + (c + 1) * dx``, so the grid can
+    be handed to a row-major ImageItem placed at ``rect()``. Points outside
+    the extent are dropped.
+    """
+
+    def __init__(self, shape: Tuple[int, int] = (256, 256), decay: float = 0.8):
+        rows, cols = shape
+        if rows < 1 or cols < 1:
+            raise ValueError(f"Raster shape must be positive, got {shape}")
+        self._shape = (int(rows), int(cols))
+        self._grid = np.zeros(self._shape, dtype=np.float64)
+        self._gain = 1.0
+        self._extent: Optional[Tuple[float, float, float, float]] = None
+        self.decay = decay
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        return self._shape
+
+    @property
+    def decay(self) -> float:
+        """Fraction of the accumulated hits kept by each ``fade()``."""
+        return self._decay
+
+    @decay.setter
+    def decay(self, value: float) -> None:
+        if not 0.0 < value <= 1.0:
+            raise ValueError(f"Decay must be in (0, 1], got {value}")
+        self._decay = float(value)
+
+    @property
+    def extent(self) -> Optional[Tuple[float, float, float, float]]:
+        """(x0, x1, y0, y1) covered by the grid, or None before it is set."""
+        return self._extent
+
+    def set_extent(self, x0: float, x1: float, y0: float, y1: float) -> None:
+        """Cover a new data extent; the accumulated hits are discarded."""
+        if not (x1 > x0 and y1 > y0):
+            raise ValueError(f"Empty raster extent ({x0}, {x1}, {y0}, {y1})")
+        self._extent = (float(x0), float(x1), float(y0), float(y1))
+        self.clear()
+
+    def rect(self) -> Tuple[float, float, float, float]:
+        """(x, y, width, height) of the grid in data units."""
+        x0, x1, y0, y1 = self._extent
+        return x0, y0, x1 - x0, y1 - y0
+
+    def clear(self) -> None:
+        self._grid.fill(0.0)
+        self._gain = 1.0
+
+    def fade(self) -> None:
+        """Age every accumulated hit by one frame."""
+        self._gain *= self._decay
+        if self._gain < _RENORMALIZE_GAIN:
+            self._grid *= self._gain
+            self._gain = 1.0
+
+    def add_points(self, x: np.ndarray, y: np.ndarray) -> int:
+        """
+        Add one hit per point; returns how many points fell inside the extent.
+        """
+        if self._extent is None:
+            raise ValueError("Raster extent is not set")
+        rows, cols = self._shape
+        x0, x1, y0, y1 = self._extent
+        # Scale in float and compare before truncating, so far-out points
+        # cannot overflow the integer conversion
+        fx = (np.asarray(x, dtype=np.float64) - x0) * (cols / (x1 - x0))
+        fy = (np.asarray(y, dtype=np.float64) - y0) * (rows / (y1 - y0))
+        inside = (fx >= 0) & (fx < cols) & (fy >= 0) & (fy < rows)
+        flat = fy[inside].astype(np.intp) * cols + fx[inside].astype(np.intp)
+        np.add.at(self._grid.reshape(-1), flat, 1.0 / self._gain)
+        return len(flat)
+
+    def add_traces(self, ys: np.ndarray, x0: float = 0.0, dx: float = 1.0) -> None:
+        """
+        Add each row of ``ys`` as a polyline sampled at ``x0 + i * dx``.
+
+        Every column a trace passes through is filled from the lowest to
+        the highest value the trace takes inside that column, so steep
+        edges draw as connected lines. That span comes from the samples in
+        the column plus the trace interpolated at the column's edges, which
+        covers both traces much longer and much shorter than the grid is
+        wide. The fill goes through a per-column difference array, so the
+        cost is O(traces x (samples + columns)), whatever the span heights.
+        """
+        if self._extent is None:
+            raise ValueError("Raster extent is not set")
+        if dx <= 0:
+            raise ValueError(f"Sample spacing must be positive, got {dx}")
+        ys = np.asarray(ys, dtype=np.float64)
+        if ys.ndim == 1:
+            ys = ys[np.newaxis, :]
+        n, m = ys.shape
+        if n == 0 or m < 2:
+            return
+        rows, cols = self._shape
+        x_lo, x_hi, y_lo, y_hi = self._extent
+
+        # Sample i sits at column position first + i * step; column c is [c, c + 1)
+        first = (x0 - x_lo) * (cols / (x_hi - x_lo))
+        step = dx * (cols / (x_hi - x_lo))
+        c0 = max(0, int(np.floor(first)))
+        c1 = min(cols, int(np.ceil(first + (m - 1) * step)))
+        if c1 <= c0:
+            return
+        columns = np.arange(c0, c1)
+
+        # Interpolation of each column edge, clamped to the trace's ends
+        edges = np.clip((np.arange(c0, c1 + 1) - first) / step, 0.0, m - 1)
+        left = np.minimum(edges.astype(np.intp), m - 2)
+        weight = edges - left
+        # Samples grouped by the column they fall in
+        sample_cols = np.floor(first + np.arange(m) * step).astype(np.intp)
+        inside = np.flatnonzero((sample_cols >= c0) & (sample_cols < c1))
+        occupied, starts = np.unique(sample_cols[inside], return_index=True)
+        occupied -= c0
+
+        # Spans go into a per-column difference array with a spare row
+        # below and two above the grid: rows are clipped to [-1, rows], so a
+        # span wholly outside the grid only touches the spare rows
+        size = (rows + 3) * cols
+        diff = np.zeros(size, dtype=np.int64)
+        row_scale = rows / (y_hi - y_lo)
+        chunk = max(1, _CHUNK_CELLS // (m + 2 * len(columns)))
+        for j in range(0, n, chunk):
+            block = ys[j:j + chunk]
+            gaps = not np.isfinite(block).all()
+            at_edges = block[:, left] * (1.0 - weight) + block[:, left + 1] * weight
+            edge_rows = self._to_rows(at_edges, y_lo, row_scale)
+            lo = np.minimum(edge_rows[:, :-1], edge_rows[:, 1:])
+            hi = np.maximum(edge_rows[:, :-1], edge_rows[:, 1:])
+            if len(inside):
+                sample_rows = self._to_rows(block[:, inside], y_lo, row_scale)
+                lo[:, occupied] = np.minimum(lo[:, occupied], np.minimum.reduceat(sample_rows, starts, axis=1))
+                hi[:, occupied] = np.maximum(hi[:, occupied], np.maximum.reduceat(sample_rows, starts, axis=1))
+            if gaps:
+                # Columns touching a NaN or inf are moved above the grid
+                bad = ~np.isfinite(at_edges)
+                bad = bad[:, :-1] | bad[:, 1:]
+                if len(inside):
+                    bad[:, occupied] |= np.logical_or.reduceat(~np.isfinite(block[:, inside]), starts, axis=1)
+                lo[bad] = hi[bad] = rows
+            diff += np.bincount(((lo + 1) * cols + columns).reshape(-1), minlength=size)
+            diff -= np.bincount(((hi + 2) * cols + columns).reshape(-1), minlength=size)
+
+        spans = np.cumsum(diff.reshape(rows + 3, cols), axis=0)[1:rows + 1]
+        self._grid += spans / self._gain
+
+    def add_folded(self, samples: np.ndarray, period: int, span: int, offset: int = 0) -> int:
+        """
+        Cut ``samples`` into traces and add each across the full grid width.
+
+        Trace ``k`` is ``samples[offset + k * period:][:span + 1]``, as in
+        an eye diagram folded at ``period`` samples. ``span`` must be a
+        multiple of ``period`` and the grid a whole number of columns per
+        sample, so every trace's column edges land on one shared upsampling
+        of ``samples``. The signal is interpolated and converted to rows
+        once, and the spans of every column are counted for all traces in a
+        single pass, so the cost is O(len(samples) x columns per sample)
+        with no per-trace work. Returns the number of traces added.
+        """
+        if self._extent is None:
+            raise ValueError("Raster extent is not set")
+        rows, cols = self._shape
+        if period < 1 or span < 1 or offset < 0 or span % period:
+            raise ValueError(f"Invalid fold: period={period}, span={span}, offset={offset}")
+        if cols % span:
+            raise ValueError(f"Raster width {cols} is not a multiple of the span {span}")
+        samples = np.asarray(samples, dtype=np.float64)
+        n = (len(samples) - 1 - span - offset) // period + 1
+        if n < 1:
+            return 0
+        up = cols // span
+        _, _, y_lo, y_hi = self._extent
+
+        # Rows of the signal at every column edge: up edges per sample.
+        # float32 is plenty for a few hundred rows and halves the traffic.
+        used = samples[offset:offset + (n - 1) * period + span + 1].astype(np.float32)
+        frac = np.arange(up, dtype=np.float32) / up
+        at_edges = np.empty((len(used) - 1) * up + 1, dtype=np.float32)
+        at_edges[:-1] = (used[:-1, np.newaxis] * (1.0 - frac) + used[1:, np.newaxis] * frac).reshape(-1)
+        at_edges[-1] = used[-1]
+        edge_rows = self._to_rows(at_edges, y_lo, rows / (y_hi - y_lo))
+        lo = np.minimum(edge_rows[:-1], edge_rows[1:])
+        hi = np.maximum(edge_rows[:-1], edge_rows[1:])
+        bad = ~np.isfinite(at_edges)
+        if bad.any():
+            bad = bad[:-1] | bad[1:]
+            lo[bad] = hi[bad] = rows
+
+        # Segment p of the signal is column (p mod stride) + j * stride of
+        # trace p // stride - j, for each of the span // period periods j a
+        # trace covers. With one row per period, column (j, phase) counts
+        # rows j .. j + n - 1 of a phase: the whole phase minus a few rows
+        # at either end. Same diff layout as add_traces.
+        periods = span // period
+        stride = period * up
+        width = rows + 3
+        lo = lo.reshape(-1, stride)
+        hi = hi.reshape(-1, stride)
+        phase_offset = np.arange(stride) * width
+
+        def phase_diff(rows_lo: np.ndarray, rows_hi: np.ndarray) -> np.ndarray:
+            starts = np.bincount((rows_lo + (phase_offset + 1)).reshape(-1), minlength=stride * width)
+            ends = np.bincount((rows_hi + (phase_offset + 2)).reshape(-1), minlength=stride * width)
+            return (starts - ends).reshape(stride, width)
+
+        whole = phase_diff(lo, hi)
+        diff = np.empty((periods, stride, width), dtype=np.int64)
+        for j in range(periods):
+            diff[j] = whole
+            outside = np.r_[0:j, j + n:n - 1 + periods]
+            if len(outside):
+                diff[j] -= phase_diff(lo[outside], hi[outside])
+        spans = np.cumsum(diff.reshape(cols, width), axis=1)[:, 1:rows + 1].T
+        self._grid += spans / self._gain
+        return n
+
+    def _to_rows(self, values: np.ndarray, y_lo: float, row_scale: float) -> np.ndarray:
+        """Grid row of each value, clipped to [-1, rows] (one past either edge)."""
+        rows = self._shape[0]
+        scaled = np.floor((values - y_lo) * row_scale)
+        np.clip(scaled, -1, rows, out=scaled)
+        if not np.isfinite(scaled).all():
+            # Only reachable through NaN; callers drop those spans
+            scaled[np.isnan(scaled)] = rows
+        return scaled.astype(np.int32)
+
+    def counts(self) -> np.ndarray:
+        """The faded hit counts, shape ``(rows, cols)``."""
+        return (self._grid * self._gain).astype(np.float32)
@@ -0,0 +1,161 @@
+"""
+Shared cache of data derived from captured values for display.
+
+One captured value can be drawn by several panels, as an overlay on other
+panels and under different lenses. Each of them used to derive the same
+channels (``np.abs``, ``np.angle``, dB, float64 copies, time vectors) and
+decimations from it. RenderCache computes each of those once per captured
+frame and hands the same read-only result to every consumer.
+
+A frame is identified by the captured array itself: every panel, overlay
+and lens of an anchor receives the very object its CaptureRecord carried,
+so the object plays the role of (anchor, seq_num) without threading
+sequence numbers through the plugin API. Entries die with their source
+array and are otherwise evicted least-recently-used once the cache holds
+more than ``max_bytes`` of arrays.
+"""
+
+import weakref
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple, TypeVar
+
+import numpy as np
+
+from ..logging import get_logger
+
+logger = get_logger(__name__)
+
+T = TypeVar('T')
+
+DEFAULT_MAX_BYTES = 256 << 20
+
+# Named per-sample transforms for channel(). Results must not be views of
+# the source: a cached view would keep its capture alive.
+CHANNELS: Dict[str, Callable[[np.ndarray], np.ndarray]] = {
+    'real': lambda v: np.ascontiguousarray(v.real) if np.iscomplexobj(v) else np.real(v),
+    'imag': lambda v: np.ascontiguousarray(v.imag) if np.iscomplexobj(v) else np.imag(v),
+    'abs': np.abs,
+    'db': lambda v: 20 * np.log10(np.abs(v) + 1e-12),
+    'angle': np.angle,
+    'angle_deg': lambda v: np.rad2deg(np.angle(v)),
+    'float64': lambda v: np.asarray(v, dtype=np.float64),
+}
+
+
+class RenderCache:
+    """Per-frame, LRU-bounded memo of channels and decimations of captured arrays."""
+
+    _instance: Optional["RenderCache"] = None
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES):
+        self._max_bytes = max_bytes
+        self._entries: "OrderedDict[Tuple[int, Hashable], Tuple[Any, int]]" = OrderedDict()
+        # id(source) -> keys of its entries, dropped when the source is collected
+        self._by_source: Dict[int, set] = {}
+        self._nbytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def instance(cls) -> "RenderCache":
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes of arrays currently held."""
+        return self._nbytes
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def derived(self, source: Any, key: Hashable, compute: Callable[[], T]) -> T:
+        """
+        ``compute()``, memoized for the lifetime of ``source`` under ``key``.
+
+        Arrays in the result are made read-only since every consumer of the
+        frame shares them. Sources that cannot be weakly referenced (lists,
+        dicts) are not cached, and neither are results that contain the
+        source itself, which would keep it alive.
+        """
+        entry_key = (id(source), key)
+        entry = self._entries.get(entry_key)
+        if entry is not None:
+            self._entries.move_to_end(entry_key)
+            self.hits += 1
+            return entry[0]
+
+        self.misses += 1
+        result = compute()
+        arrays = result if isinstance(result, tuple) else (result,)
+        if any(arr is source for arr in arrays) or not self._track(source):
+            return result
+        nbytes = _freeze(arrays)
+        if nbytes > self._max_bytes:
+            return result
+        self._entries[entry_key] = (result, nbytes)
+        self._by_source[id(source)].add(entry_key)
+        self._nbytes += nbytes
+        self._evict()
+        return result
+
+    def channel(self, source: np.ndarray, name: str) -> np.ndarray:
+        """Transform ``name`` of CHANNELS applied to ``source``, computed once per frame."""
+        transform = CHANNELS.get(name)
+        if transform is None:
+            raise ValueError(f"Unknown channel '{name}'")
+        return self.derived(source, ('channel', name), lambda: transform(source))
+
+    def uniform_axis(self, source: np.ndarray, x0: float, dx: float) -> np.ndarray:
+        """x0 + arange(len(source)) * dx, computed once per frame."""
+        return self.derived(source, ('axis', x0, dx), lambda: x0 + np.arange(len(source)) * dx)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._by_source.clear()
+        self._nbytes = 0
+
+    def _track(self, source: Any) -> bool:
+        """Register ``source`` so its entries go when it does; False if impossible."""
+        if id(source) in self._by_source:
+            return True
+        try:
+            weakref.finalize(source, self._drop_source, id(source))
+        except TypeError:
+            return False
+        self._by_source[id(source)] = set()
+        return True
+
+    def _drop_source(self, source_id: int) -> None:
+        for entry_key in self._by_source.pop(source_id, ()):
+            entry = self._entries.pop(entry_key, None)
+            if entry is not None:
+                self._nbytes -= entry[1]
+
+    def _evict(self) -> None:
+        while self._nbytes > self._max_bytes and self._entries:
+            entry_key, (_, nbytes) = self._entries.popitem(last=False)
+            self._nbytes -= nbytes
+            keys = self._by_source.get(entry_key[0])
+            if keys is not None:
+                keys.discard(entry_key)
+            logger.debug("Render cache evicted %s (%d bytes)", entry_key[1], nbytes)
+
+
+def axis_token(x: Optional[np.ndarray]) -> Optional[Hashable]:
+    """Hashable stand-in for an x-axis array in cache keys (None for index axes)."""
+    if x is None or len(x) == 0:
+        return None
+    return (id(x), len(x), float(x[0]), float(x[-1]))
+
+
+def _freeze(arrays: Tuple[Any, ...]) -> int:
+    """Make ``arrays`` read-only; return the bytes they own."""
+    total = 0
+    for arr in arrays:
+        if isinstance(arr, np.ndarray):
+            arr.flags.writeable = False
+            if arr.flags.owndata:
+                total += arr.nbytes
+    return total
@@ -0,0 +1,148 @@
+"""
+Preparation of large frames for drawing, off the Qt main thread.
+
+Stats and per-pixel decimation of a multi-megabyte frame take long enough
+to stall the UI when they run on the GUI thread. A widget instead hands
+RenderPrepPool a job over a snapshot of the frame (captured arrays are
+never modified after capture, so the snapshot is the arrays themselves),
+a worker thread produces ready-to-draw arrays, and the widget only calls
+``setData`` once they arrive. numpy releases the GIL for the heavy
+lifting, so threads are enough.
+
+Each widget has at most one job that matters: submitting a newer frame
+cancels the previous job if it has not started and discards its result
+if it has.
+"""
+
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Hashable, Optional
+
+from PyQt6.QtCore import QObject, pyqtSignal
+
+from ..logging import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_WORKERS = max(1, min(4, (os.cpu_count() or 2) - 1))
+
+
+class _Job:
+    __slots__ = ('generation', 'future', 'cancel', 'on_done')
+
+    def __init__(self, generation: int, on_done: Callable[[Any], None]):
+        self.generation = generation
+        self.future: Optional[Future] = None
+        self.cancel = threading.Event()
+        self.on_done = on_done
+
+
+class RenderPrepPool(QObject):
+    """
+    Thread pool running render-prep jobs, with results applied on the GUI thread.
+
+    Jobs are keyed by their owner. ``job(is_cancelled)`` runs on a worker
+    and should poll ``is_cancelled()`` between steps; its result is passed
+    to ``on_done`` on the GUI thread unless a newer job for the same key was
+    submitted (or the key cancelled) in the meantime.
+    """
+
+    _instance: Optional["RenderPrepPool"] = None
+    _job_finished = pyqtSignal(object, int, object)  # key, generation, result
+
+    def __init__(self, max_workers: int = DEFAULT_WORKERS, parent: Optional[QObject] = None):
+        super().__init__(parent)
+        if max_workers < 1:
+            raise ValueError(f"max_workers must be >= 1, got {max_workers}")
+        self._executor = ThreadPoolExecutor(max_workers=max_workers,
+                                            thread_name_prefix="pyprobe-render-prep")
+        self._jobs: Dict[Hashable, _Job] = {}
+        self._generation = 0
+        self.completed = 0
+        self.cancelled = 0
+        self._job_finished.connect(self._on_job_finished)
+
+    @classmethod
+    def instance(cls) -> "RenderPrepPool":
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def submit(self, key: Hashable, job: Callable[[Callable[[], bool]], Any],
+               on_done: Callable[[Any], None]) -> None:
+        """Run ``job`` for ``key``, superseding any job ``key`` still has in flight."""
+        self.cancel(key)
+        self._generation += 1
+        entry = _Job(self._generation, on_done)
+        self._jobs[key] = entry
+        entry.future = self._executor.submit(self._run, key, entry, job)
+
+    def _run(self, key: Hashable, entry: _Job, job: Callable[[Callable[[], bool]], Any]) -> Any:
+        if entry.cancel.is_set():
+            return None
+        try:
+            result = job(entry.cancel.is_set)
+        except Exception:
+            logger.exception("Render prep job failed")
+            result = None
+        if not entry.cancel.is_set():
+            self._job_finished.emit(key, entry.generation, result)
+        return result
+
+    def _on_job_finished(self, key: Hashable, generation: int, result: Any) -> None:
+        entry = self._jobs.get(key)
+        if entry is None or entry.generation != generation:
+            return  # superseded, cancelled, or already applied by wait()
+        del self._jobs[key]
+        self._deliver(entry, result)
+
+    def _deliver(self, entry: _Job, result: Any) -> None:
+        if result is None:
+            return
+        self.completed += 1
+        try:
+            entry.on_done(result)
+        except RuntimeError:
+            # The widget was deleted while its job ran
+            logger.debug("Render prep result dropped: owner is gone")
+
+    def cancel(self, key: Hashable) -> None:
+        """Drop ``key``'s job: unstarted jobs never run, running ones are discarded."""
+        entry = self._jobs.pop(key, None)
+        if entry is not None:
+            entry.cancel.set()
+            if entry.future is not None:
+                entry.future.cancel()
+            self.cancelled += 1
+
+    def is_pending(self, key: Hashable) -> bool:
+        """True while ``key`` has a job whose result has not been applied."""
+        return key in self._jobs
+
+    def wait(self, key: Hashable, timeout: Optional[float] = None) -> bool:
+        """
+        Finish ``key``'s job now and apply its result on the calling (GUI)
+        thread. Returns False if it did not complete within ``timeout``.
+        """
+        entry = self._jobs.get(key)
+        if entry is None:
+            return True
+        try:
+            result = entry.future.result(timeout)
+        except TimeoutError:
+            return False
+        if self._jobs.get(key) is entry:
+            del self._jobs[key]
+            self._deliver(entry, result)
+        return True
+
+    @property
+    def pending_count(self) -> int:
+        return len(self._jobs)
+
+    def shutdown(self) -> None:
+        """Cancel every job and stop the workers."""
+        for key in list(self._jobs):
+            self.cancel(key)
+        self._executor.shutdown(wait=False, cancel_futures=True)
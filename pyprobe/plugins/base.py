@@ -1,6 +1,8 @@
 """Abstract base class for visualization plugins (lenses)."""
+import importlib
 from abc import ABC, abstractmethod
-from typing import Any, Optional, Tuple
+from dataclasses import dataclass
+from typing import Any, FrozenSet, Optional, Tuple
 from PyQt6.QtWidgets import QWidget
 from PyQt6.QtGui import QColor
 
@@ -50,6 +52,13 @@ class ProbePlugin(ABC):
         """
         pass
     
+    def priority_for(self, dtype: str, shape: Optional[Tuple[int, ...]]) -> int:
+        """Priority for this particular data (defaults to ``priority``).
+        
+        Override to become the default lens only for some shapes.
+        """
+        return self.priority
+    
     @abstractmethod
     def create_widget(self, var_name: str, color: QColor, parent: Optional[QWidget] = None, trace_id: str = "") -> QWidget:
         """Create and return the visualization widget.
@@ -79,3 +88,21 @@ class ProbePlugin(ABC):
             source_info: Source location string (e.g., "func:42")
         """
         pass
+
+
+@dataclass(frozen=True)
+class PluginSpec:
+    """Metadata to register a plugin without importing its module.
+
+    ``dtypes`` must cover every dtype the plugin's ``can_handle`` accepts;
+    the registry imports ``module`` the first time one of them (or ``name``)
+    is asked for.
+    """
+    name: str
+    module: str
+    class_name: str
+    dtypes: FrozenSet[str]
+
+    def load(self) -> ProbePlugin:
+        """Import the plugin's module and instantiate the plugin."""
+        return getattr(importlib.import_module(self.module), self.class_name)()
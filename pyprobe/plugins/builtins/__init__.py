@@ -1,6 +1,42 @@
 """Builtin visualization plugins."""
 from typing import List
-from ..base import ProbePlugin
+from ..base import PluginSpec, ProbePlugin
+from ...core.data_classifier import (
+    DTYPE_SCALAR, DTYPE_ARRAY_1D, DTYPE_ARRAY_COMPLEX, DTYPE_ARRAY_2D,
+    DTYPE_ARRAY_COLLECTION, DTYPE_WAVEFORM_REAL, DTYPE_WAVEFORM_COMPLEX,
+    DTYPE_WAVEFORM_COLLECTION,
+)
+
+_COMPLEX = frozenset({DTYPE_ARRAY_COMPLEX, DTYPE_WAVEFORM_COMPLEX})
+_REAL_ARRAYS = frozenset({
+    DTYPE_ARRAY_1D, DTYPE_ARRAY_2D, DTYPE_WAVEFORM_REAL,
+    DTYPE_WAVEFORM_COLLECTION, DTYPE_ARRAY_COLLECTION,
+})
+_SIGNALS = frozenset({DTYPE_ARRAY_1D, DTYPE_WAVEFORM_REAL}) | _COMPLEX
+
+
+def _spec(name: str, module: str, class_name: str, dtypes) -> PluginSpec:
+    return PluginSpec(name, f"{__name__}.{module}", class_name, frozenset(dtypes))
+
+
+# Registration order breaks priority ties, so keep it stable.
+# Widget modules (and pyqtgraph items they define) load on first use.
+BUILTIN_PLUGIN_SPECS = (
+    _spec("Waveform", "waveform", "WaveformPlugin", _REAL_ARRAYS),
+    _spec("FFT Mag & Phase", "waveform", "WaveformFftMagAnglePlugin", _REAL_ARRAYS | _COMPLEX),
+    _spec("Constellation", "constellation", "ConstellationPlugin", _COMPLEX),
+    _spec("Real & Imag", "complex_plots", "ComplexRIPlugin", _COMPLEX),
+    _spec("Mag & Phase", "complex_plots", "ComplexMAPlugin", _COMPLEX),
+    _spec("Log Mag (dB)", "complex_plots", "LogMagPlugin", _COMPLEX),
+    _spec("Linear Mag", "complex_plots", "LinearMagPlugin", _COMPLEX),
+    _spec("Phase (rad)", "complex_plots", "PhaseRadPlugin", _COMPLEX),
+    _spec("Phase (deg)", "complex_plots", "PhaseDegPlugin", _COMPLEX),
+    _spec("History", "scalar_history", "ScalarHistoryPlugin", {DTYPE_SCALAR}),
+    _spec("Value", "scalar_display", "ScalarDisplayPlugin", {DTYPE_SCALAR}),
+    _spec("Spectrogram", "spectrogram", "SpectrogramPlugin", _SIGNALS),
+    _spec("Image", "image", "ImagePlugin", {DTYPE_ARRAY_2D}),
+    _spec("Eye Diagram", "eye_diagram", "EyeDiagramPlugin", _SIGNALS),
+)
 
 
 def get_builtin_plugins() -> List[ProbePlugin]:
@@ -8,27 +44,7 @@ def get_builtin_plugins() -> List[ProbePlugin]:
     
     Each plugin is instantiated once and reused.
     Order doesn't matter - priority determines default selection.
+    This imports every builtin module; PluginRegistry uses
+    BUILTIN_PLUGIN_SPECS to defer that until a plugin is needed.
     """
-    from .waveform import WaveformPlugin, WaveformFftMagAnglePlugin
-    from .constellation import ConstellationPlugin
-    from .complex_plots import (
-        ComplexRIPlugin, ComplexMAPlugin, 
-        LogMagPlugin, LinearMagPlugin, 
-        PhaseRadPlugin, PhaseDegPlugin
-    )
-    from .scalar_history import ScalarHistoryPlugin
-    from .scalar_display import ScalarDisplayPlugin
-    
-    return [
-        WaveformPlugin(),
-        WaveformFftMagAnglePlugin(),
-        ConstellationPlugin(),
-        ComplexRIPlugin(),
-        ComplexMAPlugin(),
-        LogMagPlugin(),
-        LinearMagPlugin(),
-        PhaseRadPlugin(),
-        PhaseDegPlugin(),
-        ScalarHistoryPlugin(),
-        ScalarDisplayPlugin(),
-    ]
+    return [spec.load() for spec in BUILTIN_PLUGIN_SPECS]
@@ -13,6 +13,9 @@ from ...core.data_classifier import (
 from ...plots.axis_controller import AxisController
 from ...plots.pin_indicator import PinIndicator
 from ...plots.draw_mode import DrawMode, apply_draw_mode
+from ...plots.decimation import minmax_decimate
+from ...plots.lod_pyramid import LodCache
+from ...plots.render_cache import RenderCache, axis_token
 from ...plots.editable_axis import EditableAxisItem
 from ...gui.axis_editor import AxisEditor
 from ...plots.marker_model import MarkerStore
@@ -22,59 +25,13 @@ MAX_DISPLAY_POINTS = 5000
 
 def downsample(data: np.ndarray, n_points: int = 0, x_offset: int = 0) -> tuple:
     """Downsample large data for display, returning (x_indices, y_values).
-    
-    Uses min-max decimation: the array is split into chunks and each chunk
-    contributes its (argmin, min) and (argmax, max) pair, preserving the
-    visual envelope.  Chunk boundaries are computed with linspace so the
-    full array [0, N) is always covered — no tail samples are dropped.
+
+    Min-max decimation (see plots.decimation): each chunk contributes its
+    min and max in time order, and the first and last samples are kept.
     """
     if n_points <= 0:
         n_points = MAX_DISPLAY_POINTS
-
-    n = len(data)
-    if n <= n_points:
-        return np.arange(n) + x_offset, data
-
-    if n < 2:
-        return np.arange(n) + x_offset, data
-
-    # Reserve 2 points for first and last samples to ensure boundary coverage
-    n_chunks = (n_points - 2) // 2
-    if n_chunks <= 0:
-        return np.array([x_offset, n - 1 + x_offset], dtype=np.int64), np.array([data[0], data[-1]], dtype=data.dtype)
-
-    edges = np.linspace(0, n, n_chunks + 1, dtype=int)
-    
-    x = np.empty(n_chunks * 2 + 2, dtype=np.int64)
-    y = np.empty(n_chunks * 2 + 2, dtype=data.dtype)
-    
-    # First point
-    x[0] = x_offset
-    y[0] = data[0]
-
-    for i in range(n_chunks):
-        chunk = data[edges[i]:edges[i + 1]]
-        if len(chunk) == 0:
-            x[2 * i + 1] = edges[i] + x_offset
-            x[2 * i + 2] = edges[i] + x_offset
-            y[2 * i + 1] = data[edges[i]]
-            y[2 * i + 2] = data[edges[i]]
-            continue
-            
-        amin = int(np.argmin(chunk))
-        amax = int(np.argmax(chunk))
-        lo, hi = sorted([amin, amax])
-        
-        x[2 * i + 1] = edges[i] + lo + x_offset
-        x[2 * i + 2] = edges[i] + hi + x_offset
-        y[2 * i + 1] = chunk[lo]
-        y[2 * i + 2] = chunk[hi]
-
-    # Last point
-    x[-1] = n - 1 + x_offset
-    y[-1] = data[-1]
-    
-    return x, y
+    return minmax_decimate(data, n_points, x_offset)
 
 # ── SI-prefix formatter (shared by ComplexWidget and WaveformWidget) ──
 _SI_PREFIXES = [
@@ -121,6 +78,10 @@ class ComplexWidget(QWidget):
         self._info_label = QLabel("")
         self._raw_data: Optional[np.ndarray] = None  # Raw complex array
         self._t_vector: Optional[np.ndarray] = None  # X-axis from waveform metadata
+        # Visible x-range while re-rendering a zoomed slice (None = whole slice)
+        self._view_x_range: Optional[Tuple[float, float]] = None
+        # Min/max pyramids of long channels, keyed by series name
+        self._lod = LodCache()
         
         # Axis pinning
         self._axis_controller: Optional[AxisController] = None
@@ -468,9 +429,48 @@ class ComplexWidget(QWidget):
     def _render_slice(self, i_min: int, i_max: int):
         """Override in subclasses to re-render the visible slice."""
         pass
+
+    def _view_pixel_width(self) -> int:
+        """Physical pixel columns of the plot area (a fixed budget before layout)."""
+        vb = self._plot_widget.getPlotItem().getViewBox()
+        width = int(vb.width() * self._plot_widget.devicePixelRatioF())
+        if width < 1:
+            return max(1, (self.MAX_DISPLAY_POINTS - 2) // 2)
+        return width
+
+    def _decimate_channel(self, key: str, values: np.ndarray, i_min: int = 0,
+                          i_max: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        (indices, y) to draw for the full-length channel ``values``, min/max
+        aggregated per pixel column of the view. Outside a zoom re-render the
+        view spans samples ``i_min:i_max``. Indices are ready for
+        _get_x_for_indices. Results are shared through the RenderCache with
+        every other view of the same channel array.
+        """
+        n = len(values)
+        i_max = n if i_max is None else i_max
+        t_vec = self._t_vector
+        if t_vec is not None and (len(t_vec) != n or (n > 1 and not t_vec[-1] > t_vec[0])):
+            t_vec = None
+        if self._view_x_range is not None:
+            x_min, x_max = self._view_x_range
+        elif i_max <= i_min:
+            return np.empty(0, dtype=np.int64), values[:0]
+        elif t_vec is not None:
+            x_min, x_max = t_vec[i_min], t_vec[i_max - 1]
+        else:
+            x_min, x_max = i_min, i_max - 1
+        width = self._view_pixel_width()
+
+        def decimate():
+            idx = self._lod.decimate(key, values, x_min, x_max, width, x=t_vec)
+            return idx, values[idx]
+
+        memo_key = ('viewport', float(x_min), float(x_max), width, axis_token(t_vec))
+        return RenderCache.instance().derived(values, memo_key, decimate)
         
     def _rerender_for_zoom(self):
-        """Re-downsample or show raw data based on visible x-range."""
+        """Re-aggregate the visible x-range at the view's pixel resolution."""
         if self._raw_data is None:
             return
         vb = self._plot_widget.getPlotItem().getViewBox()
@@ -488,7 +488,11 @@ class ComplexWidget(QWidget):
         if i_min >= i_max:
             return
         self._updating_curves = True
-        self._render_slice(i_min, i_max)
+        self._view_x_range = (x_min, x_max)
+        try:
+            self._render_slice(i_min, i_max)
+        finally:
+            self._view_x_range = None
         self._updating_curves = False
         self._refresh_markers()
 
@@ -698,10 +702,9 @@ class ComplexRIWidget(ComplexWidget):
         self._raw_data = value
 
         self._updating_curves = True
-        real = value.real
-        imag = value.imag
-        x_r, y_r = downsample(real)
-        x_i, y_i = downsample(imag)
+        cache = RenderCache.instance()
+        x_r, y_r = self._decimate_channel('real', cache.channel(value, 'real'))
+        x_i, y_i = self._decimate_channel('imag', cache.channel(value, 'imag'))
         self._real_curve.setData(self._get_x_for_indices(x_r), y_r)
         self._imag_curve.setData(self._get_x_for_indices(x_i), y_i)
         self._updating_curves = False
@@ -713,11 +716,9 @@ class ComplexRIWidget(ComplexWidget):
 
     def _render_slice(self, i_min: int, i_max: int):
         """Re-render real & imag for the visible slice."""
-        sliced = self._raw_data[i_min:i_max]
-        real = sliced.real
-        imag = sliced.imag
-        x_r, y_r = downsample(real, x_offset=i_min)
-        x_i, y_i = downsample(imag, x_offset=i_min)
+        cache = RenderCache.instance()
+        x_r, y_r = self._decimate_channel('real', cache.channel(self._raw_data, 'real'), i_min, i_max)
+        x_i, y_i = self._decimate_channel('imag', cache.channel(self._raw_data, 'imag'), i_min, i_max)
         self._real_curve.setData(self._get_x_for_indices(x_r), y_r)
         self._imag_curve.setData(self._get_x_for_indices(x_i), y_i)
 
@@ -743,6 +744,8 @@ class ComplexMAWidget(ComplexWidget):
 
         self._phase_curve = pg.PlotDataItem(pen=pg.mkPen('#00ff7f', width=1.5))
         self._p2.addItem(self._phase_curve)
+        self._mag_db: Optional[np.ndarray] = None
+        self._phase: Optional[np.ndarray] = None
 
         prefix = f"{trace_id}: {var_name} " if trace_id else ""
         self._legend.addItem(self._mag_curve, f"{prefix}(mag_db)")
@@ -841,10 +844,12 @@ class ComplexMAWidget(ComplexWidget):
         self._raw_data = value
 
         self._updating_curves = True
-        mag_db = 20 * np.log10(np.abs(value) + 1e-12)
-        phase = np.angle(value)
-        x_m, y_m = downsample(mag_db)
-        x_p, y_p = downsample(phase)
+        # Derived channels are kept so zoom re-renders reuse them (and their pyramids)
+        cache = RenderCache.instance()
+        self._mag_db = cache.channel(value, 'db')
+        self._phase = cache.channel(value, 'angle')
+        x_m, y_m = self._decimate_channel('mag', self._mag_db)
+        x_p, y_p = self._decimate_channel('phase', self._phase)
         self._mag_curve.setData(self._get_x_for_indices(x_m), y_m)
         self._phase_curve.setData(self._get_x_for_indices(x_p), y_p)
         self._updating_curves = False
@@ -856,11 +861,8 @@ class ComplexMAWidget(ComplexWidget):
 
     def _render_slice(self, i_min: int, i_max: int):
         """Re-render mag & phase for the visible slice."""
-        sliced = self._raw_data[i_min:i_max]
-        mag_db = 20 * np.log10(np.abs(sliced) + 1e-12)
-        phase = np.angle(sliced)
-        x_m, y_m = downsample(mag_db, x_offset=i_min)
-        x_p, y_p = downsample(phase, x_offset=i_min)
+        x_m, y_m = self._decimate_channel('mag', self._mag_db, i_min, i_max)
+        x_p, y_p = self._decimate_channel('phase', self._phase, i_min, i_max)
         self._mag_curve.setData(self._get_x_for_indices(x_m), y_m)
         self._phase_curve.setData(self._get_x_for_indices(x_p), y_p)
 
@@ -886,7 +888,7 @@ class SingleCurveWidget(ComplexWidget):
         self._raw_real_data = data
         self._raw_data = data  # Base class zoom guard checks this
         self._updating_curves = True
-        x, y = downsample(data)
+        x, y = self._decimate_channel('value', data)
         self._curve.setData(self._get_x_for_indices(x), y)
         self._updating_curves = False
 
@@ -900,8 +902,7 @@ class SingleCurveWidget(ComplexWidget):
         source = self._raw_real_data if self._raw_real_data is not None else self._raw_data
         if source is None:
             return
-        sliced = source[i_min:i_max]
-        x, y = downsample(sliced, x_offset=i_min)
+        x, y = self._decimate_channel('value', source, i_min, i_max)
         self._curve.setData(self._get_x_for_indices(x), y)
 
 # --- PLUGINS ---
@@ -917,8 +918,7 @@ def _extract_complex_waveform(value: Any, dtype: str):
         samples = np.asarray(value['samples'])
         scalars = value.get('scalars', [0.0, 1.0])
         x0, dx = scalars[0], scalars[1]
-        t_vector = x0 + np.arange(len(samples)) * dx
-        return samples, t_vector
+        return samples, RenderCache.instance().uniform_axis(samples, x0, dx)
     
     # Direct waveform object (not serialized)
     if dtype == DTYPE_WAVEFORM_COMPLEX:
@@ -928,8 +928,7 @@ def _extract_complex_waveform(value: Any, dtype: str):
             scalar_attrs = waveform_info['scalar_attrs']
             x0 = float(getattr(value, scalar_attrs[0]))
             dx = float(getattr(value, scalar_attrs[1]))
-            t_vector = x0 + np.arange(len(samples)) * dx
-            return samples, t_vector
+            return samples, RenderCache.instance().uniform_axis(samples, x0, dx)
     
     # Plain complex array — no t_vector
     return np.asanyarray(value), None
@@ -984,8 +983,7 @@ class LogMagPlugin(ProbePlugin):
         if isinstance(widget, SingleCurveWidget):
             samples, t_vector = _extract_complex_waveform(value, dtype)
             widget._t_vector = t_vector
-            mag_db = 20 * np.log10(np.abs(samples) + 1e-12)
-            widget.set_data(mag_db, f"[{samples.shape}]")
+            widget.set_data(RenderCache.instance().channel(samples, 'db'), f"[{samples.shape}]")
 
 class LinearMagPlugin(ProbePlugin):
     name = "Linear Mag"
@@ -1002,7 +1000,7 @@ class LinearMagPlugin(ProbePlugin):
         if isinstance(widget, SingleCurveWidget):
             samples, t_vector = _extract_complex_waveform(value, dtype)
             widget._t_vector = t_vector
-            widget.set_data(np.abs(samples), f"[{samples.shape}]")
+            widget.set_data(RenderCache.instance().channel(samples, 'abs'), f"[{samples.shape}]")
 
 class PhaseRadPlugin(ProbePlugin):
     name = "Phase (rad)"
@@ -1019,7 +1017,7 @@ class PhaseRadPlugin(ProbePlugin):
         if isinstance(widget, SingleCurveWidget):
             samples, t_vector = _extract_complex_waveform(value, dtype)
             widget._t_vector = t_vector
-            widget.set_data(np.angle(samples), f"[{samples.shape}]")
+            widget.set_data(RenderCache.instance().channel(samples, 'angle'), f"[{samples.shape}]")
 
 class PhaseDegPlugin(ProbePlugin):
     name = "Phase (deg)"
@@ -1036,5 +1034,4 @@ class PhaseDegPlugin(ProbePlugin):
         if isinstance(widget, SingleCurveWidget):
             samples, t_vector = _extract_complex_waveform(value, dtype)
             widget._t_vector = t_vector
-            deg = np.rad2deg(np.angle(samples))
-            widget.set_data(deg, f"[{samples.shape}]")
+            widget.set_data(RenderCache.instance().channel(samples, 'angle_deg'), f"[{samples.shape}]")
@@ -14,6 +14,7 @@ from ...plots.editable_axis import EditableAxisItem
 from ...gui.axis_editor import AxisEditor
 from ...plots.marker_model import MarkerStore
 from ...plots.marker_items import MarkerOverlay, MarkerGlyph, snap_to_nearest
+from ...plots.raster import DensityRaster, alpha_ramp_lut
 
 class ConstellationWidget(QWidget):
     """Scatter plot widget for I/Q data."""
@@ -22,6 +23,12 @@ class ConstellationWidget(QWidget):
     
     MAX_DISPLAY_POINTS = 10000
     HISTORY_LENGTH = 5  # Number of frames to show with fading
+
+    # Density mode: histogram resolution, per-frame fade and headroom
+    # around the data when the histogram extent is picked
+    DENSITY_SHAPE = (256, 256)
+    DENSITY_DECAY = 0.8
+    DENSITY_MARGIN = 1.25
     
     def __init__(self, var_name: str, color: QColor, parent: Optional[QWidget] = None, trace_id: str = ""):
         super().__init__(parent)
@@ -29,7 +36,12 @@ class ConstellationWidget(QWidget):
         self._color = color
         self._trace_id = trace_id
         self._data: Optional[np.ndarray] = None
+        # Downsampled frames, so each frame is subsampled only once
         self._history: List[np.ndarray] = []
+        # Subsample indices, reused while the frame length stays the same
+        self._sample_indices: Optional[np.ndarray] = None
+        self._sample_length = 0
+        self._density: Optional[DensityRaster] = None
         
         # Axis pinning
         self._axis_controller: Optional[AxisController] = None
@@ -116,6 +128,12 @@ class ConstellationWidget(QWidget):
         self._origin_x = self._plot_widget.addLine(x=0, pen=pg.mkPen('#333333', width=1))
         self._origin_y = self._plot_widget.addLine(y=0, pen=pg.mkPen('#333333', width=1))
         
+        # Density histogram, drawn under the scatter items when enabled
+        self._density_image = pg.ImageItem(axisOrder='row-major')
+        self._density_image.setVisible(False)
+        self._plot_widget.addItem(self._density_image)
+        self._set_density_lut()
+
         # Create scatter plot items for history (fading effect)
         self._scatter_items: List[pg.ScatterPlotItem] = []
         alphas = np.linspace(0.1, 1.0, self.HISTORY_LENGTH)
@@ -189,7 +207,14 @@ class ConstellationWidget(QWidget):
         """Randomly subsample for display."""
         if len(data) <= self.MAX_DISPLAY_POINTS:
             return data
-        indices = np.random.choice(len(data), self.MAX_DISPLAY_POINTS, replace=False)
+        # Drawing the indices is O(len(data)), so frames of the same length
+        # share one random subset
+        indices = self._sample_indices
+        if indices is None or self._sample_length != len(data):
+            indices = np.random.default_rng().choice(len(data), self.MAX_DISPLAY_POINTS, replace=False)
+            indices.sort()
+            self._sample_indices = indices
+            self._sample_length = len(data)
         return data[indices]
 
     def set_color(self, color: QColor) -> None:
@@ -203,6 +228,63 @@ class ConstellationWidget(QWidget):
         alphas = np.linspace(0.1, 1.0, self.HISTORY_LENGTH)
         for i, (scatter, alpha) in enumerate(zip(self._scatter_items, alphas)):
             scatter.setBrush(pg.mkBrush(r, g, b, int(alpha * 255)))
+        self._set_density_lut()
+
+    # === Density mode ===
+
+    @property
+    def density_mode(self) -> bool:
+        """True when frames accumulate into a decaying density image."""
+        return self._density is not None
+
+    def set_density_mode(self, enabled: bool) -> None:
+        """
+        Switch between the fading scatter history and a density image.
+
+        In density mode every point of every frame is binned into a fixed
+        grid that fades by ``DENSITY_DECAY`` per frame, so dense
+        constellations show where symbols cluster rather than a random
+        subset. The newest frame stays on top as a scatter.
+        """
+        if enabled == self.density_mode:
+            return
+        self._density = DensityRaster(self.DENSITY_SHAPE, self.DENSITY_DECAY) if enabled else None
+        self._density_image.setVisible(enabled)
+        if enabled and self._data is not None and len(self._data):
+            self._accumulate_density(self._data)
+        self._show_history()
+
+    def _set_density_lut(self) -> None:
+        """Transparent-to-probe-colour ramp, so the grid shows through."""
+        r, g, b, _ = self._color.getRgb()
+        self._density_image.setLookupTable(alpha_ramp_lut(r, g, b))
+
+    def _density_extent(self, data: np.ndarray) -> None:
+        """Square extent around the origin, re-picked when the data outgrows it or shrinks far inside."""
+        # Interleaved (real, imag) floats: one pass over the frame
+        parts = np.abs(data.view(data.real.dtype))
+        reach = float(np.nanmax(parts)) if len(parts) else 0.0
+        if not np.isfinite(reach):
+            finite = parts[np.isfinite(parts)]
+            reach = float(finite.max()) if len(finite) else 0.0
+        if reach == 0.0:
+            reach = 1.0
+        extent = self._density.extent
+        if extent is None or reach > extent[1] or reach < extent[1] / (4 * self.DENSITY_MARGIN):
+            r = reach * self.DENSITY_MARGIN
+            self._density.set_extent(-r, r, -r, r)
+
+    def _accumulate_density(self, data: np.ndarray) -> None:
+        """Fade the density image one frame and add ``data``; O(len(data))."""
+        self._density_extent(data)
+        self._density.fade()
+        self._density.add_points(data.real, data.imag)
+        counts = self._density.counts()
+        # log scale keeps sparse outliers visible next to dense clusters
+        image = np.log1p(counts)
+        peak = float(image.max())
+        self._density_image.setImage(image, autoLevels=False, levels=(0.0, peak if peak > 0 else 1.0))
+        self._density_image.setRect(QRectF(*self._density.rect()))
 
     # === Editable Axes ===
     
@@ -301,12 +383,32 @@ class ConstellationWidget(QWidget):
         if not np.issubdtype(self._data.dtype, np.complexfloating):
             self._data = self._data.astype(np.complex128)
             
-        self._history.append(self._data.copy())
+        # Older frames were downsampled when they arrived; only the new
+        # one is subsampled here
+        displayed = self.downsample(self._data)
+        self._history.append(displayed.copy() if displayed is self._data else displayed)
         if len(self._history) > self.HISTORY_LENGTH:
             self._history.pop(0)
-            
-        display_data = [self.downsample(d) for d in self._history]
+
+        if self._density is not None:
+            self._accumulate_density(self._data)
+        self._show_history()
         
+        # Note: Do NOT call autoRange() here - AxisController manages auto-ranging
+        # via enableAutoRange(). Calling autoRange() every frame would override
+        # any pinned axis settings.
+            
+            
+        self._info_label.setText(source_info)
+        self._update_stats(shape=shape if shape else value.shape)
+        self._refresh_markers()
+
+    def _show_history(self) -> None:
+        """Put the downsampled history frames on the scatter items."""
+        # In density mode the image carries the history; only the newest
+        # frame is drawn as points
+        display_data = self._history[-1:] if self._density is not None else self._history
+
         # Offset so newest data goes to brightest scatter (last scatter item has alpha=1.0)
         # e.g. with 1 item in history, put it in scatter[4] (brightest)
         # with 3 items, put them in scatter[2], scatter[3], scatter[4]
@@ -321,15 +423,6 @@ class ConstellationWidget(QWidget):
             scatter_idx = offset + i
             if 0 <= scatter_idx < len(self._scatter_items):
                 self._scatter_items[scatter_idx].setData(x=data.real, y=data.imag)
-        
-        # Note: Do NOT call autoRange() here - AxisController manages auto-ranging
-        # via enableAutoRange(). Calling autoRange() every frame would override
-        # any pinned axis settings.
-            
-            
-        self._info_label.setText(source_info)
-        self._update_stats(shape=shape if shape else value.shape)
-        self._refresh_markers()
 
     def _update_stats(self, shape: Optional[tuple] = None):
         """Update constellation statistics."""
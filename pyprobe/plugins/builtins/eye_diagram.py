@@ -0,0 +1,283 @@
+"""Eye-diagram lens: frames folded at the symbol rate into an intensity image."""
+from typing import Any, List, Optional, Tuple
+
+import numpy as np
+import pyqtgraph as pg
+from PyQt6.QtCore import QRectF
+from PyQt6.QtGui import QColor, QFont
+from PyQt6.QtWidgets import QHBoxLayout, QLabel, QVBoxLayout, QWidget
+
+from ..base import ProbePlugin
+from ...core.data_classifier import (
+    DTYPE_ARRAY_1D, DTYPE_ARRAY_COMPLEX, DTYPE_WAVEFORM_COMPLEX, DTYPE_WAVEFORM_REAL,
+)
+from ...plots.raster import DensityRaster, alpha_ramp_lut, fit_range
+from .spectrogram import frame_samples
+
+
+class EyeDiagramWidget(QWidget):
+    """
+    Eye diagram accumulated over frames.
+
+    Each frame is cut into traces of ``SYMBOLS_PER_TRACE`` symbols, one
+    starting at every symbol, and the traces are drawn as lines into a
+    decaying DensityRaster shown as a single image. Folding and drawing are
+    done for the whole frame at once (``DensityRaster.add_folded``), so a
+    frame of a million samples adds ~10^5 traces without a curve item per
+    trace. Complex frames show the I or the Q eye.
+    """
+
+    DEFAULT_SAMPLES_PER_SYMBOL = 8
+    SAMPLES_PER_SYMBOL_CHOICES = (2, 4, 8, 10, 16, 32, 64)
+    SYMBOLS_PER_TRACE = 2
+    CHANNELS = ('I', 'Q')
+    # Raster height, and the width it is rounded to a multiple of the trace span from
+    ROWS = 256
+    TARGET_COLUMNS = 128
+    # Per-frame fade of the accumulated traces
+    DECAY = 0.95
+    # Vertical headroom around the data when the raster extent is picked
+    MARGIN = 0.1
+    # Frames replayed when the history is rebuilt (older ones have faded out)
+    REPLAY_FRAMES = 64
+
+    def __init__(self, var_name: str, color: QColor, parent: Optional[QWidget] = None, trace_id: str = ""):
+        super().__init__(parent)
+        self._var_name = var_name
+        self._color = color
+        self._trace_id = trace_id
+        self._sps = self.DEFAULT_SAMPLES_PER_SYMBOL
+        self._channel = 'I'
+        self._is_complex = False
+        self._raster: Optional[DensityRaster] = None
+        self._frames = 0
+        self._traces = 0
+
+        # Last frame taken from update_history's buffer, to find new ones
+        self._last_value: Any = None
+        self._consumed = 0
+        # Newest frame, replayed when a setting change restarts the eye
+        self._latest: Any = None
+
+        self._setup_ui()
+
+        from ...gui.theme.theme_manager import ThemeManager
+        tm = ThemeManager.instance()
+        tm.theme_changed.connect(self._apply_theme)
+        self._apply_theme(tm.current)
+
+    def _setup_ui(self):
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(4, 4, 4, 4)
+        layout.setSpacing(2)
+
+        header = QHBoxLayout()
+        self._name_label = QLabel(self._var_name)
+        self._name_label.setFont(QFont("JetBrains Mono", 11, QFont.Weight.Bold))
+        self._name_label.setStyleSheet(f"color: {self._color.name()};")
+        header.addWidget(self._name_label)
+        header.addStretch()
+        self._info_label = QLabel("Eye Diagram")
+        self._info_label.setFont(QFont("JetBrains Mono", 9))
+        header.addWidget(self._info_label)
+        layout.addLayout(header)
+
+        self._plot_widget = pg.PlotWidget()
+        self._plot_widget.useOpenGL(False)
+        self._plot_widget.setLabel('bottom', 'Time (symbols)')
+        self._plot_widget.setLabel('left', 'Amplitude')
+        self._image = pg.ImageItem(axisOrder='row-major')
+        self._image.setLookupTable(alpha_ramp_lut(*self._color.getRgb()[:3]))
+        self._plot_widget.addItem(self._image)
+        layout.addWidget(self._plot_widget)
+
+    def _apply_theme(self, theme) -> None:
+        pc = theme.plot_colors
+        self._info_label.setStyleSheet(f"color: {theme.colors['text_secondary']};")
+        self._plot_widget.setBackground(pc['bg'])
+        axis_pen = pg.mkPen(color=pc['axis'], width=1)
+        for ax_name in ('left', 'bottom'):
+            ax = self._plot_widget.getAxis(ax_name)
+            ax.setPen(axis_pen)
+            ax.setTextPen(axis_pen)
+
+    def set_color(self, color: QColor) -> None:
+        self._color = color
+        self._name_label.setStyleSheet(f"color: {color.name()};")
+        self._image.setLookupTable(alpha_ramp_lut(*color.getRgb()[:3]))
+
+    # === Settings ===
+
+    @property
+    def samples_per_symbol(self) -> int:
+        return self._sps
+
+    def set_samples_per_symbol(self, sps: int) -> None:
+        """Fold at ``sps`` samples per symbol; the accumulated eye restarts."""
+        if int(sps) != sps or sps < 2:
+            raise ValueError(f"Samples per symbol must be an integer >= 2, got {sps}")
+        self._sps = int(sps)
+        self._restart()
+
+    @property
+    def channel(self) -> str:
+        """'I' or 'Q': the part of complex frames that is folded."""
+        return self._channel
+
+    @property
+    def is_complex(self) -> bool:
+        """True when the newest frame was complex."""
+        return self._is_complex
+
+    def set_channel(self, channel: str) -> None:
+        if channel not in self.CHANNELS:
+            raise ValueError(f"Unknown eye channel '{channel}'")
+        self._channel = channel
+        self._restart()
+
+    def _restart(self) -> None:
+        """Drop the accumulated eye and redraw it from the newest frame."""
+        self._raster = None
+        self._frames = 0
+        self._traces = 0
+        if self._latest is not None and self._add_frames([self._latest]):
+            self._refresh()
+        else:
+            self._image.clear()
+
+    # === Data ===
+
+    @property
+    def frame_count(self) -> int:
+        """Frames accumulated since the last restart."""
+        return self._frames
+
+    def update_data(self, value: Any, dtype: str, shape: Optional[tuple] = None, source_info: str = "") -> None:
+        """Fold one captured frame into the eye."""
+        if self._add_frames([value]):
+            self._refresh()
+
+    def update_history(self, values: List[Any]) -> None:
+        """
+        Fold the frames of the capture buffer ``values`` not shown yet.
+
+        As in the spectrogram lens, ``values`` is the panel's append-only
+        buffer; anything else rebuilds the eye from the newest frames.
+        """
+        if not values:
+            return
+        n = self._consumed
+        if 0 < n <= len(values) and values[n - 1] is self._last_value:
+            new = values[n:]
+        else:
+            self.clear_history()
+            new = values
+        self._consumed = len(values)
+        self._last_value = values[-1]
+        if self._add_frames(new[-self.REPLAY_FRAMES:]):
+            self._refresh()
+
+    def rebind(self, var_name: str, color: QColor, trace_id: str = "") -> None:
+        """Reuse this widget for another probe, back at the default settings."""
+        self._var_name = var_name
+        self._trace_id = trace_id
+        self._name_label.setText(var_name)
+        self.set_color(color)
+        self._sps = self.DEFAULT_SAMPLES_PER_SYMBOL
+        self._channel = 'I'
+        self._is_complex = False
+        self._latest = None
+        self.clear_history()
+        self._image.clear()
+        self._info_label.setText("Eye Diagram")
+
+    def clear_history(self) -> None:
+        self._raster = None
+        self._frames = 0
+        self._traces = 0
+        self._last_value = None
+        self._consumed = 0
+
+    def _add_frames(self, values: List[Any]) -> bool:
+        """Fold ``values`` into the raster; True if any frame was usable."""
+        added = False
+        for value in values:
+            samples, _ = frame_samples(value)
+            if samples is None:
+                continue
+            self._latest = value
+            self._is_complex = np.iscomplexobj(samples)
+            if self._is_complex:
+                samples = samples.imag if self._channel == 'Q' else samples.real
+            span = self.SYMBOLS_PER_TRACE * self._sps
+            if len(samples) <= span:
+                continue
+            self._fit_extent(samples)
+            self._raster.fade()
+            self._traces += self._raster.add_folded(samples, self._sps, span)
+            self._frames += 1
+            added = True
+        return added
+
+    def _fit_extent(self, samples: np.ndarray) -> None:
+        """(Re)create the raster when the frame's range no longer fits its extent."""
+        finite = samples[np.isfinite(samples)]
+        lo, hi = (float(finite.min()), float(finite.max())) if len(finite) else (-1.0, 1.0)
+        current = self._raster.extent[2:] if self._raster is not None else None
+        y_range = fit_range(lo, hi, current, self.MARGIN)
+        if y_range is None:
+            return
+        span = self.SYMBOLS_PER_TRACE * self._sps
+        columns = span * max(1, round(self.TARGET_COLUMNS / span))
+        self._raster = DensityRaster((self.ROWS, columns), self.DECAY)
+        self._raster.set_extent(0.0, float(self.SYMBOLS_PER_TRACE), *y_range)
+        self._frames = 0
+        self._traces = 0
+
+    def _refresh(self) -> None:
+        # log scale keeps rare transitions visible next to the dense eye lines
+        image = np.log1p(self._raster.counts())
+        peak = float(image.max())
+        self._image.setImage(image, autoLevels=False, levels=(0.0, peak if peak > 0 else 1.0))
+        self._image.setRect(QRectF(*self._raster.rect()))
+        channel = f" | {self._channel}" if self._is_complex else ""
+        self._info_label.setText(f"{self._sps} sps{channel} | {self._frames} frames")
+
+    def reset_view(self) -> None:
+        self._plot_widget.getPlotItem().getViewBox().autoRange(padding=0)
+
+    def get_plot_data(self) -> dict:
+        """
+        Return the eye-diagram state.
+
+        Returns:
+            dict with 'samples_per_symbol', 'channel', 'frames' and
+            'traces' accumulated, and the raster 'extent' (x0, x1, y0, y1).
+        """
+        return {
+            'samples_per_symbol': self._sps,
+            'channel': self._channel,
+            'frames': self._frames,
+            'traces': self._traces,
+            'extent': list(self._raster.extent) if self._raster is not None else [],
+        }
+
+
+class EyeDiagramPlugin(ProbePlugin):
+    """Plugin for eye diagrams of 1D real and complex frames."""
+
+    name = "Eye Diagram"
+    icon = "eye"
+    priority = 50
+
+    def can_handle(self, dtype: str, shape: Optional[Tuple[int, ...]]) -> bool:
+        return dtype in (DTYPE_ARRAY_1D, DTYPE_ARRAY_COMPLEX, DTYPE_WAVEFORM_REAL, DTYPE_WAVEFORM_COMPLEX)
+
+    def create_widget(self, var_name: str, color: QColor, parent: Optional[QWidget] = None, trace_id: str = "") -> QWidget:
+        return EyeDiagramWidget(var_name, color, parent, trace_id=trace_id)
+
+    def update(self, widget: QWidget, value: Any, dtype: str,
+               shape: Optional[Tuple[int, ...]] = None,
+               source_info: str = "") -> None:
+        if isinstance(widget, EyeDiagramWidget):
+            widget.update_data(value, dtype, shape, source_info)
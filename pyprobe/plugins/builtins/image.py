@@ -0,0 +1,284 @@
+"""Image (heatmap) lens for 2D arrays."""
+from typing import Any, Optional, Tuple
+
+import numpy as np
+import pyqtgraph as pg
+from PyQt6.QtCore import QRectF, pyqtSignal
+from PyQt6.QtGui import QColor, QFont
+from PyQt6.QtWidgets import QHBoxLayout, QLabel, QVBoxLayout, QWidget
+
+from ..base import ProbePlugin
+from ...core.data_classifier import DTYPE_ARRAY_2D
+from ...plots.decimation import block_reduce
+from ...plots.render_cache import RenderCache
+from .complex_plots import format_coord
+
+
+class ImageWidget(QWidget):
+    """
+    2D array drawn as a single texture.
+
+    The visible part of the array is block-averaged down to the plot's
+    pixel size before it is handed to the ImageItem, so a 2000 x 4096
+    matrix costs one screen-sized image rather than thousands of curves.
+    Zooming re-reduces only the visible region; hover readouts always come
+    from the full-resolution array.
+    """
+
+    status_message_requested = pyqtSignal(str)
+
+    DEFAULT_COLORMAP = 'viridis'
+    COLORMAPS = ('viridis', 'inferno', 'magma', 'plasma', 'cividis', 'turbo', 'CET-L1')
+
+    def __init__(self, var_name: str, color: QColor, parent: Optional[QWidget] = None, trace_id: str = ""):
+        super().__init__(parent)
+        self._var_name = var_name
+        self._color = color
+        self._trace_id = trace_id
+        self._data: Optional[np.ndarray] = None
+        # (offset, step) of each axis in data units per row/column
+        self._scale = {'x': (0.0, 1.0), 'y': (0.0, 1.0)}
+        self._colormap = self.DEFAULT_COLORMAP
+        self._manual_levels: Optional[Tuple[float, float]] = None
+        self._rendering = False
+
+        self._setup_ui()
+
+        from ...gui.theme.theme_manager import ThemeManager
+        tm = ThemeManager.instance()
+        tm.theme_changed.connect(self._apply_theme)
+        self._apply_theme(tm.current)
+
+    def _setup_ui(self):
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(4, 4, 4, 4)
+        layout.setSpacing(2)
+
+        header = QHBoxLayout()
+        self._name_label = QLabel(self._var_name)
+        self._name_label.setFont(QFont("JetBrains Mono", 11, QFont.Weight.Bold))
+        self._name_label.setStyleSheet(f"color: {self._color.name()};")
+        header.addWidget(self._name_label)
+        header.addStretch()
+        self._info_label = QLabel("Image")
+        self._info_label.setFont(QFont("JetBrains Mono", 9))
+        header.addWidget(self._info_label)
+        layout.addLayout(header)
+
+        body = QHBoxLayout()
+        self._plot_widget = pg.PlotWidget()
+        self._plot_widget.useOpenGL(False)
+        self._plot_widget.setLabel('bottom', 'Column')
+        self._plot_widget.setLabel('left', 'Row')
+        vb = self._plot_widget.getPlotItem().getViewBox()
+        vb.invertY(True)  # row 0 at the top, as a matrix is printed
+        self._image = pg.ImageItem(axisOrder='row-major')
+        self._plot_widget.addItem(self._image)
+        body.addWidget(self._plot_widget, stretch=1)
+
+        # Interactive levels: drag the region, right-click the gradient for presets
+        self._histogram = pg.HistogramLUTWidget()
+        self._histogram.setImageItem(self._image)
+        self._histogram.item.sigLevelChangeFinished.connect(self._on_levels_dragged)
+        body.addWidget(self._histogram)
+        layout.addLayout(body)
+
+        self.set_colormap(self._colormap)
+        vb.sigRangeChanged.connect(self._on_range_changed)
+        self._plot_widget.scene().sigMouseMoved.connect(self._on_mouse_moved)
+
+    def _apply_theme(self, theme) -> None:
+        pc = theme.plot_colors
+        self._info_label.setStyleSheet(f"color: {theme.colors['text_secondary']};")
+        self._plot_widget.setBackground(pc['bg'])
+        self._histogram.setBackground(pc['bg'])
+        axis_pen = pg.mkPen(color=pc['axis'], width=1)
+        for ax_name in ('left', 'bottom'):
+            ax = self._plot_widget.getAxis(ax_name)
+            ax.setPen(axis_pen)
+            ax.setTextPen(axis_pen)
+
+    def set_color(self, color: QColor) -> None:
+        self._color = color
+        self._name_label.setStyleSheet(f"color: {color.name()};")
+
+    # === Display settings ===
+
+    @property
+    def colormap(self) -> str:
+        return self._colormap
+
+    def set_colormap(self, name: str) -> None:
+        """Switch to one of pyqtgraph's named colormaps."""
+        cmap = pg.colormap.get(name)
+        self._colormap = name
+        self._histogram.item.gradient.setColorMap(cmap)
+
+    @property
+    def levels(self) -> Optional[Tuple[float, float]]:
+        """Current (low, high) colour levels."""
+        levels = self._image.getLevels()
+        return None if levels is None else (float(levels[0]), float(levels[1]))
+
+    def set_levels(self, levels: Optional[Tuple[float, float]]) -> None:
+        """Fix the colour levels; None returns to auto levels."""
+        self._manual_levels = None if levels is None else (float(levels[0]), float(levels[1]))
+        self._render()
+
+    def _on_levels_dragged(self, _item) -> None:
+        if self._rendering:
+            return  # setImage() moving the region, not the user
+        self._manual_levels = tuple(float(v) for v in self._histogram.item.getLevels())
+
+    def set_axis_scale(self, axis: str, offset: float, step: float) -> None:
+        """Map row/column ``i`` of ``axis`` ('x' = columns, 'y' = rows) to ``offset + i * step``."""
+        if axis not in self._scale:
+            raise ValueError(f"Unknown axis '{axis}'")
+        if step <= 0:
+            raise ValueError(f"Axis step must be positive, got {step}")
+        self._scale[axis] = (float(offset), float(step))
+        self._render()
+        self.reset_view()
+
+    # === Data ===
+
+    def update_data(self, value: Any, dtype: str, shape: Optional[tuple] = None, source_info: str = "") -> None:
+        if value is None:
+            return
+        try:
+            data = np.asarray(value)
+        except (ValueError, TypeError):
+            return
+        if data.ndim == 1:
+            data = data[np.newaxis, :]
+        if data.ndim != 2 or data.size == 0 or data.dtype.kind not in 'biufc':
+            return
+        if np.iscomplexobj(data):
+            data = RenderCache.instance().channel(data, 'abs')
+        self._data = data
+        self._info_label.setText(f"{data.shape[0]}x{data.shape[1]}")
+        self._render()
+
+    def _visible_block(self) -> Tuple[int, int, int, int]:
+        """(r0, r1, c0, c1): rows and columns of the data inside the view."""
+        n_rows, n_cols = self._data.shape
+        vb = self._plot_widget.getPlotItem().getViewBox()
+        if all(vb.autoRangeEnabled()):
+            return 0, n_rows, 0, n_cols
+        (xmin, xmax), (ymin, ymax) = vb.viewRange()
+
+        def index_range(lo, hi, axis, n):
+            offset, step = self._scale[axis]
+            i0 = int(np.clip(np.floor((lo - offset) / step), 0, n - 1))
+            i1 = int(np.clip(np.ceil((hi - offset) / step), i0 + 1, n))
+            return i0, i1
+
+        r0, r1 = index_range(ymin, ymax, 'y', n_rows)
+        c0, c1 = index_range(xmin, xmax, 'x', n_cols)
+        return r0, r1, c0, c1
+
+    def _pixel_size(self) -> Tuple[int, int]:
+        """(height, width) of the plot area in physical pixels."""
+        vb = self._plot_widget.getPlotItem().getViewBox()
+        ratio = self._plot_widget.devicePixelRatioF()
+        return max(1, int(vb.height() * ratio)), max(1, int(vb.width() * ratio))
+
+    def _render(self) -> None:
+        if self._data is None or self._rendering:
+            return
+        self._rendering = True
+        try:
+            r0, r1, c0, c1 = self._visible_block()
+            block = self._data[r0:r1, c0:c1]
+            height, width = self._pixel_size()
+            fy = max(1, -(-block.shape[0] // height))
+            fx = max(1, -(-block.shape[1] // width))
+            reduced = block_reduce(block, fy, fx)
+
+            levels = self._manual_levels
+            if levels is None:
+                lo, hi = float(np.nanmin(reduced)), float(np.nanmax(reduced))
+                levels = (lo, hi if hi > lo else lo + 1.0)
+            self._image.setImage(reduced, autoLevels=False, levels=levels)
+
+            (x0, dx), (y0, dy) = self._scale['x'], self._scale['y']
+            self._image.setRect(QRectF(x0 + c0 * dx, y0 + r0 * dy, (c1 - c0) * dx, (r1 - r0) * dy))
+        finally:
+            self._rendering = False
+
+    def _on_range_changed(self, *_args) -> None:
+        self._render()
+
+    def _on_mouse_moved(self, pos) -> None:
+        """Report the full-resolution value under the cursor."""
+        if self._data is None:
+            return
+        point = self._plot_widget.getPlotItem().getViewBox().mapSceneToView(pos)
+        (x0, dx), (y0, dy) = self._scale['x'], self._scale['y']
+        col = int(np.floor((point.x() - x0) / dx))
+        row = int(np.floor((point.y() - y0) / dy))
+        n_rows, n_cols = self._data.shape
+        if not (0 <= row < n_rows and 0 <= col < n_cols):
+            self.status_message_requested.emit("")
+            return
+        value = float(self._data[row, col])
+        self.status_message_requested.emit(
+            f"Row: {row},  Col: {col},  Value: {format_coord(value)}")
+
+    def leaveEvent(self, event):
+        super().leaveEvent(event)
+        self.status_message_requested.emit("")
+
+    def resizeEvent(self, event) -> None:
+        super().resizeEvent(event)
+        self._render()
+
+    def reset_view(self) -> None:
+        vb = self._plot_widget.getPlotItem().getViewBox()
+        vb.enableAutoRange()
+        self._render()
+        vb.autoRange(padding=0)
+
+    def get_plot_data(self) -> dict:
+        """
+        Return the image state.
+
+        Returns:
+            dict with 'shape' of the full array, 'displayed' shape of the
+            reduced texture, 'levels' and 'colormap'.
+        """
+        image = self._image.image
+        return {
+            'shape': list(self._data.shape) if self._data is not None else [],
+            'displayed': list(image.shape) if image is not None else [],
+            'levels': list(self.levels) if self.levels is not None else [],
+            'colormap': self._colormap,
+        }
+
+
+class ImagePlugin(ProbePlugin):
+    """Plugin for drawing 2D arrays as an image."""
+
+    name = "Image"
+    icon = "grid"
+    priority = 90  # Below Waveform for a few rows
+
+    # From this many rows a 2D array is shown as an image by default
+    MANY_ROWS = 32
+
+    def can_handle(self, dtype: str, shape: Optional[Tuple[int, ...]]) -> bool:
+        return dtype == DTYPE_ARRAY_2D
+
+    def priority_for(self, dtype: str, shape: Optional[Tuple[int, ...]]) -> int:
+        if shape is not None and len(shape) == 2 and shape[0] >= self.MANY_ROWS:
+            return 110  # above Waveform, which would draw a curve per row
+        return self.priority
+
+    def create_widget(self, var_name: str, color: QColor, parent: Optional[QWidget] = None, trace_id: str = "") -> QWidget:
+        return ImageWidget(var_name, color, parent, trace_id=trace_id)
+
+    def update(self, widget: QWidget, value: Any, dtype: str,
+               shape: Optional[Tuple[int, ...]] = None,
+               source_info: str = "") -> None:
+        if isinstance(widget, ImageWidget):
+            widget.update_data(value, dtype, shape, source_info)
@@ -276,6 +276,15 @@ class ScalarHistoryWidget(QWidget):
         # Update stats
         self._update_stats()
 
+    def rebind(self, var_name: str, color: QColor, trace_id: str = "") -> None:
+        """Reuse this widget for another probe: empty history, default view."""
+        self._var_name = var_name
+        self._trace_id = trace_id
+        self._name_label.setText(var_name)
+        self.set_color(color)
+        self.clear_history()
+        self.reset_view()
+
     def clear_history(self):
         """Clear the history buffer and reset the display."""
         self._history.clear()
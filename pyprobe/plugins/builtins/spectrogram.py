@@ -0,0 +1,313 @@
+"""Spectrogram (waterfall) lens: one spectrum row per captured frame."""
+from typing import Any, List, Optional, Tuple
+
+import numpy as np
+import pyqtgraph as pg
+from PyQt6.QtCore import QRectF
+from PyQt6.QtGui import QColor, QFont
+from PyQt6.QtWidgets import QLabel, QHBoxLayout, QVBoxLayout, QWidget
+
+from ..base import ProbePlugin
+from ...core.data_classifier import (
+    DTYPE_ARRAY_1D, DTYPE_ARRAY_COMPLEX, DTYPE_WAVEFORM_COMPLEX, DTYPE_WAVEFORM_REAL,
+    get_waveform_info,
+)
+from ...plots.fft_engine import compute_spectrum
+
+
+def frame_samples(value: Any) -> Tuple[Optional[np.ndarray], Optional[float]]:
+    """(1D samples, sample spacing or None) of a captured frame; (None, None) if unusable."""
+    dt = None
+    if isinstance(value, dict) and 'samples' in value:
+        dt = float(value.get('scalars', [0.0, 1.0])[1])
+        value = value['samples']
+    elif not isinstance(value, (np.ndarray, list, tuple)):
+        info = get_waveform_info(value)
+        if info is not None:
+            dt = float(getattr(value, info['scalar_attrs'][1]))
+            value = getattr(value, info['samples_attr'])
+    try:
+        samples = np.asarray(value)
+    except (ValueError, TypeError):
+        return None, None
+    if samples.ndim != 1 or len(samples) == 0 or samples.dtype.kind not in 'biufc':
+        return None, None
+    return samples, (dt if dt is not None and dt > 0 else None)
+
+
+class SpectrogramWidget(QWidget):
+    """
+    Waterfall of per-frame spectra, newest at the top.
+
+    Rows live in a mirrored ring buffer: each spectrum is written at
+    ``head`` and ``head + rows``, so ``ring[head:head + rows]`` is always a
+    contiguous, time-ordered view. Appending a frame is one row write and
+    the image is handed the same buffer every time, so nothing is
+    reallocated until the frame length (and thus the column count) changes.
+    """
+
+    DEFAULT_ROWS = 256
+    # Spectra wider than this are max-pooled, so peaks stay visible
+    MAX_COLUMNS = 2048
+    # Samples transformed per batched FFT call when catching up on frames
+    BATCH_SAMPLES = 1 << 22
+    # Pixels sampled to pick colour levels
+    LEVEL_SAMPLES = 4096
+    # Colour levels span these percentiles of the sampled pixels
+    LEVEL_PERCENTILES = (5.0, 99.9)
+    # Value of rows not yet filled (below any real spectrum level)
+    _EMPTY = -400.0
+
+    def __init__(self, var_name: str, color: QColor, parent: Optional[QWidget] = None, trace_id: str = ""):
+        super().__init__(parent)
+        self._var_name = var_name
+        self._color = color
+        self._trace_id = trace_id
+        self._rows = self.DEFAULT_ROWS
+
+        self._ring: Optional[np.ndarray] = None
+        self._head = 0
+        self._filled = 0
+        self._frames = 0
+        self._geometry: Optional[tuple] = None  # (frame length, dt, is complex)
+        self._freqs: Optional[np.ndarray] = None
+        self._edges: Optional[np.ndarray] = None  # pooling bin edges, or None
+        self._levels: Optional[Tuple[float, float]] = None
+
+        # Last frame taken from update_history's buffer, to find new ones
+        self._last_value: Any = None
+        self._consumed = 0
+
+        self._setup_ui()
+
+        from ...gui.theme.theme_manager import ThemeManager
+        tm = ThemeManager.instance()
+        tm.theme_changed.connect(self._apply_theme)
+        self._apply_theme(tm.current)
+
+    def _setup_ui(self):
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(4, 4, 4, 4)
+        layout.setSpacing(2)
+
+        header = QHBoxLayout()
+        self._name_label = QLabel(self._var_name)
+        self._name_label.setFont(QFont("JetBrains Mono", 11, QFont.Weight.Bold))
+        self._name_label.setStyleSheet(f"color: {self._color.name()};")
+        header.addWidget(self._name_label)
+        header.addStretch()
+        self._info_label = QLabel("Spectrogram")
+        self._info_label.setFont(QFont("JetBrains Mono", 9))
+        header.addWidget(self._info_label)
+        layout.addLayout(header)
+
+        self._plot_widget = pg.PlotWidget()
+        self._plot_widget.useOpenGL(False)
+        self._plot_widget.setLabel('bottom', 'FFT Bin')
+        self._plot_widget.setLabel('left', 'Frame')
+        self._image = pg.ImageItem(axisOrder='row-major')
+        self._image.setLookupTable(pg.colormap.get('viridis').getLookupTable(nPts=256))
+        self._plot_widget.addItem(self._image)
+        layout.addWidget(self._plot_widget)
+
+    def _apply_theme(self, theme) -> None:
+        pc = theme.plot_colors
+        self._info_label.setStyleSheet(f"color: {theme.colors['text_secondary']};")
+        self._plot_widget.setBackground(pc['bg'])
+        axis_pen = pg.mkPen(color=pc['axis'], width=1)
+        for ax_name in ('left', 'bottom'):
+            ax = self._plot_widget.getAxis(ax_name)
+            ax.setPen(axis_pen)
+            ax.setTextPen(axis_pen)
+
+    def set_color(self, color: QColor) -> None:
+        self._color = color
+        self._name_label.setStyleSheet(f"color: {color.name()};")
+
+    @property
+    def frame_count(self) -> int:
+        """Frames appended since the last reset."""
+        return self._frames
+
+    def update_data(self, value: Any, dtype: str, shape: Optional[tuple] = None, source_info: str = "") -> None:
+        """Append one captured frame."""
+        if self._append([value]):
+            self._refresh()
+
+    def update_history(self, values: List[Any]) -> None:
+        """
+        Append the frames of the capture buffer ``values`` not shown yet.
+
+        ``values`` is the panel's append-only buffer, so new frames are the
+        ones after the last frame taken. Anything else (a shorter list when
+        stepping through history, another buffer) rebuilds the waterfall
+        from the newest frames.
+        """
+        if not values:
+            return
+        n = self._consumed
+        if 0 < n <= len(values) and values[n - 1] is self._last_value:
+            new = values[n:]
+        else:
+            self.clear_history()
+            new = values
+        self._consumed = len(values)
+        self._last_value = values[-1]
+        if self._append(new[-self._rows:]):
+            self._refresh()
+
+    def rebind(self, var_name: str, color: QColor, trace_id: str = "") -> None:
+        """Reuse this widget for another probe: no rows until its frames arrive."""
+        self._var_name = var_name
+        self._trace_id = trace_id
+        self._name_label.setText(var_name)
+        self.set_color(color)
+        self.clear_history()
+        self._geometry = None
+        self._freqs = None
+        self._ring = None
+        self._image.clear()
+        self._info_label.setText("Spectrogram")
+
+    def clear_history(self) -> None:
+        self._clear_rows()
+        self._last_value = None
+        self._consumed = 0
+
+    def _clear_rows(self) -> None:
+        if self._ring is not None:
+            self._ring.fill(self._EMPTY)
+        self._head = 0
+        self._filled = 0
+        self._frames = 0
+        self._levels = None
+
+    def _append(self, values: List[Any]) -> bool:
+        """Write the spectra of ``values`` into the ring; True if any row was added."""
+        frames = []
+        for value in values:
+            samples, dt = frame_samples(value)
+            if samples is not None:
+                frames.append((samples, dt))
+        if not frames:
+            return False
+
+        # Consecutive frames of the same shape share one batched transform
+        start = 0
+        for end in range(1, len(frames) + 1):
+            if end == len(frames) or self._key(frames[end]) != self._key(frames[start]):
+                key = self._key(frames[start])
+                self._set_geometry(key)
+                step = max(1, self.BATCH_SAMPLES // key[0])
+                for i in range(start, end, step):
+                    self._append_batch(frames[i:min(i + step, end)])
+                start = end
+        return True
+
+    def _append_batch(self, batch: List[Tuple[np.ndarray, Optional[float]]]) -> None:
+        spectrum = compute_spectrum(np.stack([samples for samples, _ in batch]), batch[0][1])
+        if self._freqs is None:
+            self._set_frequency_axis(spectrum.freqs)
+        for row in self._pool(spectrum.mag_db):
+            self._write_row(row)
+
+    @staticmethod
+    def _key(frame: Tuple[np.ndarray, Optional[float]]) -> tuple:
+        samples, dt = frame
+        return (len(samples), dt, np.iscomplexobj(samples))
+
+    def _set_geometry(self, key: tuple) -> None:
+        """(Re)allocate the ring when the frame length, spacing or kind changes."""
+        if key == self._geometry:
+            return
+        self._geometry = key
+        self._freqs = None
+        self._ring = None
+        self._clear_rows()
+
+    def _set_frequency_axis(self, freqs: np.ndarray) -> None:
+        bins = len(freqs)
+        cols = min(bins, self.MAX_COLUMNS)
+        self._edges = None if cols == bins else np.linspace(0, bins, cols + 1).astype(np.int64)[:-1]
+        self._freqs = freqs if self._edges is None else freqs[self._edges]
+        self._ring = np.full((2 * self._rows, cols), self._EMPTY, dtype=np.float32)
+
+    def _pool(self, rows: np.ndarray) -> np.ndarray:
+        """Max-pool spectra down to the ring's column count."""
+        if self._edges is None:
+            return rows
+        return np.maximum.reduceat(rows, self._edges, axis=-1)
+
+    def _write_row(self, row: np.ndarray) -> None:
+        self._ring[self._head] = row
+        self._ring[self._head + self._rows] = row
+        self._head = (self._head + 1) % self._rows
+        self._filled = min(self._filled + 1, self._rows)
+        self._frames += 1
+
+    def _view(self) -> np.ndarray:
+        """The ring's rows, oldest first, without copying."""
+        return self._ring[self._head:self._head + self._rows]
+
+    def _update_levels(self) -> Tuple[float, float]:
+        """Colour levels from percentiles of a strided sample of the filled rows."""
+        filled = self._view()[self._rows - self._filled:].reshape(-1)
+        sample = filled[::max(1, filled.size // self.LEVEL_SAMPLES)]
+        lo, hi = np.percentile(sample, self.LEVEL_PERCENTILES)
+        if hi <= lo:
+            hi = lo + 1.0
+        self._levels = (float(lo), float(hi))
+        return self._levels
+
+    def _refresh(self) -> None:
+        self._image.setImage(self._view(), autoLevels=False, levels=self._update_levels())
+
+        length, dt, _ = self._geometry
+        freqs = self._freqs
+        df = (freqs[1] - freqs[0]) if len(freqs) > 1 else 1.0
+        row_height = length * dt if dt is not None else 1.0
+        self._image.setRect(QRectF(float(freqs[0]), -self._rows * row_height,
+                                   float(freqs[-1] - freqs[0] + df), self._rows * row_height))
+        self._plot_widget.setLabel('bottom', 'Frequency (Hz)' if dt is not None else 'FFT Bin')
+        self._plot_widget.setLabel('left', 'Time (s)' if dt is not None else 'Frame')
+        self._info_label.setText(f"{length} samples | {self._frames} frames")
+
+    def reset_view(self) -> None:
+        self._plot_widget.getPlotItem().getViewBox().autoRange(padding=0)
+
+    def get_plot_data(self) -> dict:
+        """
+        Return the spectrogram state.
+
+        Returns:
+            dict with 'x' (column frequencies), 'y' (newest spectrum row,
+            dB), 'rows' (filled rows) and 'frames' (frames appended).
+        """
+        if self._ring is None or self._filled == 0:
+            return {'x': [], 'y': [], 'rows': 0, 'frames': 0}
+        return {
+            'x': self._freqs.tolist(),
+            'y': self._view()[-1].tolist(),
+            'rows': self._filled,
+            'frames': self._frames,
+        }
+
+
+class SpectrogramPlugin(ProbePlugin):
+    """Plugin for a scrolling spectrogram of 1D real and complex frames."""
+
+    name = "Spectrogram"
+    icon = "activity"
+    priority = 60
+
+    def can_handle(self, dtype: str, shape: Optional[Tuple[int, ...]]) -> bool:
+        return dtype in (DTYPE_ARRAY_1D, DTYPE_ARRAY_COMPLEX, DTYPE_WAVEFORM_REAL, DTYPE_WAVEFORM_COMPLEX)
+
+    def create_widget(self, var_name: str, color: QColor, parent: Optional[QWidget] = None, trace_id: str = "") -> QWidget:
+        return SpectrogramWidget(var_name, color, parent, trace_id=trace_id)
+
+    def update(self, widget: QWidget, value: Any, dtype: str,
+               shape: Optional[Tuple[int, ...]] = None,
+               source_info: str = "") -> None:
+        if isinstance(widget, SpectrogramWidget):
+            widget.update_data(value, dtype, shape, source_info)
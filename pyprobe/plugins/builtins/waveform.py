@@ -1,5 +1,5 @@
 """Waveform visualization plugin for 1D arrays."""
-from typing import Any, Optional, Tuple, List
+from typing import Any, Hashable, Optional, Tuple, List
 import time
 import numpy as np
 import pyqtgraph as pg
@@ -9,6 +9,12 @@ from PyQt6.QtCore import QRectF, QTimer, Qt, pyqtSignal
 
 from ...plots.pin_layout_mixin import PinLayoutMixin
 from ...plots.draw_mode import DrawMode, apply_draw_mode
+from ...plots.decimation import minmax_decimate, viewport_decimate
+from ...plots.lod_pyramid import LodCache
+from ...plots.render_cache import RenderCache, axis_token
+from ...plots.render_prep import RenderPrepPool
+from ...plots.fft_engine import Spectrum, SpectrumAverager, SpectrumAveraging, compute_spectrum
+from ...plots.raster import DensityRaster, alpha_ramp_lut, fit_range
 
 from ..base import ProbePlugin
 from ...core.data_classifier import (
@@ -46,6 +52,16 @@ class WaveformWidget(PinLayoutMixin, QWidget):
     axis_interaction_triggered = pyqtSignal(str, str)  # (type, orientation)
     
     MAX_DISPLAY_POINTS = 5000
+
+    # Persistence mode: raster resolution, per-frame fade and vertical
+    # headroom around the data when the raster extent is picked
+    PERSISTENCE_SHAPE = (256, 1024)
+    PERSISTENCE_DECAY = 0.9
+    PERSISTENCE_MARGIN = 0.1
+
+    # Frames with at least this many samples get their stats and decimation
+    # prepared on a worker thread; the GUI thread only sets the curves
+    ASYNC_PREP_SAMPLES = 1 << 18
     
     def __init__(self, var_name: str, color: QColor, parent: Optional[QWidget] = None, trace_id: str = ""):
         super().__init__(parent)
@@ -67,6 +83,11 @@ class WaveformWidget(PinLayoutMixin, QWidget):
         self._draw_modes: dict = {}  # int -> DrawMode
         self._row_colors = list(ROW_COLORS)
         self._first_data = True
+        # Min/max pyramids of long traces, keyed by the curve drawing them
+        self._lod = LodCache()
+        self._persistence: Optional[DensityRaster] = None
+        # Identifies this widget's render-prep job in the shared pool
+        self._prep_key = object()
 
         self._setup_ui()
 
@@ -125,6 +146,13 @@ class WaveformWidget(PinLayoutMixin, QWidget):
         )]
         self._row_visible = [True]
         self._draw_modes[0] = DrawMode.LINE
+
+        # Persistence image, drawn beneath the live curves when enabled
+        self._persistence_image = pg.ImageItem(axisOrder='row-major')
+        self._persistence_image.setZValue(-1)
+        self._persistence_image.setVisible(False)
+        self._persistence_image.setLookupTable(alpha_ramp_lut(*self._color.getRgb()[:3]))
+        self._plot_widget.addItem(self._persistence_image)
         
         self._plot_widget.setMouseEnabled(x=True, y=True)
         
@@ -323,6 +351,7 @@ class WaveformWidget(PinLayoutMixin, QWidget):
             self._curves[0].setPen(pg.mkPen(hex_color, width=1.5))
             mode = self._draw_modes.get(0, DrawMode.LINE)
             apply_draw_mode(self._curves[0], mode, hex_color)
+        self._persistence_image.setLookupTable(alpha_ramp_lut(*color.getRgb()[:3]))
 
     def set_series_color(self, series_key: int, color: QColor) -> None:
         """Change the color of a curve by index."""
@@ -401,7 +430,7 @@ class WaveformWidget(PinLayoutMixin, QWidget):
         Uses min-max decimation to preserve peaks.
 
         Args:
-            data: The array to downsample.
+            data: The array to downsample (2D: each row independently).
             n_points: Max display points (0 = use MAX_DISPLAY_POINTS).
             x_offset: Offset added to x-indices (for sliced data).
 
@@ -411,57 +440,8 @@ class WaveformWidget(PinLayoutMixin, QWidget):
         """
         if n_points <= 0:
             n_points = self.MAX_DISPLAY_POINTS
+        return minmax_decimate(data, n_points, x_offset)
 
-        n = len(data)
-        if n <= n_points:
-            return np.arange(n) + x_offset, data
-
-        if n < 2:
-            return np.arange(n) + x_offset, data
-
-        # Reserve 2 points for first and last samples to ensure boundary coverage
-        # The remaining points are used for min-max chunks
-        n_chunks = (n_points - 2) // 2
-        if n_chunks <= 0:
-            # Fallback for very low n_points: just first and last
-            return np.array([x_offset, n - 1 + x_offset], dtype=np.int64), np.array([data[0], data[-1]], dtype=data.dtype)
-
-        # Use np.linspace for middle edges [0, n]
-        # We start chunks from index 0 to n-1, but we'll manually set first/last
-        edges = np.linspace(0, n, n_chunks + 1, dtype=int)
-
-        x = np.empty(n_chunks * 2 + 2, dtype=np.int64)
-        y = np.empty(n_chunks * 2 + 2, dtype=data.dtype)
-
-        # First point
-        x[0] = x_offset
-        y[0] = data[0]
-
-        # Middle chunks
-        for i in range(n_chunks):
-            chunk = data[edges[i]:edges[i + 1]]
-            if len(chunk) == 0:
-                # Should not happen with linspace(0, n, n_chunks+1) where n > n_chunks
-                x[2 * i + 1] = edges[i] + x_offset
-                x[2 * i + 2] = edges[i] + x_offset
-                y[2 * i + 1] = data[edges[i]]
-                y[2 * i + 2] = data[edges[i]]
-                continue
-
-            amin = int(np.argmin(chunk))
-            amax = int(np.argmax(chunk))
-            lo, hi = sorted([amin, amax])
-
-            x[2 * i + 1] = edges[i] + lo + x_offset
-            x[2 * i + 2] = edges[i] + hi + x_offset
-            y[2 * i + 1] = chunk[lo]
-            y[2 * i + 2] = chunk[hi]
-
-        # Last point
-        x[-1] = n - 1 + x_offset
-        y[-1] = data[-1]
-
-        return x, y
     def update_data(self, value: Any, dtype: str, shape: Optional[Tuple[int, ...]] = None, source_info: str = "") -> None:
         """Update the widget with new data."""
         if value is None:
@@ -487,7 +467,7 @@ class WaveformWidget(PinLayoutMixin, QWidget):
             samples = np.asarray(value['samples'])
             scalars = value.get('scalars', [0.0, 1.0])  # [t0, dt] sorted
             t0, dt = scalars[0], scalars[1]
-            t_vector = t0 + np.arange(len(samples)) * dt
+            t_vector = RenderCache.instance().uniform_axis(samples, t0, dt)
             value = samples
         else:
             # Check for direct waveform collection object
@@ -516,7 +496,7 @@ class WaveformWidget(PinLayoutMixin, QWidget):
                 samples = np.asarray(getattr(value, samples_attr))
                 scalars = [float(getattr(value, attr)) for attr in scalar_attrs]
                 t0, dt = scalars[0], scalars[1]
-                t_vector = t0 + np.arange(len(samples)) * dt
+                t_vector = RenderCache.instance().uniform_axis(samples, t0, dt)
                 value = samples
 
         # Convert to numpy array if needed
@@ -532,7 +512,7 @@ class WaveformWidget(PinLayoutMixin, QWidget):
         
         # Handle complex data: take absolute value (magnitude)
         if np.iscomplexobj(value) or dtype == DTYPE_ARRAY_COMPLEX:
-            value = np.abs(value)
+            value = RenderCache.instance().channel(value, 'abs')
             source_info = f"{source_info} (magnitude)"
 
         self._t_vector = t_vector
@@ -545,6 +525,77 @@ class WaveformWidget(PinLayoutMixin, QWidget):
             
         self._check_first_data_reset()
 
+    # === Persistence ===
+
+    @property
+    def persistence(self) -> bool:
+        """True when frames accumulate into a decaying intensity image."""
+        return self._persistence is not None
+
+    def set_persistence(self, enabled: bool) -> None:
+        """
+        Switch phosphor-style persistence on or off.
+
+        Every new frame is drawn as lines into a fixed-size raster whose
+        older frames fade by ``PERSISTENCE_DECAY`` per frame, and the raster
+        is shown beneath the live curves. Jitter and rare glitches stay
+        visible across many frames, at a per-frame cost of one pass over
+        the samples plus the raster size.
+        """
+        if enabled == self.persistence:
+            return
+        self._persistence = DensityRaster(self.PERSISTENCE_SHAPE, self.PERSISTENCE_DECAY) if enabled else None
+        self._persistence_image.setVisible(enabled)
+        if enabled and self._data is not None:
+            self._accumulate_persistence()
+
+    def _persistence_traces(self) -> List[Tuple[np.ndarray, float, float]]:
+        """(samples, x0, dx) of each visible series, with its x-axis as a uniform spacing."""
+        traces = []
+        for curve, samples, t_vec, uniform, _, _ in self._curve_sources():
+            n = len(samples)
+            if n < 2 or not curve.isVisible():
+                continue
+            if uniform is not None and uniform[1] > 0:
+                x0, dx = uniform
+            elif t_vec is not None and len(t_vec) == n and t_vec[-1] > t_vec[0]:
+                x0, dx = t_vec[0], (t_vec[-1] - t_vec[0]) / (n - 1)
+            else:
+                x0, dx = 0.0, 1.0
+            traces.append((samples, float(x0), float(dx)))
+        return traces
+
+    def _accumulate_persistence(self) -> None:
+        """Fade the persistence raster one frame and draw the current data into it."""
+        if self._persistence is None:
+            return
+        traces = self._persistence_traces()
+        if not traces:
+            return
+        x_lo = min(x0 for _, x0, _ in traces)
+        x_hi = max(x0 + (len(samples) - 1) * dx for samples, x0, dx in traces)
+        with np.errstate(invalid='ignore'):
+            y_lo = min(float(np.nanmin(samples)) for samples, _, _ in traces)
+            y_hi = max(float(np.nanmax(samples)) for samples, _, _ in traces)
+        if not (np.isfinite(y_lo) and np.isfinite(y_hi)):
+            return
+
+        # A new x-axis or a refitted y-range restarts the accumulation
+        extent = self._persistence.extent
+        same_x = extent is not None and (extent[0], extent[1]) == (x_lo, x_hi)
+        y_range = fit_range(y_lo, y_hi, (extent[2], extent[3]) if same_x else None, self.PERSISTENCE_MARGIN)
+        if y_range is not None:
+            self._persistence.set_extent(x_lo, x_hi, *y_range)
+
+        self._persistence.fade()
+        for samples, x0, dx in traces:
+            self._persistence.add_traces(samples, x0, dx)
+        # log scale keeps rare outliers visible next to the steady trace
+        image = np.log1p(self._persistence.counts())
+        peak = float(image.max())
+        self._persistence_image.setImage(image, autoLevels=False, levels=(0.0, peak if peak > 0 else 1.0))
+        self._persistence_image.setRect(QRectF(*self._persistence.rect()))
+
     def _check_first_data_reset(self):
         """Reset view once on first data arrival with delay for layout."""
         if getattr(self, '_first_data', False):
@@ -574,11 +625,8 @@ class WaveformWidget(PinLayoutMixin, QWidget):
         # Update info label
         self._info_label.setText(source_info)
 
-        # Update stats
-        self._update_stats_from_data(self._data, shape=shape if shape else value.shape)
-
-        # Trigger rendering (respects current zoom)
-        self._rerender_for_zoom()
+        # Update stats and trigger rendering (respects current zoom)
+        self._present_frame(shape=shape if shape else value.shape)
 
     def _update_2d_data(self, value: np.ndarray, dtype: str, shape: Optional[tuple], source_info: str):
         """Update plot with 2D data (each row is a time series)."""
@@ -591,12 +639,63 @@ class WaveformWidget(PinLayoutMixin, QWidget):
         # Update info label
         self._info_label.setText(source_info)
 
-        # Update stats (aggregate across all rows)
-        self._update_stats_from_data(self._data, prefix=f"{value.shape[0]} rows", shape=shape if shape else value.shape)
+        # Update stats (aggregate across all rows) and trigger rendering
+        self._present_frame(prefix=f"{value.shape[0]} rows", shape=shape if shape else value.shape)
 
-        # Trigger rendering (respects current zoom)
+    def _present_frame(self, prefix: str = "", shape: Optional[tuple] = None) -> None:
+        """Show stats and curves for the ndarray just stored in ``self._data``."""
+        if self._persistence is None and self._data.size >= self.ASYNC_PREP_SAMPLES:
+            self._submit_render_prep(prefix, shape)
+            return
+        RenderPrepPool.instance().cancel(self._prep_key)
+        self._update_stats_from_data(self._data, prefix=prefix, shape=shape)
+        self._accumulate_persistence()
         self._rerender_for_zoom()
 
+    def _submit_render_prep(self, prefix: str, shape: Optional[tuple]) -> None:
+        """
+        Compute stats and per-row decimation of the current frame on a
+        worker. Until the result arrives the previous frame stays on screen;
+        a newer frame supersedes the job.
+        """
+        data, t_vec = self._data, self._t_vector
+        rows = (data if data.ndim == 2 else data[np.newaxis])[:len(self._curves)]
+        x_range = self._view_x_range()
+        width = self._view_pixel_width()
+        for curve, row in zip(self._curves, rows):
+            self._lod.note_rendered(curve, row)
+
+        def prepare(is_cancelled):
+            stats = (np.min(data), np.max(data), np.mean(data))
+            points = []
+            for row in rows:
+                if is_cancelled():
+                    return None
+                points.append(self._decimate_for_view(row, t_vec, x_range, width=width))
+            return data, x_range, stats, points
+
+        RenderPrepPool.instance().submit(
+            self._prep_key, prepare, lambda result: self._apply_render_prep(result, prefix, shape))
+
+    def _apply_render_prep(self, result: tuple, prefix: str, shape: Optional[tuple]) -> None:
+        data, x_range, stats, points = result
+        if data is not self._data:
+            return
+        RenderCache.instance().derived(data, 'stats', lambda: stats)
+        self._update_stats_from_data(data, prefix=prefix, shape=shape)
+        if x_range != self._view_x_range():
+            return  # zoomed meanwhile; the zoom re-render drew this frame
+        self._updating_curves = True
+        for curve, (x, y) in zip(self._curves, points):
+            if len(x):
+                curve.setData(x, y)
+        self._updating_curves = False
+        self._refresh_markers()
+
+    def finish_render_prep(self, timeout: Optional[float] = None) -> bool:
+        """Apply the pending worker-prepared frame now; False on timeout."""
+        return RenderPrepPool.instance().wait(self._prep_key, timeout)
+
     def _update_waveform_collection_data(self, value: dict, dtype: str, shape: Optional[tuple], source_info: str):
         """Update plot with waveform collection."""
         waveforms = value.get('waveforms', [])
@@ -620,8 +719,10 @@ class WaveformWidget(PinLayoutMixin, QWidget):
             all_data = np.concatenate(all_samples)
             self._update_stats_from_data(all_data, f"{num_waveforms} wfms", shape=(num_waveforms, len(all_samples[0])) if all_samples else None)
         
-        # We need to store the waveforms for rerender_for_zoom to use
-        self._data = waveforms # Store as list of dicts for this specific widget type
+        # We need to store the waveforms for rerender_for_zoom to use, with the
+        # samples as arrays so zoom re-renders reuse them (and their pyramids)
+        self._data = [dict(wf, samples=samples) for wf, samples in zip(waveforms, all_samples)]
+        self._accumulate_persistence()
         self._rerender_for_zoom()
 
     def _update_array_collection_data(self, value: dict, dtype: str, shape: Optional[tuple], source_info: str):
@@ -646,6 +747,7 @@ class WaveformWidget(PinLayoutMixin, QWidget):
             
         # Store for rerender_for_zoom
         self._data = all_data 
+        self._accumulate_persistence()
         self._rerender_for_zoom()
 
     def _update_stats(self):
@@ -661,9 +763,8 @@ class WaveformWidget(PinLayoutMixin, QWidget):
         self._update_stats_from_data(self._data, f"{self._data.shape[0]} rows")
 
     def _update_stats_from_data(self, data: np.ndarray, prefix: str = "", shape: Optional[tuple] = None):
-        min_val = np.min(data)
-        max_val = np.max(data)
-        mean_val = np.mean(data)
+        min_val, max_val, mean_val = RenderCache.instance().derived(
+            data, 'stats', lambda: (np.min(data), np.max(data), np.mean(data)))
         
         prefix_parts = []
         if shape is not None:
@@ -682,113 +783,117 @@ class WaveformWidget(PinLayoutMixin, QWidget):
             return
         self._zoom_timer.start()
 
+    def _view_pixel_width(self) -> int:
+        """Physical pixel columns of the plot area (a fixed budget before layout)."""
+        vb = self._plot_widget.getPlotItem().getViewBox()
+        width = int(vb.width() * self._plot_widget.devicePixelRatioF())
+        if width < 1:
+            return max(1, (self.MAX_DISPLAY_POINTS - 2) // 2)
+        return width
+
+    def _decimate_for_view(self, samples: np.ndarray, t_vec: Optional[np.ndarray] = None,
+                           x_range: Optional[Tuple[float, float]] = None,
+                           key: Optional[Any] = None, uniform: Optional[Tuple[float, float]] = None,
+                           source: Optional[Any] = None, channel: Hashable = None,
+                           width: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        (x, y) to draw for ``samples`` within ``x_range`` (default: all of them),
+        min/max aggregated per pixel column of the view.
+
+        ``uniform`` = (t0, dt) describes an evenly spaced x-axis without
+        materializing it. With a ``key`` the series gets a min/max pyramid
+        in ``self._lod``, so repeated pans and zooms stay O(pixel width).
+        Results are shared through the RenderCache with every other view of
+        the captured array ``source`` (``channel`` tells apart series derived
+        from the same capture). Without ``key`` and ``source`` this is pure
+        numpy, safe on a worker thread given the pixel ``width``.
+        """
+        samples = np.asarray(samples)
+        n = len(samples)
+        if t_vec is not None and (len(t_vec) != n or (n > 1 and not t_vec[-1] > t_vec[0])):
+            t_vec = None
+        t0, dt = uniform if uniform is not None and uniform[1] > 0 else (0.0, 1.0)
+        if x_range is None:
+            if n == 0:
+                return np.empty(0), samples
+            x_range = (t_vec[0], t_vec[-1]) if t_vec is not None else (t0, t0 + (n - 1) * dt)
+        x_min, x_max = x_range
+        if t_vec is None:
+            x_min, x_max = (x_min - t0) / dt, (x_max - t0) / dt
+        if width is None:
+            width = self._view_pixel_width()
+
+        def decimate():
+            if key is None:
+                idx = viewport_decimate(samples, x_min, x_max, width, x=t_vec)
+            else:
+                idx = self._lod.decimate(key, samples, x_min, x_max, width, x=t_vec)
+            x = t_vec[idx] if t_vec is not None else t0 + idx * dt
+            return x, samples[idx]
+
+        if source is None:
+            return decimate()
+        memo_key = ('viewport', channel, float(x_min), float(x_max), width, axis_token(t_vec), t0, dt)
+        return RenderCache.instance().derived(source, memo_key, decimate)
+
+    def _lod_keys(self) -> List[Any]:
+        """Curves whose pyramids are worth keeping."""
+        return list(self._curves)
+
     def _rerender_for_zoom(self):
-        """Re-downsample or show raw data based on visible x-range."""
+        """Re-aggregate the visible x-range at the view's pixel resolution."""
         if self._data is None:
             return
-        
-        plot_item = self._plot_widget.getPlotItem()
-        vb = plot_item.getViewBox()
-        x_min, x_max = vb.viewRange()[0]
+
+        self._render_curves(self._view_x_range())
+        self._refresh_markers()
+
+    def _view_x_range(self) -> Optional[Tuple[float, float]]:
+        """
+        Visible x-range to render, or None for everything.
+
+        If not pinned, always render the full range so auto-range can fit it.
+        Programmatic zooms in tests must pin the axis to verify zoomed re-rendering.
+        """
         x_pinned = self._axis_controller.x_pinned if self._axis_controller else False
-        
-        def get_indices(n_length, t_vec=None):
-            # If not pinned, we should always use the full range to allow auto-range to work.
-            # Programmatic zooms in tests must pin the axis to verify zoomed re-rendering.
-            if not x_pinned:
-                return 0, n_length
-                
-            if t_vec is not None and len(t_vec) == n_length:
-                if t_vec[-1] > t_vec[0]:
-                    import bisect
-                    i_min = bisect.bisect_left(t_vec, x_min)
-                    i_max = bisect.bisect_right(t_vec, x_max)
-                    return max(0, i_min), min(n_length, i_max)
-            return max(0, int(np.floor(x_min))), min(n_length, int(np.ceil(x_max)) + 1)
-            
-        # For 1D data
+        if not x_pinned:
+            return None
+        return tuple(self._plot_widget.getPlotItem().getViewBox().viewRange()[0])
+
+    def _render_curves(self, x_range: Optional[Tuple[float, float]]) -> None:
+        """Set every curve to its data decimated for ``x_range`` (None = everything)."""
+        self._updating_curves = True
+        for curve, samples, t_vec, uniform, source, channel in self._curve_sources():
+            x, y = self._decimate_for_view(samples, t_vec, x_range, key=curve, uniform=uniform,
+                                           source=source, channel=channel)
+            if len(x):
+                curve.setData(x, y)
+        self._updating_curves = False
+        self._lod.retain(self._lod_keys())
+
+    def _curve_sources(self) -> List[tuple]:
+        """
+        (curve, samples, x-vector or None, (t0, dt) or None, captured array,
+        channel) for each displayed series; the last two key the RenderCache.
+        """
+        sources = []
         if isinstance(self._data, np.ndarray) and self._data.ndim == 1:
-            n = len(self._data)
-            i_min, i_max = get_indices(n, self._t_vector)
-            if i_min >= i_max:
-                return
-            
-            visible_slice = self._data[i_min:i_max]
-            visible_count = len(visible_slice)
-            
-            self._updating_curves = True
-            if visible_count <= self.MAX_DISPLAY_POINTS:
-                # Full resolution for visible slice
-                x = np.arange(i_min, i_max)
-                y = visible_slice
-            else:
-                # Re-downsample the visible slice
-                x, y = self.downsample(visible_slice, x_offset=i_min)
-            
-            if self._t_vector is not None and len(self._t_vector) == len(self._data):
-                self._curves[0].setData(self._t_vector[x], y)
-            else:
-                self._curves[0].setData(x, y)
-            self._updating_curves = False
-        
+            sources.append((self._curves[0], self._data, self._t_vector, None, self._data, None))
         elif isinstance(self._data, np.ndarray) and self._data.ndim == 2:
-            # 2D: re-downsample each row for visible range
-            n_cols = self._data.shape[1]
-            i_min, i_max = get_indices(n_cols, self._t_vector)
-            if i_min >= i_max:
-                return
-            
-            self._updating_curves = True
             for row_idx in range(min(self._data.shape[0], len(self._curves))):
-                row_slice = self._data[row_idx, i_min:i_max]
-                if len(row_slice) <= self.MAX_DISPLAY_POINTS:
-                    x = np.arange(i_min, i_max)
-                    y = row_slice
-                else:
-                    x, y = self.downsample(row_slice, x_offset=i_min)
-                
-                if self._t_vector is not None and len(self._t_vector) == n_cols:
-                    self._curves[row_idx].setData(self._t_vector[x], y)
-                else:
-                    self._curves[row_idx].setData(x, y)
-            self._updating_curves = False
-
+                sources.append((self._curves[row_idx], self._data[row_idx], self._t_vector, None,
+                                self._data, row_idx))
         elif isinstance(self._data, list):
             # WaveformCollection or ArrayCollection
-            self._updating_curves = True
-            for idx, item in enumerate(self._data):
-                if idx >= len(self._curves):
-                    break
-                
-                if isinstance(item, dict): # Waveform
+            for curve, item in zip(self._curves, self._data):
+                if isinstance(item, dict):  # Waveform
                     samples = np.asarray(item['samples'])
                     scalars = item.get('scalars', [0.0, 1.0])
-                    t0, dt = scalars[0], scalars[1]
-                    t_vector = t0 + np.arange(len(samples)) * dt
-                    
-                    i_min, i_max = get_indices(len(samples), t_vector)
-                    if i_min < i_max:
-                        visible_slice = samples[i_min:i_max]
-                        if len(visible_slice) <= self.MAX_DISPLAY_POINTS:
-                            x = np.arange(i_min, i_max)
-                            y = visible_slice
-                        else:
-                            x, y = self.downsample(visible_slice, x_offset=i_min)
-                        self._curves[idx].setData(t_vector[x], y)
-                else: # Numpy array (ArrayCollection)
+                    sources.append((curve, samples, None, (scalars[0], scalars[1]), samples, None))
+                else:  # Numpy array (ArrayCollection)
                     samples = np.asarray(item)
-                    i_min, i_max = get_indices(len(samples))
-                    if i_min < i_max:
-                        visible_slice = samples[i_min:i_max]
-                        if len(visible_slice) <= self.MAX_DISPLAY_POINTS:
-                            x = np.arange(i_min, i_max)
-                            y = visible_slice
-                        else:
-                            x, y = self.downsample(visible_slice, x_offset=i_min)
-                        self._curves[idx].setData(x, y)
-            self._updating_curves = False
-
-        self._refresh_markers()
+                    sources.append((curve, samples, None, None, samples, None))
+        return sources
 
     def reset_view(self) -> None:
         """Reset the view: restore full data to curves, unpin axes, snap to full range.
@@ -802,38 +907,7 @@ class WaveformWidget(PinLayoutMixin, QWidget):
             return
         
         # 1. Restore full dataset to curves
-        self._updating_curves = True
-        if isinstance(self._data, list):
-            # WaveformCollection or ArrayCollection
-            for idx, item in enumerate(self._data):
-                if idx >= len(self._curves):
-                    break
-                if isinstance(item, dict):  # Waveform
-                    samples = np.asarray(item['samples'])
-                    scalars = item.get('scalars', [0.0, 1.0])
-                    t0, dt = scalars[0], scalars[1]
-                    t_vector = t0 + np.arange(len(samples)) * dt
-                    x_display, y_display = self.downsample(samples)
-                    self._curves[idx].setData(t_vector[x_display], y_display)
-                else:  # Numpy array (ArrayCollection)
-                    samples = np.asarray(item)
-                    x_display, y_display = self.downsample(samples)
-                    self._curves[idx].setData(x_display, y_display)
-        elif self._data.ndim == 1:
-            x_display, y_display = self.downsample(self._data)
-            if self._t_vector is not None and len(self._t_vector) == len(self._data):
-                self._curves[0].setData(self._t_vector[x_display], y_display)
-            else:
-                self._curves[0].setData(x_display, y_display)
-        elif self._data.ndim == 2:
-            for row_idx in range(min(self._data.shape[0], len(self._curves))):
-                row_data = self._data[row_idx, :]
-                x_display, y_display = self.downsample(row_data)
-                if self._t_vector is not None and len(self._t_vector) == self._data.shape[1]:
-                    self._curves[row_idx].setData(self._t_vector[x_display], y_display)
-                else:
-                    self._curves[row_idx].setData(x_display, y_display)
-        self._updating_curves = False
+        self._render_curves(None)
         
         # 2. Unpin axes and snap to full range
         if self._axis_controller:
@@ -995,6 +1069,7 @@ class WaveformWidget(PinLayoutMixin, QWidget):
         
         This allows tests to verify what is actually rendered.
         """
+        self.finish_render_prep()
         result = []
         for curve in self._curves:
             x_data, y_data = curve.getData()
@@ -1031,9 +1106,9 @@ class WaveformFftMagAngleWidget(WaveformWidget):
         self._plot_widget.setLabel('bottom', 'Frequency')
         self._plot_widget.setLabel('left', 'Magnitude (dB)')
         self._info_label.setText("FFT Mag (dB) / Angle (deg)")
-        self.MAX_DISPLAY_POINTS = 1000000
-        self._phase_display_points = 5000
         self._first_data = True
+        self._averaging = SpectrumAveraging.NONE
+        self._averagers: dict = {}  # series group -> SpectrumAverager
         
         # Calculate a complementary color for the phase axis & curves
         c = QColor(self._color)
@@ -1196,90 +1271,90 @@ class WaveformFftMagAngleWidget(WaveformWidget):
     def _has_visible_phase_curves(self) -> bool:
         return any(curve.isVisible() for curve in self._phase_curves)
 
+    def _lod_keys(self) -> List[Any]:
+        return super()._lod_keys() + list(self._phase_curves)
+
     def _render_phase_curves_full(self):
+        self._render_phase_curves(None)
+
+    def _render_phase_curves(self, x_range: Optional[Tuple[float, float]]) -> None:
         if self._current_phase_data is None or not self._has_visible_phase_curves():
             return
+        rows = np.atleast_2d(self._current_phase_data)
         self._updating_curves = True
-        if self._current_phase_data.ndim == 1:
-            x_idx, y_disp = self.downsample(
-                self._current_phase_data, n_points=self._phase_display_points
-            )
-            if self._t_vector is not None and len(self._t_vector) == len(self._current_phase_data):
-                self._phase_curves[0].setData(self._t_vector[x_idx], y_disp)
-            else:
-                self._phase_curves[0].setData(x_idx, y_disp)
-        elif self._current_phase_data.ndim == 2:
-            n_cols = self._current_phase_data.shape[1]
-            for row_idx in range(min(self._current_phase_data.shape[0], len(self._phase_curves))):
-                x_idx, y_disp = self.downsample(
-                    self._current_phase_data[row_idx], n_points=self._phase_display_points
-                )
-                if self._t_vector is not None and len(self._t_vector) == n_cols:
-                    self._phase_curves[row_idx].setData(self._t_vector[x_idx], y_disp)
-                else:
-                    self._phase_curves[row_idx].setData(x_idx, y_disp)
+        for curve, row in zip(self._phase_curves, rows):
+            x, y = self._decimate_for_view(row, self._t_vector, x_range, key=curve)
+            if len(x):
+                curve.setData(x, y)
         self._updating_curves = False
+        self._lod.retain(self._lod_keys())
 
     def _rerender_for_zoom(self):
         super()._rerender_for_zoom()
-        if self._current_phase_data is None or not self._has_visible_phase_curves():
-            return
-            
-        plot_item = self._plot_widget.getPlotItem()
-        vb = plot_item.getViewBox()
-        x_min, x_max = vb.viewRange()[0]
-        
-        def get_indices(n_length):
-            if self._t_vector is not None and len(self._t_vector) == n_length:
-                if self._t_vector[-1] > self._t_vector[0]:
-                    import bisect
-                    i_min = bisect.bisect_left(self._t_vector, x_min)
-                    i_max = bisect.bisect_right(self._t_vector, x_max)
-                    return max(0, i_min), min(n_length, i_max)
-            return max(0, int(np.floor(x_min))), min(n_length, int(np.ceil(x_max)) + 1)
-        
-        self._updating_curves = True
-        if self._current_phase_data.ndim == 1:
-            n = len(self._current_phase_data)
-            i_min, i_max = get_indices(n)
-            if i_min < i_max:
-                slice_data = self._current_phase_data[i_min:i_max]
-                if len(slice_data) <= self._phase_display_points:
-                    x, y = np.arange(i_min, i_max), slice_data
-                else:
-                    x, y = self.downsample(
-                        slice_data, n_points=self._phase_display_points, x_offset=i_min
-                    )
-                
-                if self._t_vector is not None and len(self._t_vector) == n:
-                    self._phase_curves[0].setData(self._t_vector[x], y)
-                else:
-                    self._phase_curves[0].setData(x, y)
-                    
-        elif self._current_phase_data.ndim == 2:
-            n_cols = self._current_phase_data.shape[1]
-            i_min, i_max = get_indices(n_cols)
-            if i_min < i_max:
-                for row_idx in range(min(self._current_phase_data.shape[0], len(self._phase_curves))):
-                    row_slice = self._current_phase_data[row_idx, i_min:i_max]
-                    if len(row_slice) <= self._phase_display_points:
-                        x, y = np.arange(i_min, i_max), row_slice
-                    else:
-                        x, y = self.downsample(
-                            row_slice, n_points=self._phase_display_points, x_offset=i_min
-                        )
-                        
-                    if self._t_vector is not None and len(self._t_vector) == n_cols:
-                        self._phase_curves[row_idx].setData(self._t_vector[x], y)
-                    else:
-                        self._phase_curves[row_idx].setData(x, y)
-        self._updating_curves = False
+        vb = self._plot_widget.getPlotItem().getViewBox()
+        self._render_phase_curves(tuple(vb.viewRange()[0]))
 
     def reset_view(self) -> None:
         super().reset_view()
         self._render_phase_curves_full()
         self._p2.setYRange(-180.0, 180.0, padding=0)
 
+    def set_averaging(self, mode: SpectrumAveraging) -> None:
+        """Average spectra across frames (restarts any running average)."""
+        self._averaging = mode
+        self._averagers.clear()
+
+    def get_averaging(self) -> SpectrumAveraging:
+        return self._averaging
+
+    def _averaged(self, key: Hashable, spectrum: Spectrum) -> np.ndarray:
+        """Magnitude (dB) of ``spectrum`` after the averaging for series group ``key``."""
+        averager = self._averagers.get(key)
+        if averager is None:
+            averager = self._averagers[key] = SpectrumAverager(self._averaging)
+        return averager.update(spectrum)
+
+    def _retain_averagers(self, keys: List[Hashable]) -> None:
+        for key in list(self._averagers):
+            if key not in keys:
+                del self._averagers[key]
+
+    def _collection_spectra(self, items: List[Tuple[np.ndarray, Optional[float]]]
+                            ) -> List[Tuple[np.ndarray, np.ndarray, np.ndarray]]:
+        """
+        (mag_db, phase_deg, freqs) for each non-empty (samples, dt) item, in
+        order. Items of equal length, spacing and kind are transformed as
+        one batch.
+        """
+        groups: dict = {}
+        for idx, (samples, dt) in enumerate(items):
+            if samples.ndim == 1 and len(samples):
+                groups.setdefault((len(samples), dt, np.iscomplexobj(samples)), []).append(idx)
+
+        results = {}
+        for key, indices in groups.items():
+            spectrum = compute_spectrum(np.stack([items[i][0] for i in indices]), key[1])
+            mag_db = self._averaged(key, spectrum)
+            for row, idx in enumerate(indices):
+                results[idx] = (mag_db[row], spectrum.phase_deg[row], spectrum.freqs)
+        self._retain_averagers(list(groups))
+        return [results[idx] for idx in sorted(results)]
+
+    def _set_collection_phase_curves(self, phases: List[Tuple[np.ndarray, Optional[np.ndarray]]]) -> None:
+        self._current_phase_data = None
+        self._ensure_phase_curves(len(phases))
+        self._updating_curves = True
+        for curve, (phase, freqs) in zip(self._phase_curves, phases):
+            x_display, y_display = self._decimate_for_view(phase, freqs)
+            curve.setData(x_display, y_display)
+        self._updating_curves = False
+
+    def _schedule_first_reset(self) -> None:
+        if getattr(self, '_first_data', False):
+            from PyQt6.QtCore import QTimer
+            QTimer.singleShot(50, self.reset_view)
+            self._first_data = False
+
     def update_data(self, value: Any, dtype: str, shape: Optional[Tuple[int, ...]] = None, source_info: str = "") -> None:
         if value is None:
             return
@@ -1312,133 +1387,58 @@ class WaveformFftMagAngleWidget(WaveformWidget):
         if isinstance(value, np.ndarray):
             if value.ndim == 0:
                 value = np.atleast_1d(value)
-            
-            def compute_fft(data_arr, dt_val):
-                n = len(data_arr)
-                if n == 0:
-                    return data_arr, None, None
-                import scipy.signal
-                window = scipy.signal.windows.kaiser(n, beta=9)
-                windowed = data_arr * window
-                nfft = max(8192, 2**int(np.ceil(np.log2(n))))
-                fft_data = np.fft.fftshift(np.fft.fft(windowed, n=nfft))
-                fft_mag = 20 * np.log10(np.abs(fft_data) + 1e-12) - 20 * np.log10(nfft)
-                fft_phase = np.rad2deg(np.angle(fft_data))
-                
-                if is_waveform and dt_val > 0:
-                    freqs = np.fft.fftshift(np.fft.fftfreq(nfft, d=dt_val))
-                else:
-                    freqs = np.arange(-nfft//2, nfft - nfft//2)
-                return fft_mag, fft_phase, freqs
+            if value.ndim not in (1, 2) or value.shape[-1] == 0:
+                return
 
+            # All rows go through one batched transform
+            spectrum = compute_spectrum(value, dt if is_waveform else None)
+            mag_db = self._averaged('frame', spectrum)
+            self._retain_averagers(['frame'])
+            self._t_vector = spectrum.freqs
+            self._current_phase_data = spectrum.phase_deg
             if value.ndim == 1:
-                fft_mag, fft_phase, freqs = compute_fft(value, dt)
-                self._t_vector = freqs
-                self._current_phase_data = fft_phase
                 self._ensure_phase_curves(1)
-                super()._update_1d_data(fft_mag, dtype, shape, source_info + " (FFT)")
-                self._plot_widget.setLabel('bottom', 'Frequency (Hz)' if is_waveform else 'FFT Bin')
-                self._render_phase_curves_full()
-                
-            elif value.ndim == 2:
-                fft_mags = []
-                fft_phases = []
-                freqs = None
-                for i in range(value.shape[0]):
-                    mag, phase, f = compute_fft(value[i], dt)
-                    fft_mags.append(mag)
-                    fft_phases.append(phase)
-                    if i == 0:
-                        freqs = f
-                
-                self._t_vector = freqs
-                self._current_phase_data = np.array(fft_phases)
+                super()._update_1d_data(mag_db, dtype, shape, source_info + " (FFT)")
+            else:
                 self._ensure_phase_curves(value.shape[0])
-                super()._update_2d_data(np.array(fft_mags), dtype, shape, source_info + " (FFT)")
-                self._plot_widget.setLabel('bottom', 'Frequency (Hz)' if is_waveform else 'FFT Bin')
-                self._render_phase_curves_full()
-            
-            if getattr(self, '_first_data', False):
-                from PyQt6.QtCore import QTimer
-                QTimer.singleShot(50, self.reset_view)
-                self._first_data = False
+                super()._update_2d_data(mag_db, dtype, shape, source_info + " (FFT)")
+            self._plot_widget.setLabel('bottom', 'Frequency (Hz)' if is_waveform else 'FFT Bin')
+            self._render_phase_curves_full()
+            self._schedule_first_reset()
 
         elif isinstance(value, dict) and value.get('__dtype__') == DTYPE_WAVEFORM_COLLECTION:
-            import scipy.signal
-            new_waveforms = []
-            phase_waveforms = []
+            items = []
             for wf in value.get('waveforms', []):
-                samples = np.asarray(wf['samples'])
                 scalars = wf.get('scalars', [0.0, 1.0])
-                dt_val = scalars[1]
-                n = len(samples)
-                if n > 0:
-                    window = scipy.signal.windows.kaiser(n, beta=9)
-                    windowed = samples * window
-                    nfft = max(8192, 2**int(np.ceil(np.log2(n))))
-                    fft_data = np.fft.fftshift(np.fft.fft(windowed, n=nfft))
-                    fft_mag = 20 * np.log10(np.abs(fft_data) + 1e-12) - 20 * np.log10(nfft)
-                    fft_phase = np.rad2deg(np.angle(fft_data))
-                    
-                    new_dt = 1.0 / (nfft * dt_val) if dt_val > 0 else 1.0
-                    freqs = np.fft.fftshift(np.fft.fftfreq(nfft, d=dt_val)) if dt_val > 0 else np.arange(-nfft//2, nfft - nfft//2)
-                    new_t0 = freqs[0]
-                    if dt_val <= 0:
-                        new_dt = freqs[1] - freqs[0] if len(freqs) > 1 else 1.0
-                    
-                    new_waveforms.append({'samples': fft_mag, 'scalars': [new_t0, new_dt]})
-                    phase_waveforms.append({'samples': fft_phase, 'freqs': freqs})
-            
+                items.append((np.asarray(wf['samples']), scalars[1]))
+
+            new_waveforms = []
+            phase_waveforms = []
+            for mag_db, phase, freqs in self._collection_spectra(items):
+                new_dt = freqs[1] - freqs[0] if len(freqs) > 1 else 1.0
+                new_waveforms.append({'samples': mag_db, 'scalars': [freqs[0], new_dt]})
+                phase_waveforms.append((phase, freqs))
+
             new_value = {'__dtype__': DTYPE_WAVEFORM_COLLECTION, 'waveforms': new_waveforms}
             super().update_data(new_value, dtype, shape, source_info + " (FFT)")
             self._plot_widget.setLabel('bottom', 'Frequency (Hz)')
-            
-            self._current_phase_data = None
-            self._ensure_phase_curves(len(phase_waveforms))
-            self._updating_curves = True
-            for idx, wf in enumerate(phase_waveforms):
-                x_idx, y_display = self.downsample(wf['samples'])
-                self._phase_curves[idx].setData(wf['freqs'][x_idx], y_display)
-            self._updating_curves = False
-            
-            if getattr(self, '_first_data', False):
-                from PyQt6.QtCore import QTimer
-                QTimer.singleShot(50, self.reset_view)
-                self._first_data = False
-            
+            self._set_collection_phase_curves(phase_waveforms)
+            self._schedule_first_reset()
+
         elif isinstance(value, dict) and value.get('__dtype__') == DTYPE_ARRAY_COLLECTION:
-            import scipy.signal
+            items = [(np.asarray(arr), None) for arr in value.get('arrays', [])]
+
             new_arrays = []
             phase_arrays = []
-            for arr in value.get('arrays', []):
-                samples = np.asarray(arr)
-                n = len(samples)
-                if n > 0:
-                    window = scipy.signal.windows.kaiser(n, beta=9)
-                    windowed = samples * window
-                    nfft = max(8192, 2**int(np.ceil(np.log2(n))))
-                    fft_data = np.fft.fftshift(np.fft.fft(windowed, n=nfft))
-                    fft_mag = 20 * np.log10(np.abs(fft_data) + 1e-12) - 20 * np.log10(nfft)
-                    fft_phase = np.rad2deg(np.angle(fft_data))
-                    new_arrays.append(fft_mag)
-                    phase_arrays.append(fft_phase)
-            
+            for mag_db, phase, _ in self._collection_spectra(items):
+                new_arrays.append(mag_db)
+                phase_arrays.append((phase, None))
+
             new_value = {'__dtype__': DTYPE_ARRAY_COLLECTION, 'arrays': new_arrays}
             super().update_data(new_value, dtype, shape, source_info + " (FFT)")
             self._plot_widget.setLabel('bottom', 'FFT Bin')
-            
-            self._current_phase_data = None
-            self._ensure_phase_curves(len(phase_arrays))
-            self._updating_curves = True
-            for idx, arr in enumerate(phase_arrays):
-                x_display, y_display = self.downsample(arr)
-                self._phase_curves[idx].setData(x_display, y_display)
-            self._updating_curves = False
-            
-            if getattr(self, '_first_data', False):
-                from PyQt6.QtCore import QTimer
-                QTimer.singleShot(50, self.reset_view)
-                self._first_data = False
+            self._set_collection_phase_curves(phase_arrays)
+            self._schedule_first_reset()
         else:
             super().update_data(value, dtype, shape, source_info)
 
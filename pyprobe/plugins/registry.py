@@ -1,9 +1,9 @@
 """Plugin registry for discovering and selecting visualization plugins."""
-from typing import Dict, List, Optional, Tuple, Type
+from typing import Callable, Dict, List, Optional, Tuple, Type, Union
 from PyQt6.QtGui import QColor
 from PyQt6.QtWidgets import QWidget
 
-from .base import ProbePlugin
+from .base import PluginSpec, ProbePlugin
 from ..logging import get_logger
 
 logger = get_logger(__name__)
@@ -15,7 +15,8 @@ class PluginRegistry:
     Singleton pattern - use PluginRegistry.instance() to get.
     
     Responsibilities:
-    - Auto-discover builtin plugins at startup
+    - Auto-discover builtin plugins at startup (their modules are
+      imported when a matching dtype or name is first asked for)
     - Match (dtype, shape) to compatible plugins
     - Select default plugin for each data type
     - Provide list of available plugins for lens dropdown
@@ -32,20 +33,33 @@ class PluginRegistry:
         return cls._instance
     
     def __init__(self):
-        self._plugins: List[ProbePlugin] = []
+        # Plugins, or specs of plugins not imported yet, in registration order
+        self._plugins: List[Union[ProbePlugin, PluginSpec]] = []
     
     def _discover_plugins(self) -> None:
         """Discover and register builtin plugins."""
         # Import here to avoid circular imports
-        from .builtins import get_builtin_plugins
+        from .builtins import BUILTIN_PLUGIN_SPECS
         
-        for plugin in get_builtin_plugins():
-            self.register(plugin)
-            logger.debug(f"Registered plugin: {plugin.name}")
+        for spec in BUILTIN_PLUGIN_SPECS:
+            self.register(spec)
+            logger.debug(f"Registered plugin: {spec.name}")
     
-    def register(self, plugin: ProbePlugin) -> None:
-        """Register a plugin instance."""
+    def register(self, plugin: Union[ProbePlugin, PluginSpec]) -> None:
+        """Register a plugin instance, or a spec to instantiate on first use."""
         self._plugins.append(plugin)
+
+    def _resolve(self, wanted: Callable[[PluginSpec], bool]) -> List[ProbePlugin]:
+        """Loaded plugins, after loading every pending spec ``wanted`` accepts."""
+        plugins = []
+        for i, entry in enumerate(self._plugins):
+            if isinstance(entry, PluginSpec):
+                if not wanted(entry):
+                    continue
+                entry = self._plugins[i] = entry.load()
+                logger.debug(f"Loaded plugin: {entry.name}")
+            plugins.append(entry)
+        return plugins
     
     def get_compatible_plugins(self, dtype: str, shape: Optional[Tuple[int, ...]] = None) -> List[ProbePlugin]:
         """Get all plugins that can handle the given data type.
@@ -53,8 +67,9 @@ class PluginRegistry:
         Returns:
             List of compatible plugins, sorted by priority (highest first)
         """
-        compatible = [p for p in self._plugins if p.can_handle(dtype, shape)]
-        return sorted(compatible, key=lambda p: p.priority, reverse=True)
+        loaded = self._resolve(lambda spec: dtype in spec.dtypes)
+        compatible = [p for p in loaded if p.can_handle(dtype, shape)]
+        return sorted(compatible, key=lambda p: p.priority_for(dtype, shape), reverse=True)
     
     def get_default_plugin(self, dtype: str, shape: Optional[Tuple[int, ...]] = None) -> Optional[ProbePlugin]:
         """Get the default (highest priority) plugin for a data type.
@@ -69,7 +84,7 @@ class PluginRegistry:
         """Get a plugin by its name. If multiple plugins share a name,
         uses dtype to find the compatible one.
         """
-        candidates = [p for p in self._plugins if p.name == name]
+        candidates = [p for p in self._resolve(lambda spec: spec.name == name) if p.name == name]
         if not candidates:
             return None
         if len(candidates) == 1:
@@ -85,5 +100,10 @@ class PluginRegistry:
     
     @property
     def all_plugins(self) -> List[ProbePlugin]:
-        """Get all registered plugins."""
-        return list(self._plugins)
+        """Get all registered plugins (importing any not loaded yet)."""
+        return self._resolve(lambda spec: True)
+
+    @property
+    def plugin_names(self) -> List[str]:
+        """Names of all registered plugins, without loading any."""
+        return [entry.name for entry in self._plugins]
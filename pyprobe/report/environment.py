@@ -30,7 +30,7 @@ class EnvironmentCollector:
         try:
             from pyprobe.plugins.registry import PluginRegistry
             registry = PluginRegistry.instance()
-            data["plugins"] = [p.name for p in registry.all_plugins]
+            data["plugins"] = registry.plugin_names
         except Exception:
             data["plugins"] = []
 
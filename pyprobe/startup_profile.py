@@ -0,0 +1,87 @@
+"""
+Startup timing for PyProbe.
+
+Records how long each startup phase takes and which modules it imported,
+from interpreter entry to the first shown window.
+
+Usage:
+    python -m pyprobe --startup-profile examples/dsp_demo.py
+
+The breakdown is printed to stderr once the main window is on screen.
+"""
+
+import sys
+import time
+from dataclasses import dataclass
+from typing import List, Optional
+
+# Top-level packages whose import is worth calling out
+NOTABLE_PACKAGES = ("numpy", "PyQt6", "pyqtgraph", "scipy")
+
+
+@dataclass(frozen=True)
+class Phase:
+    """One startup phase: its name, end time and the modules it imported."""
+    name: str
+    ended_at: float
+    seconds: float
+    modules: int
+    packages: tuple
+
+
+class StartupProfile:
+    """Phase timings and import counts, measured from ``start``."""
+
+    def __init__(self, start: Optional[float] = None):
+        self.start = time.perf_counter() if start is None else start
+        self.phases: List[Phase] = []
+        self._last = self.start
+        self._seen = set(sys.modules)
+
+    def mark(self, name: str) -> Phase:
+        """End the current phase as ``name``."""
+        now = time.perf_counter()
+        loaded = set(sys.modules) - self._seen
+        self._seen.update(loaded)
+        packages = tuple(p for p in NOTABLE_PACKAGES if p in loaded)
+        phase = Phase(name, now - self.start, now - self._last, len(loaded), packages)
+        self.phases.append(phase)
+        self._last = now
+        return phase
+
+    @property
+    def total(self) -> float:
+        """Seconds from start to the last mark."""
+        return self._last - self.start
+
+    def report(self) -> str:
+        """Human-readable breakdown, one line per phase."""
+        lines = ["PyProbe startup profile:"]
+        for phase in self.phases:
+            imported = f"+{phase.modules} modules"
+            if phase.packages:
+                imported += f" ({', '.join(phase.packages)})"
+            lines.append(f"  {phase.name:<24} {phase.seconds * 1000:8.1f} ms  {imported}")
+        lines.append(f"  {'time to first window':<24} {self.total * 1000:8.1f} ms")
+        return "\n".join(lines)
+
+
+_profile: Optional[StartupProfile] = None
+
+
+def enable(start: Optional[float] = None) -> StartupProfile:
+    """Start profiling (``start`` defaults to now)."""
+    global _profile
+    _profile = StartupProfile(start)
+    return _profile
+
+
+def get_profile() -> Optional[StartupProfile]:
+    """The active profile, or None when --startup-profile is off."""
+    return _profile
+
+
+def mark(name: str) -> None:
+    """End the current phase as ``name``; a no-op when profiling is off."""
+    if _profile is not None:
+        _profile.mark(name)
@@ -0,0 +1,69 @@
+#!./.venv/bin/python
+"""
+Benchmark min-max decimation: bulk kernel vs. the old per-chunk loop.
+
+Usage Examples:
+    ./scripts/bench_decimation.py
+    ./scripts/bench_decimation.py --sizes 1e5,1e6 --points 5000
+    ./scripts/bench_decimation.py --sizes 1e8 --dtype float32   # ~400 MB
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from pyprobe.plots.decimation import minmax_decimate  # noqa: E402
+
+
+def loop_decimate(data: np.ndarray, n_points: int) -> tuple:
+    """The per-chunk Python loop that minmax_decimate replaced."""
+    n = len(data)
+    n_chunks = (n_points - 2) // 2
+    edges = np.linspace(0, n, n_chunks + 1, dtype=int)
+    x = np.empty(n_chunks * 2 + 2, dtype=np.int64)
+    y = np.empty(n_chunks * 2 + 2, dtype=data.dtype)
+    x[0], y[0] = 0, data[0]
+    for i in range(n_chunks):
+        chunk = data[edges[i]:edges[i + 1]]
+        lo, hi = sorted([int(np.argmin(chunk)), int(np.argmax(chunk))])
+        x[2 * i + 1], x[2 * i + 2] = edges[i] + lo, edges[i] + hi
+        y[2 * i + 1], y[2 * i + 2] = chunk[lo], chunk[hi]
+    x[-1], y[-1] = n - 1, data[-1]
+    return x, y
+
+
+def best_of(fn, repeat: int) -> float:
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return min(times) * 1000.0
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", default="1e5,1e6,1e7",
+                        help="Comma-separated sample counts")
+    parser.add_argument("--points", type=int, default=5000,
+                        help="Display points per trace")
+    parser.add_argument("--dtype", default="float64")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    print(f"{'samples':>12} {'loop ms':>10} {'bulk ms':>10} {'speedup':>8}")
+    for size in (int(float(s)) for s in args.sizes.split(",")):
+        data = rng.standard_normal(size).astype(args.dtype)
+        loop_ms = best_of(lambda: loop_decimate(data, args.points), args.repeat)
+        bulk_ms = best_of(lambda: minmax_decimate(data, args.points), args.repeat)
+        print(f"{size:>12} {loop_ms:>10.2f} {bulk_ms:>10.2f} {loop_ms / bulk_ms:>7.1f}x")
+        del data
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+import numpy as np
+
+from pyprobe.core.anchor import ProbeAnchor
+from pyprobe.core.broker import CaptureBroker, decode_record, encode_record
+from pyprobe.core.capture_record import CaptureRecord
+from pyprobe.core.recording import PprecRecorder, read_pprec
+
+X = ProbeAnchor(file="/tmp/demo.py", line=3, col=0, symbol="x")
+Y = ProbeAnchor(file="/tmp/demo.py", line=4, col=0, symbol="y")
+
+
+def _record(anchor, value, seq):
+    return CaptureRecord(
+        anchor=anchor, value=value, dtype="float", shape=None,
+        seq_num=seq, timestamp=seq * 1000, logical_order=seq,
+    )
+
+
+def test_subscribers_share_records_and_filter_by_anchor():
+    broker = CaptureBroker()
+    everything, only_y = [], []
+    broker.subscribe(everything.extend)
+    broker.subscribe(only_y.extend, anchors=[Y])
+
+    batch = [_record(X, 1.0, 0), _record(Y, 2.0, 1)]
+    broker.publish(batch, now=0.0)
+
+    assert everything == batch
+    assert only_y == [batch[1]]
+    assert only_y[0] is batch[1]
+
+
+def test_rate_limit_holds_the_newest_record_until_flush():
+    broker = CaptureBroker()
+    received = []
+    sub = broker.subscribe(received.extend, max_rate_hz=10)
+
+    for i in range(5):
+        broker.publish([_record(X, float(i), i)], now=i * 0.03)
+    # 0.0 passes, 0.03-0.09 are within 100 ms, 0.12 passes
+    assert [r.value for r in received] == [0.0, 4.0]
+
+    broker.publish([_record(X, 5.0, 5)], now=0.15)
+    assert [r.value for r in received] == [0.0, 4.0]
+    broker.flush()
+    assert [r.value for r in received] == [0.0, 4.0, 5.0]
+
+    broker.unsubscribe(sub)
+    broker.publish([_record(X, 6.0, 6)], now=1.0)
+    assert len(received) == 3
+
+
+def test_frame_subscribers_get_the_same_encoded_bytes():
+    broker = CaptureBroker()
+    first, second = [], []
+    broker.subscribe_frames(first.append)
+    broker.subscribe_frames(second.append)
+    broker.publish([_record(X, np.arange(4.0), 0)], now=0.0)
+    broker.shutdown()
+
+    assert len(first) == len(second) == 1
+    assert first[0] is second[0]
+    decoded = decode_record(first[0])
+    assert decoded.anchor == X
+    np.testing.assert_array_equal(decoded.value, np.arange(4.0))
+
+
+def test_pprec_roundtrip(tmp_path):
+    path = str(tmp_path / "run.pprec")
+    broker = CaptureBroker()
+    recorder = PprecRecorder(path)
+    broker.subscribe_frames(recorder)
+    broker.publish([_record(X, 1.5, 0), _record(Y, np.ones(3), 1)], now=0.0)
+    broker.publish([_record(X, 2.5, 2)], now=0.1)
+    broker.shutdown()
+    recorder.close()
+
+    records = list(read_pprec(path))
+    assert [r.anchor for r in records] == [X, Y, X]
+    assert [r.seq_num for r in records] == [0, 1, 2]
+    assert records[2].value == 2.5
+    np.testing.assert_array_equal(records[1].value, np.ones(3))
+
+
+def test_truncated_recording_ends_at_last_whole_frame(tmp_path):
+    path = tmp_path / "cut.pprec"
+    frames = encode_record(_record(X, 1.0, 0)) + encode_record(_record(X, 2.0, 1))
+    path.write_bytes(frames[:-3])
+    assert [r.value for r in read_pprec(str(path))] == [1.0]
@@ -1,5 +1,5 @@
 from pyprobe.core.anchor import ProbeAnchor
-from pyprobe.core.capture_manager import CaptureManager
+from pyprobe.core.capture_manager import CaptureManager, current_thread_id
 from pyprobe.core.sequence import SequenceGenerator
 
 
@@ -98,3 +98,48 @@ def test_flush_deferred_on_return_and_exception() -> None:
         resolve_value=resolver,
     )
     assert len(records_exception) == 1
+
+
+def test_deferred_captures_are_kept_per_thread() -> None:
+    import threading
+
+    manager = CaptureManager(seq_gen=SequenceGenerator(), clock=lambda: 333)
+    manager.defer_capture(frame_id=7, anchor=_anchor("x"))
+
+    # Another thread's frame with the same id neither sees nor flushes it
+    seen = {}
+
+    def other() -> None:
+        seen["pending"] = manager.has_pending(7)
+        seen["records"] = manager.flush_deferred(
+            frame_id=7, event="return", resolve_value=lambda a: (1, "scalar", None)
+        )
+        manager.defer_capture(frame_id=7, anchor=_anchor("y"))
+        seen["thread_id"] = current_thread_id()
+
+    worker = threading.Thread(target=other)
+    worker.start()
+    worker.join()
+    assert seen["pending"] is False
+    assert seen["records"] == []
+    assert manager.has_pending(7)
+
+    records = manager.flush_all(lambda a: (2, "scalar", None), thread_id=seen["thread_id"])
+    assert [(r.anchor.symbol, r.thread_id) for r in records] == [("y", seen["thread_id"])]
+    records = manager.flush_all(lambda a: (3, "scalar", None))
+    assert [(r.anchor.symbol, r.thread_id) for r in records] == [("x", current_thread_id())]
+
+
+def test_thread_ids_are_not_reused_after_a_thread_exits() -> None:
+    import threading
+
+    ids = []
+    for _ in range(4):
+        # One at a time, so the OS may hand each the same ident
+        worker = threading.Thread(target=lambda: ids.append(current_thread_id()))
+        worker.start()
+        worker.join()
+
+    assert len(set(ids)) == 4
+    assert current_thread_id() not in ids
+    assert current_thread_id() == current_thread_id()
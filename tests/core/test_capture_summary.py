@@ -0,0 +1,124 @@
+import numpy as np
+import pytest
+
+from pyprobe.core.capture_summary import HistoryQuery, SummaryIndex, summarize_value
+from pyprobe.core.data_classifier import DTYPE_WAVEFORM_COLLECTION, DTYPE_WAVEFORM_REAL
+
+
+def test_summary_of_real_array() -> None:
+    s = summarize_value(np.array([1.0, -3.0, 2.0]))
+    assert (s.min, s.max, s.absmax) == (-3.0, 2.0, 3.0)
+    assert s.mean == pytest.approx(0.0)
+    assert s.energy == pytest.approx(14.0)
+    assert s.rms == pytest.approx(np.sqrt(14.0 / 3))
+    assert s.nans == 0
+    assert s.size == 3
+
+
+def test_summary_ignores_nans_but_counts_them() -> None:
+    s = summarize_value(np.array([1.0, np.nan, 3.0, np.nan]))
+    assert s.nans == 2
+    assert s.size == 4
+    assert s.mean == pytest.approx(2.0)
+
+
+def test_summary_of_complex_uses_magnitude() -> None:
+    s = summarize_value(np.array([3 + 4j, 0j]))
+    assert s.max == pytest.approx(5.0)
+    assert s.energy == pytest.approx(25.0)
+
+
+def test_summary_of_serialized_waveforms() -> None:
+    wf = {'__dtype__': DTYPE_WAVEFORM_REAL, 'samples': np.array([2.0, 4.0]), 'scalars': [0.0, 1.0]}
+    assert summarize_value(wf).mean == pytest.approx(3.0)
+
+    coll = {
+        '__dtype__': DTYPE_WAVEFORM_COLLECTION,
+        'waveforms': [{'samples': np.ones(3)}, {'samples': -np.ones(2)}],
+    }
+    s = summarize_value(coll)
+    assert (s.min, s.max, s.size) == (-1.0, 1.0, 5)
+
+
+def test_summary_hash_tracks_content() -> None:
+    a = np.arange(8.0)
+    assert summarize_value(a).hash == summarize_value(a.copy()).hash
+    assert summarize_value(a).hash != summarize_value(a + 1).hash
+    assert summarize_value(5).size == 1
+    assert np.isnan(summarize_value("text").max)
+
+
+@pytest.fixture
+def index() -> SummaryIndex:
+    idx = SummaryIndex()
+    for i in range(100):
+        value = np.sin(np.linspace(0, 1, 16)) * i / 10
+        if i in (40, 70):
+            value[3] = np.nan
+        idx.append(i, value)
+    return idx
+
+
+def test_index_grows_and_exposes_columns(index) -> None:
+    assert len(index) == 100
+    assert list(index.column('seq')[:3]) == [0, 1, 2]
+    with pytest.raises(ValueError):
+        index.column('max')[0] = 1.0
+    assert index.row(-1).nans == 0
+
+
+def test_query_threshold_on_absmax(index) -> None:
+    hits = index.query("frames where max(abs(x)) > 8")
+    peak = index.column('absmax')
+    assert np.array_equal(hits, np.flatnonzero(peak > 8))
+    assert len(hits) > 0
+
+
+def test_query_first_and_last(index) -> None:
+    assert list(index.query("first frame with NaN")) == [40]
+    assert list(index.query("last frame where nans > 0")) == [70]
+    assert list(index.query("first rms > 100")) == []
+
+
+def test_query_boolean_and_builtins(index) -> None:
+    hits = index.query("frame >= 90 and not nan")
+    assert list(hits) == list(range(90, 100))
+    assert list(index.query("10 <= seq < 12")) == [10, 11]
+    assert len(index.query("changed")) == 100
+
+
+@pytest.mark.parametrize("text, message", [
+    ("", "Empty query"),
+    ("foo > 1", "Name foo is not defined"),
+    ("max(y) > 1", "Unsupported metric"),
+    ("max >", "Invalid query syntax"),
+    ("x.__class__", "Forbidden"),
+])
+def test_query_errors(index, text, message) -> None:
+    with pytest.raises(ValueError, match=message):
+        HistoryQuery.compile(text).run(index)
+
+
+def test_query_over_a_million_frames_is_fast() -> None:
+    import time
+
+    idx = SummaryIndex()
+    summary = summarize_value(np.zeros(4))
+    for i in range(1000):
+        idx.append_summary(i, summary)
+    # Fill a million rows by doubling the columns in place
+    while len(idx) < 1_000_000:
+        idx._grow()
+        n = len(idx)
+        for col in idx._columns.values():
+            col[n:2 * n] = col[:n]
+        idx._count = 2 * n
+    idx._columns['absmax'][123_456] = 5.0
+
+    query = HistoryQuery.compile("max(abs(x)) > 3")
+    start = time.perf_counter()
+    hits = query.run(idx)
+    elapsed = time.perf_counter() - start
+
+    assert list(hits) == [123_456]
+    assert elapsed < 0.25
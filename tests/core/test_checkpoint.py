@@ -0,0 +1,102 @@
+import multiprocessing as mp
+import time
+
+import pytest
+
+from pyprobe.core.anchor import ProbeAnchor
+from pyprobe.core.checkpoint import CheckpointSnapshot
+from pyprobe.core.runner import run_script_subprocess
+from pyprobe.core.zygote import zygote_supported
+from pyprobe.ipc.channels import IPCChannel
+from pyprobe.ipc.messages import (
+    Message, MessageType, make_add_probe_cmd, make_set_checkpoint_cmd
+)
+
+pytestmark = pytest.mark.skipif(not zygote_supported(), reason="checkpoints need os.fork on Linux")
+
+
+@pytest.fixture
+def ipc():
+    channel = IPCChannel(is_gui_side=True)
+    yield channel
+    channel.cleanup()
+
+
+def _receive_run(ipc):
+    """Messages of one run, up to and including DATA_SCRIPT_END."""
+    messages = []
+    deadline = time.monotonic() + 10
+    while time.monotonic() < deadline:
+        msg = ipc.receive_data(timeout=0.1)
+        if msg is None:
+            continue
+        messages.append(msg)
+        if msg.msg_type == MessageType.DATA_SCRIPT_END:
+            break
+    return messages
+
+
+def test_resumed_runs_skip_the_prefix_and_take_new_probes(tmp_path, ipc):
+    log = tmp_path / "log.txt"
+    script = (tmp_path / "target.py").resolve()
+    script.write_text(
+        f"with open({str(log)!r}, 'a') as f: f.write('prefix\\n')\n"
+        "x = 7\n"
+        f"with open({str(log)!r}, 'a') as f: f.write(f'suffix {{x}}\\n')\n"
+    )
+    probe = ProbeAnchor(file=str(script), line=3, col=0, symbol="x")
+
+    process = mp.get_context('fork').Process(
+        target=run_script_subprocess,
+        args=(str(script), ipc.command_queue, ipc.data_queue, []),
+    )
+    process.start()
+    ipc.send_command(make_set_checkpoint_cmd(3))
+    ipc.send_command(Message(msg_type=MessageType.CMD_START))
+    parked = [m.payload for m in _receive_run(ipc) if m.msg_type == MessageType.DATA_CHECKPOINT]
+    process.join(timeout=10)
+    assert process.exitcode == 0
+    assert [p['line'] for p in parked] == [3]
+
+    snapshot = CheckpointSnapshot(str(script), 3, parked[0]['address'], parked[0]['pid'])
+    try:
+        child = snapshot.spawn()
+        ipc.send_command(make_add_probe_cmd(probe))
+        ipc.send_command(Message(msg_type=MessageType.CMD_START))
+        types = [m.msg_type for m in _receive_run(ipc)]
+        assert child.wait(timeout=10) == 0
+        assert MessageType.DATA_PROBE_VALUE_BATCH in types
+        assert MessageType.DATA_CHECKPOINT not in types
+
+        # Probes from an earlier resume do not carry over
+        child = snapshot.spawn()
+        ipc.send_command(Message(msg_type=MessageType.CMD_START))
+        types = [m.msg_type for m in _receive_run(ipc)]
+        assert child.wait(timeout=10) == 0
+        assert MessageType.DATA_PROBE_VALUE_BATCH not in types
+    finally:
+        snapshot.discard()
+
+    assert log.read_text() == "prefix\n" + "suffix 7\n" * 3
+
+
+def test_snapshot_goes_stale_when_the_script_changes(tmp_path, ipc):
+    script = tmp_path / "target.py"
+    script.write_text("x = 1\ny = 2\n")
+    process = mp.get_context('fork').Process(
+        target=run_script_subprocess,
+        args=(str(script), ipc.command_queue, ipc.data_queue, []),
+    )
+    process.start()
+    ipc.send_command(make_set_checkpoint_cmd(2))
+    ipc.send_command(Message(msg_type=MessageType.CMD_START))
+    parked = [m.payload for m in _receive_run(ipc) if m.msg_type == MessageType.DATA_CHECKPOINT]
+    process.join(timeout=10)
+
+    snapshot = CheckpointSnapshot(str(script), 2, parked[0]['address'], parked[0]['pid'])
+    try:
+        assert snapshot.is_alive() and not snapshot.is_stale()
+        script.write_text("x = 1\ny = 3\n")
+        assert snapshot.is_stale()
+    finally:
+        snapshot.discard()
@@ -34,6 +34,13 @@ def test_scipy_signal_functions() -> None:
     result = engine.evaluate("np.abs(tr0)", data)
     assert np.all(result >= 0)
 
+def test_scipy_signal_is_imported_on_first_use() -> None:
+    engine = EquationEngine()
+    data = {"tr0": np.ones(3)}
+
+    result = engine.evaluate("signal.lfilter([1.0], [1.0, -0.5], tr0)", data)
+    assert np.allclose(result, [1.0, 1.5, 1.75])
+
 def test_syntax_error() -> None:
     engine = EquationEngine()
     data = {"tr0": np.array([1])}
@@ -24,3 +24,121 @@ def test_circular_dependency_graceful_failure() -> None:
     
     # At least one will have an error
     assert eq0.error or eq1.error
+
+
+def test_forward_reference_evaluates_in_dependency_order() -> None:
+    manager = EquationManager()
+    eq0 = manager.add_equation("eq1 * 10")
+    eq1 = manager.add_equation("tr0 + 1")
+
+    evaluated = manager.evaluate_all({"tr0": np.array([1, 2])})
+
+    assert evaluated == {"eq0", "eq1"}
+    assert eq0.error is None
+    assert np.array_equal(eq0.result, [20, 30])
+
+
+def test_only_equations_with_changed_inputs_are_reevaluated() -> None:
+    manager = EquationManager()
+    eq0 = manager.add_equation("tr0 * 2")
+    eq1 = manager.add_equation("tr1 + 1")
+    eq2 = manager.add_equation("eq0 + eq1")
+
+    tr0, tr1 = np.array([1.0]), np.array([5.0])
+    assert manager.evaluate_all({"tr0": tr0, "tr1": tr1}) == {"eq0", "eq1", "eq2"}
+
+    # Same objects: nothing to do
+    assert manager.evaluate_all({"tr0": tr0, "tr1": tr1}) == set()
+
+    # New tr0 capture: eq0 and its dependent eq2 only
+    assert manager.evaluate_all({"tr0": np.array([2.0]), "tr1": tr1}) == {"eq0", "eq2"}
+    assert np.array_equal(eq2.result, [10.0])
+    assert np.array_equal(eq1.result, [6.0])
+
+
+def test_expressions_are_compiled_once() -> None:
+    manager = EquationManager()
+    calls = []
+    compile_orig = manager.engine.compile
+    manager.engine.compile = lambda expr: calls.append(expr) or compile_orig(expr)
+
+    eq = manager.add_equation("tr0 * 2")
+    for i in range(5):
+        manager.evaluate_all({"tr0": np.array([i])})
+
+    assert calls == ["tr0 * 2"]
+    assert np.array_equal(eq.result, [8])
+
+
+def test_expression_edit_reevaluates_dependents() -> None:
+    manager = EquationManager()
+    eq0 = manager.add_equation("tr0")
+    eq1 = manager.add_equation("eq0 + 1")
+    data = {"tr0": np.array([1])}
+    manager.evaluate_all(data)
+
+    manager.update_expression("eq0", "tr0 * 100")
+    assert manager.evaluate_all(data) == {"eq0", "eq1"}
+    assert np.array_equal(eq1.result, [101])
+
+
+def test_cycle_reports_error_and_downstream_fails() -> None:
+    manager = EquationManager()
+    eq0 = manager.add_equation("tr0")
+    eq1 = manager.add_equation("eq0 + 1")
+    eq2 = manager.add_equation("eq1 * 2")
+    manager.evaluate_all({"tr0": np.array([1])})
+    assert eq0.result is not None
+
+    manager.update_expression("eq0", "eq1 - 1")
+    manager.evaluate_all({"tr0": np.array([1])})
+
+    assert "Circular dependency" in eq0.error
+    assert "Circular dependency" in eq1.error
+    assert eq2.result is None and eq2.error
+
+
+def test_syntax_error_is_reported_at_compile_time() -> None:
+    manager = EquationManager()
+    eq = manager.add_equation("tr0 + * 2")
+    assert "Invalid expression syntax" in eq.error
+
+    manager.evaluate_all({"tr0": np.array([1])})
+    assert eq.result is None
+    assert "Invalid expression syntax" in eq.error
+
+
+def test_cancelled_job_applies_completed_equations_only() -> None:
+    manager = EquationManager()
+    eq0 = manager.add_equation("tr0 + 1")
+    eq1 = manager.add_equation("eq0 * 2")
+
+    job = manager.plan({"tr0": np.array([1.0])})
+    calls = iter([False, True])
+    result = manager.run_job(job, lambda: next(calls))
+
+    assert result.cancelled
+    assert manager.apply(result) == {"eq0"}
+    assert eq0.eval_ms is not None
+    assert eq1.result is None
+
+    # The remainder runs on the next plan even though tr0 is unchanged
+    job = manager.plan({"tr0": job.data["tr0"]})
+    assert [step.eq_id for step in job.steps] == ["eq1"]
+    manager.apply(manager.run_job(job))
+    assert np.array_equal(eq1.result, [4.0])
+
+
+def test_result_planned_before_edit_is_discarded() -> None:
+    manager = EquationManager()
+    eq0 = manager.add_equation("tr0 + 1")
+    data = {"tr0": np.array([1])}
+
+    job = manager.plan(data)
+    result = manager.run_job(job)
+    manager.update_expression("eq0", "tr0 + 100")
+
+    assert manager.apply(result) == set()
+    assert eq0.result is None
+    assert manager.evaluate_all(data) == {"eq0"}
+    assert np.array_equal(eq0.result, [101])
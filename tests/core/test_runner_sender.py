@@ -0,0 +1,75 @@
+import time
+from collections import defaultdict
+
+from pyprobe.core.anchor import ProbeAnchor
+from pyprobe.core.runner import ScriptRunner, _MAX_THREAD_BUFFERED
+from pyprobe.ipc.messages import Message, MessageType, make_add_probe_cmd
+
+
+class _FakeIPC:
+    """Records what the runner sends and hands it queued commands."""
+
+    def __init__(self, commands):
+        self.commands = list(commands)
+        self.sent = []
+
+    def send_data(self, msg, timeout=0.1):
+        self.sent.append(msg)
+        return True
+
+    def receive_command(self, timeout=0.1):
+        if self.commands:
+            return self.commands.pop(0)
+        time.sleep(timeout)
+        return None
+
+
+def test_threaded_captures_arrive_in_order_before_the_exception_and_end(tmp_path):
+    # Enough captures per thread that each also flushes its own buffer
+    count = _MAX_THREAD_BUFFERED + 50
+    source = "\n".join(
+        [
+            "import threading",
+            "",
+            "def worker(k, out):",
+            f"    for i in range({count}):",
+            "        y = k * 10000 + i",
+            "        out.append(y)",
+            "",
+            "out = []",
+            "threads = [threading.Thread(target=worker, args=(k, out)) for k in range(4)]",
+            "for t in threads:",
+            "    t.start()",
+            "for t in threads:",
+            "    t.join()",
+            "raise RuntimeError('boom')",
+        ]
+    )
+    script = (tmp_path / "threaded.py").resolve()
+    script.write_text(source)
+    anchor = ProbeAnchor(
+        file=str(script), line=6, col=0, symbol="y", func="worker", is_assignment=False,
+    )
+    ipc = _FakeIPC([make_add_probe_cmd(anchor), Message(msg_type=MessageType.CMD_START)])
+
+    assert ScriptRunner(str(script), ipc).run() == 1
+
+    types = [m.msg_type for m in ipc.sent]
+    assert types[0] == MessageType.DATA_SCRIPT_START
+    assert types[-1] == MessageType.DATA_SCRIPT_END
+    exception_at = types.index(MessageType.DATA_EXCEPTION)
+    batches = [i for i, t in enumerate(types) if t == MessageType.DATA_PROBE_VALUE_BATCH]
+    assert batches and max(batches) < exception_at
+
+    probes = [p for i in batches for p in ipc.sent[i].payload['probes']]
+    assert sorted(p['seq_num'] for p in probes) == list(range(4 * count))
+    assert sorted(p['value'] for p in probes) == sorted(
+        k * 10000 + i for k in range(4) for i in range(count)
+    )
+    # Merged across threads, each thread's captures keep their order
+    seqs_by_thread = defaultdict(list)
+    for probe in probes:
+        seqs_by_thread[probe['thread_id']].append(probe['seq_num'])
+    assert len(seqs_by_thread) == 4
+    for seqs in seqs_by_thread.values():
+        assert seqs == sorted(seqs)
@@ -0,0 +1,78 @@
+import multiprocessing as mp
+import time
+
+import pytest
+
+from pyprobe.core.anchor import ProbeAnchor
+from pyprobe.core.capture_record import CaptureRecord
+from pyprobe.core.runner import run_script_subprocess
+from pyprobe.core.sweep import (
+    SweepPoint, build_grid, compile_with_constants, parse_constant_axis
+)
+from pyprobe.ipc.channels import IPCChannel
+from pyprobe.ipc.messages import Message, MessageType, make_add_probe_cmd
+
+
+def test_parse_constant_axis_literals_and_strings():
+    assert parse_constant_axis("SNR_DB=0, 3.5, -6") == ("SNR_DB", [0, 3.5, -6])
+    assert parse_constant_axis("MOD=qpsk,16qam") == ("MOD", ["qpsk", "16qam"])
+    assert parse_constant_axis("N=4") == ("N", [4])
+    with pytest.raises(ValueError):
+        parse_constant_axis("SNR_DB")
+    with pytest.raises(ValueError):
+        parse_constant_axis("N=")
+
+
+def test_build_grid_is_the_product_of_all_axes():
+    points = build_grid(["A=1,2", "B='x','y'"], ["--fast", "--slow -v"])
+    assert len(points) == 8
+    assert points[0] == SweepPoint((("A", 1), ("B", "x")), ("--fast",))
+    assert points[-1] == SweepPoint((("A", 2), ("B", "y")), ("--slow", "-v"))
+    assert points[1].label == "A=1, B='x', --slow -v"
+    assert build_grid() == []
+
+
+def test_compile_with_constants_keeps_line_numbers():
+    source = "import sys\nN = 4\nGAIN: float = 1.0\ny = N * GAIN\nline = sys._getframe().f_lineno\n"
+    namespace = {}
+    exec(compile_with_constants(source, "<sweep>", {"N": 8, "GAIN": 0.5}), namespace)
+    assert namespace["y"] == 4.0
+    assert namespace["line"] == 5
+
+    with pytest.raises(ValueError, match="MISSING"):
+        compile_with_constants(source, "<sweep>", {"MISSING": 1})
+
+
+def test_runs_capture_the_overridden_constant(tmp_path):
+    script = (tmp_path / "target.py").resolve()
+    script.write_text("import sys\nSCALE = 1\ny = SCALE * len(sys.argv)\n")
+    probe = ProbeAnchor(file=str(script), line=3, col=0, symbol="y", is_assignment=True)
+
+    ipc = IPCChannel(is_gui_side=True)
+    try:
+        process = mp.Process(
+            target=run_script_subprocess,
+            args=(str(script), ipc.command_queue, ipc.data_queue, []),
+            kwargs={'script_args': ['a', 'b'], 'constants': {'SCALE': 10}},
+        )
+        process.start()
+        ipc.send_command(make_add_probe_cmd(probe))
+        ipc.send_command(Message(msg_type=MessageType.CMD_START))
+
+        values = []
+        deadline = time.monotonic() + 10
+        while time.monotonic() < deadline:
+            msg = ipc.receive_data(timeout=0.1)
+            if msg is None:
+                continue
+            if msg.msg_type == MessageType.DATA_PROBE_VALUE_BATCH:
+                values += [CaptureRecord.from_dict(p).value for p in msg.payload['probes']]
+            elif msg.msg_type == MessageType.DATA_PROBE_VALUE:
+                values.append(CaptureRecord.from_dict(msg.payload).value)
+            elif msg.msg_type == MessageType.DATA_SCRIPT_END:
+                break
+        process.join(timeout=10)
+        assert process.exitcode == 0
+        assert values == [30]
+    finally:
+        ipc.cleanup()
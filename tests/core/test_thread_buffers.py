@@ -0,0 +1,36 @@
+import threading
+
+from pyprobe.core.thread_buffers import ThreadBuffers
+
+
+def test_drain_merges_threads_in_sequence_order() -> None:
+    buffers = ThreadBuffers()
+    barrier = threading.Barrier(3)
+
+    def producer(seqs) -> None:
+        barrier.wait()
+        for seq in seqs:
+            buffers.append(seq, f"m{seq}")
+
+    threads = [
+        threading.Thread(target=producer, args=(range(start, 30, 3),))
+        for start in range(3)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert buffers.wait(timeout=0)
+    assert buffers.drain() == [f"m{seq}" for seq in range(30)]
+    assert buffers.drain() == []
+    # Buffers of finished threads are dropped once drained
+    assert buffers._buffers == []
+
+
+def test_append_reports_the_calling_threads_backlog() -> None:
+    buffers = ThreadBuffers()
+    assert buffers.append(0, "a") == 1
+    assert buffers.append(1, "b") == 2
+    assert buffers.drain() == ["a", "b"]
+    assert buffers.append(2, "c") == 1
@@ -74,3 +74,52 @@ def test_tracer_emits_capture_records_for_rhs_and_lhs(tmp_path) -> None:
     assert records[1].seq_num == 1
     assert records[0].logical_order == 0
     assert records[1].logical_order == 0
+
+
+def test_tracer_captures_in_worker_threads(tmp_path) -> None:
+    source = "\n".join(
+        [
+            "import threading",
+            "",
+            "def worker(n, out):",
+            "    y = n * 10",
+            "    barrier.wait()",
+            "    out.append(y)",
+            "",
+            "barrier = threading.Barrier(4)",
+            "out = []",
+            "threads = [threading.Thread(target=worker, args=(n, out)) for n in range(4)]",
+            "for t in threads:",
+            "    t.start()",
+            "for t in threads:",
+            "    t.join()",
+        ]
+    )
+    path = tmp_path / "threaded.py"
+    path.write_text(source)
+    line = _line_number(source.splitlines(), "out.append(y)")
+    anchor = ProbeAnchor(
+        file=str(path), line=line, col=0, symbol="y", func="worker", is_assignment=False,
+    )
+
+    records = []
+    tracer = VariableTracer(
+        data_callback=lambda _: None,
+        target_files={str(path)},
+        capture_record_batch_callback=records.extend,
+    )
+    tracer.add_anchor_watch(anchor)
+
+    tracer.start_anchored()
+    try:
+        exec(compile(source, str(path), "exec"), {})
+        # Finished threads leave no frame (or locals) behind
+        worker_ids = {r.thread_id for r in records}
+        assert not worker_ids & set(tracer._last_frames)
+    finally:
+        tracer.stop()
+
+    assert sorted(r.value for r in records) == [0, 10, 20, 30]
+    # Each thread is tagged with its own id
+    assert len({r.thread_id for r in records}) == 4
+    assert len({r.seq_num for r in records}) == 4
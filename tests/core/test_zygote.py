@@ -0,0 +1,91 @@
+import time
+
+import pytest
+
+from pyprobe.core.zygote import TracerZygote, script_imports, zygote_supported
+from pyprobe.ipc.channels import IPCChannel
+from pyprobe.ipc.messages import Message, MessageType
+
+pytestmark = pytest.mark.skipif(not zygote_supported(), reason="zygote needs os.fork on Linux")
+
+
+@pytest.fixture
+def ipc():
+    channel = IPCChannel(is_gui_side=True)
+    yield channel
+    channel.cleanup()
+
+
+def _run_once(zygote, ipc):
+    """Fork a run, start it, and return (exit code, message types seen)."""
+    assert zygote.wait_ready(timeout=10)
+    child = zygote.spawn()
+    ipc.send_command(Message(msg_type=MessageType.CMD_START))
+    seen = []
+    deadline = time.monotonic() + 10
+    while MessageType.DATA_SCRIPT_END not in seen and time.monotonic() < deadline:
+        msg = ipc.receive_data(timeout=0.1)
+        if msg is not None:
+            seen.append(msg.msg_type)
+    return child.wait(timeout=10), seen
+
+
+def test_runs_are_forked_from_one_zygote_and_see_script_edits(tmp_path, ipc):
+    script = tmp_path / "target.py"
+    script.write_text("import json\nx = 1\nraise SystemExit(3)\n")
+    zygote = TracerZygote(str(script), ipc.command_queue, ipc.data_queue)
+    try:
+        code, seen = _run_once(zygote, ipc)
+        assert code == 3
+        assert MessageType.DATA_SCRIPT_START in seen and MessageType.DATA_SCRIPT_END in seen
+
+        script.write_text("import json\nx = 1\nraise SystemExit(42)\n")
+        code, _ = _run_once(zygote, ipc)
+        assert code == 42
+        assert zygote.is_alive()
+    finally:
+        zygote.shutdown()
+    assert not zygote.is_alive()
+
+
+def test_running_child_can_be_terminated(tmp_path, ipc):
+    script = tmp_path / "target.py"
+    script.write_text("import time\nwhile True:\n    time.sleep(0.01)\n")
+    zygote = TracerZygote(str(script), ipc.command_queue, ipc.data_queue)
+    try:
+        assert zygote.wait_ready(timeout=10)
+        child = zygote.spawn()
+        ipc.send_command(Message(msg_type=MessageType.CMD_START))
+        assert child.poll() is None
+        child.terminate()
+        assert child.wait(timeout=5) != 0
+    finally:
+        zygote.shutdown()
+
+
+def test_only_external_imports_are_preloaded(tmp_path):
+    (tmp_path / "helper.py").write_text("")
+    script = tmp_path / "target.py"
+    script.write_text(
+        "import json, helper\n"
+        "from numpy.fft import fft\n"
+        "from . import sibling\n"
+        "import no_such_module_anywhere\n"
+    )
+    assert script_imports(str(script)) == ["json", "numpy"]
+
+
+def test_spawn_does_not_wait_for_a_preloading_zygote(tmp_path, ipc):
+    script = tmp_path / "target.py"
+    script.write_text("x = 1\n")
+    zygote = TracerZygote(str(script), ipc.command_queue, ipc.data_queue)
+    try:
+        # Just started: still importing the runner in the forkserver
+        assert not zygote.ready
+        started = time.monotonic()
+        with pytest.raises(RuntimeError, match="preloading"):
+            zygote.spawn()
+        assert time.monotonic() - started < 1.0
+        assert zygote.wait_ready(timeout=10)
+    finally:
+        zygote.shutdown()
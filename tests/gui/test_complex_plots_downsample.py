@@ -78,10 +78,10 @@ class TestComplexRIXAxis:
         N = 16000
         data = np.exp(1j * np.linspace(0, 10 * np.pi, N))
         ri.update_data(data)
-        pd = _zoom_and_extract(ri, qapp, 7000, 8000)
+        pd = _zoom_and_extract(ri, qapp, 7000, 7300)
         y_real = np.array(pd[0]['y'])
-        assert len(y_real) >= 900, f"Expected ~1000 raw points, got {len(y_real)}"
-        assert len(y_real) <= 1100, f"Expected ~1000 raw points, got {len(y_real)}"
+        assert len(y_real) >= 290, f"Expected ~300 raw points, got {len(y_real)}"
+        assert len(y_real) <= 310, f"Expected ~300 raw points, got {len(y_real)}"
 
     def test_zoom_out_redownsamples(self, ri, qapp):
         N = 16000
@@ -122,10 +122,10 @@ class TestComplexMAXAxis:
         N = 16000
         data = np.exp(1j * np.linspace(0, 10 * np.pi, N))
         ma.update_data(data)
-        pd = _zoom_and_extract(ma, qapp, 7000, 8000)
+        pd = _zoom_and_extract(ma, qapp, 7000, 7300)
         y_mag = np.array(pd[0]['y'])
-        assert len(y_mag) >= 900
-        assert len(y_mag) <= 1100
+        assert len(y_mag) >= 290
+        assert len(y_mag) <= 310
 
 
 # ── SingleCurveWidget ────────────────────────────────────────
@@ -157,19 +157,33 @@ class TestSingleCurveXAxis:
         N = 16000
         data = np.sin(np.linspace(0, 10 * np.pi, N))
         single.set_data(data, f"[{N}]")
-        pd = _zoom_and_extract(single, qapp, 7000, 8000)
+        pd = _zoom_and_extract(single, qapp, 7000, 7300)
         y = np.array(pd[0]['y'])
-        assert len(y) >= 900
-        assert len(y) <= 1100
+        assert len(y) >= 290
+        assert len(y) <= 310
 
     def test_zoom_in_data_matches_original(self, single, qapp):
         N = 16000
         data = np.sin(np.linspace(0, 10 * np.pi, N))
         single.set_data(data, f"[{N}]")
-        pd = _zoom_and_extract(single, qapp, 7000, 8000)
+        pd = _zoom_and_extract(single, qapp, 7000, 7300)
         x = np.array(pd[0]['x'])
         y = np.array(pd[0]['y'])
         # Verify raw data matches original
         i_min = int(x[0])
         i_max = int(x[-1]) + 1
         np.testing.assert_allclose(y, data[i_min:i_max], atol=1e-10)
+
+    def test_zoom_uses_pixel_columns_of_non_uniform_x(self, single, qapp):
+        N = 200000
+        t = np.cumsum(np.linspace(0.5, 1.5, N))
+        data = np.random.default_rng(0).standard_normal(N)
+        data[120000] = 50.0
+        single._t_vector = t
+        single.set_data(data, f"[{N}]")
+        pd = _zoom_and_extract(single, qapp, t[100000], t[150000])
+        x = np.array(pd[0]['x'])
+        y = np.array(pd[0]['y'])
+        assert len(y) <= 2 * single._view_pixel_width() + 2
+        assert x[0] >= t[100000] and x[-1] <= t[150000]
+        assert 50.0 in y
@@ -2,7 +2,8 @@
 Tests for the downsampling pipeline in WaveformWidget.
 
 Level 1: X-axis correctness after min-max decimation.
-Level 2: Zoom-responsive re-rendering (raw data at high zoom).
+Level 2: Zoom-responsive re-rendering (raw data at high zoom, pyramids for
+         repeated renders of long traces).
 """
 
 import numpy as np
@@ -101,23 +102,23 @@ class TestZoomResponsiveDownsampling:
         return waveform.get_plot_data()
 
     def test_zoom_in_shows_raw_data(self, waveform, qapp):
-        """Zooming in to < MAX_DISPLAY_POINTS samples shows raw (undownsampled) data."""
+        """Zooming in to fewer samples than pixel columns shows raw (undownsampled) data."""
         N = 16000
         data = np.sin(np.linspace(0, 10 * np.pi, N))
         waveform.update_data(data, DTYPE_ARRAY_1D)
 
-        # Zoom into a 1000-sample window (< 5000 threshold)
-        plot_data = self._zoom_and_extract(waveform, qapp, 7000, 8000)
+        # Zoom into a 300-sample window (narrower than the plot in pixels)
+        plot_data = self._zoom_and_extract(waveform, qapp, 7000, 7300)
         x = np.array(plot_data[0]['x'])
         y = np.array(plot_data[0]['y'])
 
-        # Should show ~1000 raw samples, not downsampled
-        assert len(y) >= 900, f"Expected ~1000 raw points, got {len(y)}"
-        assert len(y) <= 1100, f"Expected ~1000 raw points, got {len(y)}"
+        # Should show all ~300 raw samples, not downsampled
+        assert len(y) >= 290, f"Expected ~300 raw points, got {len(y)}"
+        assert len(y) <= 310, f"Expected ~300 raw points, got {len(y)}"
 
-        # x-range should be within [7000, 8000]
+        # x-range should be within [7000, 7300]
         assert x[0] >= 6999, f"x starts at {x[0]}, expected >= 7000"
-        assert x[-1] <= 8001, f"x ends at {x[-1]}, expected <= 8000"
+        assert x[-1] <= 7301, f"x ends at {x[-1]}, expected <= 7300"
 
         # Y values should match the original data exactly (full resolution)
         i_min = int(x[0])
@@ -159,3 +160,26 @@ class TestZoomResponsiveDownsampling:
         # x-range should be within the zoomed region
         assert x[0] >= 1999, f"x starts at {x[0]}, expected >= 2000"
         assert x[-1] <= 8001, f"x ends at {x[-1]}, expected <= 8000"
+
+    def test_repeated_zoom_uses_pyramid(self, waveform, qapp):
+        """Re-rendering the same long trace goes through its min/max pyramid."""
+        N = 1 << 19
+        data = np.random.default_rng(0).standard_normal(N)
+        data[300000] = 100.0
+        waveform.update_data(data, DTYPE_ARRAY_1D)
+        curve = waveform._curves[0]
+
+        self._zoom_and_extract(waveform, qapp, 100000, 400000)
+        plot_data = self._zoom_and_extract(waveform, qapp, 200000, 350000)
+        pyramid = waveform._lod.pyramid(curve)
+        assert pyramid is not None and pyramid.built_from(data)
+
+        x = np.array(plot_data[0]['x'])
+        y = np.array(plot_data[0]['y'])
+        assert x[0] >= 200000 and x[-1] <= 350000
+        assert 100.0 in y
+        assert len(y) <= 2 * waveform._view_pixel_width() + 4
+
+        # New data drops the stale pyramid
+        waveform.update_data(data.copy(), DTYPE_ARRAY_1D)
+        assert waveform._lod.pyramid(curve) is None
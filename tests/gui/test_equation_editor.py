@@ -43,3 +43,21 @@ def test_delete_equation(qapp):
     assert "eq0" not in manager.equations
     assert "eq1" in manager.equations
     dialog.close()
+
+def test_status_shows_evaluation_time(qapp):
+    manager = EquationManager()
+    dialog = EquationEditorDialog(manager)
+    dialog.add_btn.click()
+    dialog.add_btn.click()
+    manager.update_expression("eq0", "tr0 * 2")
+    manager.update_expression("eq1", "nope + 1")
+
+    manager.evaluate_all({"tr0": 1.0})
+    dialog.refresh_status()
+
+    label = dialog.table.cellWidget(0, 2).layout().itemAt(1).widget()
+    assert label.text().endswith(" ms")
+    error_label = dialog.table.cellWidget(1, 2).layout().itemAt(1).widget()
+    assert error_label.text() == "!"
+    assert "nope" in error_label.toolTip()
+    dialog.close()
@@ -87,3 +87,31 @@ def test_equation_plot_deduplication(main_window, qtbot):
     # Click again
     main_window._on_equation_plot_requested(eq_id)
     assert len(main_window._equation_to_panels[eq_id]) == 1
+
+
+def test_equation_worker_posts_results_to_plots(main_window, qtbot):
+    eq = main_window._equation_manager.add_equation("tr0 + 1")
+    main_window._on_equation_plot_requested(eq.id)
+    panel = main_window._equation_to_panels[eq.id][0]
+
+    main_window._latest_trace_data["tr0"] = np.array([1, 2, 3])
+    with qtbot.waitSignal(main_window._equation_worker.results_ready, timeout=2000) as blocker:
+        main_window._evaluate_equations()
+
+    assert blocker.args == [{eq.id}]
+    plot_data = panel.get_plot_data()
+    y = plot_data[0]['y'] if isinstance(plot_data, list) else plot_data['y']
+    assert np.array_equal(y, [2, 3, 4])
+
+
+def test_equation_worker_coalesces_superseded_data(main_window, qtbot):
+    manager = main_window._equation_manager
+    worker = main_window._equation_worker
+    eq = manager.add_equation("tr0 * 10")
+
+    for i in range(5):
+        main_window._latest_trace_data["tr0"] = np.array([i])
+        main_window._evaluate_equations()
+
+    qtbot.waitUntil(lambda: not worker.is_busy and eq.result is not None
+                    and eq.result[0] == 40, timeout=2000)
@@ -8,6 +8,7 @@ pytestmark = pytest.mark.skipif("GITHUB_ACTIONS" in os.environ, reason="Requires
 
 from pyprobe.gui.main_window import MainWindow
 from pyprobe.core.anchor import ProbeAnchor
+from pyprobe.core.capture_record import CaptureRecord
 from pyprobe.core.data_classifier import DTYPE_ARRAY_1D, DTYPE_ARRAY_COMPLEX
 
 @pytest.fixture
@@ -40,16 +41,17 @@ def test_fft_overlay_legend_e2e(win, qapp):
     qapp.processEvents()
     
     # 2. Feed data
-    win._on_probe_value({
+    win._ingest.ingest([CaptureRecord.from_dict({
         'anchor': anchor_main.to_dict(),
         'value': np.random.randn(100) + 1j*np.random.randn(100),
         'dtype': DTYPE_ARRAY_COMPLEX
-    })
-    win._on_probe_value({
+    })])
+    win._ingest.ingest([CaptureRecord.from_dict({
         'anchor': anchor_ov.to_dict(),
         'value': np.random.randn(100),
         'dtype': DTYPE_ARRAY_1D
-    })
+    })])
+    win._force_redraw()
     qapp.processEvents()
     
     # Verify panels created
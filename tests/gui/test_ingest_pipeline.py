@@ -0,0 +1,85 @@
+from pyprobe.core.anchor import ProbeAnchor
+from pyprobe.core.capture_record import CaptureRecord
+from pyprobe.gui.ingest import IngestPipeline
+from pyprobe.gui.redraw_throttler import RedrawThrottler
+
+
+def _anchor(symbol: str) -> ProbeAnchor:
+    return ProbeAnchor(file="/tmp/example.py", line=1, col=0, symbol=symbol)
+
+
+def _record(symbol: str, seq: int) -> CaptureRecord:
+    return CaptureRecord(
+        anchor=_anchor(symbol),
+        value=seq,
+        dtype="scalar",
+        shape=None,
+        seq_num=seq,
+        timestamp=seq,
+        logical_order=0,
+    )
+
+
+def test_subscribers_see_latest_record_per_anchor(qapp) -> None:
+    throttler = RedrawThrottler(min_interval_ms=0)
+    pipeline = IngestPipeline(throttler)
+    seen = []
+    pipeline.subscribe(seen.append)
+
+    pipeline.ingest([_record("x", 0), _record("y", 1), _record("x", 2)])
+
+    assert len(seen) == 1
+    assert {a.symbol: r.value for a, r in seen[0].items()} == {"x": 2, "y": 1}
+    # Every record is still buffered
+    assert throttler.buffer_for(_anchor("x")).count == 2
+
+
+def test_batches_coalesce_into_one_repaint(qtbot) -> None:
+    current = [0.0]
+    throttler = RedrawThrottler(min_interval_ms=20.0, clock=lambda: current[0])
+    pipeline = IngestPipeline(throttler)
+    repaints = []
+    pipeline.repaint.connect(lambda: repaints.append(throttler.get_dirty_buffers()))
+
+    current[0] = 1.0
+    for seq in range(5):
+        pipeline.ingest([_record("x", seq)])
+    assert pipeline.repaint_pending
+
+    qtbot.waitUntil(lambda: len(repaints) > 0, timeout=1000)
+    qtbot.wait(30)
+    assert len(repaints) == 1
+    assert list(repaints[0]) == [_anchor("x")]
+    assert not pipeline.repaint_pending
+
+
+def test_empty_batch_does_not_schedule_repaint(qapp) -> None:
+    pipeline = IngestPipeline(RedrawThrottler())
+    pipeline.ingest([])
+    assert not pipeline.repaint_pending
+
+
+def test_probes_left_out_of_a_frame_are_repainted_next(qtbot) -> None:
+    throttler = RedrawThrottler(min_interval_ms=1.0, frame_budget_ms=1.0, max_share=1.0)
+    for symbol in ("x", "y"):
+        throttler.record_render(_anchor(symbol), 5.0)
+    pipeline = IngestPipeline(throttler)
+    frames = []
+    pipeline.repaint.connect(lambda: frames.append(list(throttler.take_due_buffers())))
+
+    pipeline.ingest([_record("x", 0), _record("y", 1)])
+    qtbot.waitUntil(lambda: len(frames) >= 2, timeout=1000)
+    assert [len(frame) for frame in frames[:2]] == [1, 1]
+    assert not throttler.has_dirty
+
+
+def test_flush_repaints_everything_despite_the_budget(qapp) -> None:
+    throttler = RedrawThrottler(frame_budget_ms=1.0)
+    for symbol in ("x", "y"):
+        throttler.record_render(_anchor(symbol), 50.0)
+    pipeline = IngestPipeline(throttler)
+    frames = []
+    pipeline.repaint.connect(lambda: frames.append(throttler.take_due_buffers()))
+    pipeline.ingest([_record("x", 0), _record("y", 1)])
+    pipeline.flush()
+    assert len(frames[0]) == 2
@@ -0,0 +1,44 @@
+import pytest
+
+from pyprobe.core.anchor import ProbeAnchor
+from pyprobe.core.capture_record import CaptureRecord
+from pyprobe.gui.main_window import MainWindow
+
+
+@pytest.fixture
+def main_window(qtbot):
+    mw = MainWindow()
+    qtbot.addWidget(mw)
+    mw.show()
+    return mw
+
+
+def _record(anchor: ProbeAnchor, seq: int) -> CaptureRecord:
+    return CaptureRecord(
+        anchor=anchor,
+        value=seq,
+        dtype="scalar",
+        shape=None,
+        seq_num=seq,
+        timestamp=seq,
+        logical_order=0,
+    )
+
+
+def test_overlay_data_is_forwarded_once_per_redraw(main_window, monkeypatch):
+    anchor = ProbeAnchor(file="/tmp/example.py", line=3, col=0, symbol="ov")
+    forwarded = []
+    monkeypatch.setattr(
+        main_window._probe_controller, "forward_overlay_data",
+        lambda a, payload: forwarded.append((a, payload['value'])),
+    )
+
+    for seq in range(3):
+        main_window._ingest.ingest([_record(anchor, seq)])
+    assert forwarded == []
+
+    main_window._force_redraw()
+    assert forwarded == [(anchor, 2)]
+
+    main_window._force_redraw()
+    assert forwarded == [(anchor, 2)]
@@ -0,0 +1,121 @@
+"""ProbeController overlay routing index: add/remove/close keep routes in sync."""
+
+import numpy as np
+import pytest
+
+from pyprobe.core.anchor import ProbeAnchor
+from pyprobe.core.data_classifier import DTYPE_ARRAY_1D
+from pyprobe.gui.panel_container import ProbePanelContainer
+from pyprobe.gui.probe_controller import ProbeController
+from pyprobe.gui.probe_registry import ProbeRegistry
+
+
+class MockCodeViewer:
+    def set_probe_active(self, anchor, color): pass
+    def remove_probe(self, anchor): pass
+    def update_probe_color(self, anchor, color): pass
+
+
+class MockGutter:
+    def set_probed_line(self, line, color): pass
+    def clear_probed_line(self, line): pass
+
+
+@pytest.fixture
+def controller(qtbot):
+    container = ProbePanelContainer()
+    qtbot.addWidget(container)
+    return ProbeController(
+        registry=ProbeRegistry(),
+        container=container,
+        code_viewer=MockCodeViewer(),
+        gutter=MockGutter(),
+        get_ipc=lambda: None,
+        get_is_running=lambda: False,
+    )
+
+
+def _anchor(symbol: str, line: int) -> ProbeAnchor:
+    return ProbeAnchor(file="test.py", line=line, col=4, symbol=symbol)
+
+
+def test_routes_follow_overlay_add_and_remove(controller):
+    main, ov = _anchor("main", 10), _anchor("ov", 20)
+    panel = controller.add_probe(main)
+    panel.update_data(np.arange(8.0), DTYPE_ARRAY_1D)
+
+    controller.handle_overlay_requested(panel, ov)
+    targets = controller._overlay_targets(ov)
+    assert [p for p, _ in targets] == [panel]
+    assert controller.is_used_as_overlay(ov)
+
+    controller.forward_overlay_data(ov, {'value': np.ones(8), 'dtype': DTYPE_ARRAY_1D})
+    assert any(k.endswith("_ov_rhs") for k in panel._plot._overlay_curves)
+
+    controller.remove_overlay(panel, ov)
+    assert controller._overlay_targets(ov) == []
+    assert not controller.is_used_as_overlay(ov)
+    assert controller._overlay_routes == {}
+
+
+def test_unrelated_data_touches_no_targets(controller):
+    main, ov = _anchor("main", 10), _anchor("ov", 20)
+    panel = controller.add_probe(main)
+    controller.handle_overlay_requested(panel, ov)
+
+    # Same symbol on another line is a different signal
+    assert controller._overlay_targets(_anchor("ov", 21)) == []
+    assert controller._overlay_targets(_anchor("main", 10)) == []
+
+
+def test_pending_overlay_is_flushed_once_plot_supports_it(controller):
+    main, ov = _anchor("main", 10), _anchor("ov", 20)
+    panel = controller.add_probe(main)
+    controller.handle_overlay_requested(panel, ov)
+
+    # Primary dtype still unknown: overlay data is buffered
+    controller.forward_overlay_data(ov, {'value': np.ones(8), 'dtype': DTYPE_ARRAY_1D})
+    if id(panel) in controller._pending_overlays:
+        panel.update_data(np.arange(8.0), DTYPE_ARRAY_1D)
+        controller.flush_pending_overlays()
+    assert controller._pending_overlays == {}
+    assert any(k.endswith("_ov_rhs") for k in panel._plot._overlay_curves)
+
+
+def test_closing_panel_drops_its_routes(controller):
+    main, ov = _anchor("main", 10), _anchor("ov", 20)
+    panel_a = controller.add_probe(main)
+    panel_b = controller.add_probe(_anchor("other", 30))
+    controller.handle_overlay_requested(panel_a, ov)
+    controller.handle_overlay_requested(panel_b, ov)
+    assert len(controller._overlay_targets(ov)) == 2
+
+    controller.handle_panel_closing(panel_a)
+    assert [p for p, _ in controller._overlay_targets(ov)] == [panel_b]
+    assert controller.is_used_as_overlay(ov)
+
+
+def test_dormant_panel_keeps_colour_and_overlay_changes(controller):
+    from PyQt6.QtGui import QColor
+
+    main, ov = _anchor("main", 10), _anchor("ov", 20)
+    panel = controller.add_probe(main)
+    panel.update_data(np.arange(8.0), DTYPE_ARRAY_1D)
+    controller.handle_overlay_requested(panel, ov)
+    controller.forward_overlay_data(ov, {'value': np.ones(8), 'dtype': DTYPE_ARRAY_1D})
+    widget = panel._plot
+    assert ov in widget._overlay_curves_by_anchor
+
+    # Scrolled out of view: the widget idles in the pool
+    panel.set_live(False)
+    assert panel._plot is None
+    red = QColor("#ff0000")
+    controller._on_probe_color_changed(main, red)
+    controller.remove_overlay(panel, ov)
+
+    # Scrolled back in: the reclaimed widget shows both changes
+    panel.set_live(True)
+    assert panel._plot is widget
+    assert widget._color == red
+    assert ov not in widget._overlay_curves_by_anchor
+    assert not any(k.endswith("_ov_rhs") for k in widget._overlay_curves)
@@ -0,0 +1,149 @@
+"""Panel virtualization: dormant panels release their plot widgets to a pool."""
+
+import numpy as np
+import pytest
+from PyQt6.QtGui import QColor
+
+from pyprobe.core.anchor import ProbeAnchor
+from pyprobe.core.capture_record import CaptureRecord
+from pyprobe.core.data_classifier import DTYPE_ARRAY_1D, DTYPE_SCALAR
+from pyprobe.gui.panel_container import ProbePanelContainer
+from pyprobe.gui.probe_buffer import ProbeDataBuffer
+from pyprobe.gui.widget_pool import PlotWidgetPool
+from pyprobe.plugins import PluginRegistry
+
+
+def _make_anchor(symbol, line=1):
+    return ProbeAnchor(file="/tmp/test.py", line=line, col=0, symbol=symbol)
+
+
+def _buffer(anchor, values, dtype=DTYPE_ARRAY_1D):
+    buffer = ProbeDataBuffer(anchor=anchor)
+    for i, value in enumerate(values):
+        shape = getattr(value, 'shape', None)
+        buffer.append(CaptureRecord(anchor=anchor, value=value, dtype=dtype, shape=shape,
+                                    seq_num=i, timestamp=i, logical_order=i))
+    return buffer
+
+
+def _settle(qapp):
+    for _ in range(3):
+        qapp.processEvents()
+
+
+@pytest.fixture
+def container(qapp):
+    c = ProbePanelContainer()
+    c.resize(800, 600)
+    c.show()
+    qapp.processEvents()
+    yield c
+    for panel in list(c.get_all_panels()):
+        c.remove_panel(panel=panel)
+    qapp.processEvents()
+    c.hide()
+    c.deleteLater()
+    qapp.processEvents()
+
+
+def _fill(container, qapp, count, dtype=DTYPE_ARRAY_1D):
+    panels = [
+        container.create_panel(f"s{i}", dtype, anchor=_make_anchor(f"s{i}", line=i + 1),
+                               color=QColor('#00ffff'))
+        for i in range(count)
+    ]
+    _settle(qapp)
+    return panels
+
+
+def test_only_panels_near_the_viewport_build_widgets(container, qapp):
+    panels = _fill(container, qapp, 40)
+    live = [p for p in panels if p.is_live]
+    assert 0 < len(live) < 20
+    assert all(p._plot is not None for p in live)
+    assert all(p._plot is None for p in panels if not p.is_live)
+    assert container.widget_pool.stats['created'] == len(live)
+
+
+def test_scrolling_rebinds_and_returns_own_widget(container, qapp):
+    panels = _fill(container, qapp, 40)
+    first = panels[0]._plot
+    bar = container.verticalScrollBar()
+    bar.setValue(bar.maximum())
+    _settle(qapp)
+    assert not panels[0].is_live and panels[-1].is_live
+    assert panels[0]._plot is None
+
+    bar.setValue(0)
+    _settle(qapp)
+    assert panels[0].is_live
+    assert panels[0]._plot is first
+
+
+def test_dormant_panel_skips_redraws_and_catches_up(container, qapp):
+    panels = _fill(container, qapp, 40)
+    far = panels[-1]
+    assert not far.is_live
+    anchor = far._anchor
+    buffer = _buffer(anchor, [np.arange(8.0), np.arange(8.0) * 3])
+    far.update_from_buffer(buffer)
+    assert far._plot is None
+
+    bar = container.verticalScrollBar()
+    bar.setValue(bar.maximum())
+    _settle(qapp)
+    assert far.is_live
+    np.testing.assert_allclose(far.get_plot_data()[0]['y'], np.arange(8.0) * 3)
+
+
+def test_parked_panels_release_their_widget(container, qapp):
+    panels = _fill(container, qapp, 2)
+    anchor = panels[0]._anchor
+    widget = panels[0]._plot
+    container.park_panel(anchor)
+    assert not panels[0].is_live and panels[0]._plot is None
+    assert container.widget_pool.idle_count() == 1
+
+    container.unpark_panel(anchor)
+    _settle(qapp)
+    assert panels[0].is_live and panels[0]._plot is widget
+
+
+def test_headless_container_keeps_panels_live(qapp):
+    c = ProbePanelContainer()
+    panel = c.create_panel("x", DTYPE_ARRAY_1D, anchor=_make_anchor("x"), color=QColor('#00ffff'))
+    c.update_panel_visibility()
+    assert panel.is_live and panel._plot is not None
+    c.remove_panel(panel=panel)
+    c.deleteLater()
+    qapp.processEvents()
+
+
+def test_pool_rebinds_history_widgets_for_other_probes(qapp):
+    pool = PlotWidgetPool(max_idle=2)
+    plugin = PluginRegistry.instance().get_plugin_by_name("History", DTYPE_SCALAR)
+    a, b = object(), object()
+    widget = pool.acquire(plugin, "a", QColor('#ff0000'))
+    widget.update_history([1.0, 2.0, 3.0])
+    pool.release(plugin.name, a, widget)
+
+    assert pool.reclaim(plugin.name, b) is None
+    rebound = pool.acquire(plugin, "b", QColor('#00ff00'))
+    assert rebound is widget
+    assert rebound._name_label.text() == "b"
+    assert len(rebound._history) == 0
+    assert pool.stats == {'created': 1, 'rebound': 1, 'idle': 0}
+
+
+def test_pool_keeps_at_most_max_idle_per_lens(qapp):
+    pool = PlotWidgetPool(max_idle=2)
+    plugin = PluginRegistry.instance().get_plugin_by_name("Waveform", DTYPE_ARRAY_1D)
+    owners = [object() for _ in range(3)]
+    for i, owner in enumerate(owners):
+        pool.release(plugin.name, owner, pool.acquire(plugin, f"s{i}", QColor('#ff0000')))
+    assert pool.idle_count(plugin.name) == 2
+    # Longest idle goes first; waveforms are never handed to another probe
+    assert pool.reclaim(plugin.name, owners[0]) is None
+    assert pool.reclaim(plugin.name, owners[2]) is not None
+    with pytest.raises(ValueError):
+        PlotWidgetPool(max_idle=-1)
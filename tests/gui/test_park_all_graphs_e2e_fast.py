@@ -17,6 +17,7 @@ pytestmark = pytest.mark.skipif("GITHUB_ACTIONS" in os.environ, reason="Requires
 
 from pyprobe.gui.main_window import MainWindow
 from pyprobe.core.anchor import ProbeAnchor
+from pyprobe.core.capture_record import CaptureRecord
 from pyprobe.core.data_classifier import (
     DTYPE_SCALAR,
     DTYPE_ARRAY_1D,
@@ -43,7 +44,8 @@ def _create_and_park_graph(win, qapp, symbol: str, data, dtype, shape=None, lens
     if shape is not None:
         payload['shape'] = shape
         
-    win._on_probe_value(payload)
+    win._ingest.ingest([CaptureRecord.from_dict(payload)])
+    win._force_redraw()
     qapp.processEvents()
     
     panel_list = win._probe_panels.get(anchor, [])
@@ -90,7 +92,8 @@ def _run_all_scenarios(qapp):
     dummy_anchor = ProbeAnchor(file="/tmp/test_park.py", line=1, col=0, symbol="dummy", func="main")
     win._on_probe_requested(dummy_anchor)
     payload = {'anchor': dummy_anchor.to_dict(), 'value': np.array([1+1j]), 'dtype': DTYPE_ARRAY_COMPLEX}
-    win._on_probe_value(payload)
+    win._ingest.ingest([CaptureRecord.from_dict(payload)])
+    win._force_redraw()
     qapp.processEvents()
     
     dummy_panel = win._probe_panels.get(dummy_anchor, [None])[0]
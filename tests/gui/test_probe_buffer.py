@@ -51,3 +51,28 @@ def test_probe_buffer_logs_out_of_order(caplog) -> None:
     buffer.append(_record(4, 20))
 
     assert "Out of order capture" in caplog.text
+
+
+def test_probe_buffer_indexes_summaries_for_queries() -> None:
+    buffer = ProbeDataBuffer(anchor=_anchor())
+
+    for seq, value in enumerate([1, 5, float("nan"), 2]):
+        buffer.append(_record(seq, value))
+
+    assert len(buffer.summary) == buffer.count == 4
+    assert list(buffer.query("max > 3")) == [1]
+    assert list(buffer.query("first frame with NaN")) == [2]
+    assert buffer.value_at(1) == 5
+
+
+def test_probe_buffer_keeps_dtype_and_shape_per_capture() -> None:
+    buffer = ProbeDataBuffer(anchor=_anchor())
+    buffer.append(_record(0, 10))
+    buffer.append(CaptureRecord(
+        anchor=_anchor(), value=[1, 2, 3], dtype="array_1d", shape=(3,),
+        seq_num=1, timestamp=101, logical_order=0,
+    ))
+
+    assert (buffer.dtype_at(0), buffer.shape_at(0)) == ("scalar", None)
+    assert (buffer.dtype_at(1), buffer.shape_at(1)) == ("array_1d", (3,))
+    assert (buffer.last_dtype, buffer.last_shape) == ("array_1d", (3,))
@@ -108,3 +108,50 @@ def test_probe_panel_lifecycle_fast(panel, panel_anchor, qapp):
 
         # Plot widget should have changed
         assert panel._plot is not old_plot
+
+
+def test_probe_panel_holds_history_frame(panel, panel_anchor, qapp):
+    """show_frame pins a past capture until release_frame returns to live."""
+    from pyprobe.core.capture_record import CaptureRecord
+    from pyprobe.gui.probe_buffer import ProbeDataBuffer
+
+    buffer = ProbeDataBuffer(anchor=panel_anchor)
+    for seq in range(3):
+        buffer.append(CaptureRecord(
+            anchor=panel_anchor, value=np.full(8, float(seq)), dtype=DTYPE_ARRAY_1D,
+            shape=(8,), seq_num=seq, timestamp=seq, logical_order=0,
+        ))
+
+    panel.show_frame(buffer, 1)
+    assert panel.held_frame == 1
+    assert np.all(panel._data == 1.0)
+    assert not panel._frame_btn.isHidden()
+
+    # Live redraws do not replace the held frame
+    panel.update_from_buffer(buffer)
+    assert np.all(panel._data == 1.0)
+
+    panel.release_frame()
+    assert panel.held_frame is None
+    assert np.all(panel._data == 2.0)
+    assert panel._frame_btn.isHidden()
+
+
+def test_held_frame_uses_its_own_shape(panel, panel_anchor, qapp):
+    """A held capture is drawn with its shape, not the newest capture's."""
+    from pyprobe.core.capture_record import CaptureRecord
+    from pyprobe.gui.probe_buffer import ProbeDataBuffer
+
+    buffer = ProbeDataBuffer(anchor=panel_anchor)
+    for seq, size in enumerate([8, 16]):
+        buffer.append(CaptureRecord(
+            anchor=panel_anchor, value=np.arange(float(size)), dtype=DTYPE_ARRAY_1D,
+            shape=(size,), seq_num=seq, timestamp=seq, logical_order=0,
+        ))
+
+    panel.show_frame(buffer, 0)
+    assert panel._shape == (8,)
+    assert len(panel._data) == 8
+
+    panel.release_frame()
+    assert panel._shape == (16,)
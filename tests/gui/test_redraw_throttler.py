@@ -60,3 +60,115 @@ def test_redraw_throttler_limits_redraw_rate() -> None:
 
     current[0] = 0.021
     assert throttler.should_redraw() is True
+
+
+def _anchor_named(symbol: str) -> ProbeAnchor:
+    return ProbeAnchor(file="/tmp/example.py", line=1, col=0, symbol=symbol)
+
+
+def _receive(throttler: RedrawThrottler, *symbols: str) -> None:
+    for seq, symbol in enumerate(symbols):
+        throttler.receive(CaptureRecord(
+            anchor=_anchor_named(symbol), value=seq, dtype="scalar", shape=None,
+            seq_num=seq, timestamp=seq, logical_order=0,
+        ))
+
+
+def test_frame_budget_defers_work_that_does_not_fit() -> None:
+    current = [10.0]
+    throttler = RedrawThrottler(frame_budget_ms=10.0, max_share=1.0, clock=lambda: current[0])
+    throttler.record_render(_anchor_named("slow"), 8.0)
+    throttler.record_render(_anchor_named("fast"), 1.0)
+    throttler.record_render(_anchor_named("other"), 4.0)
+    current[0] = 11.0
+
+    _receive(throttler, "slow", "fast", "other")
+    first = throttler.take_due_buffers()
+    assert {a.symbol for a in first} == {"slow", "fast"}
+    assert [a.symbol for a in throttler.get_dirty_buffers()] == ["other"]
+
+
+def test_priority_orders_the_frame_and_first_probe_always_fits() -> None:
+    current = [10.0]
+    throttler = RedrawThrottler(frame_budget_ms=5.0, max_share=1.0, clock=lambda: current[0])
+    for symbol in ("a", "b"):
+        throttler.record_render(_anchor_named(symbol), 20.0)
+    current[0] = 11.0
+
+    _receive(throttler, "a", "b")
+    batch = throttler.take_due_buffers(lambda anchor: 2 if anchor.symbol == "b" else 0)
+    assert [a.symbol for a in batch] == ["b"]
+    assert throttler.has_dirty
+
+
+def test_costly_probe_redraws_less_often() -> None:
+    current = [10.0]
+    throttler = RedrawThrottler(min_interval_ms=16.0, max_share=0.25, clock=lambda: current[0])
+    slow = _anchor_named("slow")
+    throttler.record_render(slow, 50.0)
+    assert throttler.interval_ms(slow) == 200.0
+    assert throttler.interval_ms(_anchor_named("new")) == 16.0
+
+    current[0] = 10.1
+    _receive(throttler, "slow")
+    assert throttler.take_due_buffers() == {}
+    assert throttler.time_until_redraw_ms() > 0
+    current[0] = 10.25
+    assert list(throttler.take_due_buffers()) == [slow]
+
+
+def test_starving_probe_goes_first() -> None:
+    current = [10.0]
+    throttler = RedrawThrottler(frame_budget_ms=1.0, max_share=1.0, starvation_ms=500.0,
+                                clock=lambda: current[0])
+    throttler.record_render(_anchor_named("hidden"), 5.0)
+    current[0] = 10.6
+    throttler.record_render(_anchor_named("focused"), 5.0)
+    current[0] = 10.7
+
+    _receive(throttler, "hidden", "focused")
+    batch = throttler.take_due_buffers(lambda anchor: 2 if anchor.symbol == "focused" else 0)
+    assert [a.symbol for a in batch] == ["hidden"]
+
+
+def test_expedite_returns_every_dirty_buffer() -> None:
+    current = [10.0]
+    throttler = RedrawThrottler(frame_budget_ms=1.0, clock=lambda: current[0])
+    for symbol in ("a", "b"):
+        throttler.record_render(_anchor_named(symbol), 100.0)
+    _receive(throttler, "a", "b")
+    throttler.expedite()
+    assert len(throttler.take_due_buffers()) == 2
+    assert not throttler.has_dirty
+
+
+def test_render_stats_report_achieved_fps() -> None:
+    current = [0.0]
+    throttler = RedrawThrottler(clock=lambda: current[0])
+    anchor = _anchor_named("x")
+    assert throttler.render_stats(anchor) is None
+    for i in range(11):
+        current[0] = i * 0.1
+        throttler.record_render(anchor, 2.0)
+    stats = throttler.render_stats(anchor)
+    assert abs(stats.fps - 10.0) < 1e-6
+    assert stats.cost_ms == 2.0 and stats.interval_ms == 16.0
+
+    # Stopped redrawing: no rate
+    current[0] = 5.0
+    assert throttler.render_stats(anchor).fps == 0.0
+
+
+def test_debug_overlay_shows_panel_render_stats(qapp) -> None:
+    from PyQt6.QtGui import QColor
+    from pyprobe.gui.probe_panel import ProbePanel
+    from pyprobe.gui.redraw_throttler import RenderStats
+
+    panel = ProbePanel(_anchor(), QColor("#00ffff"), "scalar")
+    panel.resize(400, 300)
+    panel.show()
+    panel._toggle_debug_overlay()
+    panel.set_render_stats(RenderStats(cost_ms=4.3, interval_ms=17.0, fps=58.8))
+    assert panel._debug_overlay.caption == "58.8 fps | 4.3 ms/redraw | every 17 ms"
+    panel.close()
+    panel.deleteLater()
@@ -85,3 +85,23 @@ def test_legacy_mode_lifecycle_fast(temp_script):
     assert not proc.is_alive()
     assert runner._runner_process is None
     assert runner._ipc is None
+
+def test_only_loop_mode_starts_a_zygote(temp_script):
+    from pyprobe.core.zygote import zygote_supported
+    if not zygote_supported():
+        pytest.skip("zygote needs os.fork on Linux")
+    runner = ScriptRunner()
+    runner.configure(script_path=temp_script, get_active_anchors=lambda: [])
+    runner.use_zygote = True
+
+    runner.start()
+    assert runner._zygote is None
+    runner.stop()
+
+    runner.loop_mode = True
+    runner.start()
+    zygote = runner._zygote
+    assert zygote is not None
+    runner.stop()
+    assert runner._zygote is None
+    assert not zygote.is_alive()
@@ -0,0 +1,57 @@
+from pyprobe.core.anchor import ProbeAnchor
+from pyprobe.gui.session_manager import SessionManager
+from pyprobe.gui.session_mux import SessionMux, TracerSession, capture_records
+
+
+def _script(tmp_path, name, body):
+    path = (tmp_path / name).resolve()
+    path.write_text(body)
+    return str(path)
+
+
+def test_one_reader_serves_every_session(qtbot, tmp_path):
+    mux = SessionMux()
+    values, exited = {}, []
+    mux.messages.connect(
+        lambda name, batch: values.setdefault(name, []).extend(
+            r.value for msg in batch for r in capture_records(msg)
+        )
+    )
+    mux.exited.connect(exited.append)
+
+    sessions = []
+    for i in range(3):
+        path = _script(tmp_path, f"s{i}.py", f"import sys\ny = {i} * len(sys.argv)\n")
+        anchor = ProbeAnchor(file=path, line=2, col=0, symbol="y", is_assignment=True)
+        session = TracerSession(f"s{i}", path, script_args=["a"] * i)
+        session.start([anchor])
+        mux.add(session)
+        sessions.append(session)
+    try:
+        qtbot.waitUntil(lambda: len(exited) == 3, timeout=10000)
+        assert sorted(exited) == ["s0", "s1", "s2"]
+        for i in range(3):
+            assert values[f"s{i}"] == [i * (i + 1)]
+    finally:
+        for session in sessions:
+            session.join(stop=True)
+        mux.shutdown()
+
+
+def test_only_a_sessions_own_script_is_owned(tmp_path):
+    manager = SessionManager()
+    ref = _script(tmp_path, "ref.py", "x = 1\n")
+    fast = _script(tmp_path, "fast.py", "x = 1\n")
+    ref_session = manager.add_script(ref)
+    fast_session = manager.add_script(fast)
+    again = manager.add_script(fast, ["--again"])
+    assert again == "fast#2"
+
+    ref_x = ProbeAnchor(file=ref, line=1, col=0, symbol="x")
+    fast_x = ProbeAnchor(file=fast, line=1, col=0, symbol="x")
+    assert manager.owns(ref_session, ref_x, main_script=None)
+    assert not manager.owns(ref_session, ref_x, main_script=ref)
+    assert not manager.owns(ref_session, fast_x, main_script=None)
+    # Two sessions run fast.py, so neither owns its probes
+    assert not manager.owns(fast_session, fast_x, main_script=None)
+    manager.shutdown()
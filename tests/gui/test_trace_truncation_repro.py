@@ -66,9 +66,6 @@ def test_fft_lens_downsample_boundaries(fft_widget, qtbot):
     N = 500
     data = np.random.randn(N)
     
-    # Set display points low to force downsampling even for 8192
-    fft_widget._phase_display_points = 2000 
-    
     # Update data
     fft_widget.update_data(data, DTYPE_ARRAY_1D)
     
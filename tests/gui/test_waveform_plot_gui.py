@@ -4,6 +4,8 @@ Verifies what users actually SEE on waveform plots by inspecting
 pyqtgraph widget internals (curve data, labels, stats).
 """
 
+import time
+
 import numpy as np
 import pytest
 from PyQt6.QtGui import QColor
@@ -165,6 +167,31 @@ class TestWaveformStruct:
         np.testing.assert_allclose(x, [0.0, 0.5, 1.0, 1.5])
 
 
+class TestWaveformLargeFrames:
+    def test_large_frame_is_prepared_off_thread(self, waveform):
+        """Stats and decimation of a large frame arrive ready to draw."""
+        n = WaveformWidget.ASYNC_PREP_SAMPLES + 10
+        data = np.sin(np.linspace(0, 50, n)) * 3
+        waveform.update_data(data, DTYPE_ARRAY_1D)
+        assert waveform.finish_render_prep(timeout=5)
+
+        x, y = waveform._curves[0].getData()
+        assert len(y) < n
+        assert y.max() == pytest.approx(data.max())
+        assert f"Max: {data.max():.4g}" in waveform._stats_label.text()
+
+    def test_newer_frame_supersedes_pending_prep(self, waveform, qapp):
+        """A small frame arriving mid-prep wins over the large one."""
+        big = np.ones(WaveformWidget.ASYNC_PREP_SAMPLES * 4)
+        waveform.update_data(big, DTYPE_ARRAY_1D)
+        waveform.update_data(np.array([1.0, 2.0, 3.0]), DTYPE_ARRAY_1D)
+
+        time.sleep(0.2)
+        qapp.processEvents()
+        _, y = waveform._curves[0].getData()
+        np.testing.assert_allclose(y, [1, 2, 3])
+
+
 class TestWaveformPlugin:
     def test_can_handle_array_1d(self):
         plugin = WaveformPlugin()
@@ -0,0 +1,44 @@
+import asyncio
+import time
+
+from pyprobe import client
+from pyprobe.core.anchor import ProbeAnchor
+from pyprobe.core.broker import CaptureBroker
+from pyprobe.core.capture_record import CaptureRecord
+from pyprobe.ipc.broker_server import BrokerServer
+
+X = ProbeAnchor(file="/tmp/demo.py", line=3, col=0, symbol="x")
+Y = ProbeAnchor(file="/tmp/demo.py", line=4, col=0, symbol="y")
+
+
+def _record(anchor, value, seq):
+    return CaptureRecord(
+        anchor=anchor, value=value, dtype="float", shape=None,
+        seq_num=seq, timestamp=seq * 1000, logical_order=seq,
+    )
+
+
+def test_async_client_receives_its_anchors(tmp_path):
+    broker = CaptureBroker()
+    server = BrokerServer(broker, str(tmp_path / "broker.sock"))
+
+    async def follow():
+        async with client.subscribe(server.address, anchors=[Y]) as stream:
+            # Wait for the server to register the subscription
+            deadline = time.monotonic() + 5
+            while not broker._subscriptions and time.monotonic() < deadline:
+                await asyncio.sleep(0.01)
+            broker.publish([_record(X, 1.0, 0), _record(Y, 2.0, 1)])
+            broker.publish([_record(Y, 3.0, 2)])
+            values = []
+            async for record in stream:
+                assert record.anchor == Y
+                values.append(record.value)
+                if len(values) == 2:
+                    return values
+
+    try:
+        assert asyncio.run(asyncio.wait_for(follow(), 5)) == [2.0, 3.0]
+    finally:
+        server.close()
+        broker.shutdown()
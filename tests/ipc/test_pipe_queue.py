@@ -0,0 +1,68 @@
+import os
+import sys
+import threading
+from queue import Empty, Full
+
+import pytest
+
+from pyprobe.ipc.pipe_queue import PipeQueue
+
+
+def test_put_get_in_order_with_limits():
+    queue = PipeQueue(maxsize=2)
+    queue.put({"n": 1})
+    queue.put({"n": 2}, timeout=0.1)
+    with pytest.raises(Full):
+        queue.put({"n": 3}, timeout=0.01)
+
+    assert queue.get(timeout=0.1) == {"n": 1}
+    queue.put({"n": 3}, block=False)
+    assert [queue.get(block=False), queue.get(timeout=0.1)] == [{"n": 2}, {"n": 3}]
+    with pytest.raises(Empty):
+        queue.get(block=False)
+    with pytest.raises(Empty):
+        queue.get(timeout=0.01)
+    queue.close()
+
+
+@pytest.mark.skipif(not hasattr(os, "fork") or sys.platform == "darwin", reason="needs os.fork")
+def test_child_forked_while_a_thread_writes_can_send():
+    queue = PipeQueue()
+    stop = threading.Event()
+    received = []
+
+    def writer():
+        while not stop.is_set():
+            queue.put("parent")
+
+    def reader():
+        # Keeps the pipe from filling up while the writer runs
+        while not stop.is_set() or threads[0].is_alive():
+            try:
+                received.append(queue.get(timeout=0.05))
+            except Empty:
+                pass
+
+    threads = [threading.Thread(target=writer), threading.Thread(target=reader)]
+    for thread in threads:
+        thread.start()
+    try:
+        pid = os.fork()
+        if pid == 0:
+            queue.put("child")
+            os._exit(0)
+        _, status = os.waitpid(pid, 0)
+    finally:
+        stop.set()
+        # Reader last, so the writer never waits on a full pipe
+        threads[0].join()
+        threads[1].join()
+    assert os.waitstatus_to_exitcode(status) == 0
+
+    while True:
+        try:
+            received.append(queue.get(timeout=0.1))
+        except Empty:
+            break
+    assert received.count("child") == 1
+    assert set(received) == {"parent", "child"}
@@ -131,3 +131,12 @@ def test_framing_multiple_messages():
     
     assert decode_message(frame1).msg_type == MessageType.CMD_PAUSE
     assert decode_message(frame2).msg_type == MessageType.CMD_RESUME
+
+def test_roundtrip_non_json_scalars():
+    payload = {"value": 1 + 2j, "count": np.int64(7), "flag": np.bool_(True)}
+    msg = Message(msg_type=MessageType.DATA_PROBE_VALUE, payload=payload)
+
+    decoded = decode_message(encode_message(msg))
+
+    assert decoded.payload == payload
+    assert isinstance(decoded.payload["count"], np.int64)
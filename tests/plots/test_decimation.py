@@ -0,0 +1,125 @@
+import numpy as np
+import pytest
+
+from pyprobe.plots.decimation import minmax_decimate, viewport_decimate
+
+
+def _loop_reference(data, n_points):
+    """Per-chunk envelope check: every chunk's extrema must survive."""
+    n_chunks = (n_points - 2) // 2
+    chunk_len = -(-len(data) // n_chunks)
+    return [(data[i:i + chunk_len].min(), data[i:i + chunk_len].max())
+            for i in range(0, len(data), chunk_len)]
+
+
+@pytest.mark.parametrize("n", [5001, 8193, 10007, 100000, 123457])
+def test_boundaries_and_envelope(n):
+    rng = np.random.default_rng(n)
+    data = rng.standard_normal(n)
+
+    x, y = minmax_decimate(data, 5000, x_offset=7)
+
+    assert len(x) <= 5000
+    assert x[0] == 7 and x[-1] == n - 1 + 7
+    assert np.all(np.diff(x) >= 0)
+    np.testing.assert_array_equal(y, data[x - 7])
+    assert y.max() == data.max() and y.min() == data.min()
+    for lo, hi in _loop_reference(data, 5000):
+        assert lo in y and hi in y
+
+
+def test_small_data_passthrough():
+    data = np.arange(10.0)
+    x, y = minmax_decimate(data, 5000, x_offset=3)
+    np.testing.assert_array_equal(x, np.arange(3, 13))
+    assert y is data
+
+
+def test_tiny_budget_keeps_endpoints():
+    x, y = minmax_decimate(np.arange(100.0), 3)
+    np.testing.assert_array_equal(x, [0, 99])
+    np.testing.assert_array_equal(y, [0.0, 99.0])
+
+
+def test_ramp_stays_monotonic():
+    x, y = minmax_decimate(np.arange(100000.0), 5000)
+    assert np.all(np.diff(y) >= 0)
+
+
+def test_rows_match_one_dimensional_calls():
+    rng = np.random.default_rng(0)
+    rows = rng.standard_normal((3, 20011))
+
+    xs, ys = minmax_decimate(rows, 1000, x_offset=5)
+
+    assert xs.shape == ys.shape == (3, xs.shape[1])
+    for row, x_row, y_row in zip(rows, xs, ys):
+        x1, y1 = minmax_decimate(row, 1000, x_offset=5)
+        np.testing.assert_array_equal(x_row, x1)
+        np.testing.assert_array_equal(y_row, y1)
+
+
+def _column_reference(y, xmin, xmax, width, x=None):
+    """Straightforward per-sample projection from docs/feat_downsampling.md."""
+    x = np.arange(len(y), dtype=float) if x is None else x
+    visible = np.flatnonzero((x >= xmin) & (x <= xmax))
+    if len(visible) <= width:
+        return visible
+    scale = (width - 1) / (xmax - xmin) if xmax > xmin else 0.0
+    cols = np.clip(np.floor((x[visible] - xmin) * scale), 0, width - 1).astype(int)
+    picks = {visible[0], visible[-1]}
+    for col in np.unique(cols):
+        members = visible[cols == col]
+        vals = y[members]
+        if np.isnan(vals).all():
+            continue
+        picks.add(members[np.nanargmin(vals)])
+        picks.add(members[np.nanargmax(vals)])
+    return np.array(sorted(picks))
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_viewport_matches_reference(seed):
+    rng = np.random.default_rng(seed)
+    n = int(rng.integers(2000, 50000))
+    y = rng.standard_normal(n)
+    y[rng.integers(0, n, 50)] = np.nan
+    x = np.cumsum(rng.uniform(0.1, 2.0, n)) if seed % 2 else None
+    hi = x[-1] if x is not None else n - 1
+    xmin, xmax = sorted(rng.uniform(-0.1 * hi, 1.1 * hi, 2))
+    width = int(rng.integers(1, 1500))
+
+    idx = viewport_decimate(y, xmin, xmax, width, x=x)
+
+    np.testing.assert_array_equal(idx, _column_reference(y, xmin, xmax, width, x))
+
+
+def test_viewport_keeps_visible_endpoints_and_peaks():
+    y = np.zeros(100000)
+    y[12345], y[54321] = 5.0, -5.0
+    idx = viewport_decimate(y, 10000.5, 60000.2, 800)
+    assert idx[0] == 10001 and idx[-1] == 60000
+    assert 12345 in idx and 54321 in idx
+    assert len(idx) <= 2 * 800 + 2
+
+
+def test_viewport_passthrough_when_fewer_samples_than_columns():
+    idx = viewport_decimate(np.arange(1000.0), 100, 399, 600)
+    np.testing.assert_array_equal(idx, np.arange(100, 400))
+
+
+def test_viewport_single_column_and_flat_data():
+    y = np.ones(10000)
+    np.testing.assert_array_equal(viewport_decimate(y, 0, 9999, 1), [0, 9999])
+    assert len(viewport_decimate(y, 0, 9999, 100)) <= 102
+
+
+def test_viewport_outside_data_is_empty():
+    assert len(viewport_decimate(np.arange(10.0), 20, 30, 100)) == 0
+
+
+def test_viewport_rejects_bad_arguments():
+    with pytest.raises(ValueError):
+        viewport_decimate(np.arange(10.0), 0, 9, 0)
+    with pytest.raises(ValueError):
+        viewport_decimate(np.arange(10.0), 9, 0, 10)
@@ -0,0 +1,127 @@
+import numpy as np
+import pytest
+import scipy.signal
+
+from pyprobe.plots.fft_engine import (
+    MIN_NFFT, SpectrumAverager, SpectrumAveraging, compute_spectrum, fft_size,
+    frequency_axis, kaiser_window,
+)
+
+
+def _reference(frame, dt=None):
+    """The per-frame computation the engine replaced (two-sided, complex fft)."""
+    n = len(frame)
+    window = scipy.signal.windows.kaiser(n, beta=9)
+    nfft = max(8192, 2**int(np.ceil(np.log2(n))))
+    fft_data = np.fft.fftshift(np.fft.fft(frame * window, n=nfft))
+    mag = 20 * np.log10(np.abs(fft_data) + 1e-12) - 20 * np.log10(nfft)
+    freqs = np.fft.fftshift(np.fft.fftfreq(nfft, d=dt)) if dt else np.arange(-nfft//2, nfft - nfft//2)
+    return mag, np.rad2deg(np.angle(fft_data)), freqs
+
+
+@pytest.mark.parametrize("n", [1, 100, 8192, 10000])
+def test_fft_size(n):
+    assert fft_size(n) == max(8192, 2**int(np.ceil(np.log2(n))))
+
+
+def test_complex_frame_matches_two_sided_fft():
+    rng = np.random.default_rng(0)
+    frame = rng.standard_normal(3000) + 1j * rng.standard_normal(3000)
+
+    spectrum = compute_spectrum(frame, dt=1e-3)
+    mag, phase, freqs = _reference(frame, dt=1e-3)
+
+    np.testing.assert_allclose(spectrum.mag_db, mag, atol=1e-9)
+    np.testing.assert_allclose(spectrum.phase_deg, phase, atol=1e-6)
+    np.testing.assert_allclose(spectrum.freqs, freqs)
+
+
+def test_real_frame_uses_one_sided_half():
+    frame = np.random.default_rng(1).standard_normal(10000)
+
+    spectrum = compute_spectrum(frame)
+    mag, _, bins = _reference(frame)
+
+    half = len(mag) // 2
+    assert spectrum.nfft == 16384
+    assert len(spectrum.mag_db) == spectrum.nfft // 2 + 1
+    np.testing.assert_allclose(spectrum.mag_db[:-1], mag[half:], atol=1e-9)
+    np.testing.assert_array_equal(spectrum.freqs[:-1], bins[half:])
+
+
+def test_rows_are_transformed_as_a_batch():
+    rows = np.random.default_rng(2).standard_normal((5, 700))
+
+    batch = compute_spectrum(rows, dt=0.5)
+
+    assert batch.mag_db.shape == (5, MIN_NFFT // 2 + 1)
+    for row, mag in zip(rows, batch.mag_db):
+        np.testing.assert_allclose(mag, compute_spectrum(row, dt=0.5).mag_db)
+
+
+def test_windows_and_axes_are_cached_read_only():
+    assert kaiser_window(512) is kaiser_window(512)
+    assert frequency_axis(8192, 0.1, True) is frequency_axis(8192, 0.1, True)
+    with pytest.raises(ValueError):
+        kaiser_window(512)[0] = 0.0
+
+
+@pytest.mark.parametrize("frame", [np.zeros(0), np.zeros((2, 3, 4))])
+def test_rejects_empty_or_3d_frames(frame):
+    with pytest.raises(ValueError, match="non-empty 1D or 2D"):
+        compute_spectrum(frame)
+
+
+def _spectra(count, n=256, seed=3):
+    rng = np.random.default_rng(seed)
+    return [compute_spectrum(rng.standard_normal(n)) for _ in range(count)]
+
+
+def test_no_averaging_passes_frames_through():
+    averager = SpectrumAverager()
+    spectrum = _spectra(1)[0]
+
+    assert averager.update(spectrum) is spectrum.mag_db
+    assert averager.frames == 0
+
+
+def test_welch_is_mean_power_of_all_frames():
+    spectra = _spectra(6)
+    averager = SpectrumAverager(SpectrumAveraging.WELCH)
+
+    for spectrum in spectra:
+        mag_db = averager.update(spectrum)
+
+    mean_power = np.mean([s.magnitude ** 2 for s in spectra], axis=0)
+    assert averager.frames == 6
+    np.testing.assert_allclose(10 ** ((mag_db + 20 * np.log10(MIN_NFFT)) / 10), mean_power, rtol=1e-9)
+
+
+def test_exponential_average_weights_recent_frames():
+    spectra = _spectra(4)
+    averager = SpectrumAverager(SpectrumAveraging.EXPONENTIAL, alpha=0.25)
+
+    for spectrum in spectra:
+        mag_db = averager.update(spectrum)
+
+    expected = spectra[0].magnitude ** 2
+    for spectrum in spectra[1:]:
+        expected = 0.75 * expected + 0.25 * spectrum.magnitude ** 2
+    np.testing.assert_allclose(10 ** ((mag_db + 20 * np.log10(MIN_NFFT)) / 10), expected, rtol=1e-9)
+
+
+def test_shape_or_mode_change_restarts_the_average():
+    averager = SpectrumAverager(SpectrumAveraging.WELCH)
+    for spectrum in _spectra(3):
+        averager.update(spectrum)
+
+    averager.update(_spectra(1, n=20000)[0])
+    assert averager.frames == 1
+
+    averager.mode = SpectrumAveraging.EXPONENTIAL
+    assert averager.frames == 0
+
+
+def test_rejects_bad_alpha():
+    with pytest.raises(ValueError, match="alpha"):
+        SpectrumAverager(alpha=0.0)
@@ -0,0 +1,101 @@
+import numpy as np
+import pytest
+
+from pyprobe.plots.decimation import viewport_decimate
+from pyprobe.plots.lod_pyramid import BASE_LEVEL, LodCache, MinMaxPyramid
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_pyramid_keeps_envelope_and_endpoints(seed):
+    rng = np.random.default_rng(seed)
+    n = int(rng.integers(1000, 300000))
+    y = rng.standard_normal(n)
+    if seed % 3 == 0:
+        y[rng.integers(0, n, n // 10)] = np.nan
+    x = np.cumsum(rng.uniform(0.1, 2.0, n)) if seed % 2 else None
+    hi = x[-1] if x is not None else n - 1
+    xmin, xmax = sorted(rng.uniform(-0.1 * hi, 1.1 * hi, 2))
+    width = int(rng.integers(1, 1500))
+
+    idx = MinMaxPyramid(y).decimate(xmin, xmax, width, x=x)
+    ref = viewport_decimate(y, xmin, xmax, width, x=x)
+
+    if len(ref) == 0:
+        assert len(idx) == 0
+        return
+    assert idx[0] == ref[0] and idx[-1] == ref[-1]
+    assert np.all(np.diff(idx) > 0)
+    assert len(idx) <= 2 * width + 4
+    visible = y[ref[0]:ref[-1] + 1]
+    if not np.isnan(visible).all():
+        assert np.nanmax(y[idx]) == np.nanmax(visible)
+        assert np.nanmin(y[idx]) == np.nanmin(visible)
+
+
+def test_levels_hold_bucket_extrema():
+    y = np.random.default_rng(0).standard_normal(1 << 16)
+    pyramid = MinMaxPyramid(y)
+
+    assert pyramid.top_level == 16
+    for k in range(BASE_LEVEL, pyramid.top_level + 1):
+        mins, maxs = pyramid.level(k)
+        buckets = y.reshape(-1, 1 << k)
+        np.testing.assert_array_equal(y[mins], buckets.min(axis=1))
+        np.testing.assert_array_equal(y[maxs], buckets.max(axis=1))
+    with pytest.raises(ValueError):
+        pyramid.level(BASE_LEVEL - 1)
+
+
+def test_extend_matches_full_build():
+    rng = np.random.default_rng(1)
+    y = rng.standard_normal(100003)
+    y[rng.integers(0, len(y), 500)] = np.nan
+    full = MinMaxPyramid(y)
+
+    grown = MinMaxPyramid(y[:777].copy())
+    for part in np.array_split(y[777:], 7):
+        grown.extend(part)
+
+    np.testing.assert_array_equal(grown.samples, y)
+    assert grown.top_level == full.top_level
+    for k in range(BASE_LEVEL, full.top_level + 1):
+        for a, b in zip(grown.level(k), full.level(k)):
+            np.testing.assert_array_equal(a, b)
+
+
+def test_short_trace_has_no_levels():
+    pyramid = MinMaxPyramid(np.arange(10.0))
+    assert pyramid.top_level == 0
+    np.testing.assert_array_equal(pyramid.decimate(0, 9, 4),
+                                  viewport_decimate(np.arange(10.0), 0, 9, 4))
+
+
+def test_cache_builds_pyramid_when_array_is_drawn_again():
+    cache = LodCache(min_samples=1000)
+    y = np.random.default_rng(2).standard_normal(50000)
+
+    cache.decimate("a", y, 0, len(y) - 1, 500)
+    assert cache.pyramid("a") is None
+    cache.decimate("a", y, 100, 20000, 500)
+    pyramid = cache.pyramid("a")
+    assert pyramid is not None and pyramid.built_from(y)
+    cache.decimate("a", y, 200, 30000, 500)
+    assert cache.pyramid("a") is pyramid
+
+    # New data replaces the pyramid; short data never gets one
+    cache.decimate("a", y.copy(), 0, 100, 500)
+    assert cache.pyramid("a") is None
+    cache.decimate("b", y[:10], 0, 9, 500)
+    cache.decimate("b", y[:10], 0, 9, 500)
+    assert cache.pyramid("b") is None
+
+
+def test_cache_retain_drops_other_series():
+    cache = LodCache(min_samples=1000)
+    y = np.zeros(5000)
+    for key in ("a", "b"):
+        cache.decimate(key, y, 0, 4999, 100)
+        cache.decimate(key, y, 0, 4999, 100)
+    cache.retain(["a"])
+    assert cache.pyramid("a") is not None
+    assert cache.pyramid("b") is None
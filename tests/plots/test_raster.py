@@ -0,0 +1,117 @@
+import numpy as np
+import pytest
+
+from pyprobe.plots.raster import DensityRaster, fit_range
+
+
+def test_points_land_in_their_cells():
+    raster = DensityRaster((4, 8), decay=1.0)
+    raster.set_extent(0.0, 8.0, 0.0, 4.0)
+
+    inside = raster.add_points(np.array([0.5, 0.5, 7.9, 9.0]), np.array([0.5, 0.5, 3.9, 1.0]))
+
+    counts = raster.counts()
+    assert inside == 3
+    assert counts[0, 0] == 2 and counts[3, 7] == 1
+    assert counts.sum() == 3
+
+
+def test_fade_decays_older_hits_only():
+    raster = DensityRaster((2, 2), decay=0.5)
+    raster.set_extent(0.0, 2.0, 0.0, 2.0)
+    raster.add_points([0.5], [0.5])
+
+    raster.fade()
+    raster.add_points([1.5], [1.5])
+
+    np.testing.assert_allclose(raster.counts(), [[0.5, 0.0], [0.0, 1.0]])
+
+
+def test_long_runs_renormalize_without_losing_recent_hits():
+    raster = DensityRaster((1, 1), decay=0.01)
+    raster.set_extent(0.0, 1.0, 0.0, 1.0)
+
+    for _ in range(500):
+        raster.fade()
+        raster.add_points([0.5], [0.5])
+
+    assert np.isfinite(raster.counts()).all()
+    assert raster.counts()[0, 0] == pytest.approx(1.0 / 0.99)
+
+
+def test_invalid_arguments():
+    with pytest.raises(ValueError):
+        DensityRaster((4, 4), decay=0.0)
+    raster = DensityRaster((4, 4))
+    with pytest.raises(ValueError):
+        raster.add_points([0.0], [0.0])
+    with pytest.raises(ValueError):
+        raster.set_extent(1.0, 1.0, 0.0, 1.0)
+
+
+def test_traces_fill_steep_edges_column_by_column():
+    raster = DensityRaster((8, 4), decay=1.0)
+    raster.set_extent(0.0, 4.0, 0.0, 8.0)
+
+    # Jumps from row 1 to row 6 between columns 1 and 2
+    raster.add_traces(np.array([1.5, 1.5, 1.5, 6.5, 6.5]), x0=0.0, dx=1.0)
+
+    counts = raster.counts()
+    np.testing.assert_array_equal(counts[:, 0], [0, 1, 0, 0, 0, 0, 0, 0])
+    np.testing.assert_array_equal(counts[:, 2], [0, 1, 1, 1, 1, 1, 1, 0])
+    np.testing.assert_array_equal(counts[:, 3], [0, 0, 0, 0, 0, 0, 1, 0])
+
+
+def test_dense_traces_cover_their_min_max_per_column():
+    raster = DensityRaster((10, 2), decay=1.0)
+    raster.set_extent(0.0, 2.0, 0.0, 10.0)
+    y = np.full(200, 5.5)
+    y[50], y[150] = 2.5, 8.5
+
+    raster.add_traces(y, x0=0.0, dx=0.01)
+
+    np.testing.assert_array_equal(np.flatnonzero(raster.counts()[:, 0]), [2, 3, 4, 5])
+    np.testing.assert_array_equal(np.flatnonzero(raster.counts()[:, 1]), [5, 6, 7, 8])
+
+
+def test_traces_outside_the_extent_or_with_gaps_are_dropped():
+    raster = DensityRaster((4, 4), decay=1.0)
+    raster.set_extent(0.0, 4.0, 0.0, 4.0)
+
+    raster.add_traces(np.array([[10.0, 12.0], [-3.0, -1.0], [np.nan, 1.0]]), x0=0.0, dx=4.0)
+
+    assert raster.counts().sum() == 0
+
+
+def test_folding_matches_adding_each_trace():
+    rng = np.random.default_rng(0)
+    signal = rng.standard_normal(2000)
+    folded = DensityRaster((32, 48), decay=1.0)
+    traces = DensityRaster((32, 48), decay=1.0)
+    for raster in (folded, traces):
+        raster.set_extent(0.0, 2.0, -3.0, 3.0)
+
+    n = folded.add_folded(signal, period=8, span=16, offset=3)
+
+    windows = np.lib.stride_tricks.sliding_window_view(signal[3:], 17)[::8][:n]
+    traces.add_traces(windows, x0=0.0, dx=2.0 / 16)
+    assert n == (2000 - 1 - 16 - 3) // 8 + 1
+    np.testing.assert_array_equal(folded.counts(), traces.counts())
+
+
+def test_folding_needs_whole_columns_per_sample():
+    raster = DensityRaster((8, 30))
+    raster.set_extent(0.0, 2.0, -1.0, 1.0)
+    with pytest.raises(ValueError):
+        raster.add_folded(np.zeros(100), period=8, span=16)
+    with pytest.raises(ValueError):
+        raster.add_folded(np.zeros(100), period=4, span=15)
+
+
+def test_fit_range_keeps_merges_or_refits():
+    assert fit_range(0.0, 1.0, margin=0.1) == pytest.approx((-0.1, 1.1))
+    assert fit_range(0.2, 0.9, (-0.1, 1.1)) is None
+    # Outgrowing merges with the current range
+    assert fit_range(0.5, 1.5, (-0.1, 1.1), margin=0.0) == (-0.1, 1.5)
+    # Shrinking far inside refits to the data
+    assert fit_range(0.0, 0.1, (-1.0, 1.0), margin=0.0) == (0.0, 0.1)
@@ -0,0 +1,124 @@
+import gc
+
+import numpy as np
+import pytest
+
+from pyprobe.plots.render_cache import RenderCache, axis_token
+
+
+def test_channel_is_computed_once_per_frame():
+    cache = RenderCache()
+    value = np.exp(1j * np.linspace(0, 10, 1000))
+
+    first = cache.channel(value, 'db')
+    second = cache.channel(value, 'db')
+
+    assert first is second
+    assert cache.hits == 1 and cache.misses == 1
+    np.testing.assert_allclose(first, 20 * np.log10(np.abs(value) + 1e-12))
+
+
+def test_new_frame_is_a_miss():
+    cache = RenderCache()
+    a = np.arange(10.0) + 1j
+    b = a.copy()
+
+    assert cache.channel(a, 'abs') is not cache.channel(b, 'abs')
+    assert cache.misses == 2
+
+
+def test_results_are_read_only_but_source_is_not():
+    cache = RenderCache()
+    value = np.arange(100.0)
+
+    x, y = cache.derived(value, 'decimated', lambda: (np.arange(3), value[[0, 50, 99]]))
+
+    assert value.flags.writeable
+    for arr in (x, y):
+        with pytest.raises(ValueError):
+            arr[0] = 1
+
+
+def test_entries_die_with_their_source():
+    cache = RenderCache()
+    value = np.arange(1000.0) + 1j
+    cache.channel(value, 'abs')
+    cache.uniform_axis(value, 0.0, 0.5)
+    assert len(cache) == 2 and cache.nbytes == 2 * 1000 * 8
+
+    del value
+    gc.collect()
+
+    assert len(cache) == 0 and cache.nbytes == 0
+
+
+def test_least_recently_used_entries_are_evicted():
+    cache = RenderCache(max_bytes=3 * 800)
+    frames = [np.arange(100.0) + k * 1j for k in range(4)]
+    for frame in frames[:3]:
+        cache.channel(frame, 'abs')
+    cache.channel(frames[0], 'abs')  # touch: frames[1] is now the oldest
+
+    cache.channel(frames[3], 'abs')
+
+    assert len(cache) == 3 and cache.nbytes <= 3 * 800
+    misses = cache.misses
+    cache.channel(frames[0], 'abs')
+    assert cache.misses == misses
+    cache.channel(frames[1], 'abs')
+    assert cache.misses == misses + 1
+
+
+def test_results_holding_the_source_are_not_cached():
+    cache = RenderCache()
+    value = np.arange(100.0)
+
+    assert cache.channel(value, 'real') is value
+    assert len(cache) == 0
+    assert value.flags.writeable
+
+
+def test_oversized_results_are_not_cached():
+    cache = RenderCache(max_bytes=100)
+    value = np.arange(1000.0) + 1j
+
+    cache.channel(value, 'abs')
+
+    assert len(cache) == 0
+
+
+def test_unweakrefable_sources_are_not_cached():
+    cache = RenderCache()
+    source = [1.0, 2.0, 3.0]
+
+    result = cache.derived(source, 'sum', lambda: np.asarray(source))
+
+    assert len(cache) == 0
+    assert result.flags.writeable
+
+
+def test_unknown_channel_raises():
+    with pytest.raises(ValueError, match="Unknown channel"):
+        RenderCache().channel(np.zeros(4), 'hilbert')
+
+
+def test_axis_token_tracks_axis_identity():
+    t = np.linspace(0, 1, 11)
+
+    assert axis_token(None) is None
+    assert axis_token(t) == axis_token(t)
+    assert axis_token(t) != axis_token(t.copy())
+
+
+def test_complex_parts_do_not_keep_the_capture_alive():
+    cache = RenderCache()
+    value = np.arange(1000.0) * (1 + 1j)
+    real = cache.channel(value, 'real')
+    imag = cache.channel(value, 'imag')
+    np.testing.assert_array_equal(real, value.real)
+    np.testing.assert_array_equal(imag, value.imag)
+
+    del value
+    gc.collect()
+
+    assert len(cache) == 0
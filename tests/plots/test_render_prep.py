@@ -0,0 +1,76 @@
+import threading
+
+import pytest
+
+from pyprobe.plots.render_prep import RenderPrepPool
+
+
+@pytest.fixture
+def pool(qapp):
+    p = RenderPrepPool(max_workers=1)
+    yield p
+    p.shutdown()
+
+
+def test_result_is_applied_on_the_gui_thread(pool, qtbot):
+    applied = []
+    pool.submit('a', lambda is_cancelled: 42,
+                lambda result: applied.append((result, threading.current_thread())))
+
+    qtbot.waitUntil(lambda: bool(applied), timeout=2000)
+    assert applied == [(42, threading.main_thread())]
+    assert not pool.is_pending('a')
+
+
+def test_newer_job_supersedes_a_running_one(pool, qtbot):
+    started, release = threading.Event(), threading.Event()
+    applied = []
+
+    def slow(is_cancelled):
+        started.set()
+        release.wait(2)
+        return 'old'
+
+    pool.submit('a', slow, applied.append)
+    assert started.wait(2)
+    pool.submit('a', lambda is_cancelled: 'new', applied.append)
+    release.set()
+
+    qtbot.waitUntil(lambda: bool(applied), timeout=2000)
+    qtbot.wait(50)
+    assert applied == ['new']
+    assert pool.cancelled == 1
+
+
+def test_cancelled_job_that_has_not_started_never_runs(pool):
+    release = threading.Event()
+    ran = []
+    pool.submit('busy', lambda is_cancelled: release.wait(2), lambda result: None)
+    pool.submit('queued', lambda is_cancelled: ran.append(True), lambda result: None)
+
+    pool.cancel('queued')
+    release.set()
+    assert pool.wait('busy', timeout=2)
+    assert ran == []
+
+
+def test_wait_applies_the_result_immediately(pool, qapp):
+    applied = []
+    pool.submit('a', lambda is_cancelled: 'done', applied.append)
+
+    assert pool.wait('a', timeout=2)
+    assert applied == ['done']
+    qapp.processEvents()
+    assert applied == ['done']  # the queued delivery is ignored
+
+
+def test_failing_job_delivers_nothing(pool):
+    applied = []
+    pool.submit('a', lambda is_cancelled: 1 / 0, applied.append)
+    assert pool.wait('a', timeout=2)
+    assert applied == []
+
+
+def test_rejects_empty_pool(qapp):
+    with pytest.raises(ValueError):
+        RenderPrepPool(max_workers=0)
@@ -0,0 +1,69 @@
+import numpy as np
+import pytest
+from PyQt6.QtGui import QColor
+
+from pyprobe.core.data_classifier import DTYPE_ARRAY_COMPLEX
+from pyprobe.plugins.builtins.constellation import ConstellationWidget
+
+
+@pytest.fixture
+def widget(qapp, qtbot):
+    w = ConstellationWidget("iq", QColor("cyan"))
+    qtbot.addWidget(w)
+    return w
+
+
+def _qpsk(n, seed=0):
+    rng = np.random.default_rng(seed)
+    return (rng.choice([-1, 1], n) + 1j * rng.choice([-1, 1], n)) / np.sqrt(2)
+
+
+def test_history_is_downsampled_once(widget, monkeypatch):
+    calls = []
+    original = widget.downsample
+    monkeypatch.setattr(widget, 'downsample', lambda d: calls.append(len(d)) or original(d))
+
+    for seed in range(widget.HISTORY_LENGTH + 2):
+        widget.update_data(_qpsk(50000, seed), DTYPE_ARRAY_COMPLEX)
+
+    assert calls == [50000] * (widget.HISTORY_LENGTH + 2)
+    assert all(len(frame) == widget.MAX_DISPLAY_POINTS for frame in widget._history)
+
+
+def test_density_mode_accumulates_every_point(widget):
+    widget.set_density_mode(True)
+    frames = [_qpsk(40000, seed) for seed in range(3)]
+    for frame in frames:
+        widget.update_data(frame, DTYPE_ARRAY_COMPLEX)
+
+    counts = widget._density.counts()
+    decay = widget.DENSITY_DECAY
+    assert counts.sum() == pytest.approx(40000 * (decay ** 2 + decay + 1), rel=1e-5)
+    # Four clusters, one per QPSK symbol
+    assert np.count_nonzero(counts) == 4
+    assert widget._density_image.isVisible()
+    # Only the newest frame stays drawn as points
+    assert [len(s.data) for s in widget._scatter_items[:-1]] == [0] * (widget.HISTORY_LENGTH - 1)
+    assert len(widget._scatter_items[-1].data) == widget.MAX_DISPLAY_POINTS
+
+
+def test_density_extent_follows_the_data(widget):
+    widget.set_density_mode(True)
+    widget.update_data(_qpsk(1000), DTYPE_ARRAY_COMPLEX)
+    small = widget._density.extent
+
+    widget.update_data(10 * _qpsk(1000), DTYPE_ARRAY_COMPLEX)
+
+    assert widget._density.extent[1] > 10 / np.sqrt(2) > small[1]
+    assert widget._density.counts().sum() == pytest.approx(1000)
+
+
+def test_leaving_density_mode_restores_history(widget):
+    widget.set_density_mode(True)
+    for seed in range(3):
+        widget.update_data(_qpsk(100, seed), DTYPE_ARRAY_COMPLEX)
+
+    widget.set_density_mode(False)
+
+    assert not widget._density_image.isVisible()
+    assert [len(s.data) for s in widget._scatter_items[-3:]] == [100, 100, 100]
@@ -0,0 +1,87 @@
+import numpy as np
+import pytest
+from PyQt6.QtGui import QColor
+
+from pyprobe.core.data_classifier import DTYPE_ARRAY_1D, DTYPE_ARRAY_COMPLEX
+from pyprobe.plugins.builtins.eye_diagram import EyeDiagramPlugin, EyeDiagramWidget
+
+
+@pytest.fixture
+def widget(qapp, qtbot):
+    w = EyeDiagramWidget("rx", QColor("cyan"))
+    qtbot.addWidget(w)
+    return w
+
+
+def _nrz(symbols, sps, seed=0):
+    """Rectangular NRZ pulses: flat +-1 inside each symbol."""
+    bits = np.random.default_rng(seed).choice([-1.0, 1.0], symbols)
+    return np.repeat(bits, sps)
+
+
+def test_frames_fold_into_an_open_eye(widget):
+    widget.update_data(_nrz(4000, 8), DTYPE_ARRAY_1D)
+
+    counts = widget._raster.counts()
+    rows = counts.shape[0]
+    data = widget.get_plot_data()
+    assert data['traces'] == (4000 * 8 - 1 - 16) // 8 + 1
+    assert widget._image.image.shape == counts.shape
+    # Mid-symbol columns only see the two levels: the eye is open
+    mid = counts[:, counts.shape[1] // 4]
+    lit = np.flatnonzero(mid)
+    assert len(lit) == 2 and lit[0] < rows // 4 and lit[1] > 3 * rows // 4
+
+
+def test_frames_accumulate_with_decay(widget):
+    frame = _nrz(1000, 8)
+    widget.update_data(frame, DTYPE_ARRAY_1D)
+    once = widget._raster.counts().sum()
+
+    widget.update_data(frame, DTYPE_ARRAY_1D)
+
+    assert widget.frame_count == 2
+    assert widget._raster.counts().sum() == pytest.approx(once * (1 + widget.DECAY), rel=1e-6)
+
+
+def test_samples_per_symbol_restarts_from_newest_frame(widget):
+    widget.update_data(_nrz(1000, 16), DTYPE_ARRAY_1D)
+    widget.update_data(_nrz(1000, 16, seed=1), DTYPE_ARRAY_1D)
+
+    widget.set_samples_per_symbol(16)
+
+    assert widget.frame_count == 1
+    assert widget._raster.shape[1] % 32 == 0
+    with pytest.raises(ValueError):
+        widget.set_samples_per_symbol(1)
+
+
+def test_complex_frames_show_the_selected_channel(widget):
+    iq = _nrz(1000, 8) + 3j * _nrz(1000, 8, seed=1)
+    widget.update_data(iq, DTYPE_ARRAY_COMPLEX)
+    assert widget.is_complex
+    assert widget._raster.extent[3] < 2
+
+    widget.set_channel('Q')
+
+    assert widget._raster.extent[3] > 3
+    with pytest.raises(ValueError):
+        widget.set_channel('X')
+
+
+def test_update_history_folds_only_new_frames(widget):
+    buffer = [_nrz(200, 8, seed=k) for k in range(3)]
+    widget.update_history(buffer)
+    buffer.append(_nrz(200, 8, seed=3))
+    widget.update_history(buffer)
+    assert widget.frame_count == 4
+
+    widget.update_history(buffer[:2])
+    assert widget.frame_count == 2
+
+
+def test_plugin_handles_1d_frames():
+    plugin = EyeDiagramPlugin()
+    assert plugin.can_handle(DTYPE_ARRAY_1D, (100,))
+    assert plugin.can_handle(DTYPE_ARRAY_COMPLEX, (100,))
+    assert not plugin.can_handle('array_2d', (4, 100))
@@ -0,0 +1,63 @@
+import numpy as np
+from PyQt6.QtGui import QColor
+
+from pyprobe.core.data_classifier import DTYPE_ARRAY_COLLECTION, DTYPE_WAVEFORM_COLLECTION
+from pyprobe.plots.fft_engine import SpectrumAveraging, compute_spectrum
+from pyprobe.plugins.builtins.waveform import WaveformFftMagAngleWidget
+
+
+def _widget(qtbot):
+    widget = WaveformFftMagAngleWidget("sig", QColor("cyan"))
+    qtbot.addWidget(widget)
+    return widget
+
+
+def test_real_frame_shows_one_sided_spectrum(qapp, qtbot):
+    widget = _widget(qtbot)
+    frame = np.random.default_rng(0).standard_normal(1000)
+
+    widget.update_data(frame, "array_1d")
+
+    np.testing.assert_array_equal(widget._data, compute_spectrum(frame).mag_db)
+    assert widget._t_vector[0] == 0.0 and len(widget._t_vector) == 8192 // 2 + 1
+
+
+def test_welch_averaging_accumulates_across_frames(qapp, qtbot):
+    widget = _widget(qtbot)
+    widget.set_averaging(SpectrumAveraging.WELCH)
+    rng = np.random.default_rng(1)
+    frames = rng.standard_normal((3, 2, 500))
+
+    for frame in frames:
+        widget.update_data(frame, "array_2d")
+
+    power = np.mean([compute_spectrum(f).magnitude ** 2 for f in frames], axis=0)
+    np.testing.assert_allclose(widget._data, 10 * np.log10(power + 1e-24) - 20 * np.log10(8192))
+
+    widget.set_averaging(SpectrumAveraging.NONE)
+    widget.update_data(frames[0], "array_2d")
+    np.testing.assert_array_equal(widget._data, compute_spectrum(frames[0]).mag_db)
+
+
+def test_collections_keep_item_order_across_batches(qapp, qtbot):
+    widget = _widget(qtbot)
+    rng = np.random.default_rng(2)
+    arrays = [rng.standard_normal(300), rng.standard_normal(20000), np.zeros(0), rng.standard_normal(300)]
+
+    widget.update_data({'__dtype__': DTYPE_ARRAY_COLLECTION, 'arrays': arrays}, DTYPE_ARRAY_COLLECTION)
+
+    assert len(widget._data) == 3
+    for shown, arr in zip(widget._data, [arrays[0], arrays[1], arrays[3]]):
+        np.testing.assert_allclose(shown, compute_spectrum(arr).mag_db)
+
+
+def test_waveform_collection_frequency_axis(qapp, qtbot):
+    widget = _widget(qtbot)
+    waveforms = [{'samples': np.ones(100), 'scalars': [0.0, 1e-3]}]
+
+    widget.update_data({'__dtype__': DTYPE_WAVEFORM_COLLECTION, 'waveforms': waveforms},
+                       DTYPE_WAVEFORM_COLLECTION)
+
+    t0, df = widget._data[0]['scalars']
+    assert t0 == 0.0
+    assert df == 1.0 / (8192 * 1e-3)
@@ -0,0 +1,113 @@
+import numpy as np
+import pytest
+from PyQt6.QtGui import QColor
+
+from pyprobe.core.data_classifier import DTYPE_ARRAY_2D
+from pyprobe.plots.decimation import block_reduce
+from pyprobe.plugins import PluginRegistry
+from pyprobe.plugins.builtins.image import ImagePlugin, ImageWidget
+
+
+@pytest.fixture
+def widget(qapp, qtbot):
+    w = ImageWidget("m", QColor("cyan"))
+    qtbot.addWidget(w)
+    w.resize(500, 400)
+    w.show()
+    qapp.processEvents()
+    return w
+
+
+def test_block_reduce_means_blocks_including_edges():
+    image = np.arange(20, dtype=float).reshape(4, 5)
+
+    reduced = block_reduce(image, 2, 2)
+
+    assert reduced.shape == (2, 3)
+    np.testing.assert_allclose(reduced[0], [(0 + 1 + 5 + 6) / 4, (2 + 3 + 7 + 8) / 4, (4 + 9) / 2])
+    assert block_reduce(image, 1, 1) is image
+    with pytest.raises(ValueError):
+        block_reduce(image, 0, 1)
+
+
+def test_large_matrix_is_one_screen_sized_texture(widget):
+    data = np.random.default_rng(0).standard_normal((2000, 4096))
+
+    widget.update_data(data, DTYPE_ARRAY_2D)
+
+    height, width = widget._pixel_size()
+    shown = widget._image.image
+    assert shown.shape[0] <= height and shown.shape[1] <= width
+    assert widget.get_plot_data()['shape'] == [2000, 4096]
+
+
+def test_zoom_reduces_only_the_visible_block(widget):
+    data = np.arange(1000 * 1000, dtype=float).reshape(1000, 1000)
+    widget.update_data(data, DTYPE_ARRAY_2D)
+
+    vb = widget._plot_widget.getPlotItem().getViewBox()
+    vb.setRange(xRange=(100, 150), yRange=(200, 240), padding=0)
+
+    shown = widget._image.image
+    assert shown.shape == (40, 50) or shown.shape == (41, 51)
+    assert shown[0, 0] == data[200, 100]
+
+
+def test_axis_scale_levels_and_colormap(widget):
+    data = np.linspace(0, 1, 100 * 50).reshape(100, 50)
+    widget.update_data(data, DTYPE_ARRAY_2D)
+
+    widget.set_axis_scale('x', 10.0, 0.5)
+    rect = widget._image.mapRectToParent(widget._image.boundingRect())
+    assert rect.left() == pytest.approx(10.0) and rect.width() == pytest.approx(25.0)
+
+    widget.set_levels((0.2, 0.4))
+    assert widget.levels == pytest.approx((0.2, 0.4))
+    widget.update_data(data * 2, DTYPE_ARRAY_2D)
+    assert widget.levels == pytest.approx((0.2, 0.4))
+    widget.set_levels(None)
+    assert widget.levels == pytest.approx((0.0, 2.0), abs=0.05)
+
+    widget.set_colormap('inferno')
+    assert widget.colormap == 'inferno'
+    with pytest.raises(ValueError):
+        widget.set_axis_scale('z', 0.0, 1.0)
+
+
+def test_new_frames_get_auto_levels_until_the_user_drags(widget):
+    data = np.arange(100 * 200, dtype=float).reshape(100, 200)
+    widget.update_data(data, DTYPE_ARRAY_2D)
+    assert widget.levels == pytest.approx((0, 19999), rel=0.01)
+
+    # Rendering moves the histogram region too; that must not pin the levels
+    widget.update_data(data * 10, DTYPE_ARRAY_2D)
+    assert widget.levels == pytest.approx((0, 199990), rel=0.01)
+
+    # A drag of the histogram region does
+    widget._histogram.item.region.setRegion((1000.0, 5000.0))
+    assert widget.levels == pytest.approx((1000.0, 5000.0))
+    widget.update_data(data * 100, DTYPE_ARRAY_2D)
+    assert widget.levels == pytest.approx((1000.0, 5000.0))
+
+
+def test_hover_reads_full_resolution_value(widget, qtbot):
+    data = np.random.default_rng(1).standard_normal((3000, 3000))
+    widget.update_data(data, DTYPE_ARRAY_2D)
+    vb = widget._plot_widget.getPlotItem().getViewBox()
+
+    with qtbot.waitSignal(widget.status_message_requested) as blocker:
+        widget._on_mouse_moved(vb.mapViewToScene(pg_point(1234.5, 2345.5)))
+
+    assert blocker.args[0].startswith("Row: 2345,  Col: 1234")
+
+
+def pg_point(x, y):
+    from PyQt6.QtCore import QPointF
+    return QPointF(x, y)
+
+
+def test_many_rows_default_to_image():
+    registry = PluginRegistry.instance()
+
+    assert registry.get_default_plugin(DTYPE_ARRAY_2D, (4, 1000)).name == "Waveform"
+    assert registry.get_default_plugin(DTYPE_ARRAY_2D, (2000, 4096)).name == ImagePlugin.name
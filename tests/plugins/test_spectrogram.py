@@ -0,0 +1,96 @@
+import numpy as np
+import pytest
+from PyQt6.QtGui import QColor
+
+from pyprobe.core.data_classifier import DTYPE_ARRAY_1D, DTYPE_WAVEFORM_REAL
+from pyprobe.plots.fft_engine import compute_spectrum
+from pyprobe.plugins.builtins.spectrogram import SpectrogramPlugin, SpectrogramWidget
+
+
+@pytest.fixture
+def widget(qapp, qtbot):
+    w = SpectrogramWidget("sig", QColor("cyan"))
+    qtbot.addWidget(w)
+    return w
+
+
+def _tone(k, n=512):
+    return np.cos(2 * np.pi * k * np.arange(n) / n)
+
+
+def test_rows_scroll_in_time_order(widget):
+    frames = [_tone(k) for k in (10, 20, 30)]
+    for frame in frames:
+        widget.update_data(frame, DTYPE_ARRAY_1D)
+
+    view = widget._view()
+    assert widget.frame_count == 3
+    for row, frame in zip(view[-3:], frames):
+        np.testing.assert_allclose(row, widget._pool(compute_spectrum(frame).mag_db), rtol=1e-5)
+    assert np.all(view[:-3] == SpectrogramWidget._EMPTY)
+
+
+def test_ring_wraps_without_reallocating(widget):
+    widget.update_data(_tone(1), DTYPE_ARRAY_1D)
+    ring = widget._ring
+    image = widget._image.image
+
+    for k in range(widget.DEFAULT_ROWS + 5):
+        widget.update_data(_tone(k % 100), DTYPE_ARRAY_1D)
+
+    assert widget._ring is ring
+    assert np.shares_memory(widget._image.image, ring) and np.shares_memory(image, ring)
+    newest = widget._pool(compute_spectrum(_tone((widget.DEFAULT_ROWS + 4) % 100)).mag_db)
+    np.testing.assert_allclose(widget._view()[-1], newest, rtol=1e-5)
+
+
+def test_update_history_appends_only_new_frames(widget):
+    buffer = [_tone(k) for k in range(5)]
+    widget.update_history(buffer)
+    assert widget.frame_count == 5
+
+    buffer.extend(_tone(k) for k in range(5, 8))
+    widget.update_history(buffer)
+    assert widget.frame_count == 8
+
+    # Stepping back through history rebuilds from that frame
+    widget.update_history(buffer[:2])
+    assert widget.frame_count == 2
+
+
+def test_wide_spectra_are_max_pooled(widget):
+    n = 1 << 14
+    frame = np.zeros(n)
+    frame[::2] = 1.0  # all energy at Nyquist, the last bin
+
+    widget.update_data(frame, DTYPE_ARRAY_1D)
+
+    row = widget._view()[-1]
+    assert len(row) == widget.MAX_COLUMNS
+    assert row[-1] == pytest.approx(compute_spectrum(frame).mag_db.max(), rel=1e-5)
+
+
+def test_waveform_axes_come_from_dt(widget):
+    waveform = {'__dtype__': DTYPE_WAVEFORM_REAL, 'samples': _tone(50), 'scalars': [0.0, 1e-3]}
+
+    widget.update_data(waveform, DTYPE_WAVEFORM_REAL)
+
+    rect = widget._image.mapRectToParent(widget._image.boundingRect())
+    assert rect.left() == 0.0
+    assert rect.right() == pytest.approx(500.0, rel=1e-2)  # Nyquist of 1 kHz
+    assert rect.top() == pytest.approx(-widget.DEFAULT_ROWS * 512 * 1e-3)
+
+
+def test_frame_length_change_restarts(widget):
+    widget.update_data(_tone(1, n=256), DTYPE_ARRAY_1D)
+    widget.update_data(_tone(1, n=20000), DTYPE_ARRAY_1D)
+
+    assert widget.frame_count == 1
+    assert widget.get_plot_data()['rows'] == 1
+
+
+def test_plugin_handles_1d_frames():
+    plugin = SpectrogramPlugin()
+    assert plugin.can_handle(DTYPE_ARRAY_1D, (100,))
+    assert plugin.can_handle('array_complex', (100,))
+    assert not plugin.can_handle('array_2d', (4, 100))
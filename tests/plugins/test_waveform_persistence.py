@@ -0,0 +1,91 @@
+import numpy as np
+import pytest
+from PyQt6.QtGui import QColor
+
+from pyprobe.core.data_classifier import DTYPE_ARRAY_1D, DTYPE_ARRAY_2D, DTYPE_WAVEFORM_REAL
+from pyprobe.plugins.builtins.waveform import WaveformWidget
+
+
+@pytest.fixture
+def widget(qapp, qtbot):
+    w = WaveformWidget("sig", QColor("cyan"))
+    qtbot.addWidget(w)
+    return w
+
+
+def _sine(n=4000, glitch=None):
+    y = np.sin(2 * np.pi * np.arange(n) / 500)
+    if glitch is not None:
+        y[glitch] = 3.0
+    return y
+
+
+def test_frames_accumulate_beneath_the_live_curve(widget):
+    widget.set_persistence(True)
+    widget.update_data(_sine(), DTYPE_ARRAY_1D)
+    once = widget._persistence.counts().sum()
+
+    widget.update_data(_sine(), DTYPE_ARRAY_1D)
+
+    assert widget._persistence.counts().sum() == pytest.approx(once * (1 + widget.PERSISTENCE_DECAY))
+    assert widget._persistence_image.isVisible()
+    assert widget._persistence_image.zValue() < widget._curves[0].zValue()
+    # The live curve is still drawn as before
+    assert len(widget._curves[0].getData()[0]) > 0
+
+
+def test_rare_glitch_stays_visible_after_it_passes(widget):
+    widget.set_persistence(True)
+    widget.update_data(_sine(glitch=2000), DTYPE_ARRAY_1D)
+    for _ in range(5):
+        widget.update_data(_sine(glitch=1999), DTYPE_ARRAY_1D)  # keeps the extent
+        widget.update_data(_sine(), DTYPE_ARRAY_1D)
+
+    counts = widget._persistence.counts()
+    rows, cols = counts.shape
+    column = int(2000 / 3999 * cols)
+    top = counts[int(rows * 0.9):, column - 1:column + 2]
+    assert top.max() > 0
+    # Far from the glitch nothing reaches that high
+    assert counts[int(rows * 0.9):, :column - 10].max() == 0
+
+
+def test_zoom_rerender_does_not_add_a_frame(widget):
+    widget.set_persistence(True)
+    widget.update_data(_sine(), DTYPE_ARRAY_1D)
+    before = widget._persistence.counts().copy()
+
+    widget._rerender_for_zoom()
+
+    np.testing.assert_array_equal(widget._persistence.counts(), before)
+
+
+def test_rows_and_waveform_axes(widget):
+    widget.set_persistence(True)
+    widget.update_data(np.stack([_sine(), -_sine()]), DTYPE_ARRAY_2D)
+    assert widget._persistence.extent[:2] == (0.0, 3999.0)
+
+    waveform = {'__dtype__': DTYPE_WAVEFORM_REAL, 'samples': _sine(), 'scalars': [1.0, 1e-3]}
+    widget.update_data(waveform, DTYPE_WAVEFORM_REAL)
+    assert widget._persistence.extent[:2] == pytest.approx((1.0, 1.0 + 3999e-3))
+
+
+def test_disabled_by_default_and_toggles_off(widget):
+    widget.update_data(_sine(), DTYPE_ARRAY_1D)
+    assert not widget.persistence and not widget._persistence_image.isVisible()
+
+    widget.set_persistence(True)
+    assert widget._persistence.counts().sum() > 0
+    widget.set_persistence(False)
+    assert widget._persistence is None and not widget._persistence_image.isVisible()
+
+
+def test_noisy_frames_settle_on_one_extent(widget):
+    widget.set_persistence(True)
+    rng = np.random.default_rng(0)
+    extents = []
+    for _ in range(30):
+        widget.update_data(rng.standard_normal(2000), DTYPE_ARRAY_1D)
+        extents.append(widget._persistence.extent)
+
+    assert len(set(extents[10:])) == 1
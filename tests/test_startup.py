@@ -0,0 +1,82 @@
+"""Startup cost: lazy plugin loading and the time-to-first-window budget."""
+
+import os
+import re
+import subprocess
+import sys
+import textwrap
+
+import pytest
+
+from pyprobe.core import data_classifier
+from pyprobe.plugins.builtins import BUILTIN_PLUGIN_SPECS
+from pyprobe.startup_profile import StartupProfile
+
+# Generous for slow CI machines; a warm start takes well under a second
+STARTUP_BUDGET_MS = 4000
+
+ALL_DTYPES = [getattr(data_classifier, name) for name in dir(data_classifier)
+              if name.startswith("DTYPE_")]
+
+
+def _env() -> dict:
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    path = os.pathsep.join(filter(None, [root, os.environ.get("PYTHONPATH")]))
+    return dict(os.environ, QT_QPA_PLATFORM="offscreen", PYTHONPATH=path)
+
+
+def _run_python(code: str) -> str:
+    result = subprocess.run([sys.executable, "-c", textwrap.dedent(code)],
+                            capture_output=True, text=True, timeout=60, env=_env())
+    assert result.returncode == 0, result.stderr
+    return result.stdout
+
+
+@pytest.mark.parametrize("spec", BUILTIN_PLUGIN_SPECS, ids=lambda s: s.name)
+def test_plugin_metadata_matches_plugin(spec):
+    plugin = spec.load()
+    assert plugin.name == spec.name
+    handled = {dtype for dtype in ALL_DTYPES if plugin.can_handle(dtype, None)}
+    assert handled == spec.dtypes
+
+
+def test_registry_imports_widget_modules_on_first_use():
+    out = _run_python("""
+        import sys
+        from pyprobe.plugins import PluginRegistry
+        from pyprobe.core.data_classifier import DTYPE_SCALAR
+
+        def loaded():
+            return sorted(m.rsplit('.', 1)[1] for m in sys.modules
+                          if m.startswith('pyprobe.plugins.builtins.'))
+
+        registry = PluginRegistry.instance()
+        print(len(registry.plugin_names), loaded())
+        registry.get_compatible_plugins(DTYPE_SCALAR)
+        print(loaded(), 'scipy' in sys.modules)
+    """)
+    first, second = out.splitlines()
+    assert first == f"{len(BUILTIN_PLUGIN_SPECS)} []"
+    assert second == "['scalar_display', 'scalar_history'] False"
+
+
+def test_time_to_first_window_within_budget(tmp_path):
+    result = subprocess.run(
+        [sys.executable, "-m", "pyprobe", "--startup-profile", "--auto-quit-timeout", "0.5"],
+        capture_output=True, text=True, timeout=60, env=_env(), cwd=tmp_path,
+    )
+    match = re.search(r"time to first window\s+([\d.]+) ms", result.stderr)
+    assert match, result.stderr
+    assert float(match.group(1)) < STARTUP_BUDGET_MS, result.stderr
+    # Heavy optional imports are deferred until first use
+    assert "scipy" not in result.stderr
+
+
+def test_profile_counts_imports_per_phase():
+    profile = StartupProfile()
+    profile.mark("nothing")
+    import pyprobe.gui.history_query  # noqa: F401  (not imported at startup)
+    phase = profile.mark("import")
+    assert profile.phases[0].modules == 0
+    assert phase.seconds >= 0 and phase.ended_at == pytest.approx(profile.total)
+    assert "time to first window" in profile.report()